@@ -11,6 +11,9 @@ Usage:
     chatbot = create_chatbot("gpt-4o-mini", api_key="sk-...")
     response = chatbot.chat("What's the CPU usage?")
 
+    # From async code, await achat() so the event loop is never blocked
+    response = await chatbot.achat("What's the CPU usage?")
+
     # Or import specific implementations
     from chatbots import AnthropicChatBot, OpenAIChatBot
 
@@ -6,14 +6,37 @@ This module provides Anthropic Claude-specific implementation using the official
 
 import os
 import re
-from typing import Optional, Callable, List, Dict
+import threading
+from typing import Any, Optional, Callable, List, Dict
 
 from .base import BaseChatBot
 from chatbots.tool_executor import ToolExecutor
 from common.pylogger import get_python_logger
 
+try:
+    import anthropic
+except ImportError:  # pragma: no cover - depends on the runtime image
+    anthropic = None
+
 logger = get_python_logger()
 
+# Clients shared by bots with the same API key. The SDK client is
+# thread-safe, and reusing it keeps its connection pool warm across chats.
+_CLIENTS: Dict[str, Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+_MAX_CACHED_CLIENTS = 32
+
+
+def _get_client(api_key: str) -> Any:
+    """Return the shared Anthropic client for an API key."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(api_key)
+        if client is None:
+            if len(_CLIENTS) >= _MAX_CACHED_CLIENTS:
+                _CLIENTS.pop(next(iter(_CLIENTS)))
+            client = _CLIENTS[api_key] = anthropic.Anthropic(api_key=api_key)
+        return client
+
 
 class AnthropicChatBot(BaseChatBot):
     """Anthropic Claude implementation with native tool calling."""
@@ -33,18 +56,16 @@ class AnthropicChatBot(BaseChatBot):
         tool_executor: ToolExecutor = None):
         super().__init__(model_name, api_key, tool_executor)
 
-        # Import Anthropic SDK and track SDK import status
-        self._sdk_import_failed = False
-        try:
-            import anthropic
+        # Anthropic SDK is imported once at module load; track its status
+        self._sdk_import_failed = anthropic is None
+        if anthropic is not None:
             # Only create client if API key is provided
             if self.api_key:
-                self.client = anthropic.Anthropic(api_key=self.api_key)
+                self.client = _get_client(self.api_key)
             else:
                 self.client = None
-        except ImportError:
+        else:
             logger.error("Anthropic SDK not installed. Install with: pip install anthropic")
-            self._sdk_import_failed = True
             self.client = None
 
     def _get_model_specific_instructions(self) -> str:
@@ -91,12 +112,19 @@ class AnthropicChatBot(BaseChatBot):
         conversation_history: Optional[List[Dict[str, str]]] = None
     ) -> str:
         """Chat with Anthropic Claude using tool calling."""
+        self._tool_cache.clear()
+
         if not self.client:
             if self._sdk_import_failed:
                 return "Error: Anthropic SDK not installed. Please install it with: pip install anthropic"
             else:
                 return f"Error: API key required for Anthropic model {self.model_name}. Please configure an API key in Settings."
 
+        cache_key = self._response_cache_key(user_question, namespace, conversation_history)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Create system prompt
             system_prompt = self._create_system_prompt(namespace)
@@ -124,10 +152,11 @@ class AnthropicChatBot(BaseChatBot):
             max_iterations = 30
             iteration = 0
             consecutive_tool_tracker = {"name": None, "count": 0}
+            repeat_tracker = {"seen": set(), "count": 0, "repeated": False}
 
             while iteration < max_iterations:
                 iteration += 1
-                logger.info(f"🤖 Anthropic tool calling iteration {iteration}")
+                logger.info("🤖 Anthropic tool calling iteration %s", iteration)
 
                 if progress_callback:
                     progress_callback(f"🤖 Thinking... (iteration {iteration})")
@@ -150,37 +179,37 @@ class AnthropicChatBot(BaseChatBot):
                 # If Claude wants to use tools, execute them
                 if response.stop_reason == "tool_use":
                     tool_count = sum(1 for block in response.content if block.type == "tool_use")
-                    logger.info(f"🤖 Anthropic requesting {tool_count} tool(s)")
+                    logger.info("🤖 Anthropic requesting %s tool(s)", tool_count)
 
                     # Collect tool names for iteration-level loop detection
                     tool_names_this_iteration = {
                         block.name for block in response.content if block.type == "tool_use"
                     }
 
-                    if self._check_tool_loop(tool_names_this_iteration, consecutive_tool_tracker):
+                    tool_blocks = [block for block in response.content if block.type == "tool_use"]
+                    tool_calls = [(block.name, block.input) for block in tool_blocks]
+
+                    if (self._check_tool_loop(tool_names_this_iteration, consecutive_tool_tracker)
+                            or self._check_repeated_calls(tool_calls, repeat_tracker)):
                         return (
                             "I got stuck in a loop calling the same tool repeatedly. "
                             "Please try rephrasing your question or being more specific."
                         )
 
-                    tool_results = []
-                    for content_block in response.content:
-                        if content_block.type == "tool_use":
-                            tool_name = content_block.name
-                            tool_args = content_block.input
-                            tool_id = content_block.id
-
-                            if progress_callback:
-                                progress_callback(f"🔧 Using tool: {tool_name}")
-
-                            # Get tool result with automatic truncation (logging handled in base class)
-                            tool_result = self._get_tool_result(tool_name, tool_args, namespace=namespace)
-
-                            tool_results.append({
-                                "type": "tool_result",
-                                "tool_use_id": tool_id,
-                                "content": tool_result
-                            })
+                    # Run this turn's tools concurrently (truncation and logging handled in base class)
+                    if repeat_tracker["repeated"]:
+                        results = self._repeated_call_results(tool_calls)
+                    else:
+                        results = self._get_tool_results(tool_calls, namespace, progress_callback)
+
+                    tool_results = [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": block.id,
+                            "content": tool_result
+                        }
+                        for block, tool_result in zip(tool_blocks, results)
+                    ]
 
                     # Add tool results to conversation
                     messages.append({
@@ -201,8 +230,8 @@ class AnthropicChatBot(BaseChatBot):
                         if content_block.type == "text":
                             final_response += content_block.text
 
-                    logger.info(f"Anthropic tool calling completed in {iteration} iterations")
-                    return self._strip_xml_tool_calls(final_response)
+                    logger.info("Anthropic tool calling completed in %s iterations", iteration)
+                    return self._cache_response(cache_key, self._strip_xml_tool_calls(final_response))
 
             # Hit max iterations
             logger.warning(f"Hit max iterations ({max_iterations})")
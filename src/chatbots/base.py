@@ -5,15 +5,44 @@ This module provides the base class for all chat bot implementations.
 All provider-specific implementations inherit from BaseChatBot.
 """
 
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
 import re
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any, Callable
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, AsyncIterator, Callable, FrozenSet, Tuple
 
 from chatbots.tool_executor import ToolExecutor
 from common.pylogger import get_python_logger
 
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - depends on the runtime image
+    tiktoken = None
+
 logger = get_python_logger()
 
+# Rough characters per token, used to turn the per-bot character limits into
+# token budgets when a tokenizer is available
+_CHARS_PER_TOKEN = 4
+_TRUNCATION_NOTICE = "\n... [Result truncated due to size]"
+# Share of the context window the conversation may fill before each model
+# call; the rest is headroom for the reply and estimation error
+_CONTEXT_BUDGET_FRACTION = 0.8
+
+
+@functools.lru_cache(maxsize=None)
+def _get_token_encoding(name: str) -> Any:
+    """Load a tiktoken encoding once per process."""
+    return tiktoken.get_encoding(name)
+
 # PromQL functions, keywords, and common label names that should NOT get
 # namespace injected — only actual metric names should.  Module-level constant
 # to avoid rebuilding on every call.
@@ -56,6 +85,221 @@ _PROMQL_SKIP = frozenset({
     'inf', 'nan',
 })
 
+# Shared system prompt. Only the scope slots vary per request, so the text is
+# kept as one constant and filled with str.format (literal braces are doubled).
+_BASE_PROMPT_TEMPLATE = """You are an expert Kubernetes and Prometheus observability assistant.
+
+🎯 **PRIMARY RULE: ANSWER ONLY WHAT THE USER ASKS. DO NOT EXPLORE BEYOND THEIR SPECIFIC QUESTION.**
+
+You have access to monitoring tools and should provide focused, targeted responses.
+
+**Your Environment:**
+- Cluster: OpenShift with AI/ML workloads, GPUs, and comprehensive monitoring
+- Scope: {scope_line}
+- Tools: Direct access to Prometheus/Thanos metrics via MCP tools
+{namespace_directive}
+
+**Available Tools:**
+
+**Core Observability Tools:**
+- search_metrics: Pattern-based metric search - use for broad exploration
+- execute_promql: Execute PromQL queries for actual data
+- convert_time_to_promql_duration: Convert decimal hours to Prometheus format (use before constructing queries with decimal time values)
+- get_metric_metadata: Get detailed information about specific metrics
+- get_label_values: Get available label values
+- suggest_queries: Get PromQL suggestions based on user intent
+- explain_results: Get human-readable explanation of query results
+- **get_metrics_categories**: Get all metric categories with summary (NEW - use for exploring available metrics by category)
+- **search_metrics_by_category**: Search metrics filtered by category and priority (NEW - use for targeted category-specific queries)
+
+**Trace Analysis Tools:**
+- chat_tempo_tool: Conversational trace analysis - use for trace/span/latency/request flow questions
+- query_tempo_tool: Direct tempo queries for specific trace searches
+- get_trace_details_tool: Get detailed information about specific trace IDs
+
+**Log Analysis Tools:**
+- get_correlated_logs: Fetch application and infrastructure logs for a namespace or pod. Use for: "show me logs", "error logs in namespace X", "what's happening in pod Y", crash investigation, log search by severity. Requires namespace; pod is optional.
+
+**Correlation & Advanced Analysis:**
+- korrel8r_get_correlated: Get correlated observability data across domains (find logs/traces/metrics related to alerts) - available if Korrel8r is configured. Preferred over korrel8r_query_objects (for investigation and correlation).
+- korrel8r_query_objects: Query for specific observability objects (alerts, logs, traces, metrics) - available if Korrel8r is configured. Use for direct data access only.
+
+**Note:** Additional specialized tools are available for specific use cases (VLLM metrics, OpenShift analysis, model management, etc.) and will be provided to you automatically via the function calling interface when needed.
+
+**🚨 CRITICAL: Tool Selection Guidelines:**
+
+**For Trace-Related Questions (trace, span, latency, request flow, distributed tracing, performance):**
+- Use `chat_tempo_tool` for conversational trace analysis with natural language questions
+- Use `query_tempo_tool` for specific trace queries when you need targeted data
+- Use `get_trace_details_tool` for detailed analysis of specific trace IDs
+- Extract time ranges from natural language ("last 24 hours", "yesterday", "last week")
+
+**For Alert Queries:**
+
+**Smart Two-Phase Approach:**
+- Start with Prometheus (fast, simple) for basic alert data
+- Escalate to Korrel8r only when needed for correlation or explicitly requested
+
+**1. USER EXPLICITLY REQUESTS KORREL8r ("use korrel8r", "query korrel8r")**:
+   - ALWAYS use Korrel8r tools immediately (korrel8r_query_objects or korrel8r_get_correlated)
+   - Query format: `alert:alert:{{\"alertname\":\"AlertName\"}}`
+   - Examples: "Use korrel8r to investigate AlertExampleDown", "Query korrel8r for HighCPU alert"
+
+**2. USER ASKS FOR INVESTIGATION/CORRELATION** (without mentioning korrel8r):
+   - Phase 1: Use `execute_promql` with ALERTS metric to get alert details
+   - Phase 2: Use Korrel8r to find related logs/traces/metrics
+   - Examples: "Investigate AlertExampleDown", "What's related to HighCPU alert?", "Find correlated data for alert X"
+
+**3. BASIC ALERT QUERIES** (listing/checking status only):
+   - Use ONLY `execute_promql` with the `ALERTS` metric - DO NOT use Korrel8r
+   - Query firing alerts: `ALERTS{{alertstate="firing"}}`
+   - Query specific alerts: `ALERTS{{alertstate="firing", alertname="HighCPU"}}`
+   - Examples: "Any alerts firing?", "Show me alerts", "List all critical alerts", "Check alert status"
+
+**For Log Queries (logs, errors, pod output, crash investigation, "what happened"):**
+- Use `get_correlated_logs` for namespace/pod log retrieval — pass the namespace (required) and optionally a pod name
+- Use `korrel8r_get_correlated` when you need to correlate logs with traces and metrics (cross-signal investigation)
+- Examples: "Show me logs for namespace llm-serving", "Error logs from pod vllm-predictor", "What happened in namespace gpu-workloads?", "Show me crash logs"
+
+**Your Intelligence Style:**
+1. **Rich Contextual Analysis**: Provide context, thresholds, and implications — not just raw numbers
+2. **Intelligent Grouping**: Group related pods by function (AI/ML Stack, Infrastructure, Data Storage) with counts
+3. **Operational Intelligence**: Include health assessments, trend context, and actionable recommendations
+
+**CORE PRINCIPLES:**
+- Use tools to get real data — NEVER fabricate numbers or metric names
+- Be thorough but focused — answer what was asked, nothing more
+- STOP when you have enough data to answer the question well
+
+**vLLM / Model-Serving Metrics:**
+Use `search_metrics_by_category` with category `gpu_ai` to discover exact metric names.
+Key metrics (DO NOT guess names — always search first):
+- Latency: `vllm:e2e_request_latency_seconds`, `vllm:time_to_first_token_seconds`
+- Throughput: `vllm:prompt_tokens_total`, `vllm:generation_tokens_total`, `vllm:num_requests_total`
+- Cache: `vllm:gpu_cache_usage_perc`, `vllm:cpu_cache_usage_perc`
+- GPU: `DCGM_FI_DEV_GPU_TEMP`, `DCGM_FI_DEV_POWER_USAGE`, `DCGM_FI_DEV_GPU_UTIL`
+When the user specifies a time range (e.g., "last 24 hours", "2.3 hours", "past 5 hours"), call `convert_time_to_promql_duration` to get the correct PromQL duration for query time windows.
+
+**Tool Selection Rules (ALWAYS follow these):**
+- Traces/spans/latency → `chat_tempo_tool` (search) or `get_trace_details_tool` (by ID)
+- Metrics/pods/GPU/CPU/memory → **ALWAYS** call `search_metrics` or `search_metrics_by_category` FIRST to discover exact metric names, THEN call `execute_promql` with the discovered names
+- Alerts → `execute_promql` with `ALERTS{{alertstate="firing"}}` metric
+- Logs/errors/pod output → `get_correlated_logs` with namespace and optional pod
+- Correlation/investigation/korrel8r → `korrel8r_get_correlated` with goals and k8s query
+- Pod health/failures → `execute_promql` with `kube_pod_container_status_waiting_reason` and `kube_pod_container_status_terminated_reason`
+- When the user explicitly names a tool (e.g., "use korrel8r"), ALWAYS use that tool
+
+**Your Workflow:**
+1. **Determine** what the user is asking for (trace, metrics, logs, or alerts?)
+2. **Discover** — for metrics questions, ALWAYS call `search_metrics` or `search_metrics_by_category` first
+3. **Execute** the query tool with the discovered metric names
+4. **Answer** with the specific data — DONE!
+
+**CRITICAL: Interpreting Metrics Correctly**
+- **Boolean/Status Metrics**: These use VALUE to indicate state where 1 means TRUE and 0 means FALSE
+  - Always check the metric VALUE not just the labels
+  - Filter for value equals 1 to get actual active states
+- **Gauge Metrics**: Report current state or value at a point in time
+- **Counter Metrics**: Always increasing, use rate function for meaningful analysis
+
+**CRITICAL: Always Group Metrics for Detailed Breakdowns**
+- **Always use grouping by pod and namespace** for resource metrics like CPU memory GPU
+- **Show detailed breakdowns** not just summary totals
+- List top consumers by pod and namespace with actual names
+- Categorize by workload type such as AI/ML versus Infrastructure
+
+**Pod Health & Failure Detection:**
+- `kube_pod_status_phase` only tracks pod-level phases — most failures (CrashLoopBackOff, ImagePullBackOff, OOMKilled) are NOT in "Failed" phase
+- Check container-level metrics: `kube_pod_container_status_waiting_reason` and `kube_pod_container_status_terminated_reason`
+- ALWAYS append `== 1` to kube-state-metrics status queries to exclude stale time series
+
+**PromQL Pod/Container Name Matching:**
+- When querying by pod name, always use regex matching (e.g., `pod=~"name.*"`) instead of exact match (`pod="name"`), because Kubernetes pod names include deployment and replicaset hash suffixes (e.g., `my-app-6d5f8b7c4-x9k2m`).
+- Apply the same regex pattern for container and deployment names that may have generated suffixes.
+
+**Response Format:**
+```
+🤖 [Emoji + Summary Title]
+[Key Numbers & Summary]
+
+[Rich contextual analysis with operational insights]
+
+**Technical Details:**
+- **PromQL Used:** `your_query_here`
+- **Metric Source:** metric_name_here
+- **Data Points:** X samples over Y timeframe
+```
+
+**Critical Rules:**
+- ALWAYS include the PromQL query in technical details
+- ALWAYS use tools to get real data - never make up numbers
+- ALWAYS use EXACT metric names from tool results - never modify or "normalize" metric names
+- When reporting "Metric Source", copy the exact name returned by the tool
+- Provide operational context and health assessments
+- Use emojis and categorization for clarity
+- Make responses informative and actionable
+- Show conversational tool usage: "Let me check..." "I'll also look at..."
+
+Begin by finding the perfect metric for the user's question, then provide comprehensive analysis."""
+
+
+# Converted tool definitions per executor, keyed by allowlist. MCP tools are
+# registered once at server start, so listing and converting them on every
+# chat() is wasted work. Weak keys let a discarded executor drop its entry.
+_TOOL_DEFS_CACHE: "weakref.WeakKeyDictionary[ToolExecutor, Dict[Optional[FrozenSet[str]], Tuple[Dict[str, Any], ...]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_TOOL_DEFS_LOCK = threading.Lock()
+# Tool definitions converted to a provider SDK's format, keyed by executor,
+# then (allowlist, format). Each entry remembers the definitions tuple it was
+# built from, so a refreshed tool list is converted again.
+_SDK_TOOLS_CACHE: "weakref.WeakKeyDictionary[ToolExecutor, Dict[Tuple[Optional[FrozenSet[str]], str], Tuple[Tuple[Dict[str, Any], ...], Tuple[Any, ...]]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# System prompts kept per bot instance, one per namespace asked about
+_MAX_CACHED_SYSTEM_PROMPTS = 32
+
+# Shared pool for the tool calls of one model turn. Tool calls are I/O-bound
+# MCP round-trips, so running them concurrently overlaps their latency.
+_TOOL_CALL_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="chatbot-tool")
+
+# Final answers to recent stand-alone questions. Dashboards and users re-ask
+# the same thing often, and each answer costs several model and tool round-trips.
+# Keyed by (bot class, model, namespace, normalized question); entries expire
+# after _RESPONSE_CACHE_TTL_SECONDS and the least recently used are evicted.
+_RESPONSE_CACHE: "OrderedDict[Tuple[str, str, Optional[str], str], Tuple[float, str]]" = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_MAXSIZE = 512
+_RESPONSE_CACHE_TTL_SECONDS = 300
+
+# Background event loop that drives native async chat loops for synchronous
+# chat() callers. Async SDK clients bind their connection pools to the loop
+# that first used them, so one long-lived loop keeps them reusable.
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _run_sync(coro: Any) -> Any:
+    """Run a coroutine on the shared background loop and wait for its result."""
+    global _sync_loop
+
+    if _sync_loop is None:
+        with _sync_loop_lock:
+            if _sync_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="chatbot-loop", daemon=True).start()
+                _sync_loop = loop
+    return asyncio.run_coroutine_threadsafe(coro, _sync_loop).result()
+
+
+async def _report_progress(progress_callback: Optional[Callable], message: str) -> None:
+    """Invoke a sync or async progress callback."""
+    if progress_callback:
+        result = progress_callback(message)
+        if inspect.isawaitable(result):
+            await result
+
 
 class BaseChatBot(ABC):
     """Base class for all chat bot implementations with common functionality."""
@@ -96,10 +340,25 @@ class BaseChatBot(ABC):
         # Store tool executor (dependency injection)
         self.tool_executor = tool_executor
 
-        from core.config import NAMESPACE_AWARE_TOOLS
+        from core.config import MEMOIZABLE_TOOLS, NAMESPACE_AWARE_TOOLS
         self._namespace_aware_tools = NAMESPACE_AWARE_TOOLS
+        self._memoizable_tools = MEMOIZABLE_TOOLS
 
-        logger.info(f"{self.__class__.__name__} initialized with model: {self.model_name}")
+        # Results of read-only tool calls within the current chat(), keyed by
+        # a digest of (tool name, arguments); cleared at the start of each chat
+        self._tool_cache: Dict[bytes, str] = {}
+
+        # Full system prompts by namespace. A prompt only depends on the
+        # namespace, and sending byte-identical prompts lets provider-side
+        # prompt caching reuse the prefix across questions.
+        self._system_prompt_cache: Dict[Optional[str], str] = {}
+
+        # Token counts of the messages last passed to _fit_messages_to_budget,
+        # keyed by id() and holding the message so the id stays unique. Each
+        # iteration only has to count the messages added since the last one.
+        self._message_token_counts: Dict[int, Tuple[Any, int]] = {}
+
+        logger.debug("%s initialized with model: %s", type(self).__name__, self.model_name)
 
     @abstractmethod
     def _get_api_key(self) -> Optional[str]:
@@ -169,6 +428,54 @@ class BaseChatBot(ABC):
             return True
         return False
 
+    # Iterations per chat that may consist only of tool calls already made
+    # in that chat. The first gets a reminder instead of re-running the
+    # calls; the next one ends the loop.
+    _MAX_REPEATED_TOOL_ITERATIONS = 1
+
+    def _check_repeated_calls(
+        self,
+        tool_calls: List[Tuple[str, Dict[str, Any]]],
+        repeat_tracker: dict,
+    ) -> bool:
+        """Check if an iteration only repeats tool calls made earlier in this chat.
+
+        Identical calls return identical results, so such an iteration gives
+        the model nothing new. Sets repeat_tracker["repeated"] for the current
+        iteration so the caller can answer with _repeated_call_results().
+
+        Args:
+            tool_calls: (tool_name, tool_args) pairs of this iteration.
+            repeat_tracker: Dict with 'seen', 'count' and 'repeated' keys,
+                mutated in place to track state across iterations.
+
+        Returns:
+            True if too many iterations repeated earlier calls (caller should break).
+        """
+        keys = {self._tool_cache_key(tool_name, tool_args) for tool_name, tool_args in tool_calls}
+        repeated = bool(keys) and keys <= repeat_tracker["seen"]
+        repeat_tracker["seen"] |= keys
+        repeat_tracker["repeated"] = repeated
+        if not repeated:
+            return False
+
+        repeat_tracker["count"] += 1
+        logger.warning(
+            "Iteration repeated %d earlier tool call(s) with identical arguments.",
+            len(tool_calls),
+        )
+        return repeat_tracker["count"] > self._MAX_REPEATED_TOOL_ITERATIONS
+
+    @staticmethod
+    def _repeated_call_results(tool_calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Tool results that point the model back at results it already has."""
+        return [
+            f"You already called {tool_name} with these exact arguments earlier in this "
+            "conversation; its result is above and has not changed. Do not call it again — "
+            "answer the question with the data you already have."
+            for tool_name, _ in tool_calls
+        ]
+
     def _get_tool_allowlist(self) -> Optional[set]:
         """Return a set of tool names this model should receive, or None for all tools.
 
@@ -180,27 +487,75 @@ class BaseChatBot(ABC):
     def _get_mcp_tools(self) -> List[Dict[str, Any]]:
         """Get available tools via tool executor.
 
+        The converted definitions are built once per executor and allowlist
+        and shared between bots; callers get a fresh list but must treat the
+        tool dicts as read-only.
+
         Returns:
             List of tool definitions with name, description, and input_schema
         """
+        return list(self._get_tool_defs())
+
+    def _get_tool_defs(self) -> Tuple[Dict[str, Any], ...]:
+        """Return the shared, cached tool definitions tuple for this bot's allowlist."""
+        allowlist = self._get_tool_allowlist()
+        key = frozenset(allowlist) if allowlist is not None else None
+
+        cached = _TOOL_DEFS_CACHE.get(self.tool_executor, {}).get(key)
+        if cached is None:
+            cached = self._fetch_mcp_tools(allowlist)
+            if cached:
+                with _TOOL_DEFS_LOCK:
+                    _TOOL_DEFS_CACHE.setdefault(self.tool_executor, {})[key] = cached
+        return cached
+
+    def _get_sdk_tools(
+        self,
+        sdk_format: str,
+        convert: Callable[[Dict[str, Any]], Any],
+    ) -> List[Any]:
+        """Return the MCP tools converted to a provider SDK's format.
+
+        Conversions are shared between bots like the definitions themselves,
+        and only rerun when the underlying tool definitions change.
+
+        Args:
+            sdk_format: Name of the target format, part of the cache key
+            convert: Converts one tool definition to the SDK's format
+
+        Returns:
+            Converted tools, in tool definition order
+        """
+        defs = self._get_tool_defs()
+        allowlist = self._get_tool_allowlist()
+        key = (frozenset(allowlist) if allowlist is not None else None, sdk_format)
+
+        cached = _SDK_TOOLS_CACHE.get(self.tool_executor, {}).get(key)
+        if cached is not None and cached[0] is defs:
+            return list(cached[1])
+
+        converted = tuple(convert(tool) for tool in defs)
+        if defs:
+            with _TOOL_DEFS_LOCK:
+                _SDK_TOOLS_CACHE.setdefault(self.tool_executor, {})[key] = (defs, converted)
+        return list(converted)
+
+    def _fetch_mcp_tools(self, allowlist: Optional[set]) -> Tuple[Dict[str, Any], ...]:
+        """List tools from the executor and convert them to tool definitions."""
         try:
             # Fetch tools via tool executor (dependency injection)
             tools_list = self.tool_executor.list_tools()
 
-            # Filter by allowlist if the subclass defines one
-            allowlist = self._get_tool_allowlist()
-
-            # Convert to expected format
-            tools = []
-            for tool in tools_list:
-                if allowlist is not None and tool.name not in allowlist:
-                    continue
-                tool_def = {
+            # Convert to expected format, filtering by allowlist if the subclass defines one
+            tools = tuple(
+                {
                     'name': tool.name,
                     'description': tool.description,
                     'input_schema': tool.input_schema
                 }
-                tools.append(tool_def)
+                for tool in tools_list
+                if allowlist is None or tool.name in allowlist
+            )
 
             if tools:
                 tool_names = [tool['name'] for tool in tools]
@@ -264,6 +619,12 @@ class BaseChatBot(ABC):
         except Exception:
             return q
 
+    @staticmethod
+    def _tool_cache_key(tool_name: str, arguments: Dict[str, Any]) -> bytes:
+        """Digest identifying a tool call, independent of argument order."""
+        payload = f"{tool_name}:{json.dumps(arguments, sort_keys=True, default=str)}"
+        return hashlib.sha256(payload.encode()).digest()
+
     def _route_tool_call_to_mcp(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """Route tool call via tool executor.
 
@@ -276,7 +637,7 @@ class BaseChatBot(ABC):
         Returns:
             Tool execution result as string
         """
-        logger.info(f"🔧 Routing tool call: {tool_name} with arguments: {arguments}")
+        logger.debug("🔧 Routing tool call: %s with arguments: %s", tool_name, arguments)
 
         # Normalize Korrel8r query inputs when needed before executing
         if tool_name == "korrel8r_get_correlated":
@@ -292,13 +653,22 @@ class BaseChatBot(ABC):
                 # Best-effort normalization; continue with original arguments on error
                 pass
 
+        cache_key = None
+        if tool_name in self._memoizable_tools:
+            cache_key = self._tool_cache_key(tool_name, arguments)
+            if cache_key in self._tool_cache:
+                logger.info("♻️ Reusing result of identical %s call from this chat", tool_name)
+                return self._tool_cache[cache_key]
+
         try:
-            logger.info(f"⚙️ Executing tool '{tool_name}' via tool executor")
+            logger.debug("⚙️ Executing tool '%s' via tool executor", tool_name)
 
             # Execute tool via tool executor (handles both server and client scenarios)
             result = self.tool_executor.call_tool(tool_name, arguments)
 
-            logger.info(f"✅ Tool {tool_name} returned result (length: {len(result) if result else 0})")
+            logger.info("✅ Tool %s returned result (length: %s)", tool_name, len(result) if result else 0)
+            if cache_key is not None:
+                self._tool_cache[cache_key] = result
             return result
 
         except Exception as e:
@@ -316,6 +686,17 @@ class BaseChatBot(ABC):
         """
         return 5000
 
+    def _get_token_encoding_name(self) -> Optional[str]:
+        """Get the tiktoken encoding that approximates this model's tokenizer.
+
+        Subclasses override this when a public tokenizer matches their model.
+        The default (None) keeps character-based truncation.
+
+        Returns:
+            tiktoken encoding name, or None
+        """
+        return None
+
     def _inject_namespace_into_promql(self, query: str, namespace: str) -> str:
         """Inject a namespace label filter into a PromQL query string.
 
@@ -336,7 +717,7 @@ class BaseChatBot(ABC):
                 query
             )
             if modified != query:
-                logger.info(f"📌 Replaced namespace in PromQL: {query} → {modified}")
+                logger.info("📌 Replaced namespace in PromQL: %s → %s", query, modified)
             return modified
 
         original = query
@@ -375,7 +756,7 @@ class BaseChatBot(ABC):
         )
 
         if modified != original:
-            logger.info(f"📌 Injected namespace '{namespace}' into PromQL: {original} → {modified}")
+            logger.info("📌 Injected namespace '%s' into PromQL: %s → %s", namespace, original, modified)
         return modified
 
     def _get_tool_result(self, tool_name: str, tool_args: Dict[str, Any], namespace: Optional[str] = None) -> str:
@@ -406,64 +787,175 @@ class BaseChatBot(ABC):
                 # For other tools: inject namespace as an argument
                 tool_args = dict(tool_args)
                 tool_args['namespace'] = namespace
-                logger.info(f"📌 Injected namespace '{namespace}' into {tool_name} args")
+                logger.info("📌 Injected namespace '%s' into %s args", namespace, tool_name)
 
         # Log tool request with arguments
-        logger.info(f"🔧 Requesting tool: {tool_name} with args: {tool_args}")
+        logger.info("🔧 Requesting tool: %s with args: %s", tool_name, tool_args)
 
         # Route to MCP server
         tool_result = self._route_tool_call_to_mcp(tool_name, tool_args)
 
         # Log result preview
-        logger.info(f"📬 Returning result for tool {tool_name}: {str(tool_result)[:200]}...")
+        # %.200s defers stringifying and slicing a possibly large result until the record is emitted
+        logger.info("📬 Returning result for tool %s: %.200s...", tool_name, tool_result)
 
         # Truncate large results to prevent context overflow
+        return self._truncate_tool_result(tool_result)
+
+    def _truncate_tool_result(self, tool_result: Any) -> Any:
+        """Truncate a tool result to this bot's budget.
+
+        When tiktoken is installed and the bot names an encoding, the budget
+        is counted in tokens (the character limit divided by
+        _CHARS_PER_TOKEN), so compact JSON keeps more content than verbose
+        text. Otherwise the character limit applies directly.
+        """
         max_length = self._get_max_tool_result_length()
+        encoding_name = self._get_token_encoding_name()
+
+        if isinstance(tool_result, str) and encoding_name and tiktoken is not None:
+            max_tokens = max_length // _CHARS_PER_TOKEN
+            # Every token spans at least one character, so short results fit
+            if len(tool_result) > max_tokens:
+                encoding = _get_token_encoding(encoding_name)
+                tokens = encoding.encode(tool_result, disallowed_special=())
+                if len(tokens) > max_tokens:
+                    logger.info("✂️ Truncating result from %s to %s tokens", len(tokens), max_tokens)
+                    return encoding.decode(tokens[:max_tokens]) + _TRUNCATION_NOTICE
+            logger.info("📦 Tool result within limit of %s tokens", max_tokens)
+            return tool_result
+
         if isinstance(tool_result, str) and len(tool_result) > max_length:
-            logger.info(f"✂️ Truncating result from {len(tool_result)} to {max_length} chars")
-            tool_result = tool_result[:max_length] + "\n... [Result truncated due to size]"
+            logger.info("✂️ Truncating result from %s to %s chars", len(tool_result), max_length)
+            tool_result = tool_result[:max_length] + _TRUNCATION_NOTICE
+        elif isinstance(tool_result, str):
+            logger.info("📦 Tool result size: %s chars (within limit of %s)", len(tool_result), max_length)
         else:
-            logger.info(f"📦 Tool result size: {len(str(tool_result))} chars (within limit of {max_length})")
+            logger.info("📦 Tool result of type %s is not truncated", type(tool_result).__name__)
 
         return tool_result
 
-    def _truncate_messages(
+    def _response_cache_key(
         self,
-        messages: list,
-        keep_system_prompt: bool = True,
-        max_messages: int = 20,
-        target_messages: int = 14,
-    ) -> list:
-        """Truncate messages while keeping tool-call/result pairs atomic.
-
-        Groups assistant messages that contain tool_calls together with their
-        corresponding tool-result messages, so truncation never orphans a
-        tool call from its results (which causes LLMs to hallucinate).
+        user_question: str,
+        namespace: Optional[str],
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+    ) -> Optional[Tuple[str, str, Optional[str], str]]:
+        """Key for the response cache, or None when the answer depends on prior turns."""
+        if conversation_history:
+            return None
+        normalized = " ".join(user_question.lower().split())
+        return (type(self).__name__, self.model_name, namespace, normalized)
+
+    def _get_cached_response(self, key: Optional[Tuple[str, str, Optional[str], str]]) -> Optional[str]:
+        """Return a fresh cached answer for key, if any."""
+        if key is None:
+            return None
+        with _RESPONSE_CACHE_LOCK:
+            entry = _RESPONSE_CACHE.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if time.monotonic() - stored_at > _RESPONSE_CACHE_TTL_SECONDS:
+                del _RESPONSE_CACHE[key]
+                return None
+            _RESPONSE_CACHE.move_to_end(key)
+        logger.info("♻️ Returning cached response for repeated question")
+        return response
+
+    def _cache_response(self, key: Optional[Tuple[str, str, Optional[str], str]], response: str) -> str:
+        """Remember a final answer under key and return it unchanged."""
+        if key is not None and response:
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[key] = (time.monotonic(), response)
+                _RESPONSE_CACHE.move_to_end(key)
+                while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAXSIZE:
+                    _RESPONSE_CACHE.popitem(last=False)
+        return response
+
+    def _get_tool_results(
+        self,
+        tool_calls: List[Tuple[str, Dict[str, Any]]],
+        namespace: Optional[str] = None,
+        progress_callback: Optional[Callable] = None,
+    ) -> List[str]:
+        """Execute the tool calls of one model turn concurrently.
 
-        Supports two message formats:
-        - OpenAI/LlamaStack: tool results are separate {"role": "tool", ...} messages
-        - Anthropic: tool results are a single {"role": "user", "content": [{"type": "tool_result", ...}]} message
+        Identical calls in the turn are executed once and share the result.
 
         Args:
-            messages: The current message list (mutated in-place style; returns new list).
-            keep_system_prompt: If True, preserves messages[0] as the system prompt.
-            max_messages: Trigger truncation when len(messages) exceeds this.
-            target_messages: Keep this many messages (plus optional system prompt) after truncation.
+            tool_calls: (tool_name, tool_args) pairs in the order the model sent them
+            namespace: Optional namespace to inject into namespace-aware tools
+            progress_callback: Optional callback, notified once per distinct tool call in order
 
         Returns:
-            Truncated message list.
+            Tool results aligned with tool_calls
         """
-        if len(messages) <= max_messages:
-            return messages
+        unique_calls, positions = self._dedupe_tool_calls(tool_calls)
 
-        # Separate system prompt if needed
-        if keep_system_prompt and messages:
-            system = [messages[0]]
-            body = messages[1:]
+        if progress_callback:
+            for tool_name, _ in unique_calls:
+                progress_callback(f"🔧 Using tool: {tool_name}")
+
+        if len(unique_calls) == 1:
+            tool_name, tool_args = unique_calls[0]
+            results = [self._get_tool_result(tool_name, tool_args, namespace=namespace)]
         else:
-            system = []
-            body = list(messages)
+            futures = [
+                _TOOL_CALL_POOL.submit(self._get_tool_result, tool_name, tool_args, namespace=namespace)
+                for tool_name, tool_args in unique_calls
+            ]
+            results = [future.result() for future in futures]
+        return [results[position] for position in positions]
+
+    async def _aget_tool_results(
+        self,
+        tool_calls: List[Tuple[str, Dict[str, Any]]],
+        namespace: Optional[str] = None,
+        progress_callback: Optional[Callable] = None,
+    ) -> List[str]:
+        """Async counterpart of _get_tool_results for native async chat loops."""
+        unique_calls, positions = self._dedupe_tool_calls(tool_calls)
 
+        for tool_name, _ in unique_calls:
+            await _report_progress(progress_callback, f"🔧 Using tool: {tool_name}")
+
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self._get_tool_result, tool_name, tool_args, namespace=namespace)
+            for tool_name, tool_args in unique_calls
+        ))
+        return [results[position] for position in positions]
+
+    def _dedupe_tool_calls(
+        self,
+        tool_calls: List[Tuple[str, Dict[str, Any]]],
+    ) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[int]]:
+        """Collapse identical calls within one turn.
+
+        Returns:
+            The distinct calls in first-seen order, and for each input call
+            the index of its distinct call
+        """
+        unique_calls: List[Tuple[str, Dict[str, Any]]] = []
+        index_by_key: Dict[bytes, int] = {}
+        positions = []
+        for tool_name, tool_args in tool_calls:
+            key = self._tool_cache_key(tool_name, tool_args)
+            if key not in index_by_key:
+                index_by_key[key] = len(unique_calls)
+                unique_calls.append((tool_name, tool_args))
+            positions.append(index_by_key[key])
+        if len(unique_calls) < len(tool_calls):
+            logger.info("♻️ Skipping %d duplicate tool call(s) in this turn", len(tool_calls) - len(unique_calls))
+        return unique_calls, positions
+
+    @staticmethod
+    def _group_messages(body: list) -> List[list]:
+        """Split messages into atomic groups for truncation.
+
+        A group is either a standalone message, or an assistant message with
+        tool_calls together with all of its tool-result messages.
+        """
         # Build atomic groups from body messages.
         # A "group" is either:
         #   1. A standalone message (user or assistant without tool_calls)
@@ -513,6 +1005,152 @@ class BaseChatBot(ABC):
             else:
                 groups.append([msg])
                 i += 1
+        return groups
+
+    def _get_context_window_tokens(self) -> int:
+        """Get the model's context window size in tokens.
+
+        Subclasses override this based on their model. Default is a
+        conservative 32K tokens.
+
+        Returns:
+            Context window size in tokens
+        """
+        return 32000
+
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens in text, estimating from its length without a tokenizer."""
+        encoding_name = self._get_token_encoding_name()
+        if encoding_name and tiktoken is not None:
+            return len(_get_token_encoding(encoding_name).encode(text, disallowed_special=()))
+        return len(text) // _CHARS_PER_TOKEN + 1
+
+    def _count_message_tokens(self, message: Any) -> int:
+        """Estimate the tokens a chat message contributes to a request."""
+        if not isinstance(message, dict):
+            return self._count_tokens(str(message))
+        content = message.get("content")
+        tokens = self._count_tokens(content if isinstance(content, str) else str(content or ""))
+        for tool_call in message.get("tool_calls") or ():
+            function = tool_call.get("function", {}) if isinstance(tool_call, dict) else {}
+            tokens += self._count_tokens(f"{function.get('name', '')}{function.get('arguments', '')}")
+        return tokens
+
+    def _fit_messages_to_budget(self, messages: list, keep_system_prompt: bool = True) -> list:
+        """Trim the conversation to the model's input token budget.
+
+        Called right before each model call. Tool results of older groups are
+        first replaced by short stubs, oldest first; if that is not enough,
+        the oldest atomic groups are dropped. The system prompt and the most
+        recent group are always kept whole.
+
+        Args:
+            messages: The conversation about to be sent (not modified)
+            keep_system_prompt: If True, messages[0] is the system prompt
+
+        Returns:
+            The original list if it fits, otherwise a trimmed copy
+        """
+        budget = int(self._get_context_window_tokens() * _CONTEXT_BUDGET_FRACTION)
+
+        known = self._message_token_counts
+        counts = []
+        for m in messages:
+            entry = known.get(id(m))
+            counts.append(entry[1] if entry is not None and entry[0] is m else self._count_message_tokens(m))
+        total = sum(counts)
+        if total <= budget:
+            self._message_token_counts = {id(m): (m, c) for m, c in zip(messages, counts)}
+            return messages
+
+        split = 1 if keep_system_prompt and messages else 0
+        system = messages[:split]
+        groups = self._group_messages(messages[split:])
+        group_counts = []
+        index = split
+        for group in groups:
+            group_counts.append(counts[index:index + len(group)])
+            index += len(group)
+
+        # Pass 1: stub out tool results, oldest group first
+        for g in range(len(groups) - 1):
+            if total <= budget:
+                break
+            group = groups[g]
+            names = {
+                tc.get("id"): tc.get("function", {}).get("name", "tool")
+                for tc in group[0].get("tool_calls") or ()
+            }
+            for m, msg in enumerate(group):
+                content = msg.get("content") if isinstance(msg, dict) else None
+                if msg is group[0] or not isinstance(content, str):
+                    continue
+                stub = f"[{names.get(msg.get('tool_call_id'), 'tool')} returned {len(content)} chars, dropped to save context]"
+                if len(stub) >= len(content):
+                    continue
+                group[m] = {**msg, "content": stub}
+                stub_tokens = self._count_tokens(stub)
+                total -= group_counts[g][m] - stub_tokens
+                group_counts[g][m] = stub_tokens
+
+        # Pass 2: drop whole groups, oldest first
+        dropped = 0
+        while len(groups) > 1 and total > budget:
+            groups.pop(0)
+            total -= sum(group_counts.pop(0))
+            dropped += 1
+
+        result = system[:]
+        result_counts = counts[:split]
+        for group, group_count in zip(groups, group_counts):
+            result.extend(group)
+            result_counts.extend(group_count)
+        self._message_token_counts = {id(m): (m, c) for m, c in zip(result, result_counts)}
+
+        logger.info(
+            "✂️ Fitted conversation to %s-token budget: ~%s tokens, %s → %s messages (%s groups dropped)",
+            budget, total, len(messages), len(result), dropped,
+        )
+        return result
+
+    def _truncate_messages(
+        self,
+        messages: list,
+        keep_system_prompt: bool = True,
+        max_messages: int = 20,
+        target_messages: int = 14,
+    ) -> list:
+        """Truncate messages while keeping tool-call/result pairs atomic.
+
+        Groups assistant messages that contain tool_calls together with their
+        corresponding tool-result messages, so truncation never orphans a
+        tool call from its results (which causes LLMs to hallucinate).
+
+        Supports two message formats:
+        - OpenAI/LlamaStack: tool results are separate {"role": "tool", ...} messages
+        - Anthropic: tool results are a single {"role": "user", "content": [{"type": "tool_result", ...}]} message
+
+        Args:
+            messages: The current message list (mutated in-place style; returns new list).
+            keep_system_prompt: If True, preserves messages[0] as the system prompt.
+            max_messages: Trigger truncation when len(messages) exceeds this.
+            target_messages: Keep this many messages (plus optional system prompt) after truncation.
+
+        Returns:
+            Truncated message list.
+        """
+        if len(messages) <= max_messages:
+            return messages
+
+        # Separate system prompt if needed
+        if keep_system_prompt and messages:
+            system = [messages[0]]
+            body = messages[1:]
+        else:
+            system = []
+            body = list(messages)
+
+        groups = self._group_messages(body)
 
         # Drop oldest groups until we're at or below target (keep at least the most recent group)
         total = sum(len(g) for g in groups)
@@ -544,13 +1182,20 @@ class BaseChatBot(ABC):
 
         Combines base prompt with model-specific instructions.
         Subclasses can override _get_model_specific_instructions() to customize.
+        Prompts are built once per namespace and then reused.
         """
+        prompt = self._system_prompt_cache.get(namespace)
+        if prompt is not None:
+            return prompt
+
         base_prompt = self._get_base_prompt(namespace)
         model_specific = self._get_model_specific_instructions()
+        prompt = f"{base_prompt}\n\n{model_specific}" if model_specific else base_prompt
 
-        if model_specific:
-            return f"{base_prompt}\n\n{model_specific}"
-        return base_prompt
+        if len(self._system_prompt_cache) >= _MAX_CACHED_SYSTEM_PROMPTS:
+            self._system_prompt_cache.pop(next(iter(self._system_prompt_cache)))
+        self._system_prompt_cache[namespace] = prompt
+        return prompt
 
     def _format_scope_line(self, namespace: Optional[str]) -> str:
         """Format the Scope line for the system prompt."""
@@ -579,162 +1224,10 @@ class BaseChatBot(ABC):
 
     def _get_base_prompt(self, namespace: Optional[str] = None) -> str:
         """Create base system prompt shared by all models."""
-        prompt = f"""You are an expert Kubernetes and Prometheus observability assistant.
-
-🎯 **PRIMARY RULE: ANSWER ONLY WHAT THE USER ASKS. DO NOT EXPLORE BEYOND THEIR SPECIFIC QUESTION.**
-
-You have access to monitoring tools and should provide focused, targeted responses.
-
-**Your Environment:**
-- Cluster: OpenShift with AI/ML workloads, GPUs, and comprehensive monitoring
-- Scope: {self._format_scope_line(namespace)}
-- Tools: Direct access to Prometheus/Thanos metrics via MCP tools
-{self._format_namespace_directive(namespace)}
-
-**Available Tools:**
-
-**Core Observability Tools:**
-- search_metrics: Pattern-based metric search - use for broad exploration
-- execute_promql: Execute PromQL queries for actual data
-- convert_time_to_promql_duration: Convert decimal hours to Prometheus format (use before constructing queries with decimal time values)
-- get_metric_metadata: Get detailed information about specific metrics
-- get_label_values: Get available label values
-- suggest_queries: Get PromQL suggestions based on user intent
-- explain_results: Get human-readable explanation of query results
-- **get_metrics_categories**: Get all metric categories with summary (NEW - use for exploring available metrics by category)
-- **search_metrics_by_category**: Search metrics filtered by category and priority (NEW - use for targeted category-specific queries)
-
-**Trace Analysis Tools:**
-- chat_tempo_tool: Conversational trace analysis - use for trace/span/latency/request flow questions
-- query_tempo_tool: Direct tempo queries for specific trace searches
-- get_trace_details_tool: Get detailed information about specific trace IDs
-
-**Log Analysis Tools:**
-- get_correlated_logs: Fetch application and infrastructure logs for a namespace or pod. Use for: "show me logs", "error logs in namespace X", "what's happening in pod Y", crash investigation, log search by severity. Requires namespace; pod is optional.
-
-**Correlation & Advanced Analysis:**
-- korrel8r_get_correlated: Get correlated observability data across domains (find logs/traces/metrics related to alerts) - available if Korrel8r is configured. Preferred over korrel8r_query_objects (for investigation and correlation).
-- korrel8r_query_objects: Query for specific observability objects (alerts, logs, traces, metrics) - available if Korrel8r is configured. Use for direct data access only.
-
-**Note:** Additional specialized tools are available for specific use cases (VLLM metrics, OpenShift analysis, model management, etc.) and will be provided to you automatically via the function calling interface when needed.
-
-**🚨 CRITICAL: Tool Selection Guidelines:**
-
-**For Trace-Related Questions (trace, span, latency, request flow, distributed tracing, performance):**
-- Use `chat_tempo_tool` for conversational trace analysis with natural language questions
-- Use `query_tempo_tool` for specific trace queries when you need targeted data
-- Use `get_trace_details_tool` for detailed analysis of specific trace IDs
-- Extract time ranges from natural language ("last 24 hours", "yesterday", "last week")
-
-**For Alert Queries:**
-
-**Smart Two-Phase Approach:**
-- Start with Prometheus (fast, simple) for basic alert data
-- Escalate to Korrel8r only when needed for correlation or explicitly requested
-
-**1. USER EXPLICITLY REQUESTS KORREL8r ("use korrel8r", "query korrel8r")**:
-   - ALWAYS use Korrel8r tools immediately (korrel8r_query_objects or korrel8r_get_correlated)
-   - Query format: `alert:alert:{{\"alertname\":\"AlertName\"}}`
-   - Examples: "Use korrel8r to investigate AlertExampleDown", "Query korrel8r for HighCPU alert"
-
-**2. USER ASKS FOR INVESTIGATION/CORRELATION** (without mentioning korrel8r):
-   - Phase 1: Use `execute_promql` with ALERTS metric to get alert details
-   - Phase 2: Use Korrel8r to find related logs/traces/metrics
-   - Examples: "Investigate AlertExampleDown", "What's related to HighCPU alert?", "Find correlated data for alert X"
-
-**3. BASIC ALERT QUERIES** (listing/checking status only):
-   - Use ONLY `execute_promql` with the `ALERTS` metric - DO NOT use Korrel8r
-   - Query firing alerts: `ALERTS{{alertstate="firing"}}`
-   - Query specific alerts: `ALERTS{{alertstate="firing", alertname="HighCPU"}}`
-   - Examples: "Any alerts firing?", "Show me alerts", "List all critical alerts", "Check alert status"
-
-**For Log Queries (logs, errors, pod output, crash investigation, "what happened"):**
-- Use `get_correlated_logs` for namespace/pod log retrieval — pass the namespace (required) and optionally a pod name
-- Use `korrel8r_get_correlated` when you need to correlate logs with traces and metrics (cross-signal investigation)
-- Examples: "Show me logs for namespace llm-serving", "Error logs from pod vllm-predictor", "What happened in namespace gpu-workloads?", "Show me crash logs"
-
-**Your Intelligence Style:**
-1. **Rich Contextual Analysis**: Provide context, thresholds, and implications — not just raw numbers
-2. **Intelligent Grouping**: Group related pods by function (AI/ML Stack, Infrastructure, Data Storage) with counts
-3. **Operational Intelligence**: Include health assessments, trend context, and actionable recommendations
-
-**CORE PRINCIPLES:**
-- Use tools to get real data — NEVER fabricate numbers or metric names
-- Be thorough but focused — answer what was asked, nothing more
-- STOP when you have enough data to answer the question well
-
-**vLLM / Model-Serving Metrics:**
-Use `search_metrics_by_category` with category `gpu_ai` to discover exact metric names.
-Key metrics (DO NOT guess names — always search first):
-- Latency: `vllm:e2e_request_latency_seconds`, `vllm:time_to_first_token_seconds`
-- Throughput: `vllm:prompt_tokens_total`, `vllm:generation_tokens_total`, `vllm:num_requests_total`
-- Cache: `vllm:gpu_cache_usage_perc`, `vllm:cpu_cache_usage_perc`
-- GPU: `DCGM_FI_DEV_GPU_TEMP`, `DCGM_FI_DEV_POWER_USAGE`, `DCGM_FI_DEV_GPU_UTIL`
-When the user specifies a time range (e.g., "last 24 hours", "2.3 hours", "past 5 hours"), call `convert_time_to_promql_duration` to get the correct PromQL duration for query time windows.
-
-**Tool Selection Rules (ALWAYS follow these):**
-- Traces/spans/latency → `chat_tempo_tool` (search) or `get_trace_details_tool` (by ID)
-- Metrics/pods/GPU/CPU/memory → **ALWAYS** call `search_metrics` or `search_metrics_by_category` FIRST to discover exact metric names, THEN call `execute_promql` with the discovered names
-- Alerts → `execute_promql` with `ALERTS{{alertstate="firing"}}` metric
-- Logs/errors/pod output → `get_correlated_logs` with namespace and optional pod
-- Correlation/investigation/korrel8r → `korrel8r_get_correlated` with goals and k8s query
-- Pod health/failures → `execute_promql` with `kube_pod_container_status_waiting_reason` and `kube_pod_container_status_terminated_reason`
-- When the user explicitly names a tool (e.g., "use korrel8r"), ALWAYS use that tool
-
-**Your Workflow:**
-1. **Determine** what the user is asking for (trace, metrics, logs, or alerts?)
-2. **Discover** — for metrics questions, ALWAYS call `search_metrics` or `search_metrics_by_category` first
-3. **Execute** the query tool with the discovered metric names
-4. **Answer** with the specific data — DONE!
-
-**CRITICAL: Interpreting Metrics Correctly**
-- **Boolean/Status Metrics**: These use VALUE to indicate state where 1 means TRUE and 0 means FALSE
-  - Always check the metric VALUE not just the labels
-  - Filter for value equals 1 to get actual active states
-- **Gauge Metrics**: Report current state or value at a point in time
-- **Counter Metrics**: Always increasing, use rate function for meaningful analysis
-
-**CRITICAL: Always Group Metrics for Detailed Breakdowns**
-- **Always use grouping by pod and namespace** for resource metrics like CPU memory GPU
-- **Show detailed breakdowns** not just summary totals
-- List top consumers by pod and namespace with actual names
-- Categorize by workload type such as AI/ML versus Infrastructure
-
-**Pod Health & Failure Detection:**
-- `kube_pod_status_phase` only tracks pod-level phases — most failures (CrashLoopBackOff, ImagePullBackOff, OOMKilled) are NOT in "Failed" phase
-- Check container-level metrics: `kube_pod_container_status_waiting_reason` and `kube_pod_container_status_terminated_reason`
-- ALWAYS append `== 1` to kube-state-metrics status queries to exclude stale time series
-
-**PromQL Pod/Container Name Matching:**
-- When querying by pod name, always use regex matching (e.g., `pod=~"name.*"`) instead of exact match (`pod="name"`), because Kubernetes pod names include deployment and replicaset hash suffixes (e.g., `my-app-6d5f8b7c4-x9k2m`).
-- Apply the same regex pattern for container and deployment names that may have generated suffixes.
-
-**Response Format:**
-```
-🤖 [Emoji + Summary Title]
-[Key Numbers & Summary]
-
-[Rich contextual analysis with operational insights]
-
-**Technical Details:**
-- **PromQL Used:** `your_query_here`
-- **Metric Source:** metric_name_here
-- **Data Points:** X samples over Y timeframe
-```
-
-**Critical Rules:**
-- ALWAYS include the PromQL query in technical details
-- ALWAYS use tools to get real data - never make up numbers
-- ALWAYS use EXACT metric names from tool results - never modify or "normalize" metric names
-- When reporting "Metric Source", copy the exact name returned by the tool
-- Provide operational context and health assessments
-- Use emojis and categorization for clarity
-- Make responses informative and actionable
-- Show conversational tool usage: "Let me check..." "I'll also look at..."
-
-Begin by finding the perfect metric for the user's question, then provide comprehensive analysis."""
-
-        return prompt
+        return _BASE_PROMPT_TEMPLATE.format(
+            scope_line=self._format_scope_line(namespace),
+            namespace_directive=self._format_namespace_directive(namespace),
+        )
 
     @abstractmethod
     def chat(
@@ -757,3 +1250,80 @@ Begin by finding the perfect metric for the user's question, then provide compre
         Returns:
             Model's response as a string
         """
+
+    async def achat(
+        self,
+        user_question: str,
+        namespace: Optional[str] = None,
+        progress_callback: Optional[Callable] = None,
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> str:
+        """
+        Async variant of chat() that never blocks the caller's event loop.
+
+        The default runs the synchronous chat() in a worker thread; bots with
+        an async SDK client override this with a native implementation.
+        progress_callback may be a plain function or a coroutine function.
+
+        Returns:
+            Model's response as a string
+        """
+        callback = progress_callback
+        if inspect.iscoroutinefunction(progress_callback):
+            loop = asyncio.get_running_loop()
+
+            def callback(message: str) -> None:
+                asyncio.run_coroutine_threadsafe(progress_callback(message), loop).result()
+
+        return await asyncio.to_thread(
+            self.chat, user_question, namespace, callback, conversation_history
+        )
+
+    async def achat_stream(
+        self,
+        user_question: str,
+        namespace: Optional[str] = None,
+        progress_callback: Optional[Callable] = None,
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream the response text as it is generated.
+
+        The default yields the complete achat() answer once; bots whose SDK
+        streams natively override it to yield text as the model writes it.
+        """
+        yield await self.achat(user_question, namespace, progress_callback, conversation_history)
+
+    async def abatch_chat(
+        self,
+        questions: List[Tuple[str, Optional[str]]],
+        max_concurrency: int = 4,
+    ) -> List[str]:
+        """
+        Answer independent questions concurrently, e.g. one per namespace.
+
+        At most max_concurrency chats run at once so bulk work stays within
+        provider rate limits.
+
+        Args:
+            questions: (user_question, namespace) pairs
+            max_concurrency: Maximum number of chats in flight
+
+        Returns:
+            Answers in question order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def answer(user_question: str, namespace: Optional[str]) -> str:
+            async with semaphore:
+                return await self.achat(user_question, namespace)
+
+        return list(await asyncio.gather(*(answer(q, ns) for q, ns in questions)))
+
+    def batch_chat(
+        self,
+        questions: List[Tuple[str, Optional[str]]],
+        max_concurrency: int = 4,
+    ) -> List[str]:
+        """Synchronous variant of abatch_chat() for callers without an event loop."""
+        return _run_sync(self.abatch_chat(questions, max_concurrency))
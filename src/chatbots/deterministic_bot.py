@@ -38,6 +38,8 @@ class DeterministicChatBot(BaseChatBot):
         conversation_history: Optional[List[Dict[str, str]]] = None
     ) -> str:
         """Chat using deterministic parsing approach."""
+        self._tool_cache.clear()
+
         # Note: Deterministic bot doesn't use conversation history as it's rule-based
         if progress_callback:
             progress_callback("🔍 Analyzing your question...")
@@ -19,6 +19,29 @@ from core.config import is_rag_available
 
 logger = get_python_logger()
 
+# Provider detection patterns: (pattern, must match at start), checked in order
+_PROVIDER_PATTERNS = {
+    "maas": [("maas/", True)],  # Must be at start to avoid false matches
+    "anthropic": [("anthropic/", True), ("claude", False)],
+    "openai": [("openai/", True), ("gpt-", True), ("o1-", True)],
+    "google": [("google/", True), ("gemini", False)]
+}
+
+# External provider -> chatbot class (MAAS endpoints speak the OpenAI API)
+_EXTERNAL_CHATBOTS = {
+    "maas": OpenAIChatBot,
+    "anthropic": AnthropicChatBot,
+    "openai": OpenAIChatBot,
+    "google": GoogleChatBot,
+}
+
+# Local model version -> (chatbot class, capability note, required sizes or None)
+_LLAMA_MODEL_PATTERNS = {
+    "llama.3.1": (LlamaChatBot, "tool calling capable", ["8b", "70b"]),
+    "llama.3.3": (LlamaChatBot, "tool calling capable", ["70b"]),
+    "llama.3.2": (DeterministicChatBot, "67% tool calling accuracy - using deterministic parsing", None),
+}
+
 
 def create_chatbot(
     model_name: str,
@@ -105,16 +128,9 @@ def create_chatbot(
         )
 
     # Detect provider from model name pattern using dict mapping
-    PROVIDER_PATTERNS = {
-        "maas": [("maas/", True)],  # Must be at start to avoid false matches
-        "anthropic": [("anthropic/", True), ("claude", False)],
-        "openai": [("openai/", True), ("gpt-", True), ("o1-", True)],
-        "google": [("google/", True), ("gemini", False)]
-    }
-
     model_lower = model_name.lower()
     provider = None
-    for prov, patterns in PROVIDER_PATTERNS.items():
+    for prov, patterns in _PROVIDER_PATTERNS.items():
         for pattern, is_startswith in patterns:
             if model_lower.startswith(pattern) if is_startswith else (pattern in model_lower):
                 provider = prov
@@ -127,21 +143,11 @@ def create_chatbot(
 
     # Route to appropriate implementation based on provider and capabilities
     if is_external:
-        if provider == "maas":
-            logger.info(f"Creating OpenAIChatBot for MAAS model {model_name}")
-            return OpenAIChatBot(model_name, api_key, api_url, tool_executor)
-        elif provider == "anthropic":
-            logger.info(f"Creating AnthropicChatBot for {model_name}")
-            return AnthropicChatBot(model_name, api_key, tool_executor)
-        elif provider == "openai":
-            logger.info(f"Creating OpenAIChatBot for {model_name}")
-            return OpenAIChatBot(model_name, api_key, api_url, tool_executor)
-        elif provider == "google":
-            logger.info(f"Creating GoogleChatBot for {model_name}")
-            return GoogleChatBot(model_name, api_key, tool_executor)
-        else:
-            logger.warning(f"Unknown external provider {provider}, using OpenAI as fallback")
+        bot_class = _EXTERNAL_CHATBOTS[provider]
+        logger.info(f"Creating {bot_class.__name__} for {provider} model {model_name}")
+        if bot_class is OpenAIChatBot:
             return OpenAIChatBot(model_name, api_key, api_url, tool_executor)
+        return bot_class(model_name, api_key, tool_executor)
     else:
         # Check if RAG (local models) infrastructure is available
         if not is_rag_available():
@@ -152,16 +158,10 @@ def create_chatbot(
                 "Please use an external model (anthropic/claude, openai/gpt, google/gemini) instead."
             )
         
-        # Local models - detect Llama version and create appropriate bot
-        LLAMA_MODEL_PATTERNS = {
-            "llama.3.1": (LlamaChatBot, "tool calling capable", ["8b", "70b"]),
-            "llama.3.3": (LlamaChatBot, "tool calling capable", ["70b"]),
-            "llama.3.2": (DeterministicChatBot, "67% tool calling accuracy - using deterministic parsing", None),
-        }
-        # Local models - check if they support reliable tool calling
+        # Local models - detect Llama version and check if they support reliable tool calling
         model_lower = model_name.lower().replace("-", ".")  # Replace "-" with "."
 
-        for model, patterns in LLAMA_MODEL_PATTERNS.items():
+        for model, patterns in _LLAMA_MODEL_PATTERNS.items():
             bot_class, model_capability, sizes = patterns
             if model in model_lower:
                 if sizes is None or any(size in model_lower for size in sizes):
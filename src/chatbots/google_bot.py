@@ -4,16 +4,36 @@ Google Gemini Chat Bot Implementation
 This module provides Google Gemini-specific implementation using the official SDK.
 """
 
+import hashlib
 import os
 import re
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Tuple
 
 from .base import BaseChatBot
 from chatbots.tool_executor import ToolExecutor
 from common.pylogger import get_python_logger
 
+try:
+    import google.generativeai as genai
+except ImportError:  # pragma: no cover - depends on the runtime image
+    genai = None
+
 logger = get_python_logger()
 
+# JSON schema type -> Gemini proto Type
+_GEMINI_TYPES: Dict[str, Any] = {
+    "string": genai.protos.Type.STRING,
+    "number": genai.protos.Type.NUMBER,
+    "integer": genai.protos.Type.INTEGER,
+    "boolean": genai.protos.Type.BOOLEAN,
+    "array": genai.protos.Type.ARRAY,
+    "object": genai.protos.Type.OBJECT,
+} if genai is not None else {}
+
+# GenerativeModel objects kept per bot; one per (model, system prompt) pair,
+# and the system prompt varies with the namespace
+_MAX_CACHED_MODELS = 16
+
 
 class GoogleChatBot(BaseChatBot):
     """Google Gemini implementation with native tool calling."""
@@ -33,24 +53,24 @@ class GoogleChatBot(BaseChatBot):
         tool_executor: ToolExecutor = None):
         super().__init__(model_name, api_key, tool_executor)
 
-        # Import Google SDK and configure
+        # Google SDK is imported once at module load
         # Track SDK import status separately from configuration
-        self._sdk_import_failed = False
-        try:
-            import google.generativeai as genai
-            self.genai = genai
+        self._sdk_import_failed = genai is None
+        self.genai = genai
+        if genai is not None:
             # Only configure if API key is provided
             if self.api_key:
                 genai.configure(api_key=self.api_key)
                 self.configured = True
             else:
                 self.configured = False
-        except ImportError:
+        else:
             logger.error("Google Generative AI SDK not installed. Install with: pip install google-generativeai")
-            self._sdk_import_failed = True
-            self.genai = None
             self.configured = False
 
+        # (model name, system prompt digest) -> (tool definitions, GenerativeModel)
+        self._model_cache: Dict[Tuple[str, bytes], Tuple[Any, Any]] = {}
+
     def _get_model_specific_instructions(self) -> str:
         """Gemini-specific instructions for optimal performance."""
         return """---
@@ -72,15 +92,7 @@ class GoogleChatBot(BaseChatBot):
         if not self.genai:
             return None
 
-        type_mapping = {
-            "string": self.genai.protos.Type.STRING,
-            "number": self.genai.protos.Type.NUMBER,
-            "integer": self.genai.protos.Type.INTEGER,
-            "boolean": self.genai.protos.Type.BOOLEAN,
-            "array": self.genai.protos.Type.ARRAY,
-            "object": self.genai.protos.Type.OBJECT
-        }
-        return type_mapping.get(json_type, self.genai.protos.Type.STRING)
+        return _GEMINI_TYPES.get(json_type, _GEMINI_TYPES.get("string"))
 
     def _convert_schema_to_gemini(self, schema: Dict[str, Any]):
         """Recursively convert JSON schema to Gemini proto Schema.
@@ -173,29 +185,102 @@ class GoogleChatBot(BaseChatBot):
 
         return False
 
+    def _get_generative_model(self, model_name: str, system_prompt: str) -> Any:
+        """Return a GenerativeModel for this model and system prompt, with the current tools.
+
+        Models are reused across chat() calls and rebuilt only when the MCP
+        tool definitions change. Chat sessions are not shared; callers start
+        a fresh one per question.
+        """
+        defs = self._get_tool_defs()
+        key = (model_name, hashlib.sha256(system_prompt.encode()).digest())
+
+        cached = self._model_cache.get(key)
+        if cached is not None and cached[0] is defs:
+            return cached[1]
+
+        model = self.genai.GenerativeModel(
+            model_name=model_name,
+            tools=self._convert_tools_to_gemini_format(),
+            system_instruction=system_prompt
+        )
+        self._model_cache.pop(key, None)
+        if len(self._model_cache) >= _MAX_CACHED_MODELS:
+            self._model_cache.pop(next(iter(self._model_cache)))
+        self._model_cache[key] = (defs, model)
+        return model
+
     def _convert_tools_to_gemini_format(self) -> List:
         """Convert MCP tools to Google Gemini SDK format."""
         if not self.genai:
             return []
 
-        tools = self._get_mcp_tools()
-        sdk_tools = []
-
-        for tool in tools:
-            parameters = tool.get("input_schema", tool.get("parameters", {}))
-
-            # Convert parameter schema recursively
-            parameter_schema = self._convert_schema_to_gemini(parameters)
-
-            sdk_tools.append(
-                self.genai.protos.FunctionDeclaration(
-                    name=tool["name"],
-                    description=tool["description"],
-                    parameters=parameter_schema
+        return self._get_sdk_tools("gemini", self._convert_tool_to_gemini)
+
+    def _convert_tool_to_gemini(self, tool: Dict[str, Any]):
+        """Convert one MCP tool definition to a Gemini FunctionDeclaration."""
+        parameters = tool.get("input_schema", tool.get("parameters", {}))
+
+        # Convert parameter schema recursively
+        parameter_schema = self._convert_schema_to_gemini(parameters)
+
+        return self.genai.protos.FunctionDeclaration(
+            name=tool["name"],
+            description=tool["description"],
+            parameters=parameter_schema
+        )
+
+    @staticmethod
+    def _split_parts(parts: List[Any]) -> Tuple[List[Any], str]:
+        """Split Gemini response parts into their function calls and concatenated text."""
+        function_calls = []
+        texts = []
+        for part in parts:
+            function_call = getattr(part, 'function_call', None)
+            if function_call:
+                function_calls.append(function_call)
+            else:
+                text = getattr(part, 'text', None)
+                if text:
+                    texts.append(text)
+        return function_calls, "".join(texts)
+
+    def _to_tool_calls(self, function_calls: List[Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Convert Gemini function calls to (tool_name, tool_args) pairs."""
+        return [
+            # Convert proto args to native Python types (dict with proto values -> dict with native values)
+            (function_call.name, self._convert_proto_to_native(dict(function_call.args)))
+            for function_call in function_calls
+        ]
+
+    def _run_function_calls(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        namespace: Optional[str],
+        progress_callback: Optional[Callable],
+        repeated: bool = False,
+    ) -> List[Any]:
+        """Execute one turn's tool calls and build their Gemini function response parts.
+
+        A repeated turn (see _check_repeated_calls) is answered with reminders
+        instead of being executed again.
+        """
+        if repeated:
+            results = self._repeated_call_results(calls)
+        else:
+            # Run this turn's tools concurrently (truncation and logging handled in base class)
+            results = self._get_tool_results(calls, namespace, progress_callback)
+
+        # Create function responses for Gemini SDK
+        return [
+            self.genai.protos.Part(
+                function_response=self.genai.protos.FunctionResponse(
+                    name=tool_name,
+                    response={"content": tool_result}
                 )
             )
-
-        return sdk_tools
+            for (tool_name, _), tool_result in zip(calls, results)
+        ]
 
     def chat(
         self,
@@ -205,12 +290,19 @@ class GoogleChatBot(BaseChatBot):
         conversation_history: Optional[List[Dict[str, str]]] = None
     ) -> str:
         """Chat with Google Gemini using tool calling."""
+        self._tool_cache.clear()
+
         if not self.configured:
             if self._sdk_import_failed:
                 return "Error: Google Generative AI SDK not installed. Please install it with: pip install google-generativeai"
             else:
                 return f"Error: API key required for Google model {self.model_name}. Please configure an API key in Settings."
 
+        cache_key = self._response_cache_key(user_question, namespace, conversation_history)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Create system prompt
             system_prompt = self._create_system_prompt(namespace)
@@ -220,20 +312,13 @@ class GoogleChatBot(BaseChatBot):
 
             logger.info(f"🎯 GoogleChatBot.chat() - Using Google Gemini API with model: {model_name} (from {self.model_name})")
 
-            # Convert tools to Gemini format
-            gemini_tools = self._convert_tools_to_gemini_format()
+            # Reuse the model with tools and system instruction across questions
+            model = self._get_generative_model(model_name, system_prompt)
 
             # Extract tool names for text-based tool call detection
-            tool_names = [t.name for t in gemini_tools]
+            tool_names = [t.name for t in self._convert_tools_to_gemini_format()]
             text_tool_call_retried = False
 
-            # Initialize the model with tools and system instruction
-            model = self.genai.GenerativeModel(
-                model_name=model_name,
-                tools=gemini_tools,
-                system_instruction=system_prompt
-            )
-
             # Build history for chat session
             gemini_history = []
             if conversation_history:
@@ -249,39 +334,27 @@ class GoogleChatBot(BaseChatBot):
             # Start a chat session with history
             chat = model.start_chat(history=gemini_history, enable_automatic_function_calling=False)
 
-            # Send initial message with just the user question
-            initial_message = user_question
+            # The first turn sends just the user question; later turns send
+            # the function responses of the previous turn
+            message: Any = user_question
+            generation_config = self.genai.GenerationConfig(temperature=0)
 
             # Iterative tool calling loop
             max_iterations = 10  # Reduced from 30 to prevent long waits
             iteration = 0
-            function_responses = []  # Initialize outside loop
             consecutive_tool_tracker = {"name": None, "count": 0}
+            repeat_tracker = {"seen": set(), "count": 0, "repeated": False}
 
             while iteration < max_iterations:
                 iteration += 1
-                logger.info(f"🤖 Google Gemini tool calling iteration {iteration}")
+                logger.info("🤖 Google Gemini tool calling iteration %s", iteration)
 
                 if progress_callback:
                     progress_callback(f"🤖 Thinking... (iteration {iteration})")
 
                 # Send message to model
                 try:
-                    if iteration == 1:
-                        # First iteration - send the initial question
-                        response = chat.send_message(
-                            initial_message,
-                            generation_config=self.genai.GenerationConfig(temperature=0)
-                        )
-                    else:
-                        # Subsequent iterations - send function responses
-                        if not function_responses:
-                            logger.error("No function responses to send but not first iteration")
-                            break
-                        response = chat.send_message(
-                            function_responses,
-                            generation_config=self.genai.GenerationConfig(temperature=0)
-                        )
+                    response = chat.send_message(message, generation_config=generation_config)
                 except Exception as e:
                     logger.error(f"Error sending message to Gemini: {e}")
                     return f"Error communicating with Gemini: {str(e)}"
@@ -303,61 +376,34 @@ class GoogleChatBot(BaseChatBot):
                 parts = response.candidates[0].content.parts
 
                 # Check for function calls
-                has_function_calls = any(hasattr(part, 'function_call') and part.function_call for part in parts)
+                function_calls, final_response = self._split_parts(parts)
 
-                if has_function_calls:
-                    tool_count = sum(1 for p in parts if hasattr(p, 'function_call') and p.function_call)
-                    logger.info(f"🤖 Google Gemini requesting {tool_count} tool(s)")
+                if function_calls:
+                    logger.info("🤖 Google Gemini requesting %s tool(s)", len(function_calls))
 
                     # Collect tool names for iteration-level loop detection
-                    tool_names_this_iteration = {
-                        p.function_call.name for p in parts
-                        if hasattr(p, 'function_call') and p.function_call
-                    }
+                    tool_names_this_iteration = {function_call.name for function_call in function_calls}
+
+                    calls = self._to_tool_calls(function_calls)
 
-                    if self._check_tool_loop(tool_names_this_iteration, consecutive_tool_tracker):
+                    if (self._check_tool_loop(tool_names_this_iteration, consecutive_tool_tracker)
+                            or self._check_repeated_calls(calls, repeat_tracker)):
                         return (
                             "I got stuck in a loop calling the same tool repeatedly. "
                             "Please try rephrasing your question or being more specific."
                         )
 
                     # Build function responses for next iteration
-                    function_responses = []
-                    for part in parts:
-                        if hasattr(part, 'function_call') and part.function_call:
-                            func_call = part.function_call
-                            tool_name = func_call.name
-
-                            # Convert proto args to native Python types (dict with proto values -> dict with native values)
-                            tool_args = self._convert_proto_to_native(dict(func_call.args))
-
-                            if progress_callback:
-                                progress_callback(f"🔧 Using tool: {tool_name}")
-
-                            # Get tool result with automatic truncation (logging handled in base class)
-                            tool_result = self._get_tool_result(tool_name, tool_args, namespace=namespace)
-
-                            # Create function response for Gemini SDK
-                            function_responses.append(
-                                self.genai.protos.Part(
-                                    function_response=self.genai.protos.FunctionResponse(
-                                        name=tool_name,
-                                        response={"content": tool_result}
-                                    )
-                                )
-                            )
+                    message = self._run_function_calls(
+                        calls, namespace, progress_callback, repeat_tracker["repeated"]
+                    )
 
-                    logger.info(f"Prepared {len(function_responses)} function response(s) for next iteration")
+                    logger.info("Prepared %s function response(s) for next iteration", len(message))
                     # Continue loop to send function responses
                     continue
 
                 else:
-                    # Model is done, extract final text response
-                    final_response = ""
-                    for part in parts:
-                        if hasattr(part, 'text') and part.text:
-                            final_response += part.text
-
+                    # Model is done, final_response holds its text
                     if not final_response:
                         logger.warning("Model returned parts but no text content")
                         logger.warning(f"Parts: {parts}")
@@ -372,64 +418,40 @@ class GoogleChatBot(BaseChatBot):
                                 "You described a tool call in text instead of actually calling the function. "
                                 "Please use the function calling API to execute the tool. "
                                 "Do not describe the call — invoke it directly.",
-                                generation_config=self.genai.GenerationConfig(temperature=0)
+                                generation_config=generation_config
                             )
 
                             # Check if the nudge produced proper function calls
                             if (nudge_response.candidates
                                     and nudge_response.candidates[0].content
                                     and nudge_response.candidates[0].content.parts):
-                                nudge_parts = nudge_response.candidates[0].content.parts
-                                has_nudge_function_calls = any(
-                                    hasattr(p, 'function_call') and p.function_call for p in nudge_parts
+                                nudge_calls, nudge_text = self._split_parts(
+                                    nudge_response.candidates[0].content.parts
                                 )
-                                if has_nudge_function_calls:
+                                if nudge_calls:
                                     # Process function calls from nudge response
-                                    parts = nudge_parts
-                                    tool_names_nudge = {
-                                        p.function_call.name for p in parts
-                                        if hasattr(p, 'function_call') and p.function_call
-                                    }
-                                    if self._check_tool_loop(tool_names_nudge, consecutive_tool_tracker):
+                                    tool_names_nudge = {function_call.name for function_call in nudge_calls}
+                                    calls = self._to_tool_calls(nudge_calls)
+                                    if (self._check_tool_loop(tool_names_nudge, consecutive_tool_tracker)
+                                            or self._check_repeated_calls(calls, repeat_tracker)):
                                         return (
                                             "I got stuck in a loop calling the same tool repeatedly. "
                                             "Please try rephrasing your question or being more specific."
                                         )
-                                    function_responses = []
-                                    for part in parts:
-                                        if hasattr(part, 'function_call') and part.function_call:
-                                            func_call = part.function_call
-                                            tool_name = func_call.name
-                                            tool_args = self._convert_proto_to_native(dict(func_call.args))
-
-                                            if progress_callback:
-                                                progress_callback(f"🔧 Using tool: {tool_name}")
-
-                                            tool_result = self._get_tool_result(tool_name, tool_args, namespace=namespace)
-
-                                            function_responses.append(
-                                                self.genai.protos.Part(
-                                                    function_response=self.genai.protos.FunctionResponse(
-                                                        name=tool_name,
-                                                        response={"content": tool_result}
-                                                    )
-                                                )
-                                            )
-                                    logger.info(f"Nudge successful: {len(function_responses)} function call(s) recovered")
+                                    message = self._run_function_calls(
+                                        calls, namespace, progress_callback, repeat_tracker["repeated"]
+                                    )
+                                    logger.info("Nudge successful: %s function call(s) recovered", len(message))
                                     continue
                                 else:
                                     # Nudge didn't produce function calls either — return whatever text it gave
-                                    nudge_text = ""
-                                    for p in nudge_parts:
-                                        if hasattr(p, 'text') and p.text:
-                                            nudge_text += p.text
                                     if nudge_text:
                                         final_response = nudge_text
                         except Exception as e:
                             logger.warning(f"Nudge retry failed: {e}. Returning original response.")
 
-                    logger.info(f"Google Gemini tool calling completed in {iteration} iterations")
-                    return final_response
+                    logger.info("Google Gemini tool calling completed in %s iterations", iteration)
+                    return self._cache_response(cache_key, final_response)
 
             # Hit max iterations
             logger.warning(f"Hit max iterations ({max_iterations})")
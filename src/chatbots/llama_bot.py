@@ -6,6 +6,7 @@ This module provides Llama-specific implementation using LlamaStack's OpenAI-com
 
 import json
 import re
+import threading
 from typing import Optional, List, Dict, Any, Callable
 
 from openai import OpenAI
@@ -13,10 +14,70 @@ from openai import OpenAI
 from .base import BaseChatBot
 from chatbots.tool_executor import ToolExecutor
 from core.config import LLAMA_STACK_URL, LLM_API_TOKEN, LLM_TIMEOUT_SECONDS
+from common import json_utils
 from common.pylogger import get_python_logger
 
 logger = get_python_logger()
 
+# One LlamaStack client per process. Its endpoint and token are fixed by
+# config, the SDK client is thread-safe, and sharing it keeps the connection
+# pool warm across bot instances.
+_client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> OpenAI:
+    """Return the shared LlamaStack client, creating it on first use."""
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenAI(
+                    base_url=LLAMA_STACK_URL.removesuffix("/chat/completions"),
+                    api_key=LLM_API_TOKEN or "dummy"
+                )
+    return _client
+
+# Compact system prompt for Llama's constrained context window. Filled in
+# with str.format(), so literal braces are doubled.
+_LLAMA_PROMPT_TEMPLATE = """You are an expert Kubernetes and Prometheus observability assistant.
+
+**Scope:** {scope_line}
+{namespace_directive}
+**CRITICAL — Tool Calling:**
+- ALWAYS call tools via the function calling API to get real data.
+- NEVER fabricate data or make up numbers.
+- NEVER output tool calls as JSON text — use the function calling mechanism.
+
+**Tool Selection:**
+- Metrics/pods/GPU/CPU/memory → execute_promql (primary), search_metrics, suggest_queries
+- Traces/spans/latency → chat_tempo_tool, query_tempo_tool, get_trace_details_tool
+- Logs/errors → get_correlated_logs
+- Alert investigation → execute_promql with ALERTS metric, then korrel8r_get_correlated
+- Correlation/investigation/korrel8r → korrel8r_get_correlated with:
+  goals=["alert:alert","trace:span","log:application","log:infrastructure"]
+  query="k8s:Pod:{{\\"namespace\\":\\"NS\\",\\"name\\":\\"POD_NAME\\"}}"
+  For namespace-wide: query="k8s:Namespace:{{\\"name\\":\\"NS\\"}}"
+
+**PromQL Patterns:**
+- CPU: sum(rate(container_cpu_usage_seconds_total[5m])) by (pod, namespace)
+- Memory: sum(container_memory_usage_bytes) by (pod, namespace)
+- GPU temp: avg(DCGM_FI_DEV_GPU_TEMP) or avg(habanalabs_temperature_onchip)
+- GPU util: avg(DCGM_FI_DEV_GPU_UTIL) or avg(habanalabs_utilization)
+- GPU power: avg(DCGM_FI_DEV_POWER_USAGE) or avg(habanalabs_power_mW) / 1000
+- Pod status: kube_pod_status_phase{{phase="Running"}} == 1
+- Failing pods: kube_pod_container_status_waiting_reason{{reason=~"CrashLoopBackOff|ImagePullBackOff"}} == 1
+- Always use aggregation (sum/avg/max) and group by (pod, namespace)
+- Use rate() for counters, append == 1 for boolean metrics
+- Use regex for pod names: pod=~"name.*" (pods have hash suffixes)
+- When the user specifies a time range, call convert_time_to_promql_duration to get the correct PromQL duration for query time windows
+
+**Response Format:**
+- Use markdown (bold, lists) — no code block wrappers
+- Include PromQL used, metric source, and data points in a Technical Details section
+- Provide operational context and actionable insights"""
+
 
 class LlamaChatBot(BaseChatBot):
     """Llama implementation using LlamaStack with OpenAI-compatible API."""
@@ -29,6 +90,10 @@ class LlamaChatBot(BaseChatBot):
         """Llama 3.1 supports 128K token context - 8K chars is reasonable."""
         return 8000
 
+    def _get_token_encoding_name(self) -> Optional[str]:
+        """Closest public tiktoken encoding to the Llama 3 tokenizer."""
+        return "cl100k_base"
+
     # Tools that Llama should have access to.
     #
     # Selection criteria — include a tool here if it:
@@ -93,7 +158,7 @@ class LlamaChatBot(BaseChatBot):
         from core.llm_client import get_llamastack_model_id_candidates
 
         candidates = get_llamastack_model_id_candidates(self.model_name)
-        logger.debug(f"LlamaStack model ID candidates: {candidates}")
+        logger.debug("LlamaStack model ID candidates: %s", candidates)
         return candidates if candidates else [self.model_name]
 
     def _extract_model_name(self) -> str:
@@ -114,10 +179,7 @@ class LlamaChatBot(BaseChatBot):
     ):
         super().__init__(model_name, api_key, tool_executor)
 
-        self.client = OpenAI(
-            base_url=LLAMA_STACK_URL.removesuffix("/chat/completions"),
-            api_key=LLM_API_TOKEN or "dummy"
-        )
+        self.client = _get_client()
 
     def _get_model_specific_instructions(self) -> str:
         """No separate model-specific block — merged into _get_base_prompt."""
@@ -125,45 +187,10 @@ class LlamaChatBot(BaseChatBot):
 
     def _get_base_prompt(self, namespace=None) -> str:
         """Compact system prompt for Llama's constrained context window."""
-        scope = self._format_scope_line(namespace)
-        ns_directive = self._format_namespace_directive(namespace)
-
-        return f"""You are an expert Kubernetes and Prometheus observability assistant.
-
-**Scope:** {scope}
-{ns_directive}
-**CRITICAL — Tool Calling:**
-- ALWAYS call tools via the function calling API to get real data.
-- NEVER fabricate data or make up numbers.
-- NEVER output tool calls as JSON text — use the function calling mechanism.
-
-**Tool Selection:**
-- Metrics/pods/GPU/CPU/memory → execute_promql (primary), search_metrics, suggest_queries
-- Traces/spans/latency → chat_tempo_tool, query_tempo_tool, get_trace_details_tool
-- Logs/errors → get_correlated_logs
-- Alert investigation → execute_promql with ALERTS metric, then korrel8r_get_correlated
-- Correlation/investigation/korrel8r → korrel8r_get_correlated with:
-  goals=["alert:alert","trace:span","log:application","log:infrastructure"]
-  query="k8s:Pod:{{\\"namespace\\":\\"NS\\",\\"name\\":\\"POD_NAME\\"}}"
-  For namespace-wide: query="k8s:Namespace:{{\\"name\\":\\"NS\\"}}"
-
-**PromQL Patterns:**
-- CPU: sum(rate(container_cpu_usage_seconds_total[5m])) by (pod, namespace)
-- Memory: sum(container_memory_usage_bytes) by (pod, namespace)
-- GPU temp: avg(DCGM_FI_DEV_GPU_TEMP) or avg(habanalabs_temperature_onchip)
-- GPU util: avg(DCGM_FI_DEV_GPU_UTIL) or avg(habanalabs_utilization)
-- GPU power: avg(DCGM_FI_DEV_POWER_USAGE) or avg(habanalabs_power_mW) / 1000
-- Pod status: kube_pod_status_phase{{phase="Running"}} == 1
-- Failing pods: kube_pod_container_status_waiting_reason{{reason=~"CrashLoopBackOff|ImagePullBackOff"}} == 1
-- Always use aggregation (sum/avg/max) and group by (pod, namespace)
-- Use rate() for counters, append == 1 for boolean metrics
-- Use regex for pod names: pod=~"name.*" (pods have hash suffixes)
-- When the user specifies a time range, call convert_time_to_promql_duration to get the correct PromQL duration for query time windows
-
-**Response Format:**
-- Use markdown (bold, lists) — no code block wrappers
-- Include PromQL used, metric source, and data points in a Technical Details section
-- Provide operational context and actionable insights"""
+        return _LLAMA_PROMPT_TEMPLATE.format(
+            scope_line=self._format_scope_line(namespace),
+            namespace_directive=self._format_namespace_directive(namespace),
+        )
 
     # Query category patterns → specific tool + usage hint for the nudge message.
     # Order matters: first match wins. More specific patterns come first.
@@ -386,19 +413,15 @@ class LlamaChatBot(BaseChatBot):
         return False
 
     def _convert_tools_to_openai_format(self) -> List[Dict[str, Any]]:
-        """Convert MCP tools to OpenAI function calling format."""
-        tools = self._get_mcp_tools()
-        openai_tools = []
-        for tool in tools:
-            openai_tools.append({
-                "type": "function",
-                "function": {
-                    "name": tool["name"],
-                    "description": tool["description"],
-                    "parameters": tool["input_schema"]
-                }
-            })
-        return openai_tools
+        """Convert MCP tools to OpenAI function calling format (cached, read-only)."""
+        return self._get_sdk_tools("openai", lambda tool: {
+            "type": "function",
+            "function": {
+                "name": tool["name"],
+                "description": tool["description"],
+                "parameters": tool["input_schema"]
+            }
+        })
 
     def chat(
         self,
@@ -408,6 +431,13 @@ class LlamaChatBot(BaseChatBot):
         conversation_history: Optional[List[Dict[str, str]]] = None
     ) -> str:
         """Chat with Llama using LlamaStack OpenAI-compatible API."""
+        self._tool_cache.clear()
+
+        cache_key = self._response_cache_key(user_question, namespace, conversation_history)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Create system prompt
             system_prompt = self._create_system_prompt(namespace)
@@ -440,6 +470,7 @@ class LlamaChatBot(BaseChatBot):
             has_called_tools = False
             tool_choice = "auto"
             consecutive_tool_tracker = {"name": None, "count": 0}
+            repeat_tracker = {"seen": set(), "count": 0, "repeated": False}
 
             # Track which model ID worked (for subsequent calls)
             working_model_id = None
@@ -447,17 +478,20 @@ class LlamaChatBot(BaseChatBot):
 
             while iteration < max_iterations:
                 iteration += 1
-                logger.info(f"🤖 LlamaStack tool calling iteration {iteration}")
+                logger.info("🤖 LlamaStack tool calling iteration %s", iteration)
 
                 if progress_callback:
                     progress_callback(f"🤖 Thinking... (iteration {iteration})")
 
+                # Keep the request within the model's input budget
+                messages = self._fit_messages_to_budget(messages, keep_system_prompt=True)
+
                 # Try candidate model IDs until one succeeds (only on first iteration)
                 if working_model_id is None:
                     response = None
                     for candidate_id in model_candidates:
                         try:
-                            logger.debug(f"Trying model ID: {candidate_id}")
+                            logger.debug("Trying model ID: %s", candidate_id)
                             response = self.client.chat.completions.create(
                                 model=candidate_id,
                                 messages=messages,
@@ -468,13 +502,13 @@ class LlamaChatBot(BaseChatBot):
                             )
                             # Success - remember this model ID for subsequent calls
                             working_model_id = candidate_id
-                            logger.info(f"✅ Using llama-stack model ID: {working_model_id}")
+                            logger.info("✅ Using llama-stack model ID: %s", working_model_id)
                             break
                         except Exception as e:
                             error_msg = str(e).lower()
                             # Only retry on "model not found" errors
                             if "not found" in error_msg or "404" in error_msg:
-                                logger.debug(f"Model ID '{candidate_id}' not found, trying next candidate")
+                                logger.debug("Model ID '%s' not found, trying next candidate", candidate_id)
                                 last_model_error = e
                                 continue
                             else:
@@ -537,49 +571,47 @@ class LlamaChatBot(BaseChatBot):
                 # when tool_choice forces a specific function.
                 if message.tool_calls:
                     has_called_tools = True
-                    logger.info(f"🤖 LlamaStack requesting {len(message.tool_calls)} tool(s)")
+                    logger.info("🤖 LlamaStack requesting %s tool(s)", len(message.tool_calls))
 
                     # Collect tool names for iteration-level loop detection
                     tool_names_this_iteration = {
                         tc.function.name for tc in message.tool_calls
                     }
 
-                    if self._check_tool_loop(tool_names_this_iteration, consecutive_tool_tracker):
-                        return (
-                            "I got stuck in a loop calling the same tool repeatedly. "
-                            "Please try rephrasing your question or being more specific."
-                        )
-
-                    tool_results = []
+                    tool_calls = []
                     for tool_call in message.tool_calls:
-                        tool_name = tool_call.function.name
-                        tool_args_str = tool_call.function.arguments
-                        tool_id = tool_call.id
-
                         # Parse arguments
                         try:
-                            tool_args = json.loads(tool_args_str)
-                        except json.JSONDecodeError:
+                            tool_args = json_utils.loads(tool_call.function.arguments)
+                        except json_utils.JSONDecodeError:
                             tool_args = {}
+                        tool_calls.append((tool_call.function.name, tool_args))
 
-                        if progress_callback:
-                            progress_callback(f"🔧 Using tool: {tool_name}")
+                    if (self._check_tool_loop(tool_names_this_iteration, consecutive_tool_tracker)
+                            or self._check_repeated_calls(tool_calls, repeat_tracker)):
+                        return (
+                            "I got stuck in a loop calling the same tool repeatedly. "
+                            "Please try rephrasing your question or being more specific."
+                        )
 
-                        # Get tool result with automatic truncation (logging handled in base class)
-                        tool_result = self._get_tool_result(tool_name, tool_args, namespace=namespace)
+                    # Run this turn's tools concurrently (truncation and logging handled in base class)
+                    if repeat_tracker["repeated"]:
+                        results = self._repeated_call_results(tool_calls)
+                    else:
+                        results = self._get_tool_results(tool_calls, namespace, progress_callback)
 
-                        tool_results.append({
+                    tool_results = [
+                        {
                             "role": "tool",
-                            "tool_call_id": tool_id,
+                            "tool_call_id": tool_call.id,
                             "content": tool_result
-                        })
+                        }
+                        for tool_call, tool_result in zip(message.tool_calls, results)
+                    ]
 
-                    # Add tool results to conversation
+                    # Add tool results to conversation (trimmed to budget before the next call)
                     messages.extend(tool_results)
 
-                    # Truncate conversation safely (preserves tool-call/result pairs)
-                    messages = self._truncate_messages(messages, keep_system_prompt=True)
-
                     # Continue loop
                     continue
 
@@ -646,8 +678,8 @@ class LlamaChatBot(BaseChatBot):
                             "specific about what information you need."
                         )
 
-                    logger.info(f"LlamaStack tool calling completed in {iteration} iterations")
-                    return final_response
+                    logger.info("LlamaStack tool calling completed in %s iterations", iteration)
+                    return self._cache_response(cache_key, final_response)
 
             # Hit max iterations
             logger.warning(f"Hit max iterations ({max_iterations})")
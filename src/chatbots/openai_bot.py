@@ -5,15 +5,43 @@ This module provides OpenAI GPT-specific implementation using the official SDK.
 """
 
 import os
-import json
-from typing import Optional, List, Dict, Any, Callable
+import re
+from typing import Optional, List, Dict, Any, AsyncIterator, Callable, Tuple
 
-from .base import BaseChatBot
+from .base import BaseChatBot, _report_progress, _run_sync
 from chatbots.tool_executor import ToolExecutor
+from common import json_utils
 from common.pylogger import get_python_logger
 
+try:
+    import openai
+except ImportError:  # pragma: no cover - depends on the runtime image
+    openai = None
+
 logger = get_python_logger()
 
+# A response wrapped as a whole in one markdown code fence; the opening line
+# may carry an info string such as "markdown"
+_CODE_FENCE_RE = re.compile(r"```[^\n]*\n(.*?)\n?[ \t]*```", re.DOTALL)
+
+# (config snapshot, model name -> base URL) resolved against that snapshot
+_base_url_cache: Tuple[Optional[Dict[str, Any]], Dict[str, Optional[str]]] = (None, {})
+# Model names come from callers, so misses (names absent from the config) are
+# only remembered up to this many per snapshot; hits are bounded by the config
+_MAX_CACHED_MISSES = 64
+
+
+def _base_url_from_model_config(model_config: Dict[str, Any]) -> Optional[str]:
+    api_url = model_config.get("apiUrl", "")
+
+    if api_url:
+        # Extract base URL by removing /chat/completions suffix
+        for suffix in ["/chat/completions", "/v1/chat/completions"]:
+            if api_url.endswith(suffix):
+                return api_url[:-len(suffix)]
+        return api_url  # Return as-is if no known suffix
+    return None
+
 
 class OpenAIChatBot(BaseChatBot):
     """OpenAI GPT implementation with native tool calling."""
@@ -26,21 +54,40 @@ class OpenAIChatBot(BaseChatBot):
         """GPT-4 supports 128K token context - 10K chars is reasonable."""
         return 10000
 
+    def _get_token_encoding_name(self) -> Optional[str]:
+        """GPT-4o family tokenizer."""
+        return "o200k_base"
+
+    def _get_context_window_tokens(self) -> int:
+        """GPT-4o family context window."""
+        return 128000
+
     def _get_base_url_from_config(self) -> Optional[str]:
         """Get custom base URL from model config (for MAAS, custom endpoints)."""
+        global _base_url_cache
         try:
             from core.model_config_manager import get_model_config
             config = get_model_config()
-            model_config = config.get(self.model_name, {})
-            api_url = model_config.get("apiUrl", "")
-
-            if api_url:
-                # Extract base URL by removing /chat/completions suffix
-                for suffix in ["/chat/completions", "/v1/chat/completions"]:
-                    if api_url.endswith(suffix):
-                        return api_url[:-len(suffix)]
-                return api_url  # Return as-is if no known suffix
-            return None
+
+            # The config snapshot is replaced wholesale on every refresh, so
+            # identity tells us whether previously resolved URLs still apply
+            cached_config, base_urls = _base_url_cache
+            if cached_config is not config:
+                base_urls = {}
+                _base_url_cache = (config, base_urls)
+            if self.model_name in base_urls:
+                return base_urls[self.model_name]
+
+            model_config = config.get(self.model_name)
+            if model_config is None:
+                # Hits are bounded by the config itself; only misses need a cap
+                if len(base_urls) < _MAX_CACHED_MISSES:
+                    base_urls[self.model_name] = None
+                    logger.debug(f"Model {self.model_name} not in model config, using default endpoint")
+                return None
+
+            base_urls[self.model_name] = _base_url_from_model_config(model_config)
+            return base_urls[self.model_name]
         except Exception as e:
             logger.warning(f"Could not get base_url from config: {e}")
             return None
@@ -53,10 +100,9 @@ class OpenAIChatBot(BaseChatBot):
         tool_executor: ToolExecutor = None):
         super().__init__(model_name, api_key, tool_executor)
 
-        # Import OpenAI SDK
-        self._sdk_import_failed = False
-        try:
-            from openai import OpenAI
+        # OpenAI SDK is imported once at module load
+        self._sdk_import_failed = openai is None
+        if openai is not None:
             # Only create client if API key is provided
             # This matches the pattern used by other providers
             if self.api_key:
@@ -78,14 +124,13 @@ class OpenAIChatBot(BaseChatBot):
                         logger.info(f"Using custom base_url from config for {self.model_name}: {base_url}")
 
                 if base_url:
-                    self.client = OpenAI(api_key=self.api_key, base_url=base_url)
+                    self.client = openai.AsyncOpenAI(api_key=self.api_key, base_url=base_url)
                 else:
-                    self.client = OpenAI(api_key=self.api_key)
+                    self.client = openai.AsyncOpenAI(api_key=self.api_key)
             else:
                 self.client = None
-        except ImportError:
+        else:
             logger.error("OpenAI SDK not installed. Install with: pip install openai")
-            self._sdk_import_failed = True
             self.client = None
 
     def _get_model_specific_instructions(self) -> str:
@@ -119,19 +164,15 @@ Wrong flow (DO NOT DO THIS):
 - Always execute your queries to provide real data"""
 
     def _convert_tools_to_openai_format(self) -> List[Dict[str, Any]]:
-        """Convert MCP tools to OpenAI function calling format."""
-        tools = self._get_mcp_tools()
-        openai_tools = []
-        for tool in tools:
-            openai_tools.append({
-                "type": "function",
-                "function": {
-                    "name": tool["name"],
-                    "description": tool["description"],
-                    "parameters": tool["input_schema"]
-                }
-            })
-        return openai_tools
+        """Convert MCP tools to OpenAI function calling format (cached, read-only)."""
+        return self._get_sdk_tools("openai", lambda tool: {
+            "type": "function",
+            "function": {
+                "name": tool["name"],
+                "description": tool["description"],
+                "parameters": tool["input_schema"]
+            }
+        })
 
     def chat(
         self,
@@ -141,13 +182,129 @@ Wrong flow (DO NOT DO THIS):
         conversation_history: Optional[List[Dict[str, str]]] = None
     ) -> str:
         """Chat with OpenAI GPT using tool calling."""
+        return _run_sync(self.achat(user_question, namespace, progress_callback, conversation_history))
+
+    async def achat(
+        self,
+        user_question: str,
+        namespace: Optional[str] = None,
+        progress_callback: Optional[Callable] = None,
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> str:
+        """Chat with OpenAI GPT using tool calling on the async client."""
+        parts = [
+            part async for part in self._run_chat(
+                user_question, namespace, progress_callback, conversation_history, stream=False
+            )
+        ]
+        return "".join(parts)
+
+    async def achat_stream(
+        self,
+        user_question: str,
+        namespace: Optional[str] = None,
+        progress_callback: Optional[Callable] = None,
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> AsyncIterator[str]:
+        """Chat like achat(), yielding response text as the model generates it.
+
+        Text the model writes alongside tool calls ("Let me check...") is
+        streamed too, and code fences around the answer are left in place.
+        """
+        async for part in self._run_chat(
+            user_question, namespace, progress_callback, conversation_history, stream=True
+        ):
+            yield part
+
+    async def _complete(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one non-streaming completion and return the assistant turn."""
+        response = await self.client.chat.completions.create(**request)
+        choice = response.choices[0]
+        message = choice.message
+        return {
+            "finish_reason": choice.finish_reason,
+            "content": message.content,
+            "tool_calls": [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.function.name,
+                        "arguments": tc.function.arguments
+                    }
+                }
+                for tc in message.tool_calls or ()
+            ],
+        }
+
+    async def _stream_completion(self, request: Dict[str, Any], turn: Dict[str, Any]) -> AsyncIterator[str]:
+        """Run one streaming completion, yielding content deltas.
+
+        The assembled assistant turn (same shape as _complete) is written to
+        ``turn`` once the stream ends.
+        """
+        content: List[str] = []
+        tool_calls: Dict[int, Dict[str, Any]] = {}
+        finish_reason = None
+
+        async for chunk in await self.client.chat.completions.create(**request, stream=True):
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            delta = choice.delta
+
+            if delta.content:
+                content.append(delta.content)
+                yield delta.content
+
+            # Tool calls arrive in fragments, keyed by their index in the turn
+            for tc in delta.tool_calls or ():
+                call = tool_calls.setdefault(
+                    tc.index, {"id": None, "type": "function", "function": {"name": "", "arguments": ""}}
+                )
+                if tc.id:
+                    call["id"] = tc.id
+                if tc.function:
+                    call["function"]["name"] += tc.function.name or ""
+                    call["function"]["arguments"] += tc.function.arguments or ""
+
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+
+        turn.update(
+            finish_reason=finish_reason,
+            content="".join(content) or None,
+            tool_calls=[tool_calls[index] for index in sorted(tool_calls)],
+        )
+
+    async def _run_chat(
+        self,
+        user_question: str,
+        namespace: Optional[str],
+        progress_callback: Optional[Callable],
+        conversation_history: Optional[List[Dict[str, str]]],
+        stream: bool,
+    ) -> AsyncIterator[str]:
+        """Tool calling loop shared by achat() and achat_stream().
+
+        With stream=False only the final answer is yielded, in one piece.
+        """
+        self._tool_cache.clear()
+
         if not self.client:
             if self._sdk_import_failed:
-                return "Error: OpenAI SDK not installed. Please install it with: pip install openai"
+                yield "Error: OpenAI SDK not installed. Please install it with: pip install openai"
             else:
-                return f"Error: API key required for OpenAI model {self.model_name}. Please configure an API key in Settings."
+                yield f"Error: API key required for OpenAI model {self.model_name}. Please configure an API key in Settings."
+            return
+
+        cache_key = self._response_cache_key(user_question, namespace, conversation_history)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            yield cached
+            return
 
-        logger.info(f"🎯 OpenAIChatBot.chat() - Using OpenAI API with model: {self.model_name}")
+        logger.info("🎯 OpenAIChatBot.chat() - Using OpenAI API with model: %s", self.model_name)
 
         try:
             # Create system prompt
@@ -161,7 +318,7 @@ Wrong flow (DO NOT DO THIS):
 
             # Add conversation history if provided
             if conversation_history:
-                logger.info(f"📜 Adding {len(conversation_history)} messages from conversation history")
+                logger.info("📜 Adding %d messages from conversation history", len(conversation_history))
                 messages.extend(conversation_history)
 
             # Add current user question
@@ -174,119 +331,119 @@ Wrong flow (DO NOT DO THIS):
             max_iterations = 30
             iteration = 0
             consecutive_tool_tracker = {"name": None, "count": 0}
+            repeat_tracker = {"seen": set(), "count": 0, "repeated": False}
 
             while iteration < max_iterations:
                 iteration += 1
-                logger.info(f"🤖 OpenAI tool calling iteration {iteration}")
+                logger.info("🤖 OpenAI tool calling iteration %s", iteration)
 
-                if progress_callback:
-                    progress_callback(f"🤖 Thinking... (iteration {iteration})")
+                await _report_progress(progress_callback, f"🤖 Thinking... (iteration {iteration})")
 
-                # Call OpenAI API
-                response = self.client.chat.completions.create(
-                    model=model_name,
-                    messages=messages,
-                    tools=openai_tools,
-                    temperature=0
-                )
+                # Keep the request within the model's input budget
+                messages = self._fit_messages_to_budget(messages, keep_system_prompt=True)
 
-                choice = response.choices[0]
-                finish_reason = choice.finish_reason
-                message = choice.message
+                # Call OpenAI API
+                request = {
+                    "model": model_name,
+                    "messages": messages,
+                    "tools": openai_tools,
+                    "temperature": 0,
+                }
+                if stream:
+                    turn: Dict[str, Any] = {}
+                    async for delta in self._stream_completion(request, turn):
+                        yield delta
+                else:
+                    turn = await self._complete(request)
 
-                # Convert message to dict for conversation history
+                # Convert the turn to a dict for conversation history
                 message_dict = {
                     "role": "assistant",
-                    "content": message.content
+                    "content": turn["content"]
                 }
 
                 # Add tool calls if present
-                if message.tool_calls:
-                    message_dict["tool_calls"] = [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.function.name,
-                                "arguments": tc.function.arguments
-                            }
-                        }
-                        for tc in message.tool_calls
-                    ]
+                if turn["tool_calls"]:
+                    message_dict["tool_calls"] = turn["tool_calls"]
 
                 # Add assistant's response to conversation
                 messages.append(message_dict)
 
                 # If model wants to use tools, execute them
-                if finish_reason == 'tool_calls' and message.tool_calls:
-                    logger.info(f"🤖 OpenAI requesting {len(message.tool_calls)} tool(s)")
+                if turn["finish_reason"] == 'tool_calls' and turn["tool_calls"]:
+                    logger.info("🤖 OpenAI requesting %s tool(s)", len(turn['tool_calls']))
 
                     # Collect tool names for iteration-level loop detection
                     tool_names_this_iteration = {
-                        tc.function.name for tc in message.tool_calls
+                        tc["function"]["name"] for tc in turn["tool_calls"]
                     }
 
-                    if self._check_tool_loop(tool_names_this_iteration, consecutive_tool_tracker):
-                        return (
-                            "I got stuck in a loop calling the same tool repeatedly. "
-                            "Please try rephrasing your question or being more specific."
-                        )
-
-                    tool_results = []
-                    for tool_call in message.tool_calls:
-                        tool_name = tool_call.function.name
-                        tool_args_str = tool_call.function.arguments
-                        tool_id = tool_call.id
-
+                    tool_calls = []
+                    for tool_call in turn["tool_calls"]:
                         # Parse arguments
                         try:
-                            tool_args = json.loads(tool_args_str)
-                        except json.JSONDecodeError:
+                            tool_args = json_utils.loads(tool_call["function"]["arguments"])
+                        except json_utils.JSONDecodeError:
                             tool_args = {}
+                        tool_calls.append((tool_call["function"]["name"], tool_args))
+
+                    if (self._check_tool_loop(tool_names_this_iteration, consecutive_tool_tracker)
+                            or self._check_repeated_calls(tool_calls, repeat_tracker)):
+                        yield (
+                            "I got stuck in a loop calling the same tool repeatedly. "
+                            "Please try rephrasing your question or being more specific."
+                        )
+                        return
 
-                        if progress_callback:
-                            progress_callback(f"🔧 Using tool: {tool_name}")
+                    if stream and turn["content"]:
+                        # Separate streamed commentary from the next turn's text
+                        yield "\n\n"
 
-                        # Get tool result with automatic truncation (logging handled in base class)
-                        tool_result = self._get_tool_result(tool_name, tool_args, namespace=namespace)
+                    # Run this turn's tools concurrently (truncation and logging handled in base class)
+                    if repeat_tracker["repeated"]:
+                        results = self._repeated_call_results(tool_calls)
+                    else:
+                        results = await self._aget_tool_results(tool_calls, namespace, progress_callback)
 
-                        tool_results.append({
+                    tool_results = [
+                        {
                             "role": "tool",
-                            "tool_call_id": tool_id,
+                            "tool_call_id": tool_call["id"],
                             "content": tool_result
-                        })
+                        }
+                        for tool_call, tool_result in zip(turn["tool_calls"], results)
+                    ]
 
-                    # Add tool results to conversation
+                    # Add tool results to conversation (trimmed to budget before the next call)
                     messages.extend(tool_results)
 
-                    # Truncate conversation safely (preserves tool-call/result pairs)
-                    messages = self._truncate_messages(messages, keep_system_prompt=True)
-
                     # Continue loop
                     continue
 
                 else:
+                    logger.info("OpenAI tool calling completed in %s iterations", iteration)
+                    if stream:
+                        # The answer has already been streamed
+                        return
+
                     # Model is done, return final response
-                    final_response = message.content or ''
+                    final_response = turn["content"] or ''
 
                     # Strip markdown code fences if OpenAI wrapped the response
-                    if final_response.startswith('```') and final_response.endswith('```'):
-                        lines = final_response.split('\n')
-                        if lines[0].startswith('```'):
-                            lines = lines[1:]
-                        if lines and lines[-1].strip() == '```':
-                            lines = lines[:-1]
-                        final_response = '\n'.join(lines).strip()
+                    if final_response.startswith('```'):
+                        match = _CODE_FENCE_RE.fullmatch(final_response)
+                        if match:
+                            final_response = match.group(1).strip()
 
-                    logger.info(f"OpenAI tool calling completed in {iteration} iterations")
-                    return final_response
+                    yield self._cache_response(cache_key, final_response)
+                    return
 
             # Hit max iterations
-            logger.warning(f"Hit max iterations ({max_iterations})")
-            return "Analysis incomplete. Please try a more specific question."
+            logger.warning("Hit max iterations (%d)", max_iterations)
+            yield "Analysis incomplete. Please try a more specific question."
 
         except Exception as e:
-            logger.error(f"Error in OpenAI chat: {e}")
+            logger.error("Error in OpenAI chat: %s", e)
             import traceback
             logger.error(traceback.format_exc())
-            return f"Error during OpenAI tool calling: {str(e)}"
+            yield f"Error during OpenAI tool calling: {str(e)}"
@@ -0,0 +1,80 @@
+"""
+Common JSON Utilities
+
+Shared JSON encode/decode helpers used on hot response-parsing paths.
+Uses orjson (C extension) when it is installed and falls back to the
+standard library json module otherwise, so callers never need to care.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the runtime image
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception type regardless of which backend is active.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode a JSON document from bytes or str.
+
+    Args:
+        data: Raw JSON payload, e.g. ``response.content`` from requests
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Encode an object as a JSON string.
+
+    Output is compact (no spaces after separators) unless ``indent`` is set,
+    in which case it is pretty-printed with two-space indentation. Both
+    backends produce the same layout; non-ASCII text is emitted as UTF-8.
+
+    Args:
+        obj: JSON-serializable object (dict keys must be strings)
+        indent: Pretty-print with a two-space indent
+
+    Returns:
+        JSON document as str
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumpb(obj: Any) -> bytes:
+    """Encode an object as compact UTF-8 JSON bytes.
+
+    Suited to HTTP request bodies: requests sends bytes as-is, whereas a str
+    body is re-encoded first.
+
+    Args:
+        obj: JSON-serializable object (dict keys must be strings)
+
+    Returns:
+        JSON document as UTF-8 bytes
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
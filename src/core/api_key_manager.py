@@ -8,8 +8,13 @@ from Kubernetes Secrets. Used by MCP tools that need external model credentials.
 import os
 import base64
 import logging
-import requests
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from urllib3.util.retry import Retry
+
+from .http_client import create_pooled_session
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +23,74 @@ K8S_SA_TOKEN_PATH = "/var/run/secrets/kubernetes.io/serviceaccount/token"
 K8S_SA_CA_PATH = "/var/run/secrets/kubernetes.io/serviceaccount/ca.crt"
 K8S_API_URL = "https://kubernetes.default.svc"
 
+# Keep-alive session for Secret reads against the in-cluster API server, so
+# repeated key lookups reuse one TLS connection. 5xx responses from the API
+# server are retried with backoff.
+_K8S_SESSION = create_pooled_session(
+    pool_connections=8,
+    pool_maxsize=16,
+    retry=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=("GET",),
+        raise_on_status=False,
+    ),
+)
+# Passed per call: a session-level verify is overridden by REQUESTS_CA_BUNDLE
+_K8S_VERIFY = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
+
+# Projected service account tokens rotate on the order of an hour, so the file
+# is re-read at most every few minutes rather than on every lookup.
+_SA_TOKEN_TTL_SECONDS = 300.0
+_TOKEN_CACHE: Dict[str, Any] = {"value": None, "expires": 0.0}
+
+# Decoded provider API keys keyed by (provider, namespace). Only successful
+# lookups are cached, so a newly created Secret is picked up on the next call.
+_API_KEY_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
+_API_KEY_CACHE_TTL = 300.0
+_CACHE_LOCK = threading.Lock()
+
+
+def _read_sa_token() -> str:
+    """Read the service account token, cached for _SA_TOKEN_TTL_SECONDS."""
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        if _TOKEN_CACHE["value"] and now < _TOKEN_CACHE["expires"]:
+            return _TOKEN_CACHE["value"]
+    with open(K8S_SA_TOKEN_PATH, "r") as f:
+        token = f.read().strip()
+    if token:
+        with _CACHE_LOCK:
+            _TOKEN_CACHE["value"] = token
+            _TOKEN_CACHE["expires"] = now + _SA_TOKEN_TTL_SECONDS
+    return token
+
+
+def _forget_sa_token() -> None:
+    """Drop the cached service account token after the API server rejects it."""
+    with _CACHE_LOCK:
+        _TOKEN_CACHE["value"] = None
+        _TOKEN_CACHE["expires"] = 0.0
+
+
+def invalidate_cached_api_key(provider: Optional[str] = None) -> None:
+    """Forget cached provider API keys.
+
+    Call this when a provider rejects a key (401/403) or after a credentials
+    Secret is written, so the next lookup reads the Secret again.
+
+    Args:
+        provider: Provider whose key to drop; all providers if None
+    """
+    with _CACHE_LOCK:
+        if provider is None:
+            _API_KEY_CACHE.clear()
+        else:
+            provider = provider.lower()
+            for key in [k for k in _API_KEY_CACHE if k[0] == provider]:
+                del _API_KEY_CACHE[key]
+
 
 def detect_provider_from_model_id(model_id: Optional[str]) -> Optional[str]:
     """Detect AI provider from model identifier.
@@ -104,13 +177,18 @@ def fetch_api_key_from_secret(provider: Optional[str]) -> Optional[str]:
             logger.debug("NAMESPACE not set, cannot fetch API key from secret")
             return None
 
+        cache_key = (provider, ns)
+        with _CACHE_LOCK:
+            entry = _API_KEY_CACHE.get(cache_key)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+
         secret_name = f"ai-{provider}-credentials"
 
         # Read service account token
         token = ""
         try:
-            with open(K8S_SA_TOKEN_PATH, "r") as f:
-                token = f.read().strip()
+            token = _read_sa_token()
         except Exception as e:
             logger.debug(f"Could not read service account token: {e}")
             return None
@@ -121,11 +199,12 @@ def fetch_api_key_from_secret(provider: Optional[str]) -> Optional[str]:
 
         # Prepare request to Kubernetes API
         headers = {"Authorization": f"Bearer {token}"}
-        verify = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
         url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/secrets/{secret_name}"
 
         # Fetch secret
-        resp = requests.get(url, headers=headers, timeout=5, verify=verify)
+        resp = _K8S_SESSION.get(url, headers=headers, timeout=5, verify=_K8S_VERIFY)
+        if resp.status_code == 401:
+            _forget_sa_token()
         if resp.status_code != 200:
             logger.debug(f"Secret {secret_name} fetch failed: {resp.status_code}")
             return None
@@ -139,6 +218,9 @@ def fetch_api_key_from_secret(provider: Optional[str]) -> Optional[str]:
 
         api_key = base64.b64decode(api_key_b64).decode("utf-8").strip()
         logger.info(f"✅ Retrieved API key from secret: {secret_name}")
+        if api_key:
+            with _CACHE_LOCK:
+                _API_KEY_CACHE[cache_key] = (api_key, time.monotonic() + _API_KEY_CACHE_TTL)
         return api_key
     except Exception as e:
         logger.debug(f"Failed to fetch API key from secret: {e}")
@@ -191,8 +273,7 @@ def fetch_maas_model_api_key(model_id: str) -> Optional[str]:
         # Read service account token
         token = ""
         try:
-            with open(K8S_SA_TOKEN_PATH, "r") as f:
-                token = f.read().strip()
+            token = _read_sa_token()
         except Exception as e:
             logger.debug(f"Could not read service account token: {e}")
             return None
@@ -203,11 +284,12 @@ def fetch_maas_model_api_key(model_id: str) -> Optional[str]:
 
         # Prepare request to Kubernetes API
         headers = {"Authorization": f"Bearer {token}"}
-        verify = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
         url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/secrets/{secret_name}"
 
         # Fetch secret
-        resp = requests.get(url, headers=headers, timeout=5, verify=verify)
+        resp = _K8S_SESSION.get(url, headers=headers, timeout=5, verify=_K8S_VERIFY)
+        if resp.status_code == 401:
+            _forget_sa_token()
         if resp.status_code != 200:
             logger.warning(f"Could not fetch MAAS secret {secret_name}: {resp.status_code}")
             return None
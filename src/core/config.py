@@ -162,9 +162,6 @@ DISCOVERY_TIMEOUT_SECONDS = float(os.getenv("DISCOVERY_TIMEOUT_SECONDS", "10.0")
 LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "180.0"))  # LLM API request timeout
 
 # Load complex configurations
-# NOTE: MODEL_CONFIG is deprecated - use get_model_config() from model_config_manager
-# This is kept for backward compatibility only and reads from env var
-MODEL_CONFIG = load_model_config()
 THANOS_TOKEN = load_thanos_token()
 VERIFY_SSL = get_ca_verify_setting()
 # Seed the cache at startup (logged below); consumers must call is_rag_available()
@@ -181,6 +178,17 @@ except ImportError:
     get_default_models = load_model_config
     reload_model_config = lambda: None
 
+
+def __getattr__(name: str) -> Any:
+    """Resolve the deprecated MODEL_CONFIG attribute lazily.
+
+    Legacy ``config.MODEL_CONFIG`` reads get the live, cached configuration
+    from get_model_config() instead of a copy of the env var frozen at import.
+    """
+    if name == "MODEL_CONFIG":
+        return get_model_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Log configuration for debugging
 import logging
 logger = logging.getLogger(__name__)
@@ -230,3 +238,19 @@ NAMESPACE_AWARE_TOOLS = frozenset({
     'fetch_openshift_metrics_data', 'analyze_openshift', 'chat_openshift',
     'get_correlated_logs',
 })
+
+# Read-only tools whose results chatbots may reuse within a single chat() call
+# when the model repeats an identical call. Tools that write state (credentials,
+# model config) or run their own LLM (analyze_*, chat_*) are never memoized.
+MEMOIZABLE_TOOLS = frozenset({
+    'execute_promql', 'search_metrics', 'search_metrics_by_category',
+    'get_metrics_categories', 'get_metric_metadata', 'get_label_values',
+    'suggest_queries', 'explain_results', 'select_best_metric',
+    'find_best_metric_with_metadata', 'find_best_metric_with_metadata_v2',
+    'convert_time_to_promql_duration',
+    'list_models', 'list_vllm_namespaces', 'get_gpu_info', 'get_deployment_info',
+    'list_openshift_namespaces', 'list_openshift_metric_groups',
+    'list_openshift_namespace_metric_groups',
+    'query_tempo_tool', 'get_trace_details_tool',
+    'korrel8r_query_objects', 'korrel8r_get_correlated', 'get_correlated_logs',
+})
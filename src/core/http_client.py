@@ -5,8 +5,13 @@ This module provides a unified HTTP client interface for making requests
 to various observability services (Tempo, Prometheus, Thanos, etc.).
 """
 
+import socket
+
 import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional, List
 import logging
 
@@ -15,6 +20,53 @@ from .config import VERIFY_SSL, K8S_SERVICE_ACCOUNT_TOKEN_PATH, DEV_FALLBACK_TOK
 logger = logging.getLogger(__name__)
 
 
+def tcp_keepalive_socket_options(idle: int = 30, interval: int = 10) -> List[tuple]:
+    """
+    Socket options enabling TCP keepalive on top of urllib3's defaults.
+
+    Keeps idle pooled connections from being silently dropped by cluster
+    networking. The idle/interval tunables are applied where the platform
+    exposes them (Linux).
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval))
+    return options
+
+
+def create_pooled_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    retry: Optional[Retry] = None,
+) -> requests.Session:
+    """
+    Create a requests Session with a sized connection pool and retry policy.
+
+    Module-level sessions created here keep TCP/TLS connections alive across
+    calls instead of paying a fresh handshake on every request.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum connections kept alive per host
+        retry: urllib3 Retry policy applied by the adapter (no retries if None)
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry if retry is not None else 0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class HTTPClient:
     """Centralized HTTP client for observability services."""
     
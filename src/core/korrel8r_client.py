@@ -8,6 +8,7 @@ from __future__ import annotations
 import json
 import re
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -20,10 +21,46 @@ from .config import (
 )
 from common.pylogger import get_python_logger
 from .config import THANOS_TOKEN
+from .http_client import create_pooled_session
 
 
 logger = get_python_logger()
 
+# Shared keep-alive session: korrel8r_get_correlated fans goals out across
+# threads, so the pool is sized for concurrent requests to the same host.
+_KORREL8R_SESSION = create_pooled_session(pool_connections=4, pool_maxsize=16)
+
+_ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+_LOG_LEVEL_RE = re.compile(
+    r"\b(INFO|ERROR|WARN|WARNING|DEBUG|TRACE|CRITICAL|FATAL)\b\s*:?[\t ]*(.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _parse_log_timestamp(ts: str) -> Optional[datetime]:
+    """Parse an ISO8601 log timestamp, trimming sub-microsecond digits; None if unparseable."""
+    try:
+        if not ts:
+            return None
+        s = ts.strip()
+        if s.endswith("Z"):
+            s = s[:-1] + "+00:00"
+        if "." in s:
+            head, tail = s.split(".", 1)
+            tz = ""
+            for i, ch in enumerate(tail):
+                if ch in "+-" and i != 0:
+                    tz = tail[i:]
+                    tail = tail[:i]
+                    break
+            digits = "".join(ch for ch in tail if ch.isdigit())
+            if len(digits) > 6:
+                digits = digits[:6]
+            s = f"{head}.{digits}{tz}" if digits else f"{head}{tz}"
+        return datetime.fromisoformat(s)
+    except Exception:
+        return None
+
 
 @dataclass
 class TimeWindow:
@@ -50,7 +87,7 @@ class Korrel8rClient:
         verify_param: Any = self._choose_verify_param(url)
 
         try:
-            response = requests.post(
+            response = _KORREL8R_SESSION.post(
                 url,
                 data=json.dumps(payload),
                 headers=headers,
@@ -78,7 +115,7 @@ class Korrel8rClient:
         verify_param: Any = self._choose_verify_param(url)
 
         try:
-            response = requests.get(
+            response = _KORREL8R_SESSION.get(
                 url,
                 params=params,
                 headers=headers,
@@ -130,17 +167,15 @@ class Korrel8rClient:
 
         Each entry contains: namespace, pod, level, message, timestamp.
         If the input does not appear to be a list of log objects, return None.
+        Entries are de-duplicated by (namespace, pod, level, message) in the
+        same pass, keeping the latest timestamp, so only unique entries are
+        ever held in memory.
         """
         if not isinstance(objects, list):
             return None
 
-        ansi_escape = re.compile(r"\x1b\[[0-9;]*m")
-        level_regex = re.compile(
-            r"\b(INFO|ERROR|WARN|WARNING|DEBUG|TRACE|CRITICAL|FATAL)\b\s*:?[\t ]*(.*)$",
-            re.IGNORECASE | re.DOTALL,
-        )
-
-        simplified: List[Dict[str, str]] = []
+        best_by_key: Dict[tuple, Dict[str, str]] = {}
+        best_dt_by_key: Dict[tuple, Any] = {}
         found_log_shape = False
 
         for item in objects:
@@ -148,6 +183,8 @@ class Korrel8rClient:
                 continue
 
             body: Any = item.get("body") or item.get("message") or item.get("log")
+            if body is None:
+                continue
             pod: Any = (
                 item.get("k8s_pod_name")
                 or item.get("kubernetes_pod_name")
@@ -166,17 +203,14 @@ class Korrel8rClient:
                 or item.get("ts")
             )
 
-            if body is None:
-                continue
-
             found_log_shape = True
 
             text = str(body)
-            text = ansi_escape.sub("", text).strip()
+            text = _ANSI_ESCAPE_RE.sub("", text).strip()
 
             level = "UNKNOWN"
             message = text
-            m = level_regex.search(text)
+            m = _LOG_LEVEL_RE.search(text)
             if m:
                 level = m.group(1).upper()
                 # Use captured message tail if present; otherwise keep full text
@@ -188,68 +222,34 @@ class Korrel8rClient:
             #if level in ("DEBUG", "INFO"):
             #    continue
 
-            simplified.append(
-                {
-                    "namespace": str(namespace) if namespace is not None else "",
-                    "pod": str(pod) if pod is not None else "",
-                    "level": level,
-                    "message": message,
-                    "timestamp": str(timestamp) if timestamp is not None else "",
-                }
-            )
+            entry = {
+                "namespace": str(namespace) if namespace is not None else "",
+                "pod": str(pod) if pod is not None else "",
+                "level": level,
+                "message": message,
+                "timestamp": str(timestamp) if timestamp is not None else "",
+            }
 
-        if found_log_shape:
             # De-duplicate by (namespace, pod, level, message), keep latest timestamp
-            from datetime import datetime
-
-            def _parse_ts(ts: str):
-                try:
-                    if not ts:
-                        return None
-                    s = ts.strip()
-                    if s.endswith("Z"):
-                        s = s[:-1] + "+00:00"
-                    if "." in s:
-                        head, tail = s.split(".", 1)
-                        tz = ""
-                        for i, ch in enumerate(tail):
-                            if ch in "+-" and i != 0:
-                                tz = tail[i:]
-                                tail = tail[:i]
-                                break
-                        digits = "".join(ch for ch in tail if ch.isdigit())
-                        if len(digits) > 6:
-                            digits = digits[:6]
-                        s = f"{head}.{digits}{tz}" if digits else f"{head}{tz}"
-                    return datetime.fromisoformat(s)
-                except Exception:
-                    return None
-
-            best_by_key: Dict[tuple, Dict[str, str]] = {}
-            best_dt_by_key: Dict[tuple, Any] = {}
-
-            for entry in simplified:
-                key = (entry.get("namespace", ""), entry.get("pod", ""), entry.get("level", ""), entry.get("message", ""))
-                dt = _parse_ts(entry.get("timestamp", ""))
-                if key not in best_by_key:
+            key = (entry["namespace"], entry["pod"], level, message)
+            dt = _parse_log_timestamp(entry["timestamp"])
+            if key not in best_by_key:
+                best_by_key[key] = entry
+                best_dt_by_key[key] = dt
+            else:
+                prev_dt = best_dt_by_key.get(key)
+                prev_ts = best_by_key[key].get("timestamp", "")
+                if prev_dt is None and dt is not None:
                     best_by_key[key] = entry
                     best_dt_by_key[key] = dt
-                else:
-                    prev_dt = best_dt_by_key.get(key)
-                    prev_ts = best_by_key[key].get("timestamp", "")
-                    if prev_dt is None and dt is not None:
-                        best_by_key[key] = entry
-                        best_dt_by_key[key] = dt
-                    elif dt is not None and prev_dt is not None and dt >= prev_dt:
+                elif dt is not None and prev_dt is not None and dt >= prev_dt:
+                    best_by_key[key] = entry
+                    best_dt_by_key[key] = dt
+                elif dt is None and prev_dt is None:
+                    if entry["timestamp"] > prev_ts:
                         best_by_key[key] = entry
-                        best_dt_by_key[key] = dt
-                    elif dt is None and prev_dt is None:
-                        if entry.get("timestamp", "") > prev_ts:
-                            best_by_key[key] = entry
-
-            simplified = list(best_by_key.values())
 
-        return simplified if found_log_shape else None
+        return list(best_by_key.values()) if found_log_shape else None
 
     def list_goals(self, goals: List[str], start: Dict[str, Any]) -> Any:
         """List Korrel8r goal classes for a given start.
@@ -6,6 +6,9 @@ collecting vLLM metrics, and processing observability data.
 """
 
 import requests
+import urllib3
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
 import os
 import json
@@ -13,10 +16,16 @@ import re
 import logging
 import math
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Set, Union
 from dataclasses import dataclass
 
+try:
+    import ijson
+except ImportError:  # Optional: range results fall back to buffered parsing
+    ijson = None
+
 import logging
+from common import json_utils
 from common.pylogger import get_python_logger
 
 # Initialize structured logger once - other modules should use logging.getLogger(__name__)
@@ -25,6 +34,7 @@ get_python_logger()
 logger = logging.getLogger(__name__)
 
 from .config import PROMETHEUS_URL, THANOS_TOKEN, VERIFY_SSL
+from .http_client import create_pooled_session
 from .llm_client import summarize_with_llm
 from .response_validator import ResponseType
 from .llm_client import (
@@ -36,6 +46,27 @@ from .korrel8r_service import fetch_goal_query_objects
 NAMESPACE_SCOPED = "namespace_scoped"
 CLUSTER_WIDE = "cluster_wide"
 
+# (connect, read) timeouts for Prometheus/Thanos calls: an unreachable endpoint
+# fails within seconds while slow range queries still get time to finish.
+PROMETHEUS_CONNECT_TIMEOUT = 3.0
+PROMETHEUS_TIMEOUT = (PROMETHEUS_CONNECT_TIMEOUT, 25.0)
+PROMETHEUS_FAST_TIMEOUT = (PROMETHEUS_CONNECT_TIMEOUT, 10.0)
+
+# Shared keep-alive session for all Prometheus/Thanos GETs. Transient gateway
+# errors are retried with backoff; raise_on_status=False hands the final
+# response back so callers' raise_for_status() behaves as before.
+_PROMETHEUS_SESSION = create_pooled_session(
+    pool_connections=16,
+    pool_maxsize=32,
+    retry=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=("GET",),
+        raise_on_status=False,
+    ),
+)
+
 
 # ============================================================================
 # Metric Type Registry
@@ -191,22 +222,22 @@ def execute_instant_query(query: str, timeout: int = 10) -> Dict[str, Any]:
     
     Args:
         query: PromQL query string
-        timeout: Request timeout in seconds
+        timeout: Read timeout in seconds
         
     Returns:
         Dict with 'data' containing query results
     """
     headers = _auth_headers()
     try:
-        resp = requests.get(
+        resp = _PROMETHEUS_SESSION.get(
             f"{PROMETHEUS_URL}/api/v1/query",
             headers=headers,
             params={"query": query},
             verify=VERIFY_SSL,
-            timeout=timeout,
+            timeout=(PROMETHEUS_CONNECT_TIMEOUT, timeout),
         )
         resp.raise_for_status()
-        return resp.json()
+        return json_utils.loads(resp.content)
     except requests.exceptions.Timeout:
         logger.warning(f"Timeout executing query: {query}")
         return {"data": {"result": []}}
@@ -215,6 +246,89 @@ def execute_instant_query(query: str, timeout: int = 10) -> Dict[str, Any]:
         return {"data": {"result": []}}
 
 
+def _instant_value(query: str) -> float:
+    """Run an instant query and return its first sample value (0.0 if none)."""
+    result = execute_instant_query(query)
+    value = 0.0
+    try:
+        data = result.get("data", {}).get("result", [])
+        if data and len(data) > 0:
+            val = data[0].get("value", [None, 0])
+            if isinstance(val, list) and len(val) > 1:
+                value = float(val[1])
+    except (ValueError, TypeError, IndexError):
+        # Use default value (0.0) if extraction fails - metric may be unavailable
+        pass
+    return round(value, 2)
+
+
+# Instant queries for one dashboard are sent as a single `or`-joined expression,
+# each tagged with its position via label_replace so the response can be split
+# back out. Above this length the per-query path is used instead.
+_BATCH_LABEL = "mcp_query"
+_MAX_BATCHED_QUERY_CHARS = 16000
+
+
+def execute_instant_queries_batched(queries: Dict[str, str]) -> Optional[Dict[str, float]]:
+    """Evaluate several instant queries with one Prometheus request.
+
+    Builds ``label_replace((q0), "mcp_query", "0", "", "") or ...`` and POSTs
+    it to /api/v1/query, then demultiplexes the result on the tag label. Each
+    label gets the value of the first series tagged for it, or 0.0 if none.
+
+    Args:
+        queries: Dict mapping label -> PromQL query
+
+    Returns:
+        Dict mapping label -> numeric value, or None when the queries could not
+        be batched (too long, or Prometheus rejected the combined expression);
+        callers should then fall back to execute_instant_queries_parallel.
+    """
+    if len(queries) < 2:
+        return None
+    labels = list(queries)
+    combined = " or ".join(
+        f'label_replace(({query}), "{_BATCH_LABEL}", "{i}", "", "")'
+        for i, query in enumerate(queries.values())
+    )
+    if len(combined) > _MAX_BATCHED_QUERY_CHARS:
+        return None
+
+    try:
+        resp = _PROMETHEUS_SESSION.post(
+            f"{PROMETHEUS_URL}/api/v1/query",
+            headers=_auth_headers(),
+            data={"query": combined},
+            verify=VERIFY_SSL,
+            timeout=PROMETHEUS_TIMEOUT,
+        )
+        resp.raise_for_status()
+        result = _prometheus_result(resp)
+    except Exception as e:
+        # A scalar-valued or malformed sub-expression fails the whole batch
+        logger.debug(f"Batched instant query failed, falling back to per-query: {e}")
+        return None
+
+    values = dict.fromkeys(labels, 0.0)
+    seen: Set[int] = set()
+    for series in result:
+        try:
+            idx = int(series.get("metric", {}).get(_BATCH_LABEL, ""))
+        except ValueError:
+            continue
+        if idx in seen or not 0 <= idx < len(labels):
+            continue
+        seen.add(idx)
+        val = series.get("value", [None, 0])
+        try:
+            if isinstance(val, list) and len(val) > 1:
+                values[labels[idx]] = round(float(val[1]), 2)
+        except (ValueError, TypeError):
+            # Keep the default value (0.0), as the per-query path does
+            pass
+    return values
+
+
 def execute_instant_queries_parallel(queries: Dict[str, str], max_workers: int = 10) -> Dict[str, float]:
     """Execute multiple Prometheus instant queries in parallel.
     
@@ -226,35 +340,131 @@ def execute_instant_queries_parallel(queries: Dict[str, str], max_workers: int =
         Dict mapping label -> numeric value
     """
     import concurrent.futures
-    
-    def fetch_one(label: str, query: str) -> Tuple[str, float]:
-        result = execute_instant_query(query)
-        value = 0.0
-        try:
-            data = result.get("data", {}).get("result", [])
-            if data and len(data) > 0:
-                val = data[0].get("value", [None, 0])
-                if isinstance(val, list) and len(val) > 1:
-                    value = float(val[1])
-        except (ValueError, TypeError, IndexError):
-            # Use default value (0.0) if extraction fails - metric may be unavailable
-            pass
-        return (label, round(value, 2))
-    
+
     results = {}
     with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(fetch_one, label, query): label for label, query in queries.items()}
+        futures = {executor.submit(_instant_value, query): label for label, query in queries.items()}
         for future in concurrent.futures.as_completed(futures):
+            label = futures[future]
             try:
-                label, value = future.result()
-                results[label] = value
+                results[label] = future.result()
             except Exception as e:
-                label = futures[future]
                 logger.warning(f"Failed to fetch {label}: {e}")
                 results[label] = 0.0
     return results
 
 
+# Gauge metrics that should use max_over_time() to capture peaks in sparklines
+# These metrics show instantaneous values, so we want the max during each step interval
+# This is critical for metrics like GPU utilization where brief spikes (e.g., 10s of activity
+# in a 1-hour window with 4-minute sampling) would otherwise be missed
+#
+# Note: "GPU Usage (%)" is the consolidated metric name for GPU compute utilization.
+# Internal discovery may find vendor-specific names (DCGM_FI_DEV_GPU_UTIL, habanalabs_utilization)
+# but these are all mapped to the single "GPU Usage (%)" metric for consistency.
+_SPARKLINE_GAUGE_METRICS = frozenset([
+    "GPU Usage (%)",  # Consolidated GPU compute utilization (NVIDIA, AMD, Habana, etc.)
+    "GPU Temperature (°C)",
+    "GPU Power Usage (Watts)",
+    "GPU Memory Usage (GB)",
+    "GPU Memory Temperature (°C)",
+    "GPU Energy Consumption (Joules)",
+    # Cache metrics (also gauges that can spike briefly)
+    "Kv Cache Usage Perc",
+    "Gpu Cache Usage Perc",
+])
+
+
+def _sparkline_step(start_ts: int, end_ts: int, max_points: int) -> Tuple[int, str]:
+    """Return the range query step in seconds and as a PromQL duration."""
+    # Calculate step to get approximately max_points data points
+    duration = end_ts - start_ts
+    step = max(60, duration // max_points)  # At least 1 minute step
+
+    # Format step duration for PromQL (e.g., "4m", "1h")
+    if step >= 3600:
+        step_str = f"{step // 3600}h"
+    elif step >= 60:
+        step_str = f"{step // 60}m"
+    else:
+        step_str = f"{step}s"
+    return step, step_str
+
+
+def _fetch_sparkline(
+    label: str,
+    query: str,
+    start_ts: int,
+    end_ts: int,
+    step: int,
+    step_str: str,
+    headers: Dict[str, str],
+) -> List[Dict[str, Any]]:
+    """Run one sparkline range query and return its {timestamp, value} points."""
+    try:
+        # For gauge metrics, inject max_over_time() to capture peak values during each step
+        # This ensures we don't miss brief GPU activity spikes between sample points
+        range_query = query
+        if label in _SPARKLINE_GAUGE_METRICS and "max_over_time" not in query:
+            # Inject max_over_time() inside aggregation functions
+            # Examples:
+            #   avg(DCGM_FI_DEV_GPU_UTIL) -> avg(max_over_time(DCGM_FI_DEV_GPU_UTIL[4m]))
+            #   avg(DCGM_FI_DEV_FB_USED) / (1024*1024*1024) -> avg(max_over_time(DCGM_FI_DEV_FB_USED[4m])) / (1024*1024*1024)
+
+            # Pattern: aggregation_func(metric_name)
+            # Replace with: aggregation_func(max_over_time(metric_name[duration]))
+            def inject_max_over_time(match):
+                agg_func = match.group(1)
+                metric = match.group(2)
+                return f"{agg_func}(max_over_time({metric}[{step_str}]))"
+
+            # Match avg(...), sum(...), min(...), max(...), count(...)
+            range_query = re.sub(
+                r'(avg|sum|min|max|count)\(([^()]+)\)',
+                inject_max_over_time,
+                query
+            )
+
+            # If no aggregation found (bare metric), wrap it directly
+            if range_query == query:
+                range_query = f"max_over_time({query}[{step_str}])"
+
+        resp = _PROMETHEUS_SESSION.get(
+            f"{PROMETHEUS_URL}/api/v1/query_range",
+            headers=headers,
+            params={
+                "query": range_query,
+                "start": start_ts,
+                "end": end_ts,
+                "step": f"{step}s"
+            },
+            verify=VERIFY_SSL,
+            timeout=PROMETHEUS_TIMEOUT,
+        )
+        resp.raise_for_status()
+        result = _prometheus_result(resp)
+
+        time_series = []
+        if result and len(result) > 0:
+            values = result[0].get("values", [])
+            for ts, val in values:
+                try:
+                    float_val = float(val)
+                    # Skip NaN values using math.isnan for clarity
+                    if not math.isnan(float_val):
+                        time_series.append({
+                            "timestamp": datetime.fromtimestamp(ts).isoformat(),
+                            "value": round(float_val, 2)
+                        })
+                except (ValueError, TypeError):
+                    # Skip values that can't be converted to float (e.g., "NaN" string, None)
+                    pass
+        return time_series
+    except Exception as e:
+        logger.warning(f"Failed range query for {label}: {e}")
+        return []
+
+
 def execute_range_queries_parallel(
     queries: Dict[str, str], 
     start_ts: int, 
@@ -279,121 +489,78 @@ def execute_range_queries_parallel(
         Dict mapping label -> list of {timestamp, value} dicts
     """
     import concurrent.futures
-    from datetime import datetime
-    
-    # Calculate step to get approximately max_points data points
-    duration = end_ts - start_ts
-    step = max(60, duration // max_points)  # At least 1 minute step
-
-    # Format step duration for PromQL (e.g., "4m", "1h")
-    if step >= 3600:
-        step_str = f"{step // 3600}h"
-    elif step >= 60:
-        step_str = f"{step // 60}m"
-    else:
-        step_str = f"{step}s"
 
+    step, step_str = _sparkline_step(start_ts, end_ts, max_points)
     headers = _auth_headers()
 
-    # Gauge metrics that should use max_over_time() to capture peaks in sparklines
-    # These metrics show instantaneous values, so we want the max during each step interval
-    # This is critical for metrics like GPU utilization where brief spikes (e.g., 10s of activity
-    # in a 1-hour window with 4-minute sampling) would otherwise be missed
-    #
-    # Note: "GPU Usage (%)" is the consolidated metric name for GPU compute utilization.
-    # Internal discovery may find vendor-specific names (DCGM_FI_DEV_GPU_UTIL, habanalabs_utilization)
-    # but these are all mapped to the single "GPU Usage (%)" metric for consistency.
-    GAUGE_METRICS = [
-        "GPU Usage (%)",  # Consolidated GPU compute utilization (NVIDIA, AMD, Habana, etc.)
-        "GPU Temperature (°C)",
-        "GPU Power Usage (Watts)",
-        "GPU Memory Usage (GB)",
-        "GPU Memory Temperature (°C)",
-        "GPU Energy Consumption (Joules)",
-        # Cache metrics (also gauges that can spike briefly)
-        "Kv Cache Usage Perc",
-        "Gpu Cache Usage Perc",
-    ]
-
-    def fetch_range(label: str, query: str) -> Tuple[str, List[Dict[str, Any]]]:
-        try:
-            # For gauge metrics, inject max_over_time() to capture peak values during each step
-            # This ensures we don't miss brief GPU activity spikes between sample points
-            range_query = query
-            if label in GAUGE_METRICS and "max_over_time" not in query:
-                # Inject max_over_time() inside aggregation functions
-                # Examples:
-                #   avg(DCGM_FI_DEV_GPU_UTIL) -> avg(max_over_time(DCGM_FI_DEV_GPU_UTIL[4m]))
-                #   avg(DCGM_FI_DEV_FB_USED) / (1024*1024*1024) -> avg(max_over_time(DCGM_FI_DEV_FB_USED[4m])) / (1024*1024*1024)
-                import re
-
-                # Pattern: aggregation_func(metric_name)
-                # Replace with: aggregation_func(max_over_time(metric_name[duration]))
-                def inject_max_over_time(match):
-                    agg_func = match.group(1)
-                    metric = match.group(2)
-                    return f"{agg_func}(max_over_time({metric}[{step_str}]))"
-
-                # Match avg(...), sum(...), min(...), max(...), count(...)
-                range_query = re.sub(
-                    r'(avg|sum|min|max|count)\(([^()]+)\)',
-                    inject_max_over_time,
-                    query
-                )
-
-                # If no aggregation found (bare metric), wrap it directly
-                if range_query == query:
-                    range_query = f"max_over_time({query}[{step_str}])"
-
-            resp = requests.get(
-                f"{PROMETHEUS_URL}/api/v1/query_range",
-                headers=headers,
-                params={
-                    "query": range_query,
-                    "start": start_ts,
-                    "end": end_ts,
-                    "step": f"{step}s"
-                },
-                verify=VERIFY_SSL,
-                timeout=30,
-            )
-            resp.raise_for_status()
-            result = resp.json().get("data", {}).get("result", [])
-            
-            time_series = []
-            if result and len(result) > 0:
-                values = result[0].get("values", [])
-                for ts, val in values:
-                    try:
-                        float_val = float(val)
-                        # Skip NaN values using math.isnan for clarity
-                        if not math.isnan(float_val):
-                            time_series.append({
-                                "timestamp": datetime.fromtimestamp(ts).isoformat(),
-                                "value": round(float_val, 2)
-                            })
-                    except (ValueError, TypeError):
-                        # Skip values that can't be converted to float (e.g., "NaN" string, None)
-                        pass
-            return (label, time_series)
-        except Exception as e:
-            logger.warning(f"Failed range query for {label}: {e}")
-            return (label, [])
-    
     results = {}
     with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(fetch_range, label, query): label for label, query in queries.items()}
+        futures = {
+            executor.submit(_fetch_sparkline, label, query, start_ts, end_ts, step, step_str, headers): label
+            for label, query in queries.items()
+        }
         for future in concurrent.futures.as_completed(futures):
+            label = futures[future]
             try:
-                label, time_series = future.result()
-                results[label] = time_series
+                results[label] = future.result()
             except Exception as e:
-                label = futures[future]
                 logger.warning(f"Failed to fetch range for {label}: {e}")
                 results[label] = []
     return results
 
 
+def execute_dashboard_queries_parallel(
+    queries: Dict[str, str],
+    start_ts: int,
+    end_ts: int,
+    max_workers: int = 20,
+    max_points: int = 20
+) -> Tuple[Dict[str, float], Dict[str, List[Dict[str, Any]]]]:
+    """Fetch latest values and sparklines for a set of queries in one wave.
+
+    Equivalent to execute_instant_queries_parallel followed by
+    execute_range_queries_parallel, but every instant and range request is
+    submitted to a single pool, so the two kinds overlap instead of the range
+    wave waiting for the slowest instant query. The instant values are fetched
+    with one batched request (execute_instant_queries_batched) when possible.
+
+    Args:
+        queries: Dict mapping label -> PromQL query
+        start_ts: Start timestamp (epoch seconds)
+        end_ts: End timestamp (epoch seconds)
+        max_workers: Max parallel threads shared by both kinds of query
+        max_points: Target number of data points for sparklines
+
+    Returns:
+        Tuple of (label -> latest value, label -> list of {timestamp, value} dicts)
+    """
+    import concurrent.futures
+
+    step, step_str = _sparkline_step(start_ts, end_ts, max_points)
+    headers = _auth_headers()
+
+    series: Dict[str, List[Dict[str, Any]]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_fetch_sparkline, label, query, start_ts, end_ts, step, step_str, headers): (series, label, [])
+            for label, query in queries.items()
+        }
+        # Latest values come from one batched request while the range queries run
+        values = executor.submit(execute_instant_queries_batched, queries).result()
+        if values is None:
+            values = {}
+            for label, query in queries.items():
+                futures[executor.submit(_instant_value, query)] = (values, label, 0.0)
+        for future in concurrent.futures.as_completed(futures):
+            target, label, default = futures[future]
+            try:
+                target[label] = future.result()
+            except Exception as e:
+                logger.warning(f"Failed to fetch {label}: {e}")
+                target[label] = default
+    return values, series
+
+
 def calculate_histogram_quantile_optimal_lookback(duration_hours: float) -> str:
     """Select an appropriate rate() lookback window based on the total query time range.
 
@@ -642,6 +809,86 @@ def _auth_headers() -> Dict[str, str]:
         return {}
 
 
+def _prometheus_result(response: requests.Response) -> List[Dict[str, Any]]:
+    """Decode the ``data.result`` list from a Prometheus HTTP API response.
+
+    Parses the raw body bytes directly rather than going through
+    ``response.json()``, so the C JSON backend is used when it is installed.
+    Large query_range payloads are parsed from threads in the parallel fetch
+    helpers, where stdlib parsing time dominates.
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the body is not JSON (e.g. an
+            HTML page from an auth proxy), as ``response.json()`` would, so
+            callers' RequestException handling still applies.
+    """
+    try:
+        payload = json_utils.loads(response.content)
+    except json_utils.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+    return payload.get("data", {}).get("result", [])
+
+
+# Stream query_range bodies series-by-series when ijson is installed
+_STREAM_RANGE_RESULTS = ijson is not None
+
+
+def _iter_prometheus_result(response: requests.Response) -> Iterator[Dict[str, Any]]:
+    """Yield the series objects of a Prometheus ``data.result`` list.
+
+    When ijson is available the response must have been requested with
+    ``stream=True``; series are then decoded incrementally from the socket so
+    only one series is held in memory at a time. Otherwise the whole body is
+    parsed up front via ``_prometheus_result``.
+
+    Malformed or truncated streamed bodies are raised as the same
+    ``requests`` exceptions ``response.json()``/``iter_content()`` would give.
+    """
+    if not _STREAM_RANGE_RESULTS:
+        yield from _prometheus_result(response)
+        return
+    response.raw.decode_content = True
+    try:
+        yield from ijson.items(response.raw, "data.result.item", use_float=True)
+    except ijson.JSONError as e:
+        raise requests.exceptions.JSONDecodeError(str(e), "", 0) from e
+    except urllib3.exceptions.ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e) from e
+    except urllib3.exceptions.DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e) from e
+    except urllib3.exceptions.ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e) from e
+
+
+def _prometheus_result_to_dataframe(result: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+    """Build a long-format DataFrame (labels + timestamp + value) from range results.
+
+    Accepts any iterable of series, so a streamed result is consumed one
+    series at a time. Each series becomes one columnar block with its labels
+    broadcast across its samples, instead of one dict per sample. Sample values are kept as
+    the raw strings Prometheus returns and converted in a single vectorized
+    pass; NaN and +/-Inf (which can't be JSON serialized) become 0.0.
+    """
+    frames = []
+    for series in result:
+        values = series.get("values") or []
+        if not values:
+            continue
+        ts_raw, val_raw = zip(*values)
+        columns: Dict[str, Any] = dict(series.get("metric", {}))
+        columns["timestamp"] = [datetime.fromtimestamp(float(ts)) for ts in ts_raw]
+        columns["value"] = val_raw
+        frames.append(pd.DataFrame(columns))
+
+    if not frames:
+        return pd.DataFrame()
+
+    df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    numeric = pd.to_numeric(df["value"], errors="coerce").to_numpy(dtype=float)
+    df["value"] = np.nan_to_num(numeric, nan=0.0, posinf=0.0, neginf=0.0)
+    return df
+
+
 def extract_first_json_object_from_text(text: str) -> Optional[Dict[str, Any]]:
     """Extract a JSON object from arbitrary text, robust to extra prose and nesting.
 
@@ -743,7 +990,7 @@ def get_models_helper() -> List[str]:
     # Use just the most reliable metric with 24h window (fast)
     def fetch_series(metric_name: str) -> List[dict]:
         try:
-            response = requests.get(
+            response = _PROMETHEUS_SESSION.get(
                 f"{PROMETHEUS_URL}/api/v1/series",
                 headers=headers,
                 params={
@@ -752,7 +999,7 @@ def get_models_helper() -> List[str]:
                     "end": int(datetime.now().timestamp()),
                 },
                 verify=VERIFY_SSL,
-                timeout=10,  # Fast timeout
+                timeout=PROMETHEUS_FAST_TIMEOUT,
             )
             response.raise_for_status()
             return response.json().get("data", [])
@@ -797,7 +1044,7 @@ def get_vllm_namespaces_helper() -> List[str]:
         
         def fetch_series(metric_name: str) -> List[dict]:
             try:
-                response = requests.get(
+                response = _PROMETHEUS_SESSION.get(
                     f"{PROMETHEUS_URL}/api/v1/series",
                     headers=headers,
                     params={
@@ -806,7 +1053,7 @@ def get_vllm_namespaces_helper() -> List[str]:
                         "end": int(datetime.now().timestamp()),
                     },
                     verify=VERIFY_SSL,
-                    timeout=10,  # Fast timeout
+                    timeout=PROMETHEUS_FAST_TIMEOUT,
                 )
                 response.raise_for_status()
                 return response.json().get("data", [])
@@ -849,11 +1096,11 @@ def get_openshift_namespaces_helper() -> List[str]:
     """
     try:
         headers = _auth_headers()
-        response = requests.get(
+        response = _PROMETHEUS_SESSION.get(
             f"{PROMETHEUS_URL}/api/v1/label/namespace/values",
             headers=headers,
             verify=VERIFY_SSL,
-            timeout=10,  # Fast timeout
+            timeout=PROMETHEUS_FAST_TIMEOUT,
         )
         response.raise_for_status()
         values = response.json().get("data", [])
@@ -896,11 +1143,11 @@ def discover_vllm_metrics():
     """Dynamically discover available vLLM metrics from Prometheus, including GPU metrics"""
     try:
         headers = {"Authorization": f"Bearer {THANOS_TOKEN}"}
-        response = requests.get(
+        response = _PROMETHEUS_SESSION.get(
             f"{PROMETHEUS_URL}/api/v1/label/__name__/values",
             headers=headers,
             verify=VERIFY_SSL,
-            timeout=30,  # Add timeout
+            timeout=PROMETHEUS_TIMEOUT,
         )
         response.raise_for_status()
         all_metrics = response.json()["data"]
@@ -1621,54 +1868,89 @@ def get_openshift_metrics():
     return _openshift_metrics_cache
 
 
+@dataclass(frozen=True)
+class MetricQuery:
+    """A PromQL query of the shape ``agg(func(metric{labels}[range_]))``.
+
+    Registry entries authored in this form are rendered with the namespace
+    matcher embedded directly, so no runtime regex rewriting is needed.
+    ``labels`` holds raw PromQL matchers, e.g. ``("phase='Running'",)``.
+    """
+    metric: str
+    agg: Optional[str] = "sum"
+    func: Optional[str] = None
+    range_: Optional[str] = None
+    labels: Tuple[str, ...] = ()
+
+    def render(self, namespace: Optional[str] = None) -> str:
+        matchers = (f'namespace="{namespace}"',) + self.labels if namespace else self.labels
+        expr = self.metric
+        if matchers:
+            expr += "{" + ",".join(matchers) + "}"
+        if self.range_:
+            expr += f"[{self.range_}]"
+        if self.func:
+            expr = f"{self.func}({expr})"
+        if self.agg:
+            expr = f"{self.agg}({expr})"
+        return expr
+
+
 def get_namespace_specific_metrics(category):
     """Get metrics that actually have namespace labels for namespace-specific analysis"""
 
+    running = ("phase='Running'",)
+    pending = ("phase='Pending'",)
+    failed = ("phase='Failed'",)
+    bound = ("phase='Bound'",)
+
     namespace_aware_metrics = {
         "Fleet Overview": {
             # Metrics that work with namespace filtering
-            "Deployment Replicas Ready": "sum(kube_deployment_status_replicas_ready)",
-            "Pods Running": "sum(kube_pod_status_phase{phase='Running'})",
-            "Pods Failed": "sum(kube_pod_status_phase{phase='Failed'})",
-            "Container CPU Usage": "sum(rate(container_cpu_usage_seconds_total[5m]))",
-            "Container Memory Usage": "sum(container_memory_usage_bytes)",
-            "Pod Restart Rate": "sum(rate(kube_pod_container_status_restarts_total[5m]))",
+            "Deployment Replicas Ready": MetricQuery("kube_deployment_status_replicas_ready"),
+            "Pods Running": MetricQuery("kube_pod_status_phase", labels=running),
+            "Pods Failed": MetricQuery("kube_pod_status_phase", labels=failed),
+            "Container CPU Usage": MetricQuery("container_cpu_usage_seconds_total", func="rate", range_="5m"),
+            "Container Memory Usage": MetricQuery("container_memory_usage_bytes"),
+            "Pod Restart Rate": MetricQuery("kube_pod_container_status_restarts_total", func="rate", range_="5m"),
         },
         "Workloads & Pods": {
             # Pod and container metrics naturally have namespace labels
-            "Pods Running": "sum(kube_pod_status_phase{phase='Running'})",
-            "Pods Pending": "sum(kube_pod_status_phase{phase='Pending'})",
-            "Pods Failed": "sum(kube_pod_status_phase{phase='Failed'})",
-            "Pod Restarts (Rate)": "sum(rate(kube_pod_container_status_restarts_total[5m]))",
-            "Container CPU Usage": "sum(rate(container_cpu_usage_seconds_total[5m]))",
-            "Container Memory Usage": "sum(container_memory_usage_bytes)",
+            "Pods Running": MetricQuery("kube_pod_status_phase", labels=running),
+            "Pods Pending": MetricQuery("kube_pod_status_phase", labels=pending),
+            "Pods Failed": MetricQuery("kube_pod_status_phase", labels=failed),
+            "Pod Restarts (Rate)": MetricQuery("kube_pod_container_status_restarts_total", func="rate", range_="5m"),
+            "Container CPU Usage": MetricQuery("container_cpu_usage_seconds_total", func="rate", range_="5m"),
+            "Container Memory Usage": MetricQuery("container_memory_usage_bytes"),
         },
         "Compute & Resources": {
             # Container-level compute and resource metrics
-            "Container CPU Throttling": "sum(container_cpu_cfs_throttled_seconds_total)",
-            "Container Memory Failures": "sum(container_memory_failcnt)",
-            "OOM Events": "sum(container_oom_events_total)",
-            "Container Processes": "sum(container_processes)",
-            "Container Threads": "sum(container_threads)",
-            "Container File Descriptors": "sum(container_file_descriptors)",
+            "Container CPU Throttling": MetricQuery("container_cpu_cfs_throttled_seconds_total"),
+            "Container Memory Failures": MetricQuery("container_memory_failcnt"),
+            "OOM Events": MetricQuery("container_oom_events_total"),
+            "Container Processes": MetricQuery("container_processes"),
+            "Container Threads": MetricQuery("container_threads"),
+            "Container File Descriptors": MetricQuery("container_file_descriptors"),
         },
         "Storage & Networking": {
             # Storage and network metrics that have namespace context
-            "PV Claims Bound": "sum(kube_persistentvolumeclaim_status_phase{phase='Bound'})",
-            "PV Claims Pending": "sum(kube_persistentvolumeclaim_status_phase{phase='Pending'})",
-            "Container Network Receive": "sum(rate(container_network_receive_bytes_total[5m]))",
-            "Container Network Transmit": "sum(rate(container_network_transmit_bytes_total[5m]))",
+            "PV Claims Bound": MetricQuery("kube_persistentvolumeclaim_status_phase", labels=bound),
+            "PV Claims Pending": MetricQuery("kube_persistentvolumeclaim_status_phase", labels=pending),
+            "Container Network Receive": MetricQuery("container_network_receive_bytes_total", func="rate", range_="5m"),
+            "Container Network Transmit": MetricQuery("container_network_transmit_bytes_total", func="rate", range_="5m"),
+            # Compound expression: not expressible as a MetricQuery, uses the legacy string path
             "Network Errors": "sum(rate(container_network_receive_errors_total[5m]) + rate(container_network_transmit_errors_total[5m]))",
-            "Filesystem Usage": "sum(container_fs_usage_bytes)",
+            "Filesystem Usage": MetricQuery("container_fs_usage_bytes"),
         },
         "Application Services": {
             # Application metrics that work at namespace level
-            "HTTP Request Rate": "sum(rate(http_requests_total[5m]))",
+            "HTTP Request Rate": MetricQuery("http_requests_total", func="rate", range_="5m"),
+            # Compound expression: not expressible as a MetricQuery, uses the legacy string path
             "HTTP Error Rate (%)": "sum(rate(http_requests_total{status=~'5..'}[5m])) / sum(rate(http_requests_total[5m])) * 100",
-            "Available Endpoints": "sum(kube_endpoint_address_available)",
-            "Container Processes": "sum(container_processes)",
-            "Container File Descriptors": "sum(container_file_descriptors)",
-            "Container Threads": "sum(container_threads)",
+            "Available Endpoints": MetricQuery("kube_endpoint_address_available"),
+            "Container Processes": MetricQuery("container_processes"),
+            "Container File Descriptors": MetricQuery("container_file_descriptors"),
+            "Container Threads": MetricQuery("container_threads"),
         },
     }
 
@@ -1679,7 +1961,7 @@ def _select_openshift_metrics_for_scope(
     metric_category: str,
     scope: str,
     namespace: Optional[str],
-) -> Tuple[Dict[str, str], Optional[str]]:
+) -> Tuple[Dict[str, Union[str, MetricQuery]], Optional[str]]:
     """Select metrics dict and namespace filter based on scope/category.
 
     Returns (metrics_to_fetch, namespace_for_query)
@@ -1914,15 +2196,17 @@ def fetch_metrics(query, model_name, start, end, namespace=None):
     try:
         step = choose_prometheus_step(start, end)
         logger.debug("Fetching Prometheus metrics for vLLM, query: %s, start: %s, end: %s: step: %s", query, start, end, step)
-        response = requests.get(
+        response = _PROMETHEUS_SESSION.get(
             f"{PROMETHEUS_URL}/api/v1/query_range",
             headers=headers,
             params={"query": promql_query, "start": start, "end": end, "step": step},
             verify=VERIFY_SSL,
-            timeout=30,  # Add timeout
+            timeout=PROMETHEUS_TIMEOUT,
+            stream=_STREAM_RANGE_RESULTS,
         )
-        response.raise_for_status()
-        result = response.json()["data"]["result"]
+        with response:
+            response.raise_for_status()
+            return _prometheus_result_to_dataframe(_iter_prometheus_result(response))
 
     except requests.exceptions.ConnectionError as e:
         logger.warning("Prometheus connection error for query '%s': %s", promql_query, e)
@@ -1934,89 +2218,87 @@ def fetch_metrics(query, model_name, start, end, namespace=None):
         logger.warning("Prometheus request error for query '%s': %s", promql_query, e)
         return pd.DataFrame()  # Return empty DataFrame on other request errors
 
-    rows = []
-    for series in result:
-        for val in series["values"]:
-            ts = datetime.fromtimestamp(float(val[0]))
-            value = float(val[1])
-
-            # Handle NaN values that can't be JSON serialized
-            if pd.isna(value) or value != value:  # Check for NaN
-                value = 0.0  # Convert NaN to 0 for JSON compatibility
-
-            row = dict(series["metric"])
-            row["timestamp"] = ts
-            row["value"] = value
-            rows.append(row)
 
-    return pd.DataFrame(rows)
+def _inject_openshift_namespace(query: str, namespace: str) -> str:
+    """Add a namespace matcher to a free-form PromQL string via regex rewriting.
 
+    Legacy path for queries that are not authored as ``MetricQuery``.
+    """
+    # Skip if namespace already exists in the query
+    if f'namespace="{namespace}"' in query:
+        return query  # Already has the correct namespace
+
+    # Simple string replacements for common patterns
+
+    # Pattern 1: sum(metric_name)
+    pattern1 = r"sum\(([a-zA-Z_:][a-zA-Z0-9_:]*)\)"
+    if re.search(pattern1, query):
+        query = re.sub(pattern1, f'sum(\\1{{namespace="{namespace}"}})', query)
+
+    # Pattern 2: sum(rate(metric_name[5m]))
+    elif re.search(r"sum\(rate\([a-zA-Z_:][a-zA-Z0-9_:]*\[[^\]]+\]\)\)", query):
+        pattern2 = r"sum\(rate\(([a-zA-Z_:][a-zA-Z0-9_:]*)\[([^\]]+)\]\)\)"
+        query = re.sub(
+            pattern2, f'sum(rate(\\1{{namespace="{namespace}"}}[\\2]))', query
+        )
 
-def fetch_openshift_metrics(query, start, end, namespace=None):
-    """Fetch OpenShift metrics with optional namespace filtering.
+    # Pattern 3: rate(metric_name[5m])
+    elif re.search(r"rate\([a-zA-Z_:][a-zA-Z0-9_:]*\[[^\]]+\]\)", query):
+        pattern3 = r"rate\(([a-zA-Z_:][a-zA-Z0-9_:]*)\[([^\]]+)\]\)"
+        query = re.sub(
+            pattern3, f'rate(\\1{{namespace="{namespace}"}}[\\2])', query
+        )
 
-    Network/request exceptions are raised to allow callers (e.g., MCP tools)
-    to convert them into structured errors for the UI.
-    """
-    headers = _auth_headers()
-    # Add namespace filter to the query if specified
-    if namespace:
-        # Skip if namespace already exists in the query
-        if f'namespace="{namespace}"' in query:
-            pass  # Already has the correct namespace
-        else:
-            # Simple string replacements for common patterns
+    # Pattern 4: metric_name{existing_labels}
+    elif re.search(r"[a-zA-Z_:][a-zA-Z0-9_:]*\{[^}]*\}", query):
+        pattern4 = r"([a-zA-Z_:][a-zA-Z0-9_:]*)\{([^}]*)\}"
+        query = re.sub(pattern4, f'\\1{{namespace="{namespace}",\\2}}', query)
 
-            # Pattern 1: sum(metric_name)
-            pattern1 = r"sum\(([a-zA-Z_:][a-zA-Z0-9_:]*)\)"
-            if re.search(pattern1, query):
-                query = re.sub(pattern1, f'sum(\\1{{namespace="{namespace}"}})', query)
+    # Pattern 5: simple metric_name (no labels)
+    elif re.search(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$", query):
+        query = f'{query}{{namespace="{namespace}"}}'
 
-            # Pattern 2: sum(rate(metric_name[5m]))
-            elif re.search(r"sum\(rate\([a-zA-Z_:][a-zA-Z0-9_:]*\[[^\]]+\]\)\)", query):
-                pattern2 = r"sum\(rate\(([a-zA-Z_:][a-zA-Z0-9_:]*)\[([^\]]+)\]\)\)"
+    # Pattern 6: handle other aggregations (avg, count, etc.)
+    else:
+        for func in ["avg", "count", "max", "min"]:
+            pattern = f"{func}\\(([a-zA-Z_:][a-zA-Z0-9_:]*)\\)"
+            if re.search(pattern, query):
                 query = re.sub(
-                    pattern2, f'sum(rate(\\1{{namespace="{namespace}"}}[\\2]))', query
+                    pattern, f'{func}(\\1{{namespace="{namespace}"}})', query
                 )
+                break
+    return query
 
-            # Pattern 3: rate(metric_name[5m])
-            elif re.search(r"rate\([a-zA-Z_:][a-zA-Z0-9_:]*\[[^\]]+\]\)", query):
-                pattern3 = r"rate\(([a-zA-Z_:][a-zA-Z0-9_:]*)\[([^\]]+)\]\)"
-                query = re.sub(
-                    pattern3, f'rate(\\1{{namespace="{namespace}"}}[\\2])', query
-                )
 
-            # Pattern 4: metric_name{existing_labels}
-            elif re.search(r"[a-zA-Z_:][a-zA-Z0-9_:]*\{[^}]*\}", query):
-                pattern4 = r"([a-zA-Z_:][a-zA-Z0-9_:]*)\{([^}]*)\}"
-                query = re.sub(pattern4, f'\\1{{namespace="{namespace}",\\2}}', query)
+def fetch_openshift_metrics(query: Union[str, MetricQuery], start, end, namespace=None):
+    """Fetch OpenShift metrics with optional namespace filtering.
 
-            # Pattern 5: simple metric_name (no labels)
-            elif re.search(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$", query):
-                query = f'{query}{{namespace="{namespace}"}}'
+    ``query`` may be a ``MetricQuery``, rendered with the namespace matcher
+    embedded, or a PromQL string, which is rewritten by regex for back-compat.
 
-            # Pattern 6: handle other aggregations (avg, count, etc.)
-            else:
-                for func in ["avg", "count", "max", "min"]:
-                    pattern = f"{func}\\(([a-zA-Z_:][a-zA-Z0-9_:]*)\\)"
-                    if re.search(pattern, query):
-                        query = re.sub(
-                            pattern, f'{func}(\\1{{namespace="{namespace}"}})', query
-                        )
-                        break
+    Network/request exceptions are raised to allow callers (e.g., MCP tools)
+    to convert them into structured errors for the UI.
+    """
+    headers = _auth_headers()
+    if isinstance(query, MetricQuery):
+        query = query.render(namespace)
+    elif namespace:
+        query = _inject_openshift_namespace(query, namespace)
 
     try:
         step = choose_prometheus_step(start, end)
         logger.debug("Fetching Prometheus metrics for OpenShift, query: %s, start: %s, end: %s: step: %s", query, start, end, step)
-        response = requests.get(
+        response = _PROMETHEUS_SESSION.get(
             f"{PROMETHEUS_URL}/api/v1/query_range",
             headers=headers,
             params={"query": query, "start": start, "end": end, "step": step},
             verify=VERIFY_SSL,
-            timeout=30,  # Add timeout
+            timeout=PROMETHEUS_TIMEOUT,
+            stream=_STREAM_RANGE_RESULTS,
         )
-        response.raise_for_status()
-        result = response.json()["data"]["result"]
+        with response:
+            response.raise_for_status()
+            df = _prometheus_result_to_dataframe(_iter_prometheus_result(response))
         logger.debug("Metrics fetched successfully")
     except requests.exceptions.ConnectionError as e:
         logger.warning("Prometheus connection error for OpenShift query '%s': %s", query, e)
@@ -2028,22 +2310,7 @@ def fetch_openshift_metrics(query, start, end, namespace=None):
         logger.warning("Prometheus request error for OpenShift query '%s': %s", query, e)
         raise
 
-    rows = []
-    for series in result:
-        for val in series["values"]:
-            ts = datetime.fromtimestamp(float(val[0]))
-            value = float(val[1])
-
-            # Handle NaN values that can't be JSON serialized
-            if pd.isna(value) or value != value:  # Check for NaN
-                value = 0.0  # Convert NaN to 0 for JSON compatibility
-
-            row = dict(series["metric"])
-            row["timestamp"] = ts
-            row["value"] = value
-            rows.append(row)
-
-    return pd.DataFrame(rows) 
+    return df
 
 
 # --- Business logic for MCP tools (moved from tools module) ---
@@ -2124,6 +2391,36 @@ def get_summarization_models() -> List[str]:
         return []
 
 
+# Temperature aggregates computed by Prometheus; one tiny series per stat
+_GPU_TEMP_STATS = ("count", "min", "avg", "max")
+
+
+def _gpu_temperature_stats_query(temp_metric: str) -> str:
+    """Build one instant query returning count/min/avg/max of a temperature metric.
+
+    Each aggregate is tagged with a ``stat`` label so the union comes back as
+    at most four scalar series instead of one labelled series per GPU.
+    """
+    return " or ".join(
+        f'label_replace({stat}({temp_metric}), "stat", "{stat}", "", "")'
+        for stat in _GPU_TEMP_STATS
+    )
+
+
+def _merge_temperature_stats(total: Dict[str, Any], vendor: Dict[str, float]) -> None:
+    """Fold one vendor's temperature aggregates into the cluster-wide summary."""
+    count = int(vendor["count"])
+    prev = total.get("count", 0)
+    if prev == 0:
+        total.update(count=count, min=vendor["min"], avg=vendor["avg"], max=vendor["max"])
+        return
+    merged = prev + count
+    total["avg"] = (total["avg"] * prev + vendor["avg"] * count) / merged
+    total["min"] = min(total["min"], vendor["min"])
+    total["max"] = max(total["max"], vendor["max"])
+    total["count"] = merged
+
+
 def _fetch_vendor_gpu_info(
     headers: Dict[str, str],
     temp_metric: str,
@@ -2144,19 +2441,22 @@ def _fetch_vendor_gpu_info(
         Count of GPUs/accelerators found for this vendor
     """
     try:
-        resp = requests.get(
+        resp = _PROMETHEUS_SESSION.get(
             f"{PROMETHEUS_URL}/api/v1/query",
             headers=headers,
-            params={"query": temp_metric},
+            params={"query": _gpu_temperature_stats_query(temp_metric)},
             verify=VERIFY_SSL,
-            timeout=30,
+            timeout=PROMETHEUS_TIMEOUT,
         )
         resp.raise_for_status()
-        result = resp.json().get("data", {}).get("result", [])
-        count = len(result)
-        if count > 0:
-            temps = [float(series.get("value", [None, None])[1]) for series in result if series.get("value")]
-            info["temperatures"].extend(temps)
+        stats = {
+            series["metric"]["stat"]: float(series["value"][1])
+            for series in _prometheus_result(resp)
+            if series.get("metric", {}).get("stat") in _GPU_TEMP_STATS and series.get("value")
+        }
+        count = int(stats.get("count", 0))
+        if count > 0 and len(stats) == len(_GPU_TEMP_STATS):
+            _merge_temperature_stats(info["temperatures"], stats)
             info["vendors"].append(vendor_name)
             info["models"].append(model_name)
         return count
@@ -2168,6 +2468,9 @@ def get_cluster_gpu_info() -> Dict[str, Any]:
     """Fetch cluster GPU/accelerator info from Prometheus (multi-vendor: NVIDIA DCGM + Intel Gaudi).
 
     Returns a dict with total_gpus, vendors, models, temperatures, power_usage.
+    ``temperatures`` is a summary across all accelerators
+    (``{"count", "min", "avg", "max"}``), aggregated server-side; it is empty
+    when no accelerators report a temperature.
     
     To add AMD support: Add a call to _fetch_vendor_gpu_info() with AMD-specific parameters
     (e.g., temp_metric="GPU_JUNCTION_TEMPERATURE", vendor_name="AMD", model_name="Instinct")
@@ -2178,7 +2481,7 @@ def get_cluster_gpu_info() -> Dict[str, Any]:
         "total_gpus": 0,
         "vendors": [],
         "models": [],
-        "temperatures": [],
+        "temperatures": {},
         "power_usage": [],
     }
     
@@ -2212,15 +2515,15 @@ def get_namespace_model_deployment_info(namespace: str, model: str) -> Dict[str,
     try:
         # Probe pods in namespace
         query = f'kube_pod_info{{namespace="{namespace}"}}'
-        r = requests.get(
+        r = _PROMETHEUS_SESSION.get(
             f"{PROMETHEUS_URL}/api/v1/query",
             headers=headers,
             params={"query": query},
             verify=VERIFY_SSL,
-            timeout=30,
+            timeout=PROMETHEUS_TIMEOUT,
         )
         r.raise_for_status()
-        result = r.json().get("data", {}).get("result", [])
+        result = _prometheus_result(r)
     except Exception:
         result = []
 
@@ -2233,15 +2536,15 @@ def get_namespace_model_deployment_info(namespace: str, model: str) -> Dict[str,
         try:
             one_week_ago = int((now - _td(days=7)).timestamp())
             vq = f'vllm:cache_config_info{{namespace="{namespace}"}}'
-            vr = requests.get(
+            vr = _PROMETHEUS_SESSION.get(
                 f"{PROMETHEUS_URL}/api/v1/query_range",
                 headers=headers,
                 params={"query": vq, "start": one_week_ago, "end": int(now.timestamp()), "step": "1h"},
                 verify=VERIFY_SSL,
-                timeout=30,
+                timeout=PROMETHEUS_TIMEOUT,
             )
             if vr.status_code == 200:
-                vres = vr.json().get("data", {}).get("result", [])
+                vres = _prometheus_result(vr)
                 if not vres:
                     is_new = True
                     deploy_date = now.strftime("%Y-%m-%d")
@@ -2279,22 +2582,21 @@ def get_namespace_model_deployment_info(namespace: str, model: str) -> Dict[str,
         "model": model,
     }
 
+# Any whitespace forces a span tag value to be quoted in _fmt_val
+_WS_RE = re.compile(r"\s")
+
+
 def _fmt_val(v: Any) -> str:
-    try:
-        if v is None:
-            return "null"
-        if isinstance(v, bool):
-            return "true" if v else "false"
-        if isinstance(v, (int, float)):
-            return str(v)
-        s = str(v)
-        if '"' in s:
-            s = s.replace('"', '\\"')
-        if any(c.isspace() for c in s):
-            return f"\"{s}\""
-        return s
-    except Exception:
+    if v is None:
+        return "null"
+    if isinstance(v, bool):
+        return "true" if v else "false"
+    if isinstance(v, (int, float)):
         return str(v)
+    s = str(v)
+    if '"' in s:
+        s = s.replace('"', '\\"')
+    return f'"{s}"' if _WS_RE.search(s) else s
 
 
 def _format_span_kv(span_obj: Dict[str, Any]) -> str:
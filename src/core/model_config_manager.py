@@ -7,13 +7,23 @@ using MODEL_CONFIG env var as template for initialization.
 Also discovers internal models at runtime by querying InferenceServices.
 """
 
+import asyncio
+import atexit
+import concurrent.futures
+import copy
 import os
-import json
 import logging
+import ssl
 import threading
+import time
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+
+from common import json_utils
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +35,35 @@ K8S_SA_TOKEN_PATH = "/var/run/secrets/kubernetes.io/serviceaccount/token"
 K8S_SA_CA_PATH = "/var/run/secrets/kubernetes.io/serviceaccount/ca.crt"
 CONFIGMAP_NAME = "ai-model-config"
 
+# Pooled keep-alive session for every Kubernetes API call in this module, so
+# only the first request pays the TCP + TLS handshake. Connection errors are
+# retried on idempotent verbs only (urllib3's default allowed_methods).
+_k8s_session = requests.Session()
+_k8s_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.2, raise_on_status=False),
+)
+_k8s_session.mount("https://", _k8s_adapter)
+_k8s_session.mount("http://", _k8s_adapter)
+atexit.register(_k8s_session.close)
+# Passed per call: a session-level verify is overridden by REQUESTS_CA_BUNDLE
+_K8S_VERIFY = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
+
 # InferenceService API configuration
 INFERENCE_SERVICE_API_GROUP = "serving.kserve.io"
 INFERENCE_SERVICE_API_VERSION = "v1beta1"
 
+# Pod-lifetime settings, resolved once at import (None when NAMESPACE is unset)
+_NAMESPACE = os.getenv("NAMESPACE", "")
+_CONFIGMAPS_URL = f"{K8S_API_URL}/api/v1/namespaces/{_NAMESPACE}/configmaps" if _NAMESPACE else None
+_CONFIGMAP_URL = f"{_CONFIGMAPS_URL}/{CONFIGMAP_NAME}" if _NAMESPACE else None
+_INFERENCE_SERVICES_URL = (
+    f"{K8S_API_URL}/apis/{INFERENCE_SERVICE_API_GROUP}/"
+    f"{INFERENCE_SERVICE_API_VERSION}/namespaces/{_NAMESPACE}/inferenceservices"
+    if _NAMESPACE else None
+)
+
 # Model ID mapping: InferenceService name -> HuggingFace model ID
 # This maps the InferenceService name (as deployed by llama-stack/llm-service charts)
 # to the full HuggingFace model ID used in MODEL_CONFIG
@@ -47,11 +82,32 @@ MODEL_ID_MAP = {
 }
 
 # Runtime configuration cache
-_runtime_config: Optional[Dict[str, Any]] = None
-_config_lock = threading.RLock()
-_config_last_updated: Optional[datetime] = None
+# (config, loaded_at) published by plain assignment, so readers take no lock.
+# The config dict is replaced wholesale and must be treated as read-only.
+# loaded_at is a time.monotonic() reading: cheap, and immune to wall-clock jumps.
+_snapshot: Tuple[Optional[Dict[str, Any]], Optional[float]] = (None, None)
+_refresh_lock = threading.Lock()  # Guards _refresh_event and watch startup
+# Set while a TTL refresh is in flight; concurrent callers wait on it
+_refresh_event: Optional[threading.Event] = None
 _config_cache_ttl_seconds = 60  # Refresh every 60 seconds
 
+# ConfigMap watch: while healthy, updates are pushed and TTL polling is skipped.
+# The watch is per process; the MCP server runs a single uvicorn worker, so
+# there is exactly one watch connection per pod. Multi-worker deployments
+# would need a shared leader instead of one watch per worker.
+_WATCH_TIMEOUT_SECONDS = 300  # Server-side watch timeout; each reconnect re-lists
+_WATCH_MAX_BACKOFF_SECONDS = 60
+# Watches run as tasks on one background event loop, so further watched
+# resources add a coroutine each rather than a blocking thread each.
+_watch_loop: Optional[asyncio.AbstractEventLoop] = None
+_watch_future: Optional["concurrent.futures.Future[None]"] = None
+_watch_healthy = threading.Event()
+_discovered_models: Dict[str, Any] = {}
+# ConfigMap-derived config last seen by the watch, without discovered models.
+# InferenceServices are not watched, so discovery is re-run over it on the
+# same cadence as the TTL cache while the watch is healthy.
+_base_config: Optional[Dict[str, Any]] = None
+
 
 def load_model_config_from_env() -> Dict[str, Any]:
     """
@@ -64,7 +120,7 @@ def load_model_config_from_env() -> Dict[str, Any]:
     """
     try:
         model_config_str = os.getenv("MODEL_CONFIG", "{}")
-        config = json.loads(model_config_str)
+        config = json_utils.loads(model_config_str)
         logger.debug(f"Loaded {len(config)} default models from MODEL_CONFIG env var")
         return config
     except Exception as e:
@@ -72,20 +128,50 @@ def load_model_config_from_env() -> Dict[str, Any]:
         return {}
 
 
+# Cached API headers, keyed on the token file mtime: projected SA tokens are
+# rotated by the kubelet (file replaced, mtime changes) on the order of hours.
+_token_cache: Dict[str, Any] = {"headers": None, "mtime": 0.0}
+
+
 def _get_k8s_headers() -> Dict[str, str]:
-    """Get Kubernetes API headers with service account token."""
+    """Get Kubernetes API headers with service account token.
+
+    The returned dict is shared between calls and must not be mutated.
+    """
     try:
+        mtime = os.stat(K8S_SA_TOKEN_PATH).st_mtime
+        headers = _token_cache["headers"]
+        if headers is not None and mtime == _token_cache["mtime"]:
+            return headers
+
         with open(K8S_SA_TOKEN_PATH, 'r') as f:
             token = f.read().strip()
-        return {
+        headers = {
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json'
         }
+        _token_cache["headers"] = headers
+        _token_cache["mtime"] = mtime
+        return headers
     except Exception as e:
         logger.error(f"Failed to read service account token: {e}")
         return {'Content-Type': 'application/json'}
 
 
+def _k8s_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Issue a Kubernetes API request on the pooled session.
+
+    On 401 the cached token is dropped and the request is retried once with
+    a freshly read token.
+    """
+    r = _k8s_session.request(method, url, headers=_get_k8s_headers(), verify=_K8S_VERIFY, **kwargs)
+    if r.status_code == 401:
+        r.close()
+        _token_cache["headers"] = None
+        r = _k8s_session.request(method, url, headers=_get_k8s_headers(), verify=_K8S_VERIFY, **kwargs)
+    return r
+
+
 def discover_inference_services() -> Dict[str, Any]:
     """
     Discover internal models by querying InferenceServices in the namespace.
@@ -106,20 +192,12 @@ def discover_inference_services() -> Dict[str, Any]:
     discovered_models = {}
     
     try:
-        ns = os.getenv("NAMESPACE", "")
-        if not ns:
+        if _INFERENCE_SERVICES_URL is None:
             logger.debug("NAMESPACE not set, skipping InferenceService discovery")
             return {}
         
         # Query InferenceServices in the namespace
-        url = (
-            f"{K8S_API_URL}/apis/{INFERENCE_SERVICE_API_GROUP}/"
-            f"{INFERENCE_SERVICE_API_VERSION}/namespaces/{ns}/inferenceservices"
-        )
-        headers = _get_k8s_headers()
-        verify = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
-        
-        r = requests.get(url, headers=headers, timeout=10, verify=verify)
+        r = _k8s_request("GET", _INFERENCE_SERVICES_URL, timeout=10)
         
         if r.status_code == 404:
             # InferenceService CRD not installed or no access
@@ -134,7 +212,7 @@ def discover_inference_services() -> Dict[str, Any]:
             logger.warning(f"Failed to list InferenceServices: {r.status_code}")
             return {}
         
-        data = r.json()
+        data = json_utils.loads(r.content)
         items = data.get("items", [])
         
         for isvc in items:
@@ -176,6 +254,14 @@ def discover_inference_services() -> Dict[str, Any]:
         return {}
 
 
+def _parse_model_config(configmap: Dict[str, Any]) -> Dict[str, Any]:
+    """Decode the model-config.json payload embedded in a ConfigMap object."""
+    try:
+        return json_utils.loads(configmap["data"]["model-config.json"])
+    except KeyError:
+        return {}
+
+
 def load_model_config_from_configmap() -> Optional[Dict[str, Any]]:
     """
     Load model configuration from ConfigMap.
@@ -184,16 +270,11 @@ def load_model_config_from_configmap() -> Optional[Dict[str, Any]]:
         Model config dict if ConfigMap exists, None otherwise
     """
     try:
-        ns = os.getenv("NAMESPACE", "")
-        if not ns:
+        if _CONFIGMAP_URL is None:
             logger.warning("NAMESPACE not set, cannot read ConfigMap")
             return None
 
-        url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/configmaps/{CONFIGMAP_NAME}"
-        headers = _get_k8s_headers()
-        verify = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
-
-        r = requests.get(url, headers=headers, timeout=5, verify=verify)
+        r = _k8s_request("GET", _CONFIGMAP_URL, timeout=5)
 
         if r.status_code == 404:
             logger.info(f"ConfigMap {CONFIGMAP_NAME} not found")
@@ -203,9 +284,7 @@ def load_model_config_from_configmap() -> Optional[Dict[str, Any]]:
             logger.error(f"Failed to get ConfigMap: {r.status_code}")
             return None
 
-        configmap_data = r.json()
-        config_json = configmap_data.get("data", {}).get("model-config.json", "{}")
-        config = json.loads(config_json)
+        config = _parse_model_config(json_utils.loads(r.content))
         logger.debug(f"Loaded {len(config)} models from ConfigMap")
         return config
 
@@ -214,6 +293,30 @@ def load_model_config_from_configmap() -> Optional[Dict[str, Any]]:
         return None
 
 
+# Static part of the ConfigMap created from defaults; create_configmap_from_defaults
+# deep-copies it and fills in namespace, created-at and the config payload.
+_CONFIGMAP_SKELETON: Dict[str, Any] = {
+    "apiVersion": "v1",
+    "kind": "ConfigMap",
+    "metadata": {
+        "name": CONFIGMAP_NAME,
+        "labels": {
+            "app.kubernetes.io/name": "mcp-server",
+            "app.kubernetes.io/component": "model-config",
+            "app.kubernetes.io/managed-by": "mcp-server"  # NOT helm!
+        },
+        "annotations": {
+            "config.kubernetes.io/created-by": "mcp-server",
+            "config.kubernetes.io/description": (
+                "User-managed AI model configuration. "
+                "This ConfigMap is not managed by Helm and will persist across upgrades."
+            )
+        }
+    },
+    "data": {}
+}
+
+
 def create_configmap_from_defaults(default_config: Dict[str, Any]) -> bool:
     """
     Create ConfigMap from default configuration.
@@ -228,41 +331,17 @@ def create_configmap_from_defaults(default_config: Dict[str, Any]) -> bool:
         True if successful, False otherwise
     """
     try:
-        ns = os.getenv("NAMESPACE", "")
-        if not ns:
+        if _CONFIGMAPS_URL is None:
             logger.error("Cannot create ConfigMap: NAMESPACE not set")
             return False
 
-        configmap_payload = {
-            "apiVersion": "v1",
-            "kind": "ConfigMap",
-            "metadata": {
-                "name": CONFIGMAP_NAME,
-                "namespace": ns,
-                "labels": {
-                    "app.kubernetes.io/name": "mcp-server",
-                    "app.kubernetes.io/component": "model-config",
-                    "app.kubernetes.io/managed-by": "mcp-server"  # NOT helm!
-                },
-                "annotations": {
-                    "config.kubernetes.io/created-by": "mcp-server",
-                    "config.kubernetes.io/created-at": datetime.utcnow().isoformat() + "Z",
-                    "config.kubernetes.io/description": (
-                        "User-managed AI model configuration. "
-                        "This ConfigMap is not managed by Helm and will persist across upgrades."
-                    )
-                }
-            },
-            "data": {
-                "model-config.json": json.dumps(default_config, indent=2)
-            }
-        }
+        configmap_payload = copy.deepcopy(_CONFIGMAP_SKELETON)
+        metadata = configmap_payload["metadata"]
+        metadata["namespace"] = _NAMESPACE
+        metadata["annotations"]["config.kubernetes.io/created-at"] = datetime.utcnow().isoformat() + "Z"
+        configmap_payload["data"]["model-config.json"] = json_utils.dumps(default_config, indent=True)
 
-        url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/configmaps"
-        headers = _get_k8s_headers()
-        verify = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
-
-        r = requests.post(url, headers=headers, json=configmap_payload, timeout=10, verify=verify)
+        r = _k8s_request("POST", _CONFIGMAPS_URL, data=json_utils.dumps(configmap_payload), timeout=10)
 
         if r.status_code not in (200, 201):
             logger.error(f"Failed to create ConfigMap: {r.status_code} {r.text}")
@@ -276,18 +355,17 @@ def create_configmap_from_defaults(default_config: Dict[str, Any]) -> bool:
         return False
 
 
-def load_runtime_model_config() -> Dict[str, Any]:
+def _load_base_model_config() -> Dict[str, Any]:
     """
-    Load model configuration with ConfigMap-first priority + runtime discovery.
+    Load the user-managed model configuration, creating the ConfigMap if needed.
 
     Loading strategy:
     1. Try to load from ConfigMap (user-managed, persists across Helm upgrades)
     2. If ConfigMap doesn't exist, create it from MODEL_CONFIG defaults
     3. If creation fails, fall back to defaults from env var
-    4. Discover internal models from InferenceServices and merge them
 
     Returns:
-        Model configuration dict (external + discovered internal models)
+        Model configuration dict (without discovered internal models)
     """
     # Load defaults from environment variable
     default_config = load_model_config_from_env()
@@ -298,68 +376,313 @@ def load_runtime_model_config() -> Dict[str, Any]:
     if configmap_config is not None:
         # ConfigMap exists, use it as source of truth
         logger.debug(f"Using ConfigMap as model config source ({len(configmap_config)} models)")
-        base_config = configmap_config
-    else:
-        # ConfigMap doesn't exist, try to create it from defaults
-        logger.info("ConfigMap not found, creating from defaults")
-        success = create_configmap_from_defaults(default_config)
-
-        if success:
-            # Return the newly created config
-            base_config = default_config
-        else:
-            # Fall back to env var defaults if creation failed
-            logger.warning("ConfigMap creation failed, using env var defaults")
-            base_config = default_config
-
-    # Discover internal models from InferenceServices
-    discovered_models = discover_inference_services()
-    
+        return configmap_config
+
+    # ConfigMap doesn't exist, try to create it from defaults
+    logger.info("ConfigMap not found, creating from defaults")
+    success = create_configmap_from_defaults(default_config)
+
+    if not success:
+        # Fall back to env var defaults if creation failed
+        logger.warning("ConfigMap creation failed, using env var defaults")
+
+    return default_config
+
+
+def _merge_discovered_models(
+    base_config: Dict[str, Any], discovered_models: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Merge discovered internal models over the base config."""
     # Merge: discovered models are added/updated, base_config is preserved
     # Discovered models take precedence for internal model entries
     merged_config = {**base_config, **discovered_models}
-    
+
     if discovered_models:
         logger.info(
             f"Model config: {len(base_config)} from config + "
             f"{len(discovered_models)} discovered = {len(merged_config)} total"
         )
-    
+
     return merged_config
 
 
+def load_runtime_model_config() -> Dict[str, Any]:
+    """
+    Load model configuration with ConfigMap-first priority + runtime discovery.
+
+    Loading strategy:
+    1. Load the ConfigMap, creating it from MODEL_CONFIG defaults if missing
+    2. Discover internal models from InferenceServices and merge them
+
+    Returns:
+        Model configuration dict (external + discovered internal models)
+    """
+    return _with_discovered_models(_load_base_model_config())
+
+
+def _with_discovered_models(base_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Discover internal models from InferenceServices and merge them in."""
+    global _discovered_models
+
+    _discovered_models = discover_inference_services()
+    return _merge_discovered_models(base_config, _discovered_models)
+
+
+def _publish_model_config(config: Dict[str, Any]) -> None:
+    """Atomically swap in a new runtime configuration snapshot."""
+    global _snapshot
+
+    _snapshot = (config, time.monotonic())
+
+
+def _is_fresh(loaded_at: Optional[float]) -> bool:
+    return loaded_at is not None and time.monotonic() - loaded_at <= _config_cache_ttl_seconds
+
+
+def _relist_model_config() -> str:
+    """
+    Reload the full configuration and return the ConfigMap resourceVersion.
+
+    The list response already carries the ConfigMap, so it is decoded once
+    here rather than fetched again; the ConfigMap is only created from
+    defaults when the list is empty. Changes after the returned
+    resourceVersion are replayed by the watch that starts from it.
+    """
+    global _base_config
+
+    r = _k8s_request(
+        "GET",
+        _CONFIGMAPS_URL,
+        params={"fieldSelector": f"metadata.name={CONFIGMAP_NAME}"},
+        timeout=5,
+    )
+    r.raise_for_status()
+    listing = json_utils.loads(r.content)
+    items = listing.get("items") or []
+
+    base_config = _parse_model_config(items[0]) if items else _load_base_model_config()
+    _base_config = base_config
+    _publish_model_config(_with_discovered_models(base_config))
+    return listing.get("metadata", {}).get("resourceVersion", "")
+
+
+def _apply_watch_event(event: Dict[str, Any]) -> bool:
+    """
+    Apply one ConfigMap watch event.
+
+    Returns:
+        False if the watch must be restarted from a fresh list (410 Gone)
+    """
+    global _base_config
+
+    event_type = event.get("type")
+    obj = event.get("object", {})
+
+    if event_type == "ERROR":
+        logger.info(f"ConfigMap watch ended by API server: {obj.get('code')} {obj.get('reason')}")
+        return False
+
+    if event_type in ("ADDED", "MODIFIED"):
+        config = _parse_model_config(obj)
+        _base_config = config
+        _publish_model_config(_merge_discovered_models(config, _discovered_models))
+        logger.info(f"Model configuration updated from ConfigMap watch: {len(config)} models")
+
+    return True
+
+
+async def _stream_configmap_events(client: httpx.AsyncClient, resource_version: str) -> None:
+    """Stream watch events for the model ConfigMap until the server closes the watch."""
+    params = {
+        "watch": "true",
+        "fieldSelector": f"metadata.name={CONFIGMAP_NAME}",
+        "timeoutSeconds": _WATCH_TIMEOUT_SECONDS,
+    }
+    if resource_version:
+        params["resourceVersion"] = resource_version
+
+    async with client.stream("GET", _CONFIGMAPS_URL, params=params, headers=_get_k8s_headers()) as r:
+        if r.status_code == 410:
+            return
+        if r.status_code == 401:
+            # Rotated token: the reconnect after backoff reads a fresh one
+            _token_cache["headers"] = None
+        r.raise_for_status()
+        async for line in r.aiter_lines():
+            if line and not _apply_watch_event(json_utils.loads(line)):
+                return
+
+
+async def _rediscover_models() -> None:
+    """
+    Re-run InferenceService discovery and republish over the watched config.
+
+    Only discovery runs off the loop. The merge uses the ConfigMap config
+    current when discovery returns, so watch events applied meanwhile are
+    kept. A snapshot published meanwhile by anything other than the watch
+    (e.g. a forced reload) is left alone until the next period.
+    """
+    global _discovered_models
+
+    base_config, snapshot = _base_config, _snapshot
+    if base_config is None:
+        return
+    discovered = await asyncio.to_thread(discover_inference_services)
+    _discovered_models = discovered
+    if _snapshot is snapshot or _base_config is not base_config:
+        _publish_model_config(_merge_discovered_models(_base_config, discovered))
+
+
+async def _rediscover_periodically() -> None:
+    """Refresh discovered internal models every TTL period while the watch runs."""
+    while True:
+        await asyncio.sleep(_config_cache_ttl_seconds)
+        try:
+            await _rediscover_models()
+        except Exception as e:
+            logger.warning("InferenceService rediscovery failed: %s", e)
+
+
+def _is_forbidden(error: Exception) -> bool:
+    """True for a 403 from either the requests list or the httpx watch."""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 403
+
+
+def _watch_ssl_context() -> Any:
+    """TLS verification for the watch client, matching _K8S_VERIFY."""
+    if _K8S_VERIFY is True:
+        return True
+    return ssl.create_default_context(cafile=_K8S_VERIFY)
+
+
+async def _watch_model_config() -> None:
+    """Background task: list, then watch the ConfigMap; back off on failures."""
+    backoff = 1
+    async with httpx.AsyncClient(
+        verify=_watch_ssl_context(),
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        timeout=httpx.Timeout(5, read=_WATCH_TIMEOUT_SECONDS + 30),
+    ) as client:
+        while True:
+            try:
+                # The list (and InferenceService discovery) reuses the blocking
+                # pooled session; it runs once per reconnect, off the loop
+                resource_version = await asyncio.to_thread(_relist_model_config)
+                _watch_healthy.set()
+                backoff = 1
+                rediscovery = asyncio.create_task(_rediscover_periodically())
+                try:
+                    await _stream_configmap_events(client, resource_version)
+                finally:
+                    rediscovery.cancel()
+            except Exception as e:
+                # Fall back to TTL polling in get_model_config until the watch recovers
+                _watch_healthy.clear()
+                if _is_forbidden(e):
+                    # Retrying cannot help until RBAC grants list/watch on the ConfigMap
+                    logger.warning(f"ConfigMap watch not permitted, using TTL polling instead: {e}")
+                    return
+                logger.warning(f"ConfigMap watch failed, retrying in {backoff}s: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _WATCH_MAX_BACKOFF_SECONDS)
+
+
+def _get_watch_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop shared by all watches, starting it once.
+
+    Callers must hold _refresh_lock.
+    """
+    global _watch_loop
+
+    if _watch_loop is None:
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, name="k8s-watch-loop", daemon=True).start()
+        _watch_loop = loop
+    return _watch_loop
+
+
+def _ensure_config_watch() -> None:
+    """Schedule the ConfigMap watch once, when running in-cluster."""
+    global _watch_future
+
+    if _watch_future is not None:
+        return
+
+    if _CONFIGMAPS_URL is None or not os.path.exists(K8S_SA_TOKEN_PATH):
+        return
+
+    with _refresh_lock:
+        if _watch_future is None:
+            _watch_future = asyncio.run_coroutine_threadsafe(_watch_model_config(), _get_watch_loop())
+
+
 def get_model_config(force_refresh: bool = False) -> Dict[str, Any]:
     """
     Get current model configuration with optional refresh.
 
-    Uses caching with TTL to avoid excessive ConfigMap reads.
+    Reads are lock-free against a shared snapshot. In-cluster, a
+    background watch on the ConfigMap pushes updates, so reads never poll.
+    Otherwise (or while the watch is reconnecting) a TTL cache avoids
+    excessive ConfigMap reads, and concurrent stale reads share one reload.
 
     Args:
         force_refresh: If True, bypass cache and reload from ConfigMap
 
     Returns:
-        Current model configuration dict
+        Current model configuration dict. This is the published snapshot
+        itself, so callers must copy it before making changes.
     """
-    global _runtime_config, _config_last_updated
+    _ensure_config_watch()
 
-    with _config_lock:
-        now = datetime.now()
+    config, loaded_at = _snapshot
+    if not force_refresh and config is not None and (_watch_healthy.is_set() or _is_fresh(loaded_at)):
+        return config
 
-        # Check if we need to refresh
-        should_refresh = (
-            force_refresh or
-            _runtime_config is None or
-            _config_last_updated is None or
-            (now - _config_last_updated).total_seconds() > _config_cache_ttl_seconds
-        )
+    if force_refresh:
+        # Never coalesce: an in-flight refresh may predate the caller's change
+        return _load_and_publish()
+    return _refresh_single_flight()
+
+
+def _load_and_publish() -> Dict[str, Any]:
+    logger.debug("Refreshing model configuration")
+    config = load_runtime_model_config()
+    _publish_model_config(config)
+    logger.info(f"Model configuration refreshed: {len(config)} models")
+    return config
 
-        if should_refresh:
-            logger.debug("Refreshing model configuration")
-            _runtime_config = load_runtime_model_config()
-            _config_last_updated = now
-            logger.info(f"Model configuration refreshed: {len(_runtime_config)} models")
 
-        return _runtime_config
+def _refresh_single_flight() -> Dict[str, Any]:
+    """Refresh a stale snapshot, coalescing concurrent callers into one load.
+
+    The first caller performs the load; others wait on its event without
+    holding any lock and return the snapshot it published.
+    """
+    global _refresh_event
+
+    with _refresh_lock:
+        event = _refresh_event
+        is_leader = event is None
+        if is_leader:
+            event = _refresh_event = threading.Event()
+
+    if not is_leader:
+        event.wait()
+        config = _snapshot[0]
+        # The leader failed before publishing anything: try again ourselves
+        return config if config is not None else _refresh_single_flight()
+
+    try:
+        # Double-check: a refresh may have completed since the caller's read
+        config, loaded_at = _snapshot
+        if config is not None and _is_fresh(loaded_at):
+            return config
+        return _load_and_publish()
+    finally:
+        with _refresh_lock:
+            _refresh_event = None
+        event.set()
 
 
 def reload_model_config() -> None:
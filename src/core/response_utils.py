@@ -22,4 +22,12 @@ def make_mcp_text_response(content: str, is_error: bool = False) -> List[Dict[st
     return [{"type": "text", "text": content}]
 
 
+def make_mcp_bytes_response(payload: bytes) -> List[Dict[str, Any]]:
+    """Return MCP content list for an already-serialized UTF-8 JSON payload.
 
+    Meant for tool results built with json_utils.dumpb: the payload is
+    decoded once and wrapped directly, skipping the double-wrap sniffing in
+    make_mcp_text_response, which re-parses any large list that merely
+    mentions "type" and "text".
+    """
+    return [{"type": "text", "text": payload.decode("utf-8")}]
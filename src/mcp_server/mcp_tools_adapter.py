@@ -6,6 +6,7 @@ It wraps the ObservabilityMCPServer instance to provide tool execution functiona
 """
 
 import asyncio
+import threading
 from typing import Dict, Any, List, Optional
 
 import sys
@@ -18,6 +19,26 @@ from common.pylogger import get_python_logger
 
 logger = get_python_logger()
 
+# Long-lived event loop that runs MCP tool coroutines for the synchronous
+# ToolExecutor API. Reusing it avoids building an event loop (and, when the
+# caller is itself inside a loop, a thread) on every tool call, and keeps
+# any loop-bound clients the tools create reusable across calls.
+_tool_loop: Optional[asyncio.AbstractEventLoop] = None
+_tool_loop_lock = threading.Lock()
+
+
+def _run_on_tool_loop(coro: Any) -> Any:
+    """Run a coroutine on the shared tool loop and wait for its result."""
+    global _tool_loop
+
+    if _tool_loop is None:
+        with _tool_loop_lock:
+            if _tool_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="mcp-tool-loop", daemon=True).start()
+                _tool_loop = loop
+    return asyncio.run_coroutine_threadsafe(coro, _tool_loop).result()
+
 
 class MCPServerAdapter(ToolExecutor):
     """Adapter for executing MCP tools directly in the MCP server process.
@@ -35,6 +56,11 @@ class MCPServerAdapter(ToolExecutor):
         self.mcp_server = mcp_server
         logger.info("🔌 MCPServerAdapter initialized for direct tool access")
 
+    async def _run_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Look up and run a FastMCP tool in one pass on the tool loop."""
+        tool = await self.mcp_server.mcp.get_tool(tool_name)
+        return await tool.run(arguments)
+
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """Call an MCP tool directly via the MCP server.
 
@@ -51,44 +77,7 @@ class MCPServerAdapter(ToolExecutor):
         try:
             logger.info(f"🔧 MCPServerAdapter calling tool: {tool_name}")
 
-            # Get the current event loop if we're already in one
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                # No running loop, create a new one
-                loop = None
-
-            if loop is not None:
-                # We're already in an async context, use run_coroutine_threadsafe
-                # or directly call the tool function
-                import concurrent.futures
-                import threading
-
-                # Run in a new thread with its own event loop
-                result_future = concurrent.futures.Future()
-
-                def run_in_thread():
-                    try:
-                        # Create a new event loop for this thread
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        try:
-                            tool = new_loop.run_until_complete(self.mcp_server.mcp.get_tool(tool_name))
-                            result = new_loop.run_until_complete(tool.run(arguments))
-                            result_future.set_result(result)
-                        finally:
-                            new_loop.close()
-                    except Exception as e:
-                        result_future.set_exception(e)
-
-                thread = threading.Thread(target=run_in_thread)
-                thread.start()
-                thread.join()
-                result = result_future.result()
-            else:
-                # No running loop, use asyncio.run
-                tool = asyncio.run(self.mcp_server.mcp.get_tool(tool_name))
-                result = asyncio.run(tool.run(arguments))
+            result = _run_on_tool_loop(self._run_tool(tool_name, arguments))
 
             # Extract text from result
             if hasattr(result, 'content'):
@@ -125,38 +114,7 @@ class MCPServerAdapter(ToolExecutor):
             logger.info("📋 MCPServerAdapter listing available tools")
 
             # Use FastMCP's list_tools() method (renamed from get_tools() in 3.x)
-            # Need to handle async context
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = None
-
-            if loop is not None:
-                # We're in async context - run in separate thread
-                import concurrent.futures
-                import threading
-
-                result_future = concurrent.futures.Future()
-
-                def run_in_thread():
-                    try:
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        try:
-                            tools = new_loop.run_until_complete(self.mcp_server.mcp.list_tools())
-                            result_future.set_result(tools)
-                        finally:
-                            new_loop.close()
-                    except Exception as e:
-                        result_future.set_exception(e)
-
-                thread = threading.Thread(target=run_in_thread)
-                thread.start()
-                thread.join()
-                fastmcp_tools = result_future.result()
-            else:
-                # No running loop
-                fastmcp_tools = asyncio.run(self.mcp_server.mcp.list_tools())
+            fastmcp_tools = _run_on_tool_loop(self.mcp_server.mcp.list_tools())
 
             # Convert FastMCP FunctionTool objects to MCPTool objects
             # list_tools() returns a list of FunctionTool objects
@@ -191,38 +149,7 @@ class MCPServerAdapter(ToolExecutor):
             logger.info(f"🔍 MCPServerAdapter getting tool: {tool_name}")
 
             # Use FastMCP's public get_tool() method
-            # Need to handle async context
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = None
-
-            if loop is not None:
-                # We're in async context - run in separate thread
-                import concurrent.futures
-                import threading
-
-                result_future = concurrent.futures.Future()
-
-                def run_in_thread():
-                    try:
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        try:
-                            tool = new_loop.run_until_complete(self.mcp_server.mcp.get_tool(tool_name))
-                            result_future.set_result(tool)
-                        finally:
-                            new_loop.close()
-                    except Exception as e:
-                        result_future.set_exception(e)
-
-                thread = threading.Thread(target=run_in_thread)
-                thread.start()
-                thread.join()
-                fastmcp_tool = result_future.result()
-            else:
-                # No running loop
-                fastmcp_tool = asyncio.run(self.mcp_server.mcp.get_tool(tool_name))
+            fastmcp_tool = _run_on_tool_loop(self.mcp_server.mcp.get_tool(tool_name))
 
             if not fastmcp_tool:
                 logger.warning(f"⚠️ Tool not found: {tool_name}")
@@ -14,6 +14,7 @@ class ObservabilityMCPServer:
 
         get_python_logger(settings.PYTHON_LOG_LEVEL)
         self.mcp = FastMCP("metrics-observability")
+        self._tool_count = 0
         # Ensure third-party loggers are reconfigured after FastMCP init
         force_reconfigure_all_loggers(settings.PYTHON_LOG_LEVEL)
 
@@ -22,7 +23,18 @@ class ObservabilityMCPServer:
         _server_instance = self
 
         self._register_mcp_tools()
-        logging.getLogger(__name__).info("Observability MCP Server initialized")
+        logging.getLogger(__name__).info(
+            "Observability MCP Server initialized with %d tools", self._tool_count
+        )
+
+    @property
+    def tool_count(self) -> int:
+        """Number of tools registered at init; tools are never added afterwards."""
+        return self._tool_count
+
+    def _register_tool(self, fn) -> None:
+        self.mcp.tool()(fn)
+        self._tool_count += 1
 
     def _register_mcp_tools(self) -> None:
         from .tools.observability_vllm_tools import (
@@ -67,53 +79,54 @@ class ObservabilityMCPServer:
             chat_tempo_tool
         )
         from .tools.chat_tool import chat
-        from .tools.credentials_tools import validate_api_key, save_api_key, check_provider_secret, delete_provider_secret
+        from .tools.credentials_tools import validate_api_key, validate_api_keys, save_api_key, check_provider_secret, delete_provider_secret
         from .tools.model_config_tools import (
             list_provider_models,
+            list_all_provider_models,
             add_model_to_config,
             update_maas_model_api_key,
         )
 
         # Register vLLM tools
-        self.mcp.tool()(list_models)
-        self.mcp.tool()(list_vllm_namespaces)
-        self.mcp.tool()(get_model_config)
-        self.mcp.tool()(get_vllm_metrics_tool)
-        self.mcp.tool()(fetch_vllm_metrics_data)
-        self.mcp.tool()(analyze_vllm)
-        self.mcp.tool()(calculate_metrics)
-        self.mcp.tool()(list_summarization_models)
-        self.mcp.tool()(get_gpu_info)
-        self.mcp.tool()(get_deployment_info)
-        self.mcp.tool()(chat_vllm)
+        self._register_tool(list_models)
+        self._register_tool(list_vllm_namespaces)
+        self._register_tool(get_model_config)
+        self._register_tool(get_vllm_metrics_tool)
+        self._register_tool(fetch_vllm_metrics_data)
+        self._register_tool(analyze_vllm)
+        self._register_tool(calculate_metrics)
+        self._register_tool(list_summarization_models)
+        self._register_tool(get_gpu_info)
+        self._register_tool(get_deployment_info)
+        self._register_tool(chat_vllm)
 
         # Register OpenShift tools
-        self.mcp.tool()(analyze_openshift)
-        self.mcp.tool()(fetch_openshift_metrics_data)
-        self.mcp.tool()(list_openshift_namespaces)
-        self.mcp.tool()(list_openshift_metric_groups)
-        self.mcp.tool()(list_openshift_namespace_metric_groups)
-        self.mcp.tool()(chat_openshift)
+        self._register_tool(analyze_openshift)
+        self._register_tool(fetch_openshift_metrics_data)
+        self._register_tool(list_openshift_namespaces)
+        self._register_tool(list_openshift_metric_groups)
+        self._register_tool(list_openshift_namespace_metric_groups)
+        self._register_tool(chat_openshift)
 
         # Register Prometheus tools one by one
-        self.mcp.tool()(search_metrics)                    # Search metrics by pattern
-        self.mcp.tool()(get_metric_metadata)              # Get metric metadata
-        self.mcp.tool()(get_label_values)                 # Get label values
-        self.mcp.tool()(execute_promql)                   # Execute PromQL queries
-        self.mcp.tool()(explain_results)                  # Explain query results
-        self.mcp.tool()(suggest_queries)                  # Suggest related queries
-        self.mcp.tool()(select_best_metric)               # Select best metric
-        self.mcp.tool()(find_best_metric_with_metadata_v2)  # Smart metric selection v2
-        self.mcp.tool()(find_best_metric_with_metadata)   # Smart metric selection v1
-        self.mcp.tool()(get_metrics_categories)           # Get metric categories (NEW)
-        self.mcp.tool()(search_metrics_by_category)       # Search by category (NEW)
-        self.mcp.tool()(get_category_metrics_detail)      # Get category catalog JSON for UI
-        self.mcp.tool()(convert_time_to_promql_duration)  # Time conversion helper
+        self._register_tool(search_metrics)                    # Search metrics by pattern
+        self._register_tool(get_metric_metadata)              # Get metric metadata
+        self._register_tool(get_label_values)                 # Get label values
+        self._register_tool(execute_promql)                   # Execute PromQL queries
+        self._register_tool(explain_results)                  # Explain query results
+        self._register_tool(suggest_queries)                  # Suggest related queries
+        self._register_tool(select_best_metric)               # Select best metric
+        self._register_tool(find_best_metric_with_metadata_v2)  # Smart metric selection v2
+        self._register_tool(find_best_metric_with_metadata)   # Smart metric selection v1
+        self._register_tool(get_metrics_categories)           # Get metric categories (NEW)
+        self._register_tool(search_metrics_by_category)       # Search by category (NEW)
+        self._register_tool(get_category_metrics_detail)      # Get category catalog JSON for UI
+        self._register_tool(convert_time_to_promql_duration)  # Time conversion helper
 
         # Register Tempo query tools
-        self.mcp.tool()(query_tempo_tool)
-        self.mcp.tool()(get_trace_details_tool)
-        self.mcp.tool()(chat_tempo_tool)
+        self._register_tool(query_tempo_tool)
+        self._register_tool(get_trace_details_tool)
+        self._register_tool(chat_tempo_tool)
 
         # Register Korrel8r tools
         from .tools.korrel8r_tools import (
@@ -121,17 +134,19 @@ class ObservabilityMCPServer:
             korrel8r_get_correlated,
             get_correlated_logs,
         )
-        self.mcp.tool()(korrel8r_query_objects)
-        self.mcp.tool()(korrel8r_get_correlated)
-        self.mcp.tool()(get_correlated_logs)
+        self._register_tool(korrel8r_query_objects)
+        self._register_tool(korrel8r_get_correlated)
+        self._register_tool(get_correlated_logs)
 
-        self.mcp.tool()(chat)
-        self.mcp.tool()(validate_api_key)
-        self.mcp.tool()(save_api_key)
-        self.mcp.tool()(check_provider_secret)
-        self.mcp.tool()(delete_provider_secret)
+        self._register_tool(chat)
+        self._register_tool(validate_api_key)
+        self._register_tool(validate_api_keys)
+        self._register_tool(save_api_key)
+        self._register_tool(check_provider_secret)
+        self._register_tool(delete_provider_secret)
 
         # Register model config tools
-        self.mcp.tool()(list_provider_models)
-        self.mcp.tool()(add_model_to_config)
-        self.mcp.tool()(update_maas_model_api_key)
+        self._register_tool(list_provider_models)
+        self._register_tool(list_all_provider_models)
+        self._register_tool(add_model_to_config)
+        self._register_tool(update_maas_model_api_key)
@@ -4,17 +4,48 @@ This tool provides a unified interface for chatting with AI models through MCP.
 Progress updates are captured and returned in the response for UI replay.
 """
 
+import asyncio
 import json
 import logging
+import sys
+import threading
 from datetime import datetime
+from pathlib import Path
 from typing import Optional, List, Dict
 
 from core.api_key_manager import resolve_api_key
 
 logger = logging.getLogger(__name__)
 
+# Make the shared chatbots package importable (once, not per chat call)
+_SRC_DIR = str(Path(__file__).parent.parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
-def chat(
+# One adapter per server instance, reused across chat calls so per-executor
+# caches (e.g. converted tool definitions) survive between requests
+_tool_executor = None
+_tool_executor_lock = threading.Lock()
+
+
+def _get_tool_executor():
+    """Return the shared MCPServerAdapter for the running server instance."""
+    global _tool_executor
+
+    # Global reference set during ObservabilityMCPServer initialization
+    from mcp_server.observability_mcp import _server_instance
+
+    executor = _tool_executor
+    if executor is None or executor.mcp_server is not _server_instance:
+        with _tool_executor_lock:
+            if _tool_executor is None or _tool_executor.mcp_server is not _server_instance:
+                from mcp_server.mcp_tools_adapter import MCPServerAdapter
+                _tool_executor = MCPServerAdapter(_server_instance)
+            executor = _tool_executor
+    return executor
+
+
+async def chat(
     model_name: str,
     message: str,
     api_key: Optional[str] = None,
@@ -27,7 +58,9 @@ def chat(
     Chat with AI models using observability tools.
 
     This tool creates a chatbot and executes the query with progress tracking.
-    Progress updates are captured and returned in the response.
+    Progress updates are captured and returned in the response. Blocking setup
+    runs in worker threads and the chat itself is awaited, so concurrent chats
+    do not hold up the server's event loop.
 
     Args:
         model_name: Model identifier (e.g., "anthropic/claude-3-5-sonnet-20241022",
@@ -44,7 +77,7 @@ def chat(
         JSON string with response and progress_log
 
     Example:
-        >>> result = chat(
+        >>> result = await chat(
         ...     model_name="anthropic/claude-3-5-sonnet-20241022",
         ...     message="What's the CPU usage?",
         ...     api_key="sk-ant-...",
@@ -55,13 +88,7 @@ def chat(
         >>> for progress in parsed["progress_log"]:
         ...     print(progress["message"])
     """
-    # Import from shared chatbots package and adapter
-    import sys
-    from pathlib import Path
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
     from chatbots import create_chatbot
-    from mcp_server.mcp_tools_adapter import MCPServerAdapter
 
     logger.info(f"💬 Chat tool: model={model_name}, message={message[:50]}...")
 
@@ -84,17 +111,12 @@ def chat(
         logger.info(f"📝 Progress: {status_msg}")
 
     try:
-        # Get the MCP server instance (injected by FastMCP context)
-        # We need to access the ObservabilityMCPServer instance
-        # For now, we'll use a global reference that will be set during server initialization
-        from mcp_server.observability_mcp import _server_instance
-
-        # Create MCP tools adapter for this server
-        tool_executor = MCPServerAdapter(_server_instance)
+        # MCP tools adapter for the running ObservabilityMCPServer instance
+        tool_executor = _get_tool_executor()
 
         # Resolve API key with fallback logic (same as analyze_openshift)
         # Priority: 1) Provided api_key (from UI), 2) Kubernetes secret
-        resolved_api_key = resolve_api_key(api_key=api_key, model_id=model_name)
+        resolved_api_key = await asyncio.to_thread(resolve_api_key, api_key=api_key, model_id=model_name)
 
         # Auto-detect namespace from question if not provided by UI
         if not namespace:
@@ -106,7 +128,8 @@ def chat(
                 capture_progress(f"📌 Detected namespace: {namespace}")
 
         # Create chatbot with tool executor
-        chatbot = create_chatbot(
+        chatbot = await asyncio.to_thread(
+            create_chatbot,
             model_name=model_name,
             api_key=resolved_api_key if resolved_api_key else None,
             api_url=api_url,
@@ -123,7 +146,7 @@ def chat(
         if conversation_history:
             logger.info(f"📜 Conversation history provided: {len(conversation_history)} messages")
 
-        response = chatbot.chat(
+        response = await chatbot.achat(
             user_question=message,
             namespace=namespace,
             progress_callback=capture_progress,
@@ -1,30 +1,378 @@
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, FrozenSet, Mapping, Optional, List, Tuple
+from types import MappingProxyType
+from collections import OrderedDict
+import atexit
+import functools
+import hashlib
 import os
 import base64
+import ssl
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from urllib.parse import urlencode
 import requests
+import urllib3
+from urllib3.util.retry import Retry
 
+from common import json_utils
 from common.pylogger import get_python_logger
 from mcp_server.exceptions import MCPException, MCPErrorCode
-from core.response_utils import make_mcp_text_response
+from core.api_key_manager import invalidate_cached_api_key
+from core.http_client import create_pooled_session, tcp_keepalive_socket_options
+from core.response_utils import make_mcp_bytes_response
+from .model_config_tools import _invalidate_secret_cache
 
 logger = get_python_logger()
 
 K8S_SA_TOKEN_PATH = "/var/run/secrets/kubernetes.io/serviceaccount/token"
 K8S_SA_CA_PATH = "/var/run/secrets/kubernetes.io/serviceaccount/ca.crt"
 K8S_API_URL = "https://kubernetes.default.svc"
+_ANTHROPIC_MODELS_URL = "https://api.anthropic.com/v1/models"
+# Server-side apply query: force takes ownership of fields set by earlier writers
+_APPLY_PARAMS = {"fieldManager": "ai-obs-summarizer", "force": "true"}
+
+# Keep-alive sessions so repeated validations and Secret writes reuse their
+# TCP + TLS connections. Transient errors on idempotent verbs are retried with
+# exponential backoff; raise_on_status=False hands the final response back to
+# the status checks. POST is never retried so a Secret is not created twice.
+# Provider checks leave 429 alone: for Anthropic it already proves the key.
+_IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "PATCH"])
+_SESSION = create_pooled_session(
+    pool_connections=10,
+    pool_maxsize=20,
+    retry=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=_IDEMPOTENT_METHODS,
+        raise_on_status=False,
+    ),
+)
+# Kubernetes calls go straight through a urllib3 PoolManager: they only need
+# headers, a body and TLS verification, so requests' Session/PreparedRequest
+# layer is pure per-call overhead. Idle sockets are kept alive with TCP
+# keepalive and every connection shares one SSL context (CA loaded once).
+_K8S_POOL = urllib3.PoolManager(
+    num_pools=2,
+    maxsize=10,
+    timeout=urllib3.Timeout(connect=2, read=5),
+    socket_options=tcp_keepalive_socket_options(),
+    ssl_context=(
+        ssl.create_default_context(cafile=K8S_SA_CA_PATH)
+        if os.path.exists(K8S_SA_CA_PATH)
+        else ssl.create_default_context()
+    ),
+    retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=_IDEMPOTENT_METHODS,
+        raise_on_status=False,
+    ),
+)
+atexit.register(_SESSION.close)
+atexit.register(_K8S_POOL.clear)
+
+# (connect, read) timeouts: an unreachable host fails fast instead of
+# holding the caller for the whole budget
+_PROVIDER_TIMEOUT = (2, 5)
+_MAAS_TIMEOUT = (2, 10)  # runs a one-token completion, so allow a slower read
+
+# Upper bound on concurrent provider checks in validate_api_keys
+_MAX_VALIDATION_WORKERS = 8
+
+# Recent validation results, so UI-driven re-validation of the same key is a
+# memory hit. Entries are keyed by a SHA-256 digest of the key.
+_VALIDATION_CACHE: "OrderedDict[Tuple[str, bytes, str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_VALIDATION_CACHE_LOCK = threading.Lock()
+_VALIDATION_CACHE_MAXSIZE = 256
+_VALIDATION_CACHE_TTL_SECONDS = 60
+
+# Pod-lifetime setting, resolved once at import (empty when NAMESPACE is unset)
+_NAMESPACE = os.getenv("NAMESPACE", "")
+
+# Projected ServiceAccount tokens rotate on the order of hours; re-read the
+# file at most every few minutes, or straight away when the API answers 401.
+_SA_TOKEN_TTL_SECONDS = 300.0
+_TOKEN_CACHE: Dict[str, Any] = {"value": None, "ts": 0.0}
+
+# Secret applies currently on the wire, keyed by (Secret name, payload digest).
+# Identical concurrent saves wait on the first one instead of racing it.
+_INFLIGHT_APPLIES: Dict[Tuple[str, bytes], "Future[urllib3.BaseHTTPResponse]"] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _sa_token(refresh: bool = False) -> str:
+    """Return the ServiceAccount token, re-reading the file once the TTL expires."""
+    now = time.monotonic()
+    if not refresh and _TOKEN_CACHE["value"] and now - _TOKEN_CACHE["ts"] < _SA_TOKEN_TTL_SECONDS:
+        return _TOKEN_CACHE["value"]
+    with open(K8S_SA_TOKEN_PATH, "r") as f:
+        token = f.read().strip()
+    _TOKEN_CACHE["value"] = token
+    _TOKEN_CACHE["ts"] = now
+    return token
+
+
+def _k8s_request(
+    method: str,
+    url: str,
+    token: str,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, str]] = None,
+    body: Optional[bytes] = None,
+) -> urllib3.BaseHTTPResponse:
+    """Send a Kubernetes API request, retrying once with a fresh token on 401."""
+    if params:
+        url = f"{url}?{urlencode(params)}"
+    request_headers = dict(headers or {})
+    request_headers["Authorization"] = f"Bearer {token}"
+    r = _K8S_POOL.request(method, url, headers=request_headers, body=body)
+    if r.status == 401:
+        fresh = _sa_token(refresh=True)
+        if fresh and fresh != token:
+            request_headers["Authorization"] = f"Bearer {fresh}"
+            r = _K8S_POOL.request(method, url, headers=request_headers, body=body)
+    return r
+
+
+def _apply_secret(name: str, url: str, token: str, body: bytes) -> urllib3.BaseHTTPResponse:
+    """Server-side apply a Secret, sharing the response with identical concurrent applies."""
+    key = (name, hashlib.sha256(body).digest())
+    with _INFLIGHT_LOCK:
+        pending = _INFLIGHT_APPLIES.get(key)
+        if pending is None:
+            future: "Future[urllib3.BaseHTTPResponse]" = Future()
+            _INFLIGHT_APPLIES[key] = future
+    if pending is not None:
+        return pending.result()
 
-
-def _provider_defaults(provider: str) -> Dict[str, str]:
+    try:
+        r = _k8s_request(
+            "PATCH",
+            url,
+            token,
+            {"Content-Type": "application/apply-patch+yaml"},
+            params=_APPLY_PARAMS,
+            body=body,
+        )
+        future.set_result(r)
+        return r
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT_APPLIES.pop(key, None)
+
+
+@functools.lru_cache(maxsize=32)
+def _secret_location(ns: str, provider_lower: str) -> Tuple[str, str]:
+    """Return (secret name, secret URL) for a provider's credentials Secret."""
+    name = f"ai-{provider_lower}-credentials"
+    return name, f"{K8S_API_URL}/api/v1/namespaces/{ns}/secrets/{name}"
+
+
+@functools.lru_cache(maxsize=8)
+def _provider_defaults(provider: str) -> Mapping[str, str]:
+    # Read-only so the cached mapping is safe to share between callers
     provider = (provider or "").lower()
     if provider == "openai":
-        return {"endpoint": "https://api.openai.com/v1/models"}
+        return MappingProxyType({"endpoint": "https://api.openai.com/v1/models"})
     if provider == "anthropic":
-        return {"endpoint": "https://api.anthropic.com/v1/messages"}
+        return MappingProxyType({"endpoint": _ANTHROPIC_MODELS_URL})
     if provider == "google":
-        return {"endpoint": "https://generativelanguage.googleapis.com/v1beta/models"}
+        return MappingProxyType({"endpoint": "https://generativelanguage.googleapis.com/v1beta/models"})
     if provider == "meta":
-        return {"endpoint": "https://api.llama-api.com/v1/models"}
-    return {"endpoint": ""}
+        return MappingProxyType({"endpoint": "https://api.llama-api.com/v1/models"})
+    return MappingProxyType({"endpoint": ""})
+
+
+def _get_cached_validation(key: Tuple[str, bytes, str, str]) -> Optional[Dict[str, Any]]:
+    """Return a copy of a fresh cached validation result for key, if any."""
+    with _VALIDATION_CACHE_LOCK:
+        entry = _VALIDATION_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > _VALIDATION_CACHE_TTL_SECONDS:
+            del _VALIDATION_CACHE[key]
+            return None
+        _VALIDATION_CACHE.move_to_end(key)
+    return {"success": result["success"], "details": dict(result["details"])}
+
+
+def _cache_validation(key: Tuple[str, bytes, str, str], result: Dict[str, Any]) -> None:
+    """Remember a validation result under key."""
+    stored = {"success": result["success"], "details": dict(result["details"])}
+    with _VALIDATION_CACHE_LOCK:
+        _VALIDATION_CACHE[key] = (time.monotonic(), stored)
+        _VALIDATION_CACHE.move_to_end(key)
+        while len(_VALIDATION_CACHE) > _VALIDATION_CACHE_MAXSIZE:
+            _VALIDATION_CACHE.popitem(last=False)
+
+
+def _head_or_get(url: str, headers: Dict[str, str], timeout: Any) -> requests.Response:
+    """Probe url with HEAD to skip the body, falling back to GET when HEAD is not allowed."""
+    r = _SESSION.head(url, headers=headers, timeout=timeout)
+    if r.status_code == 405:
+        r = _SESSION.get(url, headers=headers, timeout=timeout)
+    return r
+
+
+def _validate_one(provider: str, api_key: str, endpoint: Optional[str] = None, model_id: Optional[str] = None) -> Dict[str, Any]:
+    """Validate one key and return { success, details }, answering repeats from memory."""
+    if not provider or not api_key:
+        raise MCPException(
+            message="provider and api_key are required",
+            error_code=MCPErrorCode.INVALID_INPUT,
+        )
+    # Keyed by a digest so the plaintext key is never kept in memory
+    key = (
+        provider.lower(),
+        hashlib.sha256(api_key.encode("utf-8")).digest(),
+        endpoint or "",
+        model_id or "",
+    )
+    cached = _get_cached_validation(key)
+    if cached is not None:
+        return cached
+    result = _probe_provider(provider, api_key, endpoint, model_id)
+    # Server errors say nothing about the key, so only definitive answers are kept
+    if result["details"].get("status", 500) < 500:
+        _cache_validation(key, result)
+    return result
+
+
+def _models_url(ep: str) -> str:
+    """Return the /models listing URL next to an API base or /messages endpoint."""
+    base = ep.rstrip("/")
+    if base.endswith("/models"):
+        return base
+    if base.endswith("/messages"):
+        base = base[: -len("/messages")]
+    return f"{base}/models"
+
+
+@dataclass(frozen=True)
+class _ProviderSpec:
+    """How to probe one provider's key: request shape and the statuses that mean valid."""
+    method: str  # "HEAD" falls back to GET when the server answers 405
+    key_header: str
+    ok_codes: FrozenSet[int]
+    probe_url: Optional[Callable[[str], str]] = None  # endpoint -> URL probed; the endpoint when None
+    key_prefix: str = ""
+    static_headers: Mapping[str, str] = field(default_factory=dict)
+
+    def headers(self, api_key: str) -> Dict[str, str]:
+        """Copy the static headers and fill in the key header."""
+        h = dict(self.static_headers)
+        h[self.key_header] = self.key_prefix + api_key
+        return h
+
+
+_PROVIDERS: Dict[str, _ProviderSpec] = {
+    # HEAD (or GET) /v1/models with Bearer token; 401 indicates invalid
+    "openai": _ProviderSpec("HEAD", "Authorization", frozenset({200, 403}), key_prefix="Bearer "),
+    # Validate API key by listing models: free and auth-checked, unlike a
+    # billable POST /v1/messages, and not coupled to a specific model ID.
+    # A custom /v1/messages endpoint is probed at its sibling /v1/models.
+    # 200 = valid key, 401/403 = invalid key, 429 = rate limited (but key is valid)
+    "anthropic": _ProviderSpec(
+        "GET",
+        "x-api-key",
+        frozenset({200, 429}),
+        probe_url=_models_url,
+        static_headers=MappingProxyType({"anthropic-version": "2023-06-01"}),
+    ),
+    # GET list models; the key travels in a header so it never lands in
+    # the URL, which requests echoes in connection error messages
+    "google": _ProviderSpec("GET", "x-goog-api-key", frozenset({200})),
+    # Generic HEAD/GET; many gateways vary. Treat 200 as valid.
+    "meta": _ProviderSpec("HEAD", "Authorization", frozenset({200}), key_prefix="Bearer "),
+}
+
+_MAAS_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+
+def _probe_provider(provider: str, api_key: str, endpoint: Optional[str] = None, model_id: Optional[str] = None) -> Dict[str, Any]:
+    """Run the provider-specific validation request and return { success, details }."""
+    provider_lower = provider.lower()
+    ep = endpoint or _provider_defaults(provider_lower)["endpoint"]
+    details: Dict[str, Any] = {"provider": provider_lower, "endpoint": ep}
+    # Never log api_key itself
+    logger.debug("validate_api_key provider=%s endpoint=%s", provider_lower, ep)
+
+    if provider_lower == "maas":
+        ok, details["status"] = _probe_maas(api_key, ep, model_id)
+        return {"success": ok, "details": details}
+
+    spec = _PROVIDERS.get(provider_lower)
+    if spec is None:
+        raise MCPException(
+            message=f"Unsupported provider: {provider}",
+            error_code=MCPErrorCode.INVALID_INPUT,
+        )
+    url = spec.probe_url(ep) if spec.probe_url else ep
+    # Report the URL actually probed, which may differ from a custom endpoint
+    details["endpoint"] = url
+    headers = spec.headers(api_key)
+    if spec.method == "HEAD":
+        r = _head_or_get(url, headers, _PROVIDER_TIMEOUT)
+    else:
+        r = _SESSION.request(spec.method, url, headers=headers, timeout=_PROVIDER_TIMEOUT)
+    details["status"] = r.status_code
+    return {"success": r.status_code in spec.ok_codes, "details": details}
+
+
+def _probe_maas(api_key: str, ep: str, model_id: Optional[str]) -> Tuple[bool, int]:
+    """Probe a MaaS endpoint with a one-token completion and return (valid, status)."""
+    # MaaS uses per-model API keys with custom endpoints
+    # Test by making a minimal chat completion request with the actual model
+    if not model_id:
+        raise MCPException(
+            message="model_id is required for MaaS validation",
+            error_code=MCPErrorCode.INVALID_INPUT,
+        )
+
+    test_url = ep.rstrip('/')
+    # Ensure we're testing the /chat/completions endpoint
+    if not test_url.endswith('/chat/completions'):
+        if test_url.endswith('/v1'):
+            test_url = f"{test_url}/chat/completions"
+        else:
+            test_url = f"{test_url}/v1/chat/completions"
+
+    # Clean model ID (remove maas/ prefix if present)
+    clean_model_id = model_id.replace("maas/", "").strip()
+    logger.info("Testing MaaS connection to: %s with model: %s", test_url, clean_model_id)
+
+    # Make a minimal test request with the actual model ID
+    # A valid API key will return 200 (success) or 400 (bad request but authenticated)
+    # An invalid API key will return 401 (unauthorized) or 403 (forbidden)
+    test_payload = {
+        "model": clean_model_id,
+        "messages": [{"role": "user", "content": "test"}],
+        "max_tokens": 1
+    }
+    headers = dict(_MAAS_HEADERS)
+    headers["Authorization"] = f"Bearer {api_key}"
+    r = _SESSION.post(
+        test_url,
+        headers=headers,
+        json=test_payload,
+        timeout=_MAAS_TIMEOUT
+    )
+    # 200/201 = valid key and successful request
+    # 400 = bad request but valid auth (key is valid)
+    # 401 = unauthorized (invalid key)
+    # 403 = forbidden (invalid key)
+    # 422 = validation error but valid auth (key is valid)
+    ok = r.status_code not in (401, 403)
+    logger.info("MaaS validation result - Status: %s, Valid: %s", r.status_code, ok)
+    return ok, r.status_code
 
 
 def validate_api_key(provider: str, api_key: str, endpoint: Optional[str] = None, model_id: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -39,102 +387,54 @@ def validate_api_key(provider: str, api_key: str, endpoint: Optional[str] = None
         model_id: Optional model ID (required for MaaS)
     """
     try:
-        if not provider or not api_key:
-            raise MCPException(
-                message="provider and api_key are required",
-                error_code=MCPErrorCode.INVALID_INPUT,
-            )
-        provider_lower = provider.lower()
-        ep = endpoint or _provider_defaults(provider_lower)["endpoint"]
-        timeout = 10
-        ok = False
-        details: Dict[str, Any] = {"provider": provider_lower, "endpoint": ep}
-
-        if provider_lower == "openai":
-            # GET /v1/models with Bearer token
-            r = requests.get(ep, headers={"Authorization": f"Bearer {api_key}"}, timeout=timeout)
-            ok = r.status_code in (200, 401, 403) and r.status_code != 401  # 401 indicates invalid
-            details["status"] = r.status_code
-        elif provider_lower == "anthropic":
-            # Validate API key by listing models (avoids coupling to specific model ID)
-            # This validates key authenticity without requiring access to a specific model
-            models_url = "https://api.anthropic.com/v1/models"
-            r = requests.get(
-                models_url,
-                headers={
-                    "x-api-key": api_key,
-                    "anthropic-version": "2023-06-01",
-                },
-                timeout=timeout,
-            )
-            # 200 = valid key, 401 = invalid key, 429 = rate limited (but key is valid)
-            ok = r.status_code in (200, 429)
-            details["status"] = r.status_code
-        elif provider_lower == "google":
-            # GET list models with key
-            sep = "&" if "?" in ep else "?"
-            r = requests.get(f"{ep}{sep}key={api_key}", timeout=timeout)
-            ok = r.status_code == 200
-            details["status"] = r.status_code
-        elif provider_lower == "meta":
-            # Generic GET; many gateways vary. Treat 200 as valid.
-            r = requests.get(ep, headers={"Authorization": f"Bearer {api_key}"}, timeout=timeout)
-            ok = r.status_code == 200
-            details["status"] = r.status_code
-        elif provider_lower == "maas":
-            # MaaS uses per-model API keys with custom endpoints
-            # Test by making a minimal chat completion request with the actual model
-            if not model_id:
-                raise MCPException(
-                    message="model_id is required for MaaS validation",
-                    error_code=MCPErrorCode.INVALID_INPUT,
-                )
+        result = _validate_one(provider, api_key, endpoint, model_id)
+        return make_mcp_bytes_response(json_utils.dumpb(result))
+    except MCPException as e:
+        return e.to_mcp_response()
+    except Exception as e:
+        err = MCPException(
+            message=f"Validation failed: {str(e)}",
+            error_code=MCPErrorCode.INTERNAL_ERROR,
+        )
+        return err.to_mcp_response()
 
-            test_url = ep.rstrip('/')
-            # Ensure we're testing the /chat/completions endpoint
-            if not test_url.endswith('/chat/completions'):
-                if test_url.endswith('/v1'):
-                    test_url = f"{test_url}/chat/completions"
-                else:
-                    test_url = f"{test_url}/v1/chat/completions"
-
-            # Clean model ID (remove maas/ prefix if present)
-            clean_model_id = model_id.replace("maas/", "").strip()
-            logger.info(f"Testing MaaS connection to: {test_url} with model: {clean_model_id}")
-
-            # Make a minimal test request with the actual model ID
-            # A valid API key will return 200 (success) or 400 (bad request but authenticated)
-            # An invalid API key will return 401 (unauthorized) or 403 (forbidden)
-            test_payload = {
-                "model": clean_model_id,
-                "messages": [{"role": "user", "content": "test"}],
-                "max_tokens": 1
-            }
-            r = requests.post(
-                test_url,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json=test_payload,
-                timeout=timeout
-            )
-            # 200/201 = valid key and successful request
-            # 400 = bad request but valid auth (key is valid)
-            # 401 = unauthorized (invalid key)
-            # 403 = forbidden (invalid key)
-            # 422 = validation error but valid auth (key is valid)
-            ok = r.status_code not in (401, 403)
-            details["status"] = r.status_code
-            logger.info(f"MaaS validation result - Status: {r.status_code}, Valid: {ok}")
-        else:
+
+def validate_api_keys(keys: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Validate several provider API keys concurrently.
+    Returns structured MCP content with { results: [{ success, details } | { success, error }] }
+    in the same order as the input.
+
+    Args:
+        keys: List of objects with provider, api_key and optional endpoint / model_id
+    """
+    try:
+        if not isinstance(keys, list) or not all(isinstance(k, dict) for k in keys):
             raise MCPException(
-                message=f"Unsupported provider: {provider}",
+                message="keys must be a list of objects",
                 error_code=MCPErrorCode.INVALID_INPUT,
             )
 
-        result = {"success": bool(ok), "details": details}
-        return make_mcp_text_response(json.dumps(result))
+        def run(entry: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return _validate_one(
+                    entry.get("provider", ""),
+                    entry.get("api_key", ""),
+                    entry.get("endpoint"),
+                    entry.get("model_id"),
+                )
+            except Exception as e:
+                message = e.message if isinstance(e, MCPException) else f"Validation failed: {str(e)}"
+                return {"success": False, "error": message, "details": {"provider": (entry.get("provider") or "").lower()}}
+
+        # Each check is a single blocking request; overlap them so the batch
+        # takes as long as the slowest provider rather than the sum.
+        if len(keys) <= 1:
+            results = [run(k) for k in keys]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_MAX_VALIDATION_WORKERS, len(keys))) as ex:
+                results = list(ex.map(run, keys))
+        return make_mcp_bytes_response(json_utils.dumpb({"results": results}))
     except MCPException as e:
         return e.to_mcp_response()
     except Exception as e:
@@ -145,8 +445,6 @@ def validate_api_key(provider: str, api_key: str, endpoint: Optional[str] = None
         return err.to_mcp_response()
 
 
-import json
-
 def save_api_key(
     provider: str,
     api_key: str,
@@ -179,63 +477,49 @@ def save_api_key(
         provider_lower = provider.lower()
 
         # Save to K8s Secret
-        ns = os.getenv("NAMESPACE", "")
+        ns = _NAMESPACE
         if not ns:
             raise MCPException(
                 message="Server namespace not detected; cannot save Secret",
                 error_code=MCPErrorCode.INTERNAL_ERROR,
             )
-        token = ""
-        with open(K8S_SA_TOKEN_PATH, "r") as f:
-            token = f.read().strip()
+        token = _sa_token()
         if not token:
             raise MCPException(
                 message="ServiceAccount token unavailable; cannot save Secret",
                 error_code=MCPErrorCode.KUBERNETES_API_ERROR,
             )
-        name = f"ai-{provider_lower}-credentials"
-        url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/secrets/{name}"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/merge-patch+json",
-        }
-        verify = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
+        name, url = _secret_location(ns, provider_lower)
 
-        # Try PATCH existing Secret; if 404, create with POST
+        # Server-side apply creates or updates the Secret in one request
+        # (JSON is valid YAML for the apply-patch content type)
         payload = {
             "apiVersion": "v1",
             "kind": "Secret",
             "metadata": {"name": name, "namespace": ns, "labels": {"app.kubernetes.io/component": "ai-model-config"}},
             "type": "Opaque",
-            "data": {
-                "api-key": base64.b64encode(api_key.encode("utf-8")).decode("utf-8"),
-            },
         }
-        if model_id:
-            payload["data"]["model-id"] = base64.b64encode(model_id.encode("utf-8")).decode("utf-8")
-        if description:
-            payload["data"]["description"] = base64.b64encode(description.encode("utf-8")).decode("utf-8")
-
-        r = requests.patch(url, headers=headers, data=json.dumps(payload), timeout=5, verify=verify)
-        status = "updated"
-        if r.status_code == 404:
-            # Create
-            url_post = f"{K8S_API_URL}/api/v1/namespaces/{ns}/secrets"
-            headers_post = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            }
-            r = requests.post(url_post, headers=headers_post, data=json.dumps(payload), timeout=5, verify=verify)
-            status = "created"
-
-        if r.status_code not in (200, 201):
+        fields = {"api-key": api_key, "model-id": model_id, "description": description}
+        # base64 output is pure ASCII
+        payload["data"] = {
+            key: base64.b64encode(value.encode("utf-8")).decode("ascii")
+            for key, value in fields.items()
+            if value
+        }
+
+        r = _apply_secret(name, url, token, json_utils.dumpb(payload))
+        if r.status not in (200, 201):
             raise MCPException(
-                message=f"Failed to save Secret {name}: {r.status_code} {r.text}",
+                message=f"Failed to save Secret {name}: {r.status} {r.data.decode('utf-8', 'replace')}",
                 error_code=MCPErrorCode.KUBERNETES_API_ERROR,
             )
+        # Apply answers 201 when it created the object and 200 when it updated it
+        status = "created" if r.status == 201 else "updated"
+        _invalidate_secret_cache(provider_lower)
+        invalidate_cached_api_key(provider_lower)
 
         result = {"secret_name": name, "namespace": ns, "status": status}
-        return make_mcp_text_response(json.dumps(result))
+        return make_mcp_bytes_response(json_utils.dumpb(result))
     except MCPException as e:
         return e.to_mcp_response()
     except Exception as e:
@@ -259,40 +543,35 @@ def check_provider_secret(provider: str) -> List[Dict[str, Any]]:
             )
 
         provider_lower = provider.lower()
-        ns = os.getenv("NAMESPACE", "")
+        ns = _NAMESPACE
         if not ns:
             raise MCPException(
                 message="Server namespace not detected",
                 error_code=MCPErrorCode.INTERNAL_ERROR,
             )
 
-        token = ""
-        with open(K8S_SA_TOKEN_PATH, "r") as f:
-            token = f.read().strip()
+        token = _sa_token()
         if not token:
             raise MCPException(
                 message="ServiceAccount token unavailable",
                 error_code=MCPErrorCode.KUBERNETES_API_ERROR,
             )
 
-        name = f"ai-{provider_lower}-credentials"
-        url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/secrets/{name}"
-        headers = {"Authorization": f"Bearer {token}"}
-        verify = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
+        name, url = _secret_location(ns, provider_lower)
 
-        r = requests.get(url, headers=headers, timeout=5, verify=verify)
+        r = _k8s_request("GET", url, token)
 
-        if r.status_code == 404:
+        if r.status == 404:
             result = {"exists": False, "secret_name": name}
-            return make_mcp_text_response(json.dumps(result))
+            return make_mcp_bytes_response(json_utils.dumpb(result))
 
-        if r.status_code != 200:
+        if r.status != 200:
             raise MCPException(
-                message=f"Failed to check secret {name}: {r.status_code} {r.text}",
+                message=f"Failed to check secret {name}: {r.status} {r.data.decode('utf-8', 'replace')}",
                 error_code=MCPErrorCode.KUBERNETES_API_ERROR,
             )
 
-        secret_data = r.json()
+        secret_data = json_utils.loads(r.data)
         last_updated = secret_data.get("metadata", {}).get("annotations", {}).get("ai.observability/last-updated")
 
         result = {
@@ -301,7 +580,7 @@ def check_provider_secret(provider: str) -> List[Dict[str, Any]]:
             "last_updated": last_updated,
             "is_valid": None  # Would need validation to determine
         }
-        return make_mcp_text_response(json.dumps(result))
+        return make_mcp_bytes_response(json_utils.dumpb(result))
 
     except MCPException as e:
         return e.to_mcp_response()
@@ -326,42 +605,39 @@ def delete_provider_secret(provider: str) -> List[Dict[str, Any]]:
             )
 
         provider_lower = provider.lower()
-        ns = os.getenv("NAMESPACE", "")
+        ns = _NAMESPACE
         if not ns:
             raise MCPException(
                 message="Server namespace not detected",
                 error_code=MCPErrorCode.INTERNAL_ERROR,
             )
 
-        token = ""
-        with open(K8S_SA_TOKEN_PATH, "r") as f:
-            token = f.read().strip()
+        token = _sa_token()
         if not token:
             raise MCPException(
                 message="ServiceAccount token unavailable",
                 error_code=MCPErrorCode.KUBERNETES_API_ERROR,
             )
 
-        name = f"ai-{provider_lower}-credentials"
-        url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/secrets/{name}"
-        headers = {"Authorization": f"Bearer {token}"}
-        verify = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
+        name, url = _secret_location(ns, provider_lower)
 
-        r = requests.delete(url, headers=headers, timeout=5, verify=verify)
+        r = _k8s_request("DELETE", url, token)
+        _invalidate_secret_cache(provider_lower)
+        invalidate_cached_api_key(provider_lower)
 
         # 404 is acceptable - secret already doesn't exist
-        if r.status_code == 404:
+        if r.status == 404:
             result = {"success": True, "secret_name": name, "message": "Secret already deleted"}
-            return make_mcp_text_response(json.dumps(result))
+            return make_mcp_bytes_response(json_utils.dumpb(result))
 
-        if r.status_code not in (200, 202):
+        if r.status not in (200, 202):
             raise MCPException(
-                message=f"Failed to delete secret {name}: {r.status_code} {r.text}",
+                message=f"Failed to delete secret {name}: {r.status} {r.data.decode('utf-8', 'replace')}",
                 error_code=MCPErrorCode.KUBERNETES_API_ERROR,
             )
 
         result = {"success": True, "secret_name": name, "message": "Secret deleted successfully"}
-        return make_mcp_text_response(json.dumps(result))
+        return make_mcp_bytes_response(json_utils.dumpb(result))
 
     except MCPException as e:
         return e.to_mcp_response()
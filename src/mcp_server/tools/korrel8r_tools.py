@@ -1,16 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 import json
+import re
 
+from common import json_utils
 from common.pylogger import get_python_logger
 from core.korrel8r_client import Korrel8rClient
 from core.korrel8r_service import fetch_goal_query_objects
 from core.chat_with_prometheus import execute_promql_query
-from core.response_utils import make_mcp_text_response
+from core.response_utils import make_mcp_bytes_response, make_mcp_text_response
 from mcp_server.exceptions import MCPException, MCPErrorCode
 
 logger = get_python_logger()
 # korrel8r_build_links tool removed per request
 
+# Upper bound on concurrent per-goal Korrel8r requests, to avoid overloading it
+_MAX_GOAL_WORKERS = 8
+
+# Cheap shape checks so malformed input fails before any Korrel8r round-trip
+# (domain:class:selector; the selector is JSON for most domains but PromQL for metric)
+_QUERY_RE = re.compile(r"^[\w-]+:[\w.-]+:.+$", re.DOTALL)
+_GOAL_DOMAINS = frozenset({"alert", "incident", "k8s", "log", "metric", "netflow", "trace"})
+
+
+def _fan_out(goals: List[str], query: str) -> Dict[str, List[Any]]:
+    """Resolve each goal concurrently and merge the per-goal results.
+
+    Each goal is an independent list_goals + query_objects round-trip, so
+    running them in parallel bounds latency by the slowest goal rather than
+    the sum. Results are merged in goal order.
+    """
+    if len(goals) <= 1:
+        return fetch_goal_query_objects(goals, query)
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_GOAL_WORKERS, len(goals))) as ex:
+        results = list(ex.map(lambda g: fetch_goal_query_objects([g], query), goals))
+
+    aggregated: Dict[str, List[Any]] = {"logs": [], "traces": []}
+    for result in results:
+        for key, values in result.items():
+            if values:
+                aggregated.setdefault(key, []).extend(values)
+    return aggregated
+
 
 def korrel8r_query_objects(query: str) -> List[Dict[str, Any]]:
     """Execute a Korrel8r domain query and return objects.
@@ -27,8 +59,10 @@ def korrel8r_query_objects(query: str) -> List[Dict[str, Any]]:
         # Preserve previous behavior: simplify logs when applicable
         simplified = client.simplify_log_objects(result)
         to_return = simplified if simplified is not None else result
+        # Drop the raw objects before serializing so both copies are not held
+        del result, simplified
         logger.debug("korrel8r_query_objects result (possibly simplified): %s", to_return)
-        return make_mcp_text_response(json.dumps(to_return))
+        return make_mcp_bytes_response(json_utils.dumpb(to_return))
     except Exception as e:
         logger.error("korrel8r_query_objects failed: %s", e)
         err = MCPException(
@@ -87,7 +121,27 @@ def korrel8r_get_correlated(goals: List[str], query: str) -> List[Dict[str, Any]
             )
             return err.to_mcp_response()
 
-        aggregated = fetch_goal_query_objects(goals, query)
+        bad_goals = [g for g in goals if g.partition(":")[0] not in _GOAL_DOMAINS or not g.partition(":")[2]]
+        if bad_goals:
+            err = MCPException(
+                message=f"Invalid goals: {bad_goals}",
+                error_code=MCPErrorCode.INVALID_INPUT,
+                recovery_suggestion=(
+                    "Goals are 'domain:class', e.g. 'trace:span', 'log:application', "
+                    "'log:infrastructure', 'metric:metric', 'alert:alert'."
+                ),
+            )
+            return err.to_mcp_response()
+
+        if not _QUERY_RE.match(query.strip()):
+            err = MCPException(
+                message="query must have the form domain:class:selector",
+                error_code=MCPErrorCode.INVALID_INPUT,
+                recovery_suggestion='Example: k8s:Pod:{"namespace":"NS","name":"POD_NAME"}',
+            )
+            return err.to_mcp_response()
+
+        aggregated = _fan_out(goals, query)
 
         # Retry with resolved pod names if no results found
         has_results = any(v for v in aggregated.values() if v)
@@ -102,7 +156,7 @@ def korrel8r_get_correlated(goals: List[str], query: str) -> List[Dict[str, Any]
                     selector = json.dumps({"namespace": ns, "name": exact_pod})
                     retry_query = f"k8s:Pod:{selector}"
                     logger.info("korrel8r_get_correlated: retrying with resolved pod: %s", exact_pod)
-                    retry_result = fetch_goal_query_objects(goals, retry_query)
+                    retry_result = _fan_out(goals, retry_query)
                     for key in retry_result:
                         if retry_result[key]:
                             key_seen = seen.setdefault(key, set())
@@ -112,7 +166,7 @@ def korrel8r_get_correlated(goals: List[str], query: str) -> List[Dict[str, Any]
                                     key_seen.add(item_json)
                                     aggregated.setdefault(key, []).append(item)
 
-        return make_mcp_text_response(json.dumps(aggregated))
+        return make_mcp_bytes_response(json_utils.dumpb(aggregated))
     except Exception as e:
         logger.error("korrel8r_get_correlated failed: goals=%s, query=%s, error=%s", goals, query, e)
         err = MCPException(
@@ -339,9 +393,9 @@ def get_correlated_logs(
         # Check for unhealthy pods (may have no logs or partial logs)
         pod_warning = _check_unhealthy_pods(namespace)
         if pod_warning:
-            response_text = pod_warning + "\n\n" + json.dumps(all_logs)
+            response_text = pod_warning + "\n\n" + json_utils.dumps(all_logs)
         else:
-            response_text = json.dumps(all_logs)
+            response_text = json_utils.dumps(all_logs)
         return make_mcp_text_response(response_text)
     except Exception as e:
         logger.error("get_correlated_logs failed: namespace=%s, pod=%s, error=%s", namespace, pod_name, e)
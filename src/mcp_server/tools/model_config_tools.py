@@ -7,15 +7,24 @@ This module provides tools for:
 - Retrieving current model configuration
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import os
-import json
 import base64
+import copy
+import binascii
+import hashlib
+import atexit
+import threading
+import time
 import requests
-from datetime import datetime
+from urllib3.util.retry import Retry
 
+from common import json_utils
 from common.pylogger import get_python_logger
 from mcp_server.exceptions import MCPException, MCPErrorCode
+from core.http_client import create_pooled_session
 from core.response_utils import make_mcp_text_response
 
 logger = get_python_logger()
@@ -24,14 +33,70 @@ K8S_SA_TOKEN_PATH = "/var/run/secrets/kubernetes.io/serviceaccount/token"
 K8S_SA_CA_PATH = "/var/run/secrets/kubernetes.io/serviceaccount/ca.crt"
 K8S_API_URL = "https://kubernetes.default.svc"
 
+# Pod-lifetime settings, resolved once at import (empty when NAMESPACE is unset)
+_NAMESPACE = os.getenv("NAMESPACE", "")
+_MAAS_API_URL = os.getenv("MAAS_API_URL", "https://litellm-prod.apps.maas.redhatworkshops.io/v1")
+
+# Shared sessions keep TLS connections to the API server and to provider
+# APIs alive between tool calls. The two are separate so each keeps its own
+# per-host pools.
+#
+# Every write this module makes to the API server is safe to repeat (merge
+# patches set fields; a repeated create answers 409, which callers handle),
+# so transient API server errors and throttling are retried in-process for
+# all verbs, honouring Retry-After. Provider listings retry GETs on gateway
+# errors only: a provider's 429 can ask for a wait longer than a UI call.
+_K8S_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST", "PATCH", "DELETE"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+_PROVIDER_RETRY = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+_K8S_SESSION = create_pooled_session(
+    pool_connections=4,
+    pool_maxsize=10,
+    retry=_K8S_RETRY,
+)
+_PROVIDER_SESSION = create_pooled_session(
+    pool_connections=4,
+    pool_maxsize=10,
+    retry=_PROVIDER_RETRY,
+)
+# (connect, read) per attempt, so retries cannot stack up long connect waits
+_K8S_READ_TIMEOUT = (2, 5)
+_K8S_WRITE_TIMEOUT = (2, 10)
+atexit.register(_K8S_SESSION.close)
+atexit.register(_PROVIDER_SESSION.close)
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a Z suffix, to the second."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+# Passed per call: a session-level verify is overridden by REQUESTS_CA_BUNDLE
+_CA_VERIFY = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
+
+# Projected ServiceAccount tokens rotate on the order of an hour; re-read the
+# file at most every few minutes.
+_SA_TOKEN_TTL_SECONDS = 300.0
+_TOKEN_CACHE: Dict[str, Any] = {"value": None, "expires": 0.0}
+
 
 def _get_k8s_headers() -> Dict[str, str]:
     """Get Kubernetes API headers with service account token."""
     try:
-        with open(K8S_SA_TOKEN_PATH, "r") as f:
-            token = f.read().strip()
+        now = time.monotonic()
+        if _TOKEN_CACHE["value"] is None or now > _TOKEN_CACHE["expires"]:
+            with open(K8S_SA_TOKEN_PATH, "r") as f:
+                _TOKEN_CACHE["value"] = f.read().strip()
+            _TOKEN_CACHE["expires"] = now + _SA_TOKEN_TTL_SECONDS
+        # Fresh dict each call: callers adjust Content-Type in place
         return {
-            "Authorization": f"Bearer {token}",
+            "Authorization": f"Bearer {_TOKEN_CACHE['value']}",
             "Content-Type": "application/json",
         }
     except Exception as e:
@@ -41,10 +106,85 @@ def _get_k8s_headers() -> Dict[str, str]:
         )
 
 
+_WATCH_CACHE_READ = {"resourceVersion": "0"}
+
+_MAX_LISTING_WORKERS = 4
+
+# Provider API keys read from Secrets, as {provider: (api_key, expires_at)}.
+# Keys change rarely; an auth failure or a save through the API Keys tab
+# drops the entry early.
+_SECRET_CACHE: Dict[str, Tuple[str, float]] = {}
+_SECRET_CACHE_LOCK = threading.Lock()
+_SECRET_CACHE_TTL = 600
+
+
+def _invalidate_secret_cache(provider: str) -> None:
+    """Forget the cached API key for a provider."""
+    with _SECRET_CACHE_LOCK:
+        _SECRET_CACHE.pop(provider.lower(), None)
+
+
+# Serialized list_provider_models results for providers queried live, keyed by
+# (provider, truncated key digest). Model catalogs change on the order of weeks.
+_MODEL_LIST_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+_MODEL_LIST_CACHE_LOCK = threading.Lock()
+_MODEL_LIST_CACHE_MAXSIZE = 32
+_MODEL_LIST_CACHE_TTL = 300
+
+
+def _model_list_cache_key(provider_lower: str, api_key: str) -> Tuple[str, str]:
+    """Cache key for a provider/API key pair; the key itself is never stored."""
+    return provider_lower, hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def _get_cached_model_list(key: Tuple[str, str]) -> Optional[str]:
+    """Return the cached JSON model list for key if it is still fresh."""
+    with _MODEL_LIST_CACHE_LOCK:
+        entry = _MODEL_LIST_CACHE.get(key)
+        if entry is None:
+            return None
+        ts, payload = entry
+        if time.monotonic() - ts >= _MODEL_LIST_CACHE_TTL:
+            del _MODEL_LIST_CACHE[key]
+            return None
+        _MODEL_LIST_CACHE.move_to_end(key)
+        return payload
+
+
+def _cache_model_list(key: Tuple[str, str], payload: str) -> None:
+    """Remember a JSON model list under key."""
+    with _MODEL_LIST_CACHE_LOCK:
+        _MODEL_LIST_CACHE[key] = (time.monotonic(), payload)
+        _MODEL_LIST_CACHE.move_to_end(key)
+        while len(_MODEL_LIST_CACHE) > _MODEL_LIST_CACHE_MAXSIZE:
+            _MODEL_LIST_CACHE.popitem(last=False)
+
+
+def _forget_api_key(provider_lower: str, cache_key: Tuple[str, str]) -> None:
+    """Drop everything cached for a key the provider has just rejected."""
+    _invalidate_secret_cache(provider_lower)
+    with _MODEL_LIST_CACHE_LOCK:
+        _MODEL_LIST_CACHE.pop(cache_key, None)
+
+
 def _get_api_key_from_secret(provider: str) -> Optional[str]:
-    """Retrieve API key from Kubernetes secret."""
+    """Retrieve API key from Kubernetes secret, cached for _SECRET_CACHE_TTL seconds."""
+    provider = provider.lower()
+    with _SECRET_CACHE_LOCK:
+        entry = _SECRET_CACHE.get(provider)
+    if entry and entry[1] > time.monotonic():
+        return entry[0]
+    api_key = _read_api_key_from_secret(provider)
+    if api_key:
+        with _SECRET_CACHE_LOCK:
+            _SECRET_CACHE[provider] = (api_key, time.monotonic() + _SECRET_CACHE_TTL)
+    return api_key
+
+
+def _read_api_key_from_secret(provider: str) -> Optional[str]:
+    """Fetch API key from Kubernetes secret."""
     try:
-        ns = os.getenv("NAMESPACE", "")
+        ns = _NAMESPACE
         if not ns:
             logger.warning("NAMESPACE not set, cannot retrieve API key from secret")
             return None
@@ -52,9 +192,11 @@ def _get_api_key_from_secret(provider: str) -> Optional[str]:
         secret_name = f"ai-{provider.lower()}-credentials"
         url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/secrets/{secret_name}"
         headers = _get_k8s_headers()
-        verify = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
 
-        r = requests.get(url, headers=headers, timeout=5, verify=verify)
+        # resourceVersion=0 lets the API server answer from its watch cache
+        # instead of a quorum read from etcd; a key that is a moment stale is
+        # fine here, and auth failures invalidate the cached copy anyway
+        r = _K8S_SESSION.get(url, headers=headers, params=_WATCH_CACHE_READ, timeout=_K8S_READ_TIMEOUT, verify=_CA_VERIFY)
         if r.status_code == 404:
             logger.info(f"Secret {secret_name} not found")
             return None
@@ -62,13 +204,12 @@ def _get_api_key_from_secret(provider: str) -> Optional[str]:
             logger.warning(f"Failed to get secret {secret_name}: {r.status_code}")
             return None
 
-        secret_data = r.json()
-        api_key_b64 = secret_data.get("data", {}).get("api-key")
+        data = json_utils.loads(r.content).get("data") or {}
+        api_key_b64 = data.get("api-key")
         if not api_key_b64:
             return None
 
-        api_key = base64.b64decode(api_key_b64).decode("utf-8")
-        return api_key
+        return binascii.a2b_base64(api_key_b64).decode("utf-8")
     except Exception as e:
         logger.warning(f"Error retrieving API key from secret: {e}")
         return None
@@ -87,7 +228,7 @@ def _provider_api_url(provider: str) -> str:
         return "https://api.llama-api.com/v1"
     if provider == "maas":
         # Allow MAAS URL to be configured via environment variable
-        return os.getenv("MAAS_API_URL", "https://litellm-prod.apps.maas.redhatworkshops.io/v1")
+        return _MAAS_API_URL
     return ""
 
 
@@ -101,21 +242,59 @@ def _is_gpt5_model(model_id: str) -> bool:
     return model_lower.startswith("gpt-5")
 
 
-def _get_curated_maas_models() -> List[Dict[str, Any]]:
-    """
-    Get curated list of available MAAS models.
-
-    Since MAAS requires per-model API keys, we cannot query a generic
-    /models endpoint. Users must configure each model individually.
-    """
-    return [
-        {
-            "id": "qwen3-14b",
-            "name": "Qwen 3 14B",
-            "description": "Alibaba Qwen 14B parameter model for general-purpose tasks",
-            "context_length": 32768,
-        },
-    ]
+# Curated model lists for providers without a usable listing endpoint. The
+# responses never change, so they are serialized once at import.
+#
+# MAAS requires per-model API keys, so there is no generic /models endpoint
+# to query; users configure each model individually.
+_MAAS_MODELS = (
+    {
+        "id": "qwen3-14b",
+        "name": "Qwen 3 14B",
+        "description": "Alibaba Qwen 14B parameter model for general-purpose tasks",
+        "context_length": 32768,
+    },
+)
+_META_MODELS = (
+    {
+        "id": "llama-3.3-70b",
+        "name": "Llama 3.3 70B",
+        "description": "Latest Llama model, 70B parameters",
+        "context_length": 128000,
+    },
+    {
+        "id": "llama-3.1-70b",
+        "name": "Llama 3.1 70B",
+        "description": "Llama 3.1 with 70B parameters",
+        "context_length": 128000,
+    },
+    {
+        "id": "llama-3.1-8b",
+        "name": "Llama 3.1 8B",
+        "description": "Efficient 8B parameter model",
+        "context_length": 128000,
+    },
+    {
+        "id": "llama-2-70b",
+        "name": "Llama 2 70B",
+        "description": "Llama 2 with 70B parameters",
+        "context_length": 4096,
+    },
+    {
+        "id": "llama-2-13b",
+        "name": "Llama 2 13B",
+        "description": "Llama 2 with 13B parameters",
+        "context_length": 4096,
+    },
+)
+# Model listing filters: known chat model prefixes (str.startswith takes the
+# whole tuple) and substrings that mark non-chat models.
+_OPENAI_VALID_PREFIXES = ("gpt-5.2", "gpt-5.1", "gpt-5", "gpt-4o", "gpt-4-turbo", "gpt-4", "gpt-3.5-turbo")
+_OPENAI_EXCLUDE = ("instruct", "vision", "embedding", "tts", "whisper", "dall-e", "audio", "realtime")
+_GOOGLE_EXCLUDE = ("embedding", "vision-only", "imagen", "code-only", "aqa")
+
+_MAAS_RESPONSE_JSON = json_utils.dumps({"models": list(_MAAS_MODELS), "provider": "maas", "count": len(_MAAS_MODELS)})
+_META_RESPONSE_JSON = json_utils.dumps({"models": list(_META_MODELS), "provider": "meta", "count": len(_META_MODELS)})
 
 
 def _save_maas_model_api_key(secret_field: str, api_key: str) -> Dict[str, Any]:
@@ -130,54 +309,26 @@ def _save_maas_model_api_key(secret_field: str, api_key: str) -> Dict[str, Any]:
         Success/error dict
     """
     try:
-        ns = os.getenv("NAMESPACE", "")
+        ns = _NAMESPACE
         if not ns:
             return {"success": False, "error": "NAMESPACE not set"}
 
         secret_name = "ai-maas-credentials"
-        get_url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/secrets/{secret_name}"
+        secret_url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/secrets/{secret_name}"
         create_url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/secrets"
         headers = _get_k8s_headers()
-        verify = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
+        encoded_key = base64.b64encode(api_key.encode()).decode()
 
-        # Try to get existing secret
-        secret_exists = False
-        secret_data = {}
-        try:
-            r = requests.get(get_url, headers=headers, timeout=5, verify=verify)
-            if r.status_code == 200:
-                # Update existing secret
-                secret = r.json()
-                secret_data = secret.get("data", {})
-                secret_exists = True
-            elif r.status_code == 404:
-                # Will create new secret
-                logger.info(f"Secret {secret_name} does not exist, will create it")
-            else:
-                return {"success": False, "error": f"Failed to get secret: {r.status_code}"}
-        except Exception as e:
-            logger.warning(f"Error getting secret, will create new: {e}")
-
-        # Add/update model's API key field
-        secret_data[secret_field] = base64.b64encode(api_key.encode()).decode()
-
-        if secret_exists:
-            # Update existing secret using PATCH (strategic merge)
-            patch_headers = headers.copy()
-            patch_headers["Content-Type"] = "application/strategic-merge-patch+json"
+        # Merge just this model's field into the existing Secret (strategic
+        # merge), so there is no read-modify-write window with other writers
+        patch_headers = headers.copy()
+        patch_headers["Content-Type"] = "application/strategic-merge-patch+json"
+        patch_body = json_utils.dumpb({"data": {secret_field: encoded_key}})
 
-            # Only send the data field to merge
-            patch_payload = {
-                "data": {
-                    secret_field: secret_data[secret_field]
-                }
-            }
-
-            r = requests.patch(get_url, headers=patch_headers, json=patch_payload, timeout=10, verify=verify)
-            if r.status_code not in (200, 201):
-                return {"success": False, "error": f"Failed to update secret: {r.status_code}"}
-        else:
-            # Create new secret using POST
+        r = _K8S_SESSION.patch(secret_url, headers=patch_headers, data=patch_body, timeout=_K8S_WRITE_TIMEOUT, verify=_CA_VERIFY)
+        if r.status_code == 404:
+            # First MAAS model: create the Secret
+            logger.info(f"Secret {secret_name} does not exist, will create it")
             secret_payload = {
                 "apiVersion": "v1",
                 "kind": "Secret",
@@ -190,12 +341,19 @@ def _save_maas_model_api_key(secret_field: str, api_key: str) -> Dict[str, Any]:
                     }
                 },
                 "type": "Opaque",
-                "data": secret_data
+                "data": {secret_field: encoded_key}
             }
 
-            r = requests.post(create_url, headers=headers, json=secret_payload, timeout=10, verify=verify)
-            if r.status_code not in (200, 201):
+            r = _K8S_SESSION.post(create_url, headers=headers, data=json_utils.dumpb(secret_payload), timeout=_K8S_WRITE_TIMEOUT, verify=_CA_VERIFY)
+            if r.status_code == 409:
+                # Created concurrently by another writer: merge into theirs
+                r = _K8S_SESSION.patch(secret_url, headers=patch_headers, data=patch_body, timeout=_K8S_WRITE_TIMEOUT, verify=_CA_VERIFY)
+                if r.status_code not in (200, 201):
+                    return {"success": False, "error": f"Failed to update secret: {r.status_code}"}
+            elif r.status_code not in (200, 201):
                 return {"success": False, "error": f"Failed to create secret: {r.status_code}"}
+        elif r.status_code not in (200, 201):
+            return {"success": False, "error": f"Failed to update secret: {r.status_code}"}
 
         logger.info(f"Successfully saved MAAS API key for model in field '{secret_field}'")
         return {"success": True, "message": f"API key saved for MAAS model"}
@@ -205,6 +363,171 @@ def _save_maas_model_api_key(secret_field: str, api_key: str) -> Dict[str, Any]:
         return {"success": False, "error": f"Failed to save API key: {str(e)}"}
 
 
+def _models_error_json(message: str) -> str:
+    """Serialize a list_provider_models error result."""
+    return json_utils.dumps({"error": True, "message": message, "models": []})
+
+
+def _models_error(message: str) -> List[Dict[str, Any]]:
+    """MCP response for a list_provider_models error."""
+    return make_mcp_text_response(_models_error_json(message))
+
+
+# Fixed error responses, serialized once
+_ERR_PROVIDER_REQUIRED = _models_error_json("provider is required")
+_ERR_INVALID_OPENAI_KEY = _models_error_json("Invalid OpenAI API key. Please check your API key in the API Keys tab.")
+_ERR_INVALID_ANTHROPIC_KEY = _models_error_json("Invalid Anthropic API key. Please check your API key in the API Keys tab.")
+_ERR_ANTHROPIC_TIMEOUT = _models_error_json("Connection to Anthropic API timed out. Please try again later.")
+_ERR_INVALID_GOOGLE_KEY = _models_error_json("Invalid Google API key. Please check your API key in the API Keys tab.")
+
+
+class _ProviderError(Exception):
+    """A provider listing failed; payload is the serialized error result."""
+
+    def __init__(self, payload: str, invalid_key: bool = False):
+        super().__init__(payload)
+        self.payload = payload
+        self.invalid_key = invalid_key
+
+
+_PROVIDER_LIST_TIMEOUT = 10
+_OPENAI_MODELS_URL = "https://api.openai.com/v1/models"
+_ANTHROPIC_MODELS_URL = "https://api.anthropic.com/v1/models"
+_GOOGLE_MODELS_URL = "https://generativelanguage.googleapis.com/v1beta/models"
+
+
+def _is_openai_chat_model(model_id: str) -> bool:
+    """Whether an OpenAI model id names a known, non-fine-tuned chat model."""
+    # Only include models that start with known valid chat model prefixes
+    # Exclude fine-tuned models (contain ':'), and non-chat models
+    if ":" in model_id or not model_id.startswith(_OPENAI_VALID_PREFIXES):
+        return False
+    model_id_lower = model_id.lower()
+    for keyword in _OPENAI_EXCLUDE:
+        if keyword in model_id_lower:
+            return False
+    return True
+
+
+def _list_openai_models(api_key: str, timeout: float) -> List[Dict[str, Any]]:
+    """Query the OpenAI models API and keep chat models only."""
+    headers = {"Authorization": f"Bearer {api_key}"}
+    r = _PROVIDER_SESSION.get(_OPENAI_MODELS_URL, headers=headers, timeout=timeout)
+
+    if r.status_code == 401:
+        raise _ProviderError(_ERR_INVALID_OPENAI_KEY, invalid_key=True)
+    if r.status_code != 200:
+        raise _ProviderError(_models_error_json(f"OpenAI API error: {r.status_code}. Please try again later."))
+
+    data = json_utils.loads(r.content)
+    # Filter to chat models only - only include known valid GPT chat models
+    return [
+        {
+            "id": model["id"],
+            "name": model["id"].upper().replace("-", " ").title(),
+            "created": model.get("created"),
+            "owned_by": model.get("owned_by"),
+        }
+        for model in data.get("data", [])
+        if _is_openai_chat_model(model.get("id", ""))
+    ]
+
+
+def _list_anthropic_models(api_key: str, timeout: float) -> List[Dict[str, Any]]:
+    """Query the Anthropic models API."""
+    # Using API version 2023-06-01 (stable version for models endpoint)
+    try:
+        headers = {
+            "x-api-key": api_key,
+            "anthropic-version": "2023-06-01"
+        }
+        r = _PROVIDER_SESSION.get(_ANTHROPIC_MODELS_URL, headers=headers, timeout=timeout)
+    except requests.exceptions.Timeout:
+        raise _ProviderError(_ERR_ANTHROPIC_TIMEOUT)
+    except requests.exceptions.ConnectionError as e:
+        raise _ProviderError(_models_error_json(f"Failed to connect to Anthropic API: {str(e)}"))
+    except requests.exceptions.RequestException as e:
+        raise _ProviderError(_models_error_json(f"Anthropic API request failed: {str(e)}"))
+
+    if r.status_code == 401:
+        raise _ProviderError(_ERR_INVALID_ANTHROPIC_KEY, invalid_key=True)
+    if r.status_code != 200:
+        raise _ProviderError(_models_error_json(f"Anthropic API error: {r.status_code}. Please try again later."))
+
+    # Parse JSON response with error handling
+    try:
+        data = json_utils.loads(r.content)
+    except json_utils.JSONDecodeError as e:
+        raise _ProviderError(_models_error_json(f"Invalid JSON response from Anthropic API: {str(e)}"))
+
+    models = []
+    # Filter to chat models only (type: "model") with field validation
+    for model in data.get("data", []):
+        # Only include models of type "model" (excludes other types if any)
+        if model.get("type") == "model":
+            model_id = model.get("id")
+            # Validate required field - skip models without IDs
+            if not model_id:
+                logger.warning("Skipping Anthropic model with missing ID: %s", model)
+                continue
+
+            models.append({
+                "id": model_id,
+                "name": model.get("display_name") or model_id,
+                # Omit 'created' field - API returns string but UI expects number
+                # Field is optional and not currently used, avoiding type mismatch
+            })
+    return models
+
+
+def _list_google_models(api_key: str, timeout: float) -> List[Dict[str, Any]]:
+    """Query the Google models API and keep Gemini text generation models."""
+    # The key travels in a header so it never lands in the URL, which
+    # requests echoes in connection error messages
+    headers = {"x-goog-api-key": api_key}
+    r = _PROVIDER_SESSION.get(_GOOGLE_MODELS_URL, headers=headers, timeout=timeout)
+
+    if r.status_code == 400 or r.status_code == 403:
+        raise _ProviderError(_ERR_INVALID_GOOGLE_KEY, invalid_key=True)
+    if r.status_code != 200:
+        raise _ProviderError(_models_error_json(f"Google API error: {r.status_code}. Please try again later."))
+
+    models = []
+    data = json_utils.loads(r.content)
+    for model in data.get("models", []):
+        name = model.get("name", "")
+        # Extract model ID from full name (models/gemini-xxx)
+        if name.startswith("models/"):
+            model_id = name[7:]  # Remove "models/" prefix
+            model_id_lower = model_id.lower()
+
+            # Filter to Gemini generative models only
+            # Include: gemini-* models that support text generation
+            # Exclude: embeddings, vision-only, code-only, experimental variants
+            if "gemini" in model_id_lower:
+                # Exclude non-chat models
+                if not any(keyword in model_id_lower for keyword in _GOOGLE_EXCLUDE):
+                    # Get supported generation methods to verify it supports text generation
+                    supported_methods = model.get("supportedGenerationMethods", [])
+                    # Only include if it supports generateContent (text generation)
+                    if not supported_methods or "generateContent" in supported_methods:
+                        models.append({
+                            "id": model_id,
+                            "name": model.get("displayName", model_id),
+                            "description": model.get("description", ""),
+                            "context_length": model.get("inputTokenLimit"),
+                        })
+    return models
+
+
+# Providers whose models are listed live; maas and meta use curated lists
+_PROVIDER_HANDLERS = {
+    "openai": _list_openai_models,
+    "anthropic": _list_anthropic_models,
+    "google": _list_google_models,
+}
+
+
 def list_provider_models(
     provider: str,
     api_key: Optional[str] = None
@@ -225,22 +548,15 @@ def list_provider_models(
         logger.info(f"Listing models for provider: {provider}")
 
         if not provider:
-            error_result = {
-                "error": True,
-                "message": "provider is required",
-                "models": []
-            }
-            return make_mcp_text_response(json.dumps(error_result))
+            return make_mcp_text_response(_ERR_PROVIDER_REQUIRED)
 
         provider_lower = provider.lower()
 
         # MAAS: Return curated list immediately (no API key needed for listing)
         # MAAS uses per-model API keys, not a provider-level key
         if provider_lower == "maas":
-            models = _get_curated_maas_models()
-            result = {"models": models, "provider": provider_lower, "count": len(models)}
-            logger.info(f"Returning {len(models)} curated MAAS models (no API key required)")
-            return make_mcp_text_response(json.dumps(result))
+            logger.info(f"Returning {len(_MAAS_MODELS)} curated MAAS models (no API key required)")
+            return make_mcp_text_response(_MAAS_RESPONSE_JSON)
 
         # Get API key: use provided key (dev mode) or retrieve from K8s Secret (production)
         if api_key:
@@ -249,231 +565,93 @@ def list_provider_models(
             logger.info(f"Retrieving API key from K8s Secret for {provider_lower} (production mode)")
             api_key = _get_api_key_from_secret(provider_lower)
             if not api_key:
-                error_result = {
-                    "error": True,
-                    "message": f"API key not found for provider {provider}. Please configure API key in the API Keys tab.",
-                    "models": []
-                }
-                return make_mcp_text_response(json.dumps(error_result))
-
-        models = []
-        timeout = 10
-
-        if provider_lower == "openai":
-            # Query OpenAI models API
-            url = "https://api.openai.com/v1/models"
-            headers = {"Authorization": f"Bearer {api_key}"}
-            r = requests.get(url, headers=headers, timeout=timeout)
-
-            if r.status_code == 401:
-                error_result = {
-                    "error": True,
-                    "message": "Invalid OpenAI API key. Please check your API key in the API Keys tab.",
-                    "models": []
-                }
-                return make_mcp_text_response(json.dumps(error_result))
-            if r.status_code != 200:
-                error_result = {
-                    "error": True,
-                    "message": f"OpenAI API error: {r.status_code}. Please try again later.",
-                    "models": []
-                }
-                return make_mcp_text_response(json.dumps(error_result))
-
-            data = r.json()
-            # Filter to chat models only - only include known valid GPT chat models
-            valid_prefixes = ["gpt-5.2", "gpt-5.1", "gpt-5", "gpt-4o", "gpt-4-turbo", "gpt-4", "gpt-3.5-turbo"]
-            for model in data.get("data", []):
-                model_id = model.get("id", "")
-                # Only include models that start with known valid chat model prefixes
-                # Exclude fine-tuned models (contain ':'), and non-chat models
-                if any(model_id.startswith(prefix) for prefix in valid_prefixes) and ":" not in model_id:
-                    # Further exclude specific non-chat models
-                    if not any(x in model_id.lower() for x in ["instruct", "vision", "embedding", "tts", "whisper", "dall-e", "audio", "realtime"]):
-                        models.append({
-                            "id": model_id,
-                            "name": model_id.upper().replace("-", " ").title(),
-                            "created": model.get("created"),
-                            "owned_by": model.get("owned_by"),
-                        })
-
-        elif provider_lower == "anthropic":
-            # Query Anthropic models API
-            # Using API version 2023-06-01 (stable version for models endpoint)
-            try:
-                url = "https://api.anthropic.com/v1/models"
-                headers = {
-                    "x-api-key": api_key,
-                    "anthropic-version": "2023-06-01"
-                }
-                r = requests.get(url, headers=headers, timeout=timeout)
+                return _models_error(f"API key not found for provider {provider}. Please configure API key in the API Keys tab.")
 
-                if r.status_code == 401:
-                    error_result = {
-                        "error": True,
-                        "message": "Invalid Anthropic API key. Please check your API key in the API Keys tab.",
-                        "models": []
-                    }
-                    return make_mcp_text_response(json.dumps(error_result))
-                if r.status_code != 200:
-                    error_result = {
-                        "error": True,
-                        "message": f"Anthropic API error: {r.status_code}. Please try again later.",
-                        "models": []
-                    }
-                    return make_mcp_text_response(json.dumps(error_result))
-
-                # Parse JSON response with error handling
-                try:
-                    data = r.json()
-                except json.JSONDecodeError as e:
-                    error_result = {
-                        "error": True,
-                        "message": f"Invalid JSON response from Anthropic API: {str(e)}",
-                        "models": []
-                    }
-                    return make_mcp_text_response(json.dumps(error_result))
-
-                # Filter to chat models only (type: "model") with field validation
-                for model in data.get("data", []):
-                    # Only include models of type "model" (excludes other types if any)
-                    if model.get("type") == "model":
-                        model_id = model.get("id")
-                        # Validate required field - skip models without IDs
-                        if not model_id:
-                            logger.warning("Skipping Anthropic model with missing ID: %s", model)
-                            continue
+        if provider_lower == "meta":
+            # Meta/Llama API - use curated list
+            return make_mcp_text_response(_META_RESPONSE_JSON)
 
-                        models.append({
-                            "id": model_id,
-                            "name": model.get("display_name") or model_id,
-                            # Omit 'created' field - API returns string but UI expects number
-                            # Field is optional and not currently used, avoiding type mismatch
-                        })
+        handler = _PROVIDER_HANDLERS.get(provider_lower)
+        if handler is None:
+            return _models_error(f"Unsupported provider: {provider}")
 
-            except requests.exceptions.Timeout:
-                error_result = {
-                    "error": True,
-                    "message": "Connection to Anthropic API timed out. Please try again later.",
-                    "models": []
-                }
-                return make_mcp_text_response(json.dumps(error_result))
-            except requests.exceptions.ConnectionError as e:
-                error_result = {
-                    "error": True,
-                    "message": f"Failed to connect to Anthropic API: {str(e)}",
-                    "models": []
-                }
-                return make_mcp_text_response(json.dumps(error_result))
-            except requests.exceptions.RequestException as e:
-                error_result = {
-                    "error": True,
-                    "message": f"Anthropic API request failed: {str(e)}",
-                    "models": []
-                }
-                return make_mcp_text_response(json.dumps(error_result))
-
-        elif provider_lower == "google":
-            # Query Google models API
-            url = f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}"
-            r = requests.get(url, timeout=timeout)
-
-            if r.status_code == 400 or r.status_code == 403:
-                error_result = {
-                    "error": True,
-                    "message": "Invalid Google API key. Please check your API key in the API Keys tab.",
-                    "models": []
-                }
-                return make_mcp_text_response(json.dumps(error_result))
-            if r.status_code != 200:
-                error_result = {
-                    "error": True,
-                    "message": f"Google API error: {r.status_code}. Please try again later.",
-                    "models": []
-                }
-                return make_mcp_text_response(json.dumps(error_result))
-
-            data = r.json()
-            for model in data.get("models", []):
-                name = model.get("name", "")
-                # Extract model ID from full name (models/gemini-xxx)
-                if name.startswith("models/"):
-                    model_id = name[7:]  # Remove "models/" prefix
-                    model_id_lower = model_id.lower()
-
-                    # Filter to Gemini generative models only
-                    # Include: gemini-* models that support text generation
-                    # Exclude: embeddings, vision-only, code-only, experimental variants
-                    if "gemini" in model_id_lower:
-                        # Exclude non-chat models
-                        exclude_keywords = ["embedding", "vision-only", "imagen", "code-only", "aqa"]
-                        if not any(keyword in model_id_lower for keyword in exclude_keywords):
-                            # Get supported generation methods to verify it supports text generation
-                            supported_methods = model.get("supportedGenerationMethods", [])
-                            # Only include if it supports generateContent (text generation)
-                            if not supported_methods or "generateContent" in supported_methods:
-                                models.append({
-                                    "id": model_id,
-                                    "name": model.get("displayName", model_id),
-                                    "description": model.get("description", ""),
-                                    "context_length": model.get("inputTokenLimit"),
-                                })
-
-        elif provider_lower == "meta":
-            # Meta/Llama API - use curated list
-            models = [
-                {
-                    "id": "llama-3.3-70b",
-                    "name": "Llama 3.3 70B",
-                    "description": "Latest Llama model, 70B parameters",
-                    "context_length": 128000,
-                },
-                {
-                    "id": "llama-3.1-70b",
-                    "name": "Llama 3.1 70B",
-                    "description": "Llama 3.1 with 70B parameters",
-                    "context_length": 128000,
-                },
-                {
-                    "id": "llama-3.1-8b",
-                    "name": "Llama 3.1 8B",
-                    "description": "Efficient 8B parameter model",
-                    "context_length": 128000,
-                },
-                {
-                    "id": "llama-2-70b",
-                    "name": "Llama 2 70B",
-                    "description": "Llama 2 with 70B parameters",
-                    "context_length": 4096,
-                },
-                {
-                    "id": "llama-2-13b",
-                    "name": "Llama 2 13B",
-                    "description": "Llama 2 with 13B parameters",
-                    "context_length": 4096,
-                },
-            ]
+        cache_key = _model_list_cache_key(provider_lower, api_key)
+        cached = _get_cached_model_list(cache_key)
+        if cached is not None:
+            logger.info(f"Returning cached model list for provider {provider_lower}")
+            return make_mcp_text_response(cached)
 
-        else:
-            error_result = {
-                "error": True,
-                "message": f"Unsupported provider: {provider}",
-                "models": []
-            }
-            return make_mcp_text_response(json.dumps(error_result))
+        try:
+            models = handler(api_key, _PROVIDER_LIST_TIMEOUT)
+        except _ProviderError as e:
+            if e.invalid_key:
+                _forget_api_key(provider_lower, cache_key)
+            return make_mcp_text_response(e.payload)
 
         result = {"models": models, "provider": provider_lower, "count": len(models)}
         logger.info(f"Found {len(models)} models for provider {provider_lower}")
-        return make_mcp_text_response(json.dumps(result))
+        payload = json_utils.dumps(result)
+        _cache_model_list(cache_key, payload)
+        return make_mcp_text_response(payload)
 
     except Exception as e:
         logger.error(f"Error listing models: {e}")
-        error_result = {
-            "error": True,
-            "message": f"Failed to list models: {str(e)}",
-            "models": []
-        }
-        return make_mcp_text_response(json.dumps(error_result))
+        return _models_error(f"Failed to list models: {str(e)}")
+
+
+def list_all_provider_models(
+    providers: List[str],
+    api_keys: Optional[Dict[str, str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    List models for several providers concurrently.
+
+    Each provider is queried as by list_provider_models, so per-provider
+    errors are reported in that provider's entry rather than failing the
+    whole call.
+
+    Args:
+        providers: Provider names (openai, anthropic, google, meta, maas)
+        api_keys: Optional map of provider name to API key (dev mode); providers
+                  without an entry read their key from the Kubernetes Secret
+
+    Returns:
+        MCP response with {"providers": {provider: <list_provider_models result>}}
+    """
+    try:
+        if not isinstance(providers, list) or not providers:
+            raise MCPException(
+                message="providers must be a non-empty list",
+                error_code=MCPErrorCode.INVALID_INPUT,
+            )
+
+        keys = {(p or "").lower(): k for p, k in (api_keys or {}).items()}
+        unique = list(dict.fromkeys((p or "").lower() for p in providers))
+
+        def run(provider: str) -> str:
+            return list_provider_models(provider, keys.get(provider))[0]["text"]
+
+        # Live listings block on the provider API; overlap them so the batch
+        # takes as long as the slowest provider rather than the sum
+        if len(unique) == 1:
+            payloads = [run(unique[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_MAX_LISTING_WORKERS, len(unique))) as ex:
+                payloads = list(ex.map(run, unique))
+
+        # Each payload is already a JSON document; splice them in as-is
+        entries = ",".join(f"{json_utils.dumps(p)}:{payload}" for p, payload in zip(unique, payloads))
+        return make_mcp_text_response(f'{{"providers":{{{entries}}}}}')
+
+    except MCPException as e:
+        return e.to_mcp_response()
+    except Exception as e:
+        logger.error(f"Error listing models for providers: {e}")
+        err = MCPException(
+            message=f"Failed to list models: {str(e)}",
+            error_code=MCPErrorCode.INTERNAL_ERROR,
+        )
+        return err.to_mcp_response()
 
 
 def add_model_to_config(
@@ -514,7 +692,7 @@ def add_model_to_config(
             )
 
         provider_lower = provider.lower()
-        ns = os.getenv("NAMESPACE", "")
+        ns = _NAMESPACE
         if not ns:
             raise MCPException(
                 message="Server namespace not detected; cannot update ConfigMap",
@@ -531,7 +709,7 @@ def add_model_to_config(
                 )
             if not api_url:
                 # Use MAAS URL from environment variable or default
-                api_url = os.getenv("MAAS_API_URL", "https://litellm-prod.apps.maas.redhatworkshops.io/v1")
+                api_url = _MAAS_API_URL
 
             # Save API key to Secret (specific field for this model)
             secret_field = model_id.replace("maas/", "").strip()
@@ -544,6 +722,7 @@ def add_model_to_config(
 
         # Generate model key
         model_key = f"{provider_lower}/{model_id}"
+        now = _utc_timestamp()
 
         # Build model config object
         if provider_lower == "maas":
@@ -570,7 +749,7 @@ def add_model_to_config(
                 "_metadata": {
                     "source": "user",
                     "addedBy": "console-plugin",
-                    "addedAt": datetime.utcnow().isoformat() + "Z",
+                    "addedAt": now,
                     "description": description or ""
                 }
             }
@@ -617,7 +796,7 @@ def add_model_to_config(
                 "_metadata": {
                     "source": "user",
                     "addedBy": "console-plugin",
-                    "addedAt": datetime.utcnow().isoformat() + "Z"
+                    "addedAt": now
                 }
             }
 
@@ -628,31 +807,28 @@ def add_model_to_config(
 
         # Get current config from runtime config manager (with force refresh)
         from core.model_config_manager import get_model_config
-        current_config = get_model_config(force_refresh=True)
-
-        # Add/update model in config
-        current_config[model_key] = model_config
+        # Add/update model in a copy: the returned dict is the live snapshot
+        current_config = {**get_model_config(force_refresh=True), model_key: model_config}
 
         # Update ConfigMap using PATCH (strategic merge)
         configmap_name = "ai-model-config"
         url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/configmaps/{configmap_name}"
         headers = _get_k8s_headers()
         headers["Content-Type"] = "application/strategic-merge-patch+json"
-        verify = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
 
         # Use strategic merge patch to update data and annotations
         patch_payload = {
             "metadata": {
                 "annotations": {
-                    "config.kubernetes.io/last-modified": datetime.utcnow().isoformat() + "Z"
+                    "config.kubernetes.io/last-modified": now
                 }
             },
             "data": {
-                "model-config.json": json.dumps(current_config, indent=2)
+                "model-config.json": json_utils.dumps(current_config, indent=True)
             }
         }
 
-        r = requests.patch(url, headers=headers, json=patch_payload, timeout=10, verify=verify)
+        r = _K8S_SESSION.patch(url, headers=headers, data=json_utils.dumpb(patch_payload), timeout=_K8S_WRITE_TIMEOUT, verify=_CA_VERIFY)
 
         if r.status_code not in (200, 201):
             raise MCPException(
@@ -673,7 +849,7 @@ def add_model_to_config(
             "message": f"Model {model_key} added successfully and configuration reloaded."
         }
         logger.info(f"Model {model_key} added to ConfigMap and runtime config refreshed")
-        return make_mcp_text_response(json.dumps(result))
+        return make_mcp_text_response(json_utils.dumps(result))
 
     except MCPException as e:
         return e.to_mcp_response()
@@ -736,7 +912,7 @@ def update_maas_model_api_key(
 
         # Update endpoint in ConfigMap if provided
         if api_url:
-            ns = os.getenv("NAMESPACE", "")
+            ns = _NAMESPACE
             if not ns:
                 raise MCPException(
                     message="Server namespace not detected; cannot update ConfigMap",
@@ -750,10 +926,11 @@ def update_maas_model_api_key(
             else:
                 final_api_url = normalized_url
 
-            # Update model config
-            model_config = current_config[model_key]
+            # Update model config in a copy, leaving the live snapshot untouched
+            model_config = copy.deepcopy(current_config[model_key])
             model_config["apiUrl"] = final_api_url
-            model_config["_metadata"]["lastUpdated"] = datetime.utcnow().isoformat() + "Z"
+            now = _utc_timestamp()
+            model_config["_metadata"]["lastUpdated"] = now
             model_config["_metadata"]["updatedBy"] = "console-plugin"
 
             # Update ConfigMap
@@ -761,20 +938,19 @@ def update_maas_model_api_key(
             url = f"{K8S_API_URL}/api/v1/namespaces/{ns}/configmaps/{configmap_name}"
             headers = _get_k8s_headers()
             headers["Content-Type"] = "application/strategic-merge-patch+json"
-            verify = K8S_SA_CA_PATH if os.path.exists(K8S_SA_CA_PATH) else True
 
             patch_payload = {
                 "metadata": {
                     "annotations": {
-                        "config.kubernetes.io/last-modified": datetime.utcnow().isoformat() + "Z"
+                        "config.kubernetes.io/last-modified": now
                     }
                 },
                 "data": {
-                    "model-config.json": json.dumps(current_config, indent=2)
+                    "model-config.json": json_utils.dumps({**current_config, model_key: model_config}, indent=True)
                 }
             }
 
-            r = requests.patch(url, headers=headers, json=patch_payload, timeout=10, verify=verify)
+            r = _K8S_SESSION.patch(url, headers=headers, data=json_utils.dumpb(patch_payload), timeout=_K8S_WRITE_TIMEOUT, verify=_CA_VERIFY)
 
             if r.status_code not in (200, 201):
                 # API key was updated but endpoint update failed
@@ -785,7 +961,7 @@ def update_maas_model_api_key(
                     "warning": f"API key updated successfully, but endpoint update failed: {r.status_code}",
                     "message": f"Model {model_key} API key updated (endpoint update failed)"
                 }
-                return make_mcp_text_response(json.dumps(result))
+                return make_mcp_text_response(json_utils.dumps(result))
 
             # Force refresh runtime config
             from core.model_config_manager import reload_model_config
@@ -797,7 +973,7 @@ def update_maas_model_api_key(
             "message": f"Model {model_key} updated successfully" + (" with new endpoint" if api_url else "")
         }
         logger.info(f"MAAS model {model_key} updated successfully")
-        return make_mcp_text_response(json.dumps(result))
+        return make_mcp_text_response(json_utils.dumps(result))
 
     except MCPException as e:
         return e.to_mcp_response()
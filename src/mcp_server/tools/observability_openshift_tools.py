@@ -1,8 +1,11 @@
 from typing import Dict, Any, List, Optional
+import functools
 import os
-import json
 import core.metrics as core_metrics
+import numpy as np
+import pandas as pd
 import requests
+from pandas.api.types import is_datetime64_dtype, is_numeric_dtype
 
 from .observability_vllm_tools import resolve_time_range
 from core.response_utils import make_mcp_text_response
@@ -14,8 +17,11 @@ from core.metrics import (
     calculate_histogram_quantile_optimal_lookback,
 )
 from core.api_key_manager import (
+    detect_provider_from_model_id,
+    invalidate_cached_api_key,
     resolve_api_key,
 )
+from common import json_utils
 from common.pylogger import get_python_logger
 from mcp_server.exceptions import (
     ValidationError,
@@ -48,6 +54,81 @@ def _classify_requests_error(e: Exception) -> str:
         return "unknown"
 
 
+def _forget_rejected_api_key(e: requests.exceptions.HTTPError, model_id: Optional[str]) -> None:
+    """Drop the cached Secret key for a model's provider if the LLM rejected it."""
+    resp = getattr(e, "response", None)
+    if resp is not None and resp.status_code in (401, 403):
+        provider = detect_provider_from_model_id(model_id)
+        if provider:
+            invalidate_cached_api_key(provider)
+
+
+def _serialize_metric_rows_slow(rows: List[Any]) -> List[Dict[str, Any]]:
+    """Serialize {timestamp, value} rows one at a time, tolerating any row shape."""
+    safe_rows = []
+    for r in rows:
+        if isinstance(r, dict):
+            ts = r.get("timestamp")
+            val = r.get("value")
+            # Convert timestamp to ISO 8601 string; ensure it ends with 'Z' to indicate UTC.
+            if hasattr(ts, "isoformat"):
+                ts_str = ts.isoformat()
+                if not ts_str.endswith("Z"):
+                    ts_str += "Z"
+            else:
+                ts_str = str(ts) if ts is not None else ""
+            try:
+                val_num = float(val) if val is not None else None
+            except Exception:
+                val_num = None
+            safe_rows.append({"timestamp": ts_str, "value": val_num})
+    return safe_rows
+
+
+def _serialize_metric_rows(rows: List[Any]) -> List[Dict[str, Any]]:
+    """Serialize one metric's {timestamp, value} rows for the UI payload.
+
+    Rows produced by analyze_openshift_metrics have naive whole-second
+    timestamps and non-missing numeric values; those are formatted
+    column-wise with NumPy.
+    Anything else goes through the per-row path, which yields the same output.
+    """
+    if not rows:
+        return []
+    if not all(isinstance(r, dict) for r in rows):
+        return _serialize_metric_rows_slow(rows)
+    df = pd.DataFrame(rows)
+    if "timestamp" not in df.columns or "value" not in df.columns:
+        return _serialize_metric_rows_slow(rows)
+    ts = df["timestamp"]
+    if not (is_datetime64_dtype(ts) and is_numeric_dtype(df["value"])):
+        return _serialize_metric_rows_slow(rows)
+    # A None (or missing) value becomes NaN in the column, indistinguishable
+    # from a real NaN sample; the per-row path keeps None as None
+    if not df["value"].notna().all():
+        return _serialize_metric_rows_slow(rows)
+    ts_values = ts.to_numpy()
+    # isoformat() only adds a fractional part when one is present
+    if not (ts_values.astype("datetime64[s]") == ts_values).all():
+        return _serialize_metric_rows_slow(rows)
+    ts_strs = np.char.add(np.datetime_as_string(ts_values, unit="s"), "Z").tolist()
+    values = df["value"].astype(float).tolist()
+    return [{"timestamp": t, "value": v} for t, v in zip(ts_strs, values)]
+
+
+@functools.lru_cache(maxsize=1024)
+def _apply_namespace_filter(query: str, namespace: str) -> str:
+    """Add a namespace matcher to every selector in a dashboard query.
+
+    The category catalog is fixed, so the rewrite for each (query, namespace)
+    pair is memoized across dashboard loads.
+    """
+    if '{' in query:
+        return query.replace('{', f'{{namespace="{namespace}",')
+    # Add namespace filter to queries without existing filters
+    return query.replace(')', f'{{namespace="{namespace}"}})')
+
+
 def _extract_llm_error_message(e: requests.exceptions.HTTPError) -> str:
     """Extract detailed error message from LLM API HTTP error response."""
     try:
@@ -181,25 +262,7 @@ def analyze_openshift(
             out: Dict[str, Any] = {}
             try:
                 for label, rows in (metrics or {}).items():
-                    safe_rows = []
-                    if isinstance(rows, list):
-                        for r in rows:
-                            if isinstance(r, dict):
-                                ts = r.get("timestamp")
-                                val = r.get("value")
-                                # Convert timestamp to ISO 8601 string; ensure it ends with 'Z' to indicate UTC.
-                                if hasattr(ts, "isoformat"):
-                                    ts_str = ts.isoformat()
-                                    if not ts_str.endswith("Z"):
-                                        ts_str += "Z"
-                                else:
-                                    ts_str = str(ts) if ts is not None else ""
-                                try:
-                                    val_num = float(val) if val is not None else None
-                                except Exception:
-                                    val_num = None
-                                safe_rows.append({"timestamp": ts_str, "value": val_num})
-                    out[label] = safe_rows
+                    out[label] = _serialize_metric_rows(rows) if isinstance(rows, list) else []
             except Exception:
                 return {}
             return out
@@ -210,7 +273,7 @@ def analyze_openshift(
             "metrics": _serialize_metrics(result.get("metrics", {})),
         }
 
-        content = f"{header}\n\n{summary}\n\nSTRUCTURED_DATA:\n{json.dumps(structured)}".strip()
+        content = f"{header}\n\n{summary}\n\nSTRUCTURED_DATA:\n{json_utils.dumps(structured)}".strip()
         return make_mcp_text_response(content)
 
     except PrometheusError as e:
@@ -218,6 +281,7 @@ def analyze_openshift(
     except requests.exceptions.HTTPError as e:
         cls = _classify_requests_error(e)
         if cls == "llm":
+            _forget_rejected_api_key(e, summarize_model_id)
             error_msg = _extract_llm_error_message(e)
             return LLMServiceError(message=error_msg).to_mcp_response()
         # Default: treat as Prometheus HTTP error
@@ -301,7 +365,7 @@ def fetch_openshift_metrics_data(
         category_queries = openshift_metrics.get(metric_category, {})
         
         if not category_queries:
-            return make_mcp_text_response(json.dumps({
+            return make_mcp_text_response(json_utils.dumps({
                 "category": metric_category,
                 "scope": scope,
                 "namespace": namespace,
@@ -310,16 +374,13 @@ def fetch_openshift_metrics_data(
             }))
 
         # Prepare queries with namespace filter if needed
-        prepared_queries: Dict[str, str] = {}
-        for label, query in category_queries.items():
-            final_query = query
-            if scope == NAMESPACE_SCOPED and namespace:
-                if '{' in query:
-                    final_query = query.replace('{', f'{{namespace="{namespace}",')
-                else:
-                    # Add namespace filter to queries without existing filters
-                    final_query = query.replace(')', f'{{namespace="{namespace}"}})')
-            prepared_queries[label] = final_query
+        if scope == NAMESPACE_SCOPED and namespace:
+            prepared_queries: Dict[str, str] = {
+                label: _apply_namespace_filter(query, namespace)
+                for label, query in category_queries.items()
+            }
+        else:
+            prepared_queries = dict(category_queries)
 
         # Calculate time range for dynamic query adjustment
         duration_seconds = end_ts - start_ts
@@ -354,18 +415,15 @@ def fetch_openshift_metrics_data(
 
         prepared_queries = adjusted_queries
 
-        # Execute instant queries for current values (fast!)
-        values = core_metrics.execute_instant_queries_parallel(prepared_queries, max_workers=10)
-        
-        # Execute range queries for sparklines (in parallel)
-        time_series_data = core_metrics.execute_range_queries_parallel(
+        # Latest values and sparklines go out together as one parallel wave
+        values, time_series_data = core_metrics.execute_dashboard_queries_parallel(
             prepared_queries,
             start_ts,
             end_ts,
-            max_workers=10,
+            max_workers=20,
             max_points=15  # ~15 points for sparklines
         )
-        
+
         # Format results
         metrics_data: Dict[str, Any] = {}
         for label, value in values.items():
@@ -383,7 +441,7 @@ def fetch_openshift_metrics_data(
             "metrics": metrics_data,
         }
         
-        return make_mcp_text_response(json.dumps(result))
+        return make_mcp_text_response(json_utils.dumps(result))
 
     except Exception as e:
         error = MCPException(
@@ -529,12 +587,13 @@ def chat_openshift(
             "promql": result.get("promql", ""),
             "summary": result.get("summary", ""),
         }
-        return make_mcp_text_response(json.dumps(payload))
+        return make_mcp_text_response(json_utils.dumps(payload))
     except PrometheusError as e:
         return e.to_mcp_response()
     except requests.exceptions.HTTPError as e:
         cls = _classify_requests_error(e)
         if cls == "llm":
+            _forget_rejected_api_key(e, summarize_model_id)
             error_msg = _extract_llm_error_message(e)
             return LLMServiceError(message=error_msg).to_mcp_response()
         prom_err = parse_prometheus_error(getattr(e, 'response', None))
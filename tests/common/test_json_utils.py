@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+import pytest
+
+import common.json_utils as json_utils
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def backend(request):
+    if request.param == "stdlib":
+        with patch.object(json_utils, "orjson", None):
+            yield request.param
+    else:
+        yield request.param
+
+
+def test_loads_accepts_bytes_and_str(backend):
+    assert json_utils.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    assert json_utils.loads('{"a": null}') == {"a": None}
+
+
+def test_loads_invalid_raises_json_decode_error(backend):
+    with pytest.raises(json_utils.JSONDecodeError):
+        json_utils.loads(b"{not json")
+
+
+def test_dumps_compact(backend):
+    assert json_utils.dumps({"a": 1, "b": ["x"]}) == '{"a":1,"b":["x"]}'
+
+
+def test_dumps_indent_matches_stdlib_layout(backend):
+    assert json_utils.dumps({"m": {"external": True}}, indent=True) == (
+        '{\n  "m": {\n    "external": true\n  }\n}'
+    )
+
+
+def test_dumps_keeps_unicode(backend):
+    assert json_utils.dumps({"name": "café"}) == '{"name":"café"}'
+
+
+def test_dumpb_returns_compact_utf8_bytes(backend):
+    assert json_utils.dumpb({"name": "café", "n": [1]}) == '{"name":"café","n":[1]}'.encode("utf-8")
@@ -11,13 +11,25 @@ import os
 import base64
 from unittest.mock import patch, Mock, MagicMock
 
+import src.core.api_key_manager as api_key_manager
 from src.core.api_key_manager import (
     detect_provider_from_model_id,
     fetch_api_key_from_secret,
+    invalidate_cached_api_key,
     resolve_api_key,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_api_key_caches():
+    """Each test starts without cached keys or service account token."""
+    invalidate_cached_api_key()
+    api_key_manager._forget_sa_token()
+    yield
+    invalidate_cached_api_key()
+    api_key_manager._forget_sa_token()
+
+
 class TestDetectProviderFromModelId:
     """Test provider detection from model identifiers"""
 
@@ -104,7 +116,76 @@ class TestDetectProviderFromModelId:
 class TestFetchApiKeyFromSecret:
     """Test Kubernetes secret retrieval for API keys"""
 
-    @patch('src.core.api_key_manager.requests.get')
+    @staticmethod
+    def _secret_response(api_key):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "data": {"api-key": base64.b64encode(api_key.encode('utf-8')).decode('utf-8')}
+        }
+        return mock_response
+
+    @patch('src.core.api_key_manager._K8S_SESSION.get')
+    @patch('builtins.open', create=True)
+    @patch.dict(os.environ, {'NAMESPACE': 'test-namespace'})
+    def test_key_and_token_are_cached(self, mock_open, mock_get):
+        """Repeated lookups reuse the decoded key and token without new reads"""
+        mock_open.return_value.__enter__.return_value.read.return_value = "test-token"
+        mock_get.return_value = self._secret_response("cached-key")
+
+        assert fetch_api_key_from_secret("openai") == "cached-key"
+        assert fetch_api_key_from_secret("openai") == "cached-key"
+
+        mock_get.assert_called_once()
+        mock_open.assert_called_once()
+
+    @patch('src.core.api_key_manager._K8S_VERIFY', '/var/run/secrets/ca.crt')
+    @patch('src.core.api_key_manager._K8S_SESSION.get')
+    @patch('builtins.open', create=True)
+    @patch.dict(os.environ, {'NAMESPACE': 'test-namespace', 'REQUESTS_CA_BUNDLE': '/etc/ssl/env-bundle.pem'})
+    def test_service_account_ca_passed_per_request(self, mock_open, mock_get):
+        """The SA CA is passed on each call so REQUESTS_CA_BUNDLE cannot replace it"""
+        mock_open.return_value.__enter__.return_value.read.return_value = "test-token"
+        mock_get.return_value = self._secret_response("key")
+
+        fetch_api_key_from_secret("openai")
+
+        assert mock_get.call_args.kwargs["verify"] == '/var/run/secrets/ca.crt'
+
+    @patch('src.core.api_key_manager._K8S_SESSION.get')
+    @patch('builtins.open', create=True)
+    @patch.dict(os.environ, {'NAMESPACE': 'test-namespace'})
+    def test_invalidate_forces_secret_reread(self, mock_open, mock_get):
+        """invalidate_cached_api_key drops only the named provider"""
+        mock_open.return_value.__enter__.return_value.read.return_value = "test-token"
+        mock_get.side_effect = [
+            self._secret_response("old-key"),
+            self._secret_response("google-key"),
+            self._secret_response("new-key"),
+        ]
+
+        assert fetch_api_key_from_secret("openai") == "old-key"
+        assert fetch_api_key_from_secret("google") == "google-key"
+        invalidate_cached_api_key("openai")
+
+        assert fetch_api_key_from_secret("openai") == "new-key"
+        assert fetch_api_key_from_secret("google") == "google-key"
+        assert mock_get.call_count == 3
+
+    @patch('src.core.api_key_manager._K8S_SESSION.get')
+    @patch('builtins.open', create=True)
+    @patch.dict(os.environ, {'NAMESPACE': 'test-namespace'})
+    def test_failed_lookup_is_not_cached(self, mock_open, mock_get):
+        """A missing Secret is looked up again on the next call"""
+        mock_open.return_value.__enter__.return_value.read.return_value = "test-token"
+        missing = Mock()
+        missing.status_code = 404
+        mock_get.side_effect = [missing, self._secret_response("created-later")]
+
+        assert fetch_api_key_from_secret("openai") is None
+        assert fetch_api_key_from_secret("openai") == "created-later"
+
+    @patch('src.core.api_key_manager._K8S_SESSION.get')
     @patch('builtins.open', create=True)
     @patch('os.path.exists')
     @patch.dict(os.environ, {'NAMESPACE': 'test-namespace'})
@@ -131,7 +212,7 @@ class TestFetchApiKeyFromSecret:
         assert result == api_key
         mock_requests_get.assert_called_once()
 
-    @patch('src.core.api_key_manager.requests.get')
+    @patch('src.core.api_key_manager._K8S_SESSION.get')
     @patch('builtins.open', create=True)
     @patch('os.path.exists')
     @patch.dict(os.environ, {'NAMESPACE': 'test-namespace'})
@@ -165,7 +246,7 @@ class TestFetchApiKeyFromSecret:
         result = fetch_api_key_from_secret(None)
         assert result is None
 
-    @patch('src.core.api_key_manager.requests.get')
+    @patch('src.core.api_key_manager._K8S_SESSION.get')
     @patch('builtins.open', create=True)
     @patch('os.path.exists')
     @patch.dict(os.environ, {'NAMESPACE': 'test-namespace'})
@@ -199,7 +280,7 @@ class TestFetchApiKeyFromSecret:
 
         assert result is None
 
-    @patch('src.core.api_key_manager.requests.get')
+    @patch('src.core.api_key_manager._K8S_SESSION.get')
     @patch('builtins.open', create=True)
     @patch('os.path.exists')
     @patch.dict(os.environ, {'NAMESPACE': 'test-namespace'})
@@ -217,7 +298,7 @@ class TestFetchApiKeyFromSecret:
 
         assert result is None
 
-    @patch('src.core.api_key_manager.requests.get')
+    @patch('src.core.api_key_manager._K8S_SESSION.get')
     @patch('builtins.open', create=True)
     @patch('os.path.exists')
     @patch.dict(os.environ, {'NAMESPACE': 'test-namespace'})
@@ -238,7 +319,7 @@ class TestFetchApiKeyFromSecret:
         assert "ai-google-credentials" in url
         assert "/namespaces/test-namespace/" in url
 
-    @patch('src.core.api_key_manager.requests.get')
+    @patch('src.core.api_key_manager._K8S_SESSION.get')
     @patch('builtins.open', create=True)
     @patch('os.path.exists')
     @patch.dict(os.environ, {'NAMESPACE': 'test-namespace'})
@@ -373,7 +454,7 @@ class TestEdgeCases:
         assert detect_provider_from_model_id("gpt-4-turbo-2024-04-09") == "openai"
         assert detect_provider_from_model_id("claude-3-5-sonnet-20241022") == "anthropic"
 
-    @patch('src.core.api_key_manager.requests.get')
+    @patch('src.core.api_key_manager._K8S_SESSION.get')
     @patch('builtins.open', create=True)
     @patch('os.path.exists')
     @patch.dict(os.environ, {'NAMESPACE': 'test-namespace'})
@@ -389,7 +470,7 @@ class TestEdgeCases:
 
         assert result is None
 
-    @patch('src.core.api_key_manager.requests.get')
+    @patch('src.core.api_key_manager._K8S_SESSION.get')
     @patch('builtins.open', create=True)
     @patch('os.path.exists')
     @patch.dict(os.environ, {'NAMESPACE': 'test-namespace'})
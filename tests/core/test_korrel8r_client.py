@@ -0,0 +1,35 @@
+"""Unit tests for Korrel8r log object simplification."""
+from src.core.korrel8r_client import Korrel8rClient
+
+
+class TestSimplifyLogObjects:
+    """Test simplify_log_objects parsing and de-duplication."""
+
+    def setup_method(self):
+        self.client = Korrel8rClient(base_url="http://korrel8r.test")
+
+    def test_non_list_returns_none(self):
+        assert self.client.simplify_log_objects({"body": "x"}) is None
+
+    def test_no_log_shape_returns_none(self):
+        assert self.client.simplify_log_objects([{"name": "pod"}, 3]) is None
+
+    def test_parses_level_and_strips_ansi(self):
+        result = self.client.simplify_log_objects([
+            {"body": "\x1b[31mERROR: disk full\x1b[0m", "pod": "p", "namespace": "ns", "timestamp": "t"},
+        ])
+        assert result == [
+            {"namespace": "ns", "pod": "p", "level": "ERROR", "message": "disk full", "timestamp": "t"}
+        ]
+
+    def test_duplicates_keep_latest_timestamp_in_first_seen_order(self):
+        result = self.client.simplify_log_objects([
+            {"body": "ERROR boom", "pod": "a", "timestamp": "2024-01-01T00:00:01.5Z"},
+            {"body": "WARN other", "pod": "a", "timestamp": "2024-01-01T00:00:00Z"},
+            {"body": "ERROR boom", "pod": "a", "timestamp": "2024-01-01T00:00:03.123456789Z"},
+            {"body": "ERROR boom", "pod": "a", "timestamp": "2024-01-01T00:00:02Z"},
+        ])
+        assert [(e["message"], e["timestamp"]) for e in result] == [
+            ("boom", "2024-01-01T00:00:03.123456789Z"),
+            ("other", "2024-01-01T00:00:00Z"),
+        ]
@@ -0,0 +1,386 @@
+"""Unit tests for Prometheus response parsing in core.metrics fetchers."""
+import json
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+import requests
+import urllib3
+
+from core.metrics import (
+    MetricQuery,
+    PROMETHEUS_TIMEOUT,
+    _PROMETHEUS_SESSION,
+    _fmt_val,
+    _inject_openshift_namespace,
+    _prometheus_result,
+    execute_dashboard_queries_parallel,
+    execute_instant_queries_batched,
+    fetch_metrics,
+    fetch_openshift_metrics,
+    get_cluster_gpu_info,
+    get_namespace_specific_metrics,
+)
+
+
+def _mock_response(payload):
+    resp = MagicMock()
+    resp.content = json.dumps(payload).encode("utf-8")
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+class TestPrometheusResult:
+    """Test decoding of the data.result list from raw response bytes."""
+
+    def test_returns_result_list(self):
+        payload = {"status": "success", "data": {"result": [{"metric": {}, "value": [1, "2"]}]}}
+        assert _prometheus_result(_mock_response(payload)) == payload["data"]["result"]
+
+    def test_missing_data_returns_empty_list(self):
+        assert _prometheus_result(_mock_response({"status": "success"})) == []
+
+    def test_invalid_json_raises_value_error(self):
+        resp = MagicMock()
+        resp.content = b"not json"
+        with pytest.raises(ValueError):
+            _prometheus_result(resp)
+
+    def test_invalid_json_raises_requests_error(self):
+        resp = MagicMock()
+        resp.content = b"<html><body>Log in</body></html>"
+        with pytest.raises(requests.exceptions.RequestException):
+            _prometheus_result(resp)
+
+
+class TestNonJsonResponse:
+    """A 200 with a non-JSON body (e.g. an OAuth proxy page) is a request error."""
+
+    @staticmethod
+    def _html_response():
+        resp = MagicMock()
+        resp.headers = {"Content-Type": "text/html"}
+        resp.content = b"<!DOCTYPE html><html><body>Sign in</body></html>"
+        resp.raise_for_status.return_value = None
+        return resp
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_fetch_metrics_returns_empty_dataframe(self, mock_get):
+        mock_get.return_value = self._html_response()
+
+        df = fetch_metrics("vllm:num_requests_running", "model", 1700000000, 1700000060)
+
+        assert df.empty
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_fetch_openshift_metrics_raises_request_exception(self, mock_get):
+        mock_get.return_value = self._html_response()
+
+        with pytest.raises(requests.exceptions.RequestException):
+            fetch_openshift_metrics("up", 1700000000, 1700000060)
+
+
+    @patch("core.metrics._STREAM_RANGE_RESULTS", True)
+    @patch("core.metrics.ijson")
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_truncated_stream_returns_empty_dataframe(self, mock_get, mock_ijson):
+        class FakeJSONError(Exception):
+            pass
+
+        mock_ijson.JSONError = FakeJSONError
+        mock_ijson.items.side_effect = FakeJSONError("Incomplete JSON content")
+        mock_get.return_value = self._html_response()
+
+        assert fetch_metrics("vllm:num_requests_running", "model", 1700000000, 1700000060).empty
+
+    @patch("core.metrics._STREAM_RANGE_RESULTS", True)
+    @patch("core.metrics.ijson")
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_dropped_stream_raises_request_exception(self, mock_get, mock_ijson):
+        mock_ijson.JSONError = type("FakeJSONError", (Exception,), {})
+        mock_ijson.items.side_effect = urllib3.exceptions.ProtocolError("Connection broken")
+        mock_get.return_value = self._html_response()
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            fetch_openshift_metrics("up", 1700000000, 1700000060)
+
+
+class TestPrometheusSession:
+    """Test the shared pooled session used for Prometheus calls."""
+
+    def test_adapter_retries_gateway_errors(self):
+        adapter = _PROMETHEUS_SESSION.get_adapter("https://thanos.example")
+        retry = adapter.max_retries
+        assert retry.total == 2
+        assert set(retry.status_forcelist) == {502, 503, 504}
+        assert retry.raise_on_status is False
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_uses_connect_read_timeout(self, mock_get):
+        mock_get.return_value = _mock_response({"data": {"result": []}})
+
+        fetch_openshift_metrics("up", 1700000000, 1700000060)
+
+        assert mock_get.call_args.kwargs["timeout"] == PROMETHEUS_TIMEOUT
+
+
+class TestFetchOpenshiftMetrics:
+    """Test DataFrame construction from query_range responses."""
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_builds_rows_with_labels(self, mock_get):
+        mock_get.return_value = _mock_response({
+            "data": {
+                "result": [
+                    {"metric": {"pod": "a"}, "values": [[1700000000, "1.5"], [1700000060, "2"]]},
+                    {"metric": {"pod": "b"}, "values": [[1700000000, "3"]]},
+                ]
+            }
+        })
+
+        df = fetch_openshift_metrics("up", 1700000000, 1700000060)
+
+        assert list(df["pod"]) == ["a", "a", "b"]
+        assert list(df["value"]) == [1.5, 2.0, 3.0]
+        assert isinstance(df["timestamp"].iloc[0], pd.Timestamp)
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_empty_result_returns_empty_dataframe(self, mock_get):
+        mock_get.return_value = _mock_response({"data": {"result": []}})
+
+        df = fetch_openshift_metrics("up", 1700000000, 1700000060)
+
+        assert df.empty
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_nan_and_inf_values_become_zero(self, mock_get):
+        mock_get.return_value = _mock_response({
+            "data": {
+                "result": [
+                    {
+                        "metric": {"pod": "a"},
+                        "values": [[1700000000, "NaN"], [1700000060, "+Inf"], [1700000120, "-Inf"], [1700000180, "4"]],
+                    },
+                ]
+            }
+        })
+
+        df = fetch_openshift_metrics("up", 1700000000, 1700000180)
+
+        assert list(df["value"]) == [0.0, 0.0, 0.0, 4.0]
+        assert df["value"].dtype == float
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_series_with_different_labels_are_aligned(self, mock_get):
+        mock_get.return_value = _mock_response({
+            "data": {
+                "result": [
+                    {"metric": {"pod": "a"}, "values": [[1700000000, "1"]]},
+                    {"metric": {"pod": "b", "container": "c"}, "values": [[1700000000, "2"]]},
+                    {"metric": {"pod": "c"}, "values": []},
+                ]
+            }
+        })
+
+        df = fetch_openshift_metrics("up", 1700000000, 1700000060)
+
+        assert len(df) == 2
+        assert pd.isna(df["container"].iloc[0])
+        assert df["container"].iloc[1] == "c"
+
+
+def _stats_response(count, lo, avg, hi):
+    return _mock_response({
+        "data": {
+            "result": [
+                {"metric": {"stat": "count"}, "value": [1700000000, str(count)]},
+                {"metric": {"stat": "min"}, "value": [1700000000, str(lo)]},
+                {"metric": {"stat": "avg"}, "value": [1700000000, str(avg)]},
+                {"metric": {"stat": "max"}, "value": [1700000000, str(hi)]},
+            ]
+        }
+    })
+
+
+class TestGetClusterGpuInfo:
+    """Test server-side aggregation of accelerator temperatures."""
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_queries_aggregates_not_raw_series(self, mock_get):
+        mock_get.return_value = _mock_response({"data": {"result": []}})
+
+        get_cluster_gpu_info()
+
+        query = mock_get.call_args_list[0].kwargs["params"]["query"]
+        assert "count(DCGM_FI_DEV_GPU_TEMP)" in query
+        assert "max(DCGM_FI_DEV_GPU_TEMP)" in query
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_merges_vendor_stats(self, mock_get):
+        mock_get.side_effect = [_stats_response(2, 40, 45, 50), _stats_response(1, 60, 60, 60)]
+
+        info = get_cluster_gpu_info()
+
+        assert info["total_gpus"] == 3
+        assert info["temperatures"] == {"count": 3, "min": 40.0, "avg": 50.0, "max": 60.0}
+        assert info["mixed"] is True
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_no_accelerators(self, mock_get):
+        mock_get.return_value = _mock_response({"data": {"result": []}})
+
+        info = get_cluster_gpu_info()
+
+        assert info["total_gpus"] == 0
+        assert info["temperatures"] == {}
+        assert info["vendors"] == []
+
+
+class TestMetricQuery:
+    """Test structured PromQL rendering for namespace-scoped registries."""
+
+    @pytest.mark.parametrize(
+        "mq,expected",
+        [
+            (MetricQuery("container_threads"), 'sum(container_threads{namespace="ns"})'),
+            (
+                MetricQuery("container_cpu_usage_seconds_total", func="rate", range_="5m"),
+                'sum(rate(container_cpu_usage_seconds_total{namespace="ns"}[5m]))',
+            ),
+            (
+                MetricQuery("kube_pod_status_phase", labels=("phase='Running'",)),
+                "sum(kube_pod_status_phase{namespace=\"ns\",phase='Running'})",
+            ),
+            (MetricQuery("up", agg=None), 'up{namespace="ns"}'),
+        ],
+    )
+    def test_render_with_namespace(self, mq, expected):
+        assert mq.render("ns") == expected
+
+    def test_render_without_namespace(self):
+        mq = MetricQuery("kube_pod_status_phase", labels=("phase='Failed'",))
+        assert mq.render() == "sum(kube_pod_status_phase{phase='Failed'})"
+
+    def test_matches_legacy_regex_injection(self):
+        for category in ("Fleet Overview", "Workloads & Pods", "Storage & Networking"):
+            for query in get_namespace_specific_metrics(category).values():
+                if isinstance(query, MetricQuery):
+                    assert query.render("ns") == _inject_openshift_namespace(query.render(), "ns")
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_fetch_accepts_metric_query(self, mock_get):
+        mock_get.return_value = _mock_response({"data": {"result": []}})
+
+        fetch_openshift_metrics(MetricQuery("container_threads"), 1700000000, 1700000060, "ns")
+
+        assert mock_get.call_args.kwargs["params"]["query"] == 'sum(container_threads{namespace="ns"})'
+
+
+class TestExecuteDashboardQueriesParallel:
+    """Test the combined instant + range fetch used by the OpenShift dashboard."""
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_returns_values_and_sparklines(self, mock_get):
+        def respond(url, **kwargs):
+            if url.endswith("/query_range"):
+                return _mock_response({"data": {"result": [{"values": [[1700000000, "1.5"], [1700000060, "NaN"]]}]}})
+            return _mock_response({"data": {"result": [{"value": [1700000060, "3.14159"]}]}})
+
+        mock_get.side_effect = respond
+
+        values, series = execute_dashboard_queries_parallel(
+            {"Pods Running": "sum(kube_pod_status_phase)"}, 1700000000, 1700000060, max_points=15
+        )
+
+        assert values == {"Pods Running": 3.14}
+        assert [point["value"] for point in series["Pods Running"]] == [1.5]
+        assert mock_get.call_count == 2
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    def test_gauge_range_query_uses_max_over_time(self, mock_get):
+        mock_get.return_value = _mock_response({"data": {"result": []}})
+
+        values, series = execute_dashboard_queries_parallel(
+            {"GPU Usage (%)": "avg(DCGM_FI_DEV_GPU_UTIL)"}, 1700000000, 1700003600, max_points=15
+        )
+
+        range_queries = [
+            c.kwargs["params"]["query"] for c in mock_get.call_args_list if c.args[0].endswith("/query_range")
+        ]
+        assert range_queries == ["avg(max_over_time(DCGM_FI_DEV_GPU_UTIL[4m]))"]
+        assert values == {"GPU Usage (%)": 0.0}
+        assert series == {"GPU Usage (%)": []}
+
+
+class TestExecuteInstantQueriesBatched:
+    """Test the single-request instant query path and its demultiplexing."""
+
+    QUERIES = {"Pods Running": "sum(kube_pod_status_phase)", "Nodes": "count(kube_node_info)"}
+
+    @patch("core.metrics._PROMETHEUS_SESSION.post")
+    def test_demultiplexes_by_tag_label(self, mock_post):
+        mock_post.return_value = _mock_response({"data": {"result": [
+            {"metric": {"mcp_query": "1"}, "value": [1700000000, "3"]},
+            {"metric": {"mcp_query": "0"}, "value": [1700000000, "12.345"]},
+            {"metric": {"mcp_query": "0"}, "value": [1700000000, "99"]},
+        ]}})
+
+        assert execute_instant_queries_batched(self.QUERIES) == {"Pods Running": 12.35, "Nodes": 3.0}
+
+        query = mock_post.call_args.kwargs["data"]["query"]
+        assert query == (
+            'label_replace((sum(kube_pod_status_phase)), "mcp_query", "0", "", "") or '
+            'label_replace((count(kube_node_info)), "mcp_query", "1", "", "")'
+        )
+
+    @patch("core.metrics._PROMETHEUS_SESSION.post")
+    def test_missing_series_default_to_zero(self, mock_post):
+        mock_post.return_value = _mock_response({"data": {"result": []}})
+
+        assert execute_instant_queries_batched(self.QUERIES) == {"Pods Running": 0.0, "Nodes": 0.0}
+
+    @patch("core.metrics._PROMETHEUS_SESSION.post")
+    def test_rejected_batch_returns_none(self, mock_post):
+        mock_post.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError("400 Bad Request")
+
+        assert execute_instant_queries_batched(self.QUERIES) is None
+
+    @patch("core.metrics._PROMETHEUS_SESSION.post")
+    def test_single_or_oversized_queries_are_not_batched(self, mock_post):
+        assert execute_instant_queries_batched({"Nodes": "count(kube_node_info)"}) is None
+        assert execute_instant_queries_batched({"a": "x" * 10000, "b": "y" * 10000}) is None
+        mock_post.assert_not_called()
+
+    @patch("core.metrics._PROMETHEUS_SESSION.get")
+    @patch("core.metrics._PROMETHEUS_SESSION.post")
+    def test_dashboard_falls_back_to_per_query(self, mock_post, mock_get):
+        mock_post.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError("400 Bad Request")
+        mock_get.return_value = _mock_response({"data": {"result": [{"value": [1700000000, "5"], "values": []}]}})
+
+        values, series = execute_dashboard_queries_parallel(self.QUERIES, 1700000000, 1700000060)
+
+        assert values == {"Pods Running": 5.0, "Nodes": 5.0}
+        assert series == {"Pods Running": [], "Nodes": []}
+        assert mock_get.call_count == 4
+
+
+class TestFmtVal:
+    """Test span tag value formatting used in trace context lines."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (None, "null"),
+            (True, "true"),
+            (False, "false"),
+            (42, "42"),
+            (1.5, "1.5"),
+            ("plain", "plain"),
+            ("has space", '"has space"'),
+            ("tab\there", '"tab\there"'),
+            ('say "hi"', '"say \\"hi\\""'),
+            ('no"space', 'no\\"space'),
+        ],
+    )
+    def test_formats_values(self, value, expected):
+        assert _fmt_val(value) == expected
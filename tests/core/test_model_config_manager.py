@@ -0,0 +1,310 @@
+"""Unit tests for the runtime model configuration cache and ConfigMap watch."""
+import asyncio
+import json
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+import core.model_config_manager as mcm
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    """Isolate module-level cache state between tests."""
+    mcm._snapshot = (None, None)
+    mcm._discovered_models = {}
+    mcm._base_config = None
+    mcm._watch_healthy.clear()
+    mcm._token_cache.update(headers=None, mtime=0.0)
+    yield
+    mcm._snapshot = (None, None)
+    mcm._discovered_models = {}
+    mcm._base_config = None
+    mcm._watch_healthy.clear()
+    mcm._token_cache.update(headers=None, mtime=0.0)
+
+
+def _event(event_type, config):
+    return {
+        "type": event_type,
+        "object": {"data": {"model-config.json": json.dumps(config)}},
+    }
+
+
+class TestApplyWatchEvent:
+    """Test handling of ConfigMap watch events."""
+
+    def test_modified_publishes_config_with_discovered_models(self):
+        mcm._discovered_models = {"internal/model": {"external": False}}
+
+        assert mcm._apply_watch_event(_event("MODIFIED", {"openai/gpt-4o": {"external": True}}))
+
+        config, loaded_at = mcm._snapshot
+        assert set(config) == {"openai/gpt-4o", "internal/model"}
+        assert loaded_at is not None
+
+    def test_deleted_keeps_current_config(self):
+        mcm._publish_model_config({"openai/gpt-4o": {}})
+
+        assert mcm._apply_watch_event(_event("DELETED", {}))
+
+        assert mcm._snapshot[0] == {"openai/gpt-4o": {}}
+
+    def test_error_event_requests_relist(self):
+        assert mcm._apply_watch_event({"type": "ERROR", "object": {"code": 410, "reason": "Gone"}}) is False
+
+
+class TestStreamConfigmapEvents:
+    """Test the async watch stream over the shared event loop."""
+
+    def _stream(self, handler):
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                await mcm._stream_configmap_events(client, "42")
+
+        with patch.object(mcm, "_CONFIGMAPS_URL", "https://k8s/cms"):
+            asyncio.run(run())
+
+    def test_applies_each_event_line(self):
+        seen = {}
+
+        def handler(request):
+            seen.update(request.url.params)
+            body = "\n".join(json.dumps(_event("MODIFIED", {f"m{i}": {}})) for i in range(2))
+            return httpx.Response(200, content=body.encode())
+
+        self._stream(handler)
+
+        assert seen["watch"] == "true"
+        assert seen["resourceVersion"] == "42"
+        assert mcm._snapshot[0] == {"m1": {}}
+
+    def test_gone_returns_without_error(self):
+        self._stream(lambda request: httpx.Response(410))
+
+        assert mcm._snapshot[0] is None
+
+
+class TestRelistModelConfig:
+    """Test the list step that seeds the ConfigMap watch."""
+
+    @patch("core.model_config_manager.discover_inference_services", return_value={})
+    @patch("core.model_config_manager._load_base_model_config")
+    @patch("core.model_config_manager._k8s_request")
+    def test_uses_configmap_from_list_response(self, mock_request, mock_load_base, _mock_discover):
+        listing = {
+            "metadata": {"resourceVersion": "42"},
+            "items": [{"data": {"model-config.json": json.dumps({"openai/gpt-4o": {}})}}],
+        }
+        mock_request.return_value = MagicMock(status_code=200, content=json.dumps(listing).encode())
+
+        assert mcm._relist_model_config() == "42"
+
+        assert mcm._snapshot[0] == {"openai/gpt-4o": {}}
+        mock_load_base.assert_not_called()
+
+    @patch("core.model_config_manager.discover_inference_services", return_value={})
+    @patch("core.model_config_manager._load_base_model_config", return_value={"default": {}})
+    @patch("core.model_config_manager._k8s_request")
+    def test_missing_configmap_falls_back_to_defaults(self, mock_request, mock_load_base, _mock_discover):
+        listing = {"metadata": {"resourceVersion": "7"}, "items": []}
+        mock_request.return_value = MagicMock(status_code=200, content=json.dumps(listing).encode())
+
+        assert mcm._relist_model_config() == "7"
+
+        assert mcm._snapshot[0] == {"default": {}}
+        mock_load_base.assert_called_once()
+
+    def test_configmap_without_payload_parses_empty(self):
+        assert mcm._parse_model_config({"data": {}}) == {}
+
+
+class TestWatchModelConfig:
+    """Test the watch loop's handling of RBAC denials and discovery refresh."""
+
+    @patch("core.model_config_manager.asyncio.sleep")
+    @patch("core.model_config_manager._relist_model_config")
+    def test_forbidden_list_stops_watch_without_retrying(self, mock_relist, mock_sleep):
+        response = MagicMock(status_code=403)
+        mock_relist.side_effect = mcm.requests.exceptions.HTTPError("403 Forbidden", response=response)
+
+        asyncio.run(asyncio.wait_for(mcm._watch_model_config(), timeout=5))
+
+        mock_relist.assert_called_once()
+        mock_sleep.assert_not_called()
+        assert not mcm._watch_healthy.is_set()
+
+    @patch("core.model_config_manager.discover_inference_services", return_value={"internal/new": {"external": False}})
+    def test_rediscovery_republishes_over_watched_config(self, _mock_discover):
+        mcm._apply_watch_event(_event("MODIFIED", {"openai/gpt-4o": {"external": True}}))
+
+        asyncio.run(mcm._rediscover_models())
+
+        assert set(mcm._snapshot[0]) == {"openai/gpt-4o", "internal/new"}
+
+    @patch("core.model_config_manager.discover_inference_services")
+    def test_rediscovery_keeps_event_applied_during_discovery(self, mock_discover):
+        mcm._apply_watch_event(_event("MODIFIED", {"openai/gpt-4o": {"external": True}}))
+
+        def discover():
+            # A watch event lands while discovery is still running
+            mcm._apply_watch_event(_event("MODIFIED", {"anthropic/claude": {"external": True}}))
+            return {"internal/new": {"external": False}}
+
+        mock_discover.side_effect = discover
+
+        asyncio.run(mcm._rediscover_models())
+
+        assert set(mcm._snapshot[0]) == {"anthropic/claude", "internal/new"}
+        assert mcm._discovered_models == {"internal/new": {"external": False}}
+
+    @patch("core.model_config_manager.discover_inference_services")
+    def test_rediscovery_leaves_snapshot_published_during_discovery(self, mock_discover):
+        mcm._apply_watch_event(_event("MODIFIED", {"openai/gpt-4o": {"external": True}}))
+        reloaded = {"openai/gpt-4o": {"external": True}, "openai/new": {"external": True}}
+
+        def discover():
+            # e.g. reload_model_config() after add_model_to_config's PATCH
+            mcm._publish_model_config(reloaded)
+            return {}
+
+        mock_discover.side_effect = discover
+
+        asyncio.run(mcm._rediscover_models())
+
+        assert mcm._snapshot[0] is reloaded
+
+    @patch("core.model_config_manager.discover_inference_services")
+    def test_rediscovery_before_first_list_is_noop(self, mock_discover):
+        asyncio.run(mcm._rediscover_models())
+
+        mock_discover.assert_not_called()
+        assert mcm._snapshot[0] is None
+
+
+class TestCreateConfigmapFromDefaults:
+    """Test the ConfigMap payload built from MODEL_CONFIG defaults."""
+
+    @patch("core.model_config_manager._k8s_request")
+    def test_payload_fills_skeleton_without_mutating_it(self, mock_request):
+        mock_request.return_value = MagicMock(status_code=201)
+
+        with patch.object(mcm, "_NAMESPACE", "obs"), patch.object(mcm, "_CONFIGMAPS_URL", "https://k8s/cms"):
+            assert mcm.create_configmap_from_defaults({"openai/gpt-4o": {"external": True}})
+
+        payload = json.loads(mock_request.call_args.kwargs["data"])
+        assert payload["metadata"]["name"] == mcm.CONFIGMAP_NAME
+        assert payload["metadata"]["namespace"] == "obs"
+        assert payload["metadata"]["annotations"]["config.kubernetes.io/created-at"].endswith("Z")
+        assert json.loads(payload["data"]["model-config.json"]) == {"openai/gpt-4o": {"external": True}}
+        assert mcm._CONFIGMAP_SKELETON["data"] == {}
+        assert "namespace" not in mcm._CONFIGMAP_SKELETON["metadata"]
+
+
+class TestGetModelConfig:
+    """Test cache behaviour with and without a healthy watch."""
+
+    @patch("core.model_config_manager._ensure_config_watch")
+    @patch("core.model_config_manager.load_runtime_model_config")
+    def test_watch_healthy_skips_reload(self, mock_load, _mock_watch):
+        mcm._snapshot = ({"a": {}}, None)
+        mcm._watch_healthy.set()
+
+        assert mcm.get_model_config() == {"a": {}}
+        mock_load.assert_not_called()
+
+    @patch("core.model_config_manager._ensure_config_watch")
+    @patch("core.model_config_manager.load_runtime_model_config", return_value={"b": {}})
+    def test_without_watch_loads_on_first_read(self, mock_load, _mock_watch):
+        assert mcm.get_model_config() == {"b": {}}
+        assert mcm.get_model_config() == {"b": {}}
+        mock_load.assert_called_once()
+
+    @patch("core.model_config_manager._ensure_config_watch")
+    @patch("core.model_config_manager.load_runtime_model_config", return_value={"b": {}})
+    def test_stale_snapshot_is_refreshed(self, mock_load, _mock_watch):
+        mcm._snapshot = ({"a": {}}, time.monotonic() - mcm._config_cache_ttl_seconds - 1)
+
+        assert mcm.get_model_config() == {"b": {}}
+        mock_load.assert_called_once()
+
+    @patch("core.model_config_manager._ensure_config_watch")
+    @patch("core.model_config_manager.load_runtime_model_config", return_value={"c": {}})
+    def test_force_refresh_bypasses_watch(self, mock_load, _mock_watch):
+        mcm._snapshot = ({"a": {}}, None)
+        mcm._watch_healthy.set()
+
+        assert mcm.get_model_config(force_refresh=True) == {"c": {}}
+        mock_load.assert_called_once()
+
+    @patch("core.model_config_manager._ensure_config_watch")
+    def test_concurrent_stale_reads_share_one_load(self, _mock_watch):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_load():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"d": {}}
+
+        results = []
+        with patch("core.model_config_manager.load_runtime_model_config", side_effect=slow_load):
+            leader = threading.Thread(target=lambda: results.append(mcm.get_model_config()))
+            leader.start()
+            started.wait(5)
+            followers = [
+                threading.Thread(target=lambda: results.append(mcm.get_model_config()))
+                for _ in range(3)
+            ]
+            for t in followers:
+                t.start()
+            release.set()
+            for t in [leader, *followers]:
+                t.join(5)
+
+        assert len(calls) == 1
+        assert results == [{"d": {}}] * 4
+
+
+class TestK8sHeaders:
+    """Test service account token caching."""
+
+    def test_token_read_once_until_file_changes(self, tmp_path):
+        token_file = tmp_path / "token"
+        token_file.write_text("first\n")
+
+        with patch.object(mcm, "K8S_SA_TOKEN_PATH", str(token_file)):
+            assert mcm._get_k8s_headers()["Authorization"] == "Bearer first"
+            token_file.write_text("second")
+            os.utime(token_file, (0, mcm._token_cache["mtime"]))
+            assert mcm._get_k8s_headers()["Authorization"] == "Bearer first"
+            os.utime(token_file, (0, mcm._token_cache["mtime"] + 10))
+            assert mcm._get_k8s_headers()["Authorization"] == "Bearer second"
+
+    def test_missing_token_returns_content_type_only(self, tmp_path):
+        with patch.object(mcm, "K8S_SA_TOKEN_PATH", str(tmp_path / "missing")):
+            assert mcm._get_k8s_headers() == {"Content-Type": "application/json"}
+
+    @patch("core.model_config_manager._k8s_session")
+    def test_401_invalidates_token_and_retries_once(self, mock_session, tmp_path):
+        token_file = tmp_path / "token"
+        token_file.write_text("stale")
+        unauthorized = MagicMock(status_code=401)
+        mock_session.request.side_effect = [unauthorized, MagicMock(status_code=200)]
+
+        with patch.object(mcm, "K8S_SA_TOKEN_PATH", str(token_file)):
+            mcm._get_k8s_headers()
+            token_file.write_text("fresh")
+            os.utime(token_file, (0, mcm._token_cache["mtime"]))
+            r = mcm._k8s_request("GET", "https://k8s/api", timeout=5)
+
+        assert r.status_code == 200
+        unauthorized.close.assert_called_once()
+        retry_headers = mock_session.request.call_args_list[1].kwargs["headers"]
+        assert retry_headers["Authorization"] == "Bearer fresh"
@@ -83,6 +83,16 @@ GEMINI_FLASH_EXP_WITH_PROVIDER = f"{GOOGLE_PROVIDER}/{GEMINI_FLASH_EXP}"
 
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Keep cached answers from leaking between tests."""
+    from chatbots import base
+
+    base._RESPONSE_CACHE.clear()
+    yield
+    base._RESPONSE_CACHE.clear()
+
+
 def test_chatbot_imports(mock_mcp_tools):
     """Test that all chatbot classes can be imported."""
     from chatbots import (
@@ -165,7 +175,7 @@ def test_factory_maas_with_api_url(mock_mcp_tools):
     """Test that factory passes api_url to OpenAIChatBot for MAAS models."""
     from chatbots import create_chatbot, OpenAIChatBot
 
-    with patch('openai.OpenAI') as mock_openai_class:
+    with patch('openai.AsyncOpenAI') as mock_openai_class:
         bot = create_chatbot(
             "maas/qwen3-14b",
             api_key="test-maas-key",
@@ -203,7 +213,7 @@ def test_openai_bot_with_custom_base_url(mock_mcp_tools):
     from chatbots import OpenAIChatBot
 
     # Test with /v1/chat/completions suffix - should strip /chat/completions, leaving /v1
-    with patch('openai.OpenAI') as mock_openai_class:
+    with patch('openai.AsyncOpenAI') as mock_openai_class:
         bot = OpenAIChatBot(
             "maas/qwen3-14b",
             api_key="test-key",
@@ -217,7 +227,7 @@ def test_openai_bot_with_custom_base_url(mock_mcp_tools):
         )
 
     # Test with just /chat/completions suffix - should strip it completely
-    with patch('openai.OpenAI') as mock_openai_class:
+    with patch('openai.AsyncOpenAI') as mock_openai_class:
         bot = OpenAIChatBot(
             "maas/qwen3-14b",
             api_key="test-key",
@@ -231,7 +241,7 @@ def test_openai_bot_with_custom_base_url(mock_mcp_tools):
         )
 
     # Test with URL that has no known suffix - should use as-is
-    with patch('openai.OpenAI') as mock_openai_class:
+    with patch('openai.AsyncOpenAI') as mock_openai_class:
         bot = OpenAIChatBot(
             "maas/qwen3-14b",
             api_key="test-key",
@@ -249,7 +259,7 @@ def test_openai_bot_api_url_priority(mock_mcp_tools):
     """Test that passed api_url takes priority over model config."""
     from chatbots import OpenAIChatBot
 
-    with patch('openai.OpenAI') as mock_openai_class:
+    with patch('openai.AsyncOpenAI') as mock_openai_class:
         with patch('core.model_config_manager.get_model_config') as mock_get_config:
             # Mock model config with different URL
             mock_get_config.return_value = {
@@ -273,6 +283,162 @@ def test_openai_bot_api_url_priority(mock_mcp_tools):
             )
 
 
+def test_openai_bot_base_url_misses_are_bounded(mock_mcp_tools):
+    """Test that unknown model names are cached per config snapshot, up to a limit."""
+    from chatbots import OpenAIChatBot
+    import chatbots.openai_bot as openai_bot
+
+    config = {"maas/qwen3-14b": {"apiUrl": "https://maas.example.com/v1/chat/completions"}}
+    with patch('openai.AsyncOpenAI'), patch('core.model_config_manager.get_model_config', return_value=config):
+        for i in range(openai_bot._MAX_CACHED_MISSES + 10):
+            OpenAIChatBot(f"unknown/model-{i}", api_key="test-key", tool_executor=mock_mcp_tools)
+        bot = OpenAIChatBot("maas/qwen3-14b", api_key="test-key", tool_executor=mock_mcp_tools)
+
+        assert bot._get_base_url_from_config() == "https://maas.example.com/v1"
+        cached_config, base_urls = openai_bot._base_url_cache
+        assert cached_config is config
+        assert len(base_urls) <= len(config) + openai_bot._MAX_CACHED_MISSES
+
+
+def test_openai_bot_achat_awaits_client_and_async_progress(mock_mcp_tools):
+    """Test that OpenAIChatBot.achat awaits the async client and async callbacks."""
+    import asyncio
+    from unittest.mock import AsyncMock
+    from chatbots import OpenAIChatBot
+
+    with patch('openai.AsyncOpenAI'):
+        bot = OpenAIChatBot(GPT_4O_MINI, api_key="test-key", tool_executor=mock_mcp_tools)
+
+    tool_call = MagicMock(id="call_1")
+    tool_call.function.name = "execute_promql"
+    tool_call.function.arguments = json.dumps({"query": "up"})
+    tool_turn = MagicMock(choices=[MagicMock(finish_reason="tool_calls", message=MagicMock(content=None, tool_calls=[tool_call]))])
+    final_turn = MagicMock(choices=[MagicMock(finish_reason="stop", message=MagicMock(content="All good", tool_calls=None))])
+    bot.client.chat.completions.create = AsyncMock(side_effect=[tool_turn, final_turn])
+
+    progress = []
+
+    async def on_progress(message):
+        progress.append(message)
+
+    assert asyncio.run(bot.achat("is it up?", progress_callback=on_progress)) == "All good"
+    assert bot.client.chat.completions.create.await_count == 2
+    assert "🔧 Using tool: execute_promql" in progress
+
+    # The sync entry point drives the same loop
+    bot.client.chat.completions.create = AsyncMock(side_effect=[final_turn])
+    assert bot.chat("is it up?") == "All good"
+
+
+def test_openai_bot_achat_stream_yields_deltas_and_assembles_tool_calls(mock_mcp_tools):
+    """Test that achat_stream streams text and rebuilds fragmented tool calls."""
+    import asyncio
+    from types import SimpleNamespace
+    from chatbots import OpenAIChatBot
+
+    with patch('openai.AsyncOpenAI'):
+        bot = OpenAIChatBot(GPT_4O_MINI, api_key="test-key", tool_executor=mock_mcp_tools)
+
+    def chunk(content=None, tool_calls=None, finish_reason=None):
+        delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+        return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)])
+
+    def fragment(id=None, name=None, arguments=None):
+        return SimpleNamespace(index=0, id=id, function=SimpleNamespace(name=name, arguments=arguments))
+
+    turns = [
+        [
+            chunk("Let me check."),
+            chunk(tool_calls=[fragment("call_1", "execute_promql", '{"que')]),
+            chunk(tool_calls=[fragment(arguments='ry": "up"}')], finish_reason="tool_calls"),
+        ],
+        [chunk("All "), chunk("good", finish_reason="stop")],
+    ]
+
+    async def stream(chunks):
+        for c in chunks:
+            yield c
+
+    requests_seen = []
+
+    async def create(**request):
+        requests_seen.append(request)
+        return stream(turns.pop(0))
+
+    bot.client.chat.completions.create = create
+
+    async def collect():
+        return [part async for part in bot.achat_stream("is it up?")]
+
+    with patch.object(bot, "_get_tool_result", return_value="1") as mock_result:
+        assert asyncio.run(collect()) == ["Let me check.", "\n\n", "All ", "good"]
+
+    mock_result.assert_called_once_with("execute_promql", {"query": "up"}, namespace=None)
+    assert all(request["stream"] for request in requests_seen)
+
+
+def test_sync_sdk_clients_are_shared_between_bots(mock_mcp_tools):
+    """Test that bots reuse one thread-safe SDK client per endpoint and key."""
+    from chatbots import AnthropicChatBot, LlamaChatBot
+
+    assert LlamaChatBot(LLAMA_3_1_8B, tool_executor=mock_mcp_tools).client is \
+        LlamaChatBot(LLAMA_3_2_3B, tool_executor=mock_mcp_tools).client
+
+    with patch('anthropic.Anthropic', side_effect=lambda api_key: Mock(api_key=api_key)) as mock_anthropic:
+        first = AnthropicChatBot(CLAUDE_HAIKU, api_key="shared-key", tool_executor=mock_mcp_tools)
+        second = AnthropicChatBot(CLAUDE_HAIKU, api_key="shared-key", tool_executor=mock_mcp_tools)
+        other = AnthropicChatBot(CLAUDE_HAIKU, api_key="other-key", tool_executor=mock_mcp_tools)
+
+    assert first.client is second.client
+    assert other.client is not first.client
+    assert mock_anthropic.call_count == 2
+
+
+def test_default_achat_runs_sync_chat_in_thread(mock_mcp_tools):
+    """Test that bots without a native async loop still expose achat."""
+    import asyncio
+    import threading
+    from chatbots import AnthropicChatBot
+
+    bot = AnthropicChatBot(CLAUDE_HAIKU, api_key="test-key", tool_executor=mock_mcp_tools)
+    progress = []
+
+    def fake_chat(user_question, namespace=None, progress_callback=None, conversation_history=None):
+        progress_callback(f"thread={threading.current_thread() is threading.main_thread()}")
+        return f"answer to {user_question}"
+
+    async def on_progress(message):
+        progress.append(message)
+
+    with patch.object(bot, "chat", side_effect=fake_chat):
+        assert asyncio.run(bot.achat("q", progress_callback=on_progress)) == "answer to q"
+    assert progress == ["thread=False"]
+
+
+def test_batch_chat_bounds_concurrency_and_keeps_order(mock_mcp_tools):
+    """Test that batch_chat answers every question with at most max_concurrency in flight."""
+    import asyncio
+    from chatbots import AnthropicChatBot
+
+    bot = AnthropicChatBot(CLAUDE_HAIKU, api_key="test-key", tool_executor=mock_mcp_tools)
+    in_flight = []
+    peak = []
+
+    async def fake_achat(user_question, namespace=None, progress_callback=None, conversation_history=None):
+        in_flight.append(user_question)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(user_question)
+        return f"{namespace}: {user_question}"
+
+    questions = [(f"q{i}", f"ns{i}") for i in range(6)]
+    with patch.object(bot, "achat", side_effect=fake_achat):
+        answers = bot.batch_chat(questions, max_concurrency=2)
+
+    assert answers == [f"ns{i}: q{i}" for i in range(6)]
+    assert max(peak) == 2
+
+
 class TestAPIKeyRetrieval:
     """Test API key retrieval for all bot types."""
 
@@ -341,7 +507,7 @@ class TestAPIKeyRetrieval:
         """Test that OpenAIChatBot creates client when API key is provided."""
         from chatbots import OpenAIChatBot
 
-        with patch('openai.OpenAI') as mock_openai_class:
+        with patch('openai.AsyncOpenAI') as mock_openai_class:
             bot = OpenAIChatBot(GPT_4O_MINI, api_key="test-key", tool_executor=mock_mcp_tools)
             assert bot.api_key == "test-key"
             # Verify OpenAI client was instantiated with the API key
@@ -351,7 +517,7 @@ class TestAPIKeyRetrieval:
         """Test that OpenAIChatBot does not create client when no API key is provided."""
         from chatbots import OpenAIChatBot
 
-        with patch('openai.OpenAI') as mock_openai_class:
+        with patch('openai.AsyncOpenAI') as mock_openai_class:
             with patch.dict(os.environ, {}, clear=True):
                 bot = OpenAIChatBot(GPT_4O_MINI, tool_executor=mock_mcp_tools)
                 assert bot.api_key is None
@@ -414,6 +580,27 @@ class TestToolResultTruncation:
             assert result.endswith("\n... [Result truncated due to size]")
             assert result.startswith("x" * 100)  # Verify it starts with the original content
 
+    def test_get_tool_result_truncates_by_tokens_when_tokenizer_available(self, mock_mcp_tools):
+        """Test token-budget truncation for bots that name a tiktoken encoding."""
+        from chatbots import LlamaChatBot
+
+        bot = LlamaChatBot(LLAMA_3_1_8B, tool_executor=mock_mcp_tools)
+        # One "token" per space-separated word; Llama's 8K chars -> 2000 tokens
+        encoding = MagicMock()
+        encoding.encode.side_effect = lambda text, disallowed_special=(): text.split(" ")
+        encoding.decode.side_effect = " ".join
+
+        with patch("chatbots.base.tiktoken", MagicMock()), \
+                patch("chatbots.base._get_token_encoding", return_value=encoding):
+            with patch.object(bot, '_route_tool_call_to_mcp', return_value="ab " * 2500):
+                result = bot._get_tool_result("test_tool", {})
+            with patch.object(bot, '_route_tool_call_to_mcp', return_value="abcdefgh " * 1500):
+                long_words = bot._get_tool_result("test_tool", {})
+
+        assert result == " ".join(["ab"] * 2000) + "\n... [Result truncated due to size]"
+        # 13.5K chars but only 1500 tokens: kept whole
+        assert long_words == "abcdefgh " * 1500
+
     def test_get_tool_result_does_not_truncate_small_results(self, mock_mcp_tools):
         """Test that _get_tool_result doesn't truncate results within max length."""
         from chatbots import LlamaChatBot
@@ -494,6 +681,196 @@ class TestToolAllowlist:
             assert len(tools) == 2
 
 
+class TestToolResultMemoization:
+    """Test reuse of read-only tool results within a chat."""
+
+    def test_identical_read_only_calls_hit_executor_once(self, mock_mcp_tools):
+        from chatbots import AnthropicChatBot
+
+        bot = AnthropicChatBot(CLAUDE_HAIKU, api_key="test", tool_executor=mock_mcp_tools)
+        with patch.object(mock_mcp_tools, "call_tool", return_value="result") as mock_call:
+            assert bot._route_tool_call_to_mcp("execute_promql", {"query": "up", "step": "1m"}) == "result"
+            assert bot._route_tool_call_to_mcp("execute_promql", {"step": "1m", "query": "up"}) == "result"
+            bot._route_tool_call_to_mcp("execute_promql", {"query": "down"})
+
+        assert mock_call.call_count == 2
+
+    def test_side_effecting_tools_and_failures_are_not_cached(self, mock_mcp_tools):
+        from chatbots import AnthropicChatBot
+
+        bot = AnthropicChatBot(CLAUDE_HAIKU, api_key="test", tool_executor=mock_mcp_tools)
+        with patch.object(mock_mcp_tools, "call_tool", side_effect=["ok", "ok", RuntimeError("boom"), "ok"]) as mock_call:
+            bot._route_tool_call_to_mcp("save_api_key", {"provider": "openai"})
+            bot._route_tool_call_to_mcp("save_api_key", {"provider": "openai"})
+            assert bot._route_tool_call_to_mcp("search_metrics", {"pattern": "gpu"}).startswith("Error executing")
+            assert bot._route_tool_call_to_mcp("search_metrics", {"pattern": "gpu"}) == "ok"
+
+        assert mock_call.call_count == 4
+
+
+class TestConcurrentToolCalls:
+    """Test concurrent execution of the tool calls in one model turn."""
+
+    def test_tool_calls_overlap_and_keep_order(self, mock_mcp_tools):
+        import threading
+        from chatbots import AnthropicChatBot
+
+        bot = AnthropicChatBot(CLAUDE_HAIKU, api_key="test", tool_executor=mock_mcp_tools)
+        barrier = threading.Barrier(2, timeout=5)
+        progress = []
+
+        def fake_result(tool_name, tool_args, namespace=None):
+            barrier.wait()  # Deadlocks (and times out) unless both calls run at once
+            return f"{tool_name}:{tool_args['query']}"
+
+        with patch.object(bot, "_get_tool_result", side_effect=fake_result):
+            results = bot._get_tool_results(
+                [("execute_promql", {"query": "a"}), ("execute_promql", {"query": "b"})],
+                progress_callback=progress.append,
+            )
+
+        assert results == ["execute_promql:a", "execute_promql:b"]
+        assert progress == ["🔧 Using tool: execute_promql"] * 2
+
+    def test_identical_calls_in_a_turn_run_once(self, mock_mcp_tools):
+        from chatbots import AnthropicChatBot
+
+        bot = AnthropicChatBot(CLAUDE_HAIKU, api_key="test", tool_executor=mock_mcp_tools)
+        calls = [
+            ("save_api_key", {"provider": "openai"}),
+            ("execute_promql", {"query": "up"}),
+            ("save_api_key", {"provider": "openai"}),
+        ]
+
+        with patch.object(bot, "_get_tool_result", side_effect=lambda name, args, namespace=None: name) as mock_result:
+            results = bot._get_tool_results(calls)
+
+        assert results == ["save_api_key", "execute_promql", "save_api_key"]
+        assert mock_result.call_count == 2
+
+
+class TestFitMessagesToBudget:
+    """Test token-budget trimming of the conversation before each model call."""
+
+    def _conversation(self, tool_turns, result_size):
+        messages = [{"role": "system", "content": "system"}, {"role": "user", "content": "question"}]
+        for i in range(tool_turns):
+            messages.append({
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [{"id": f"c{i}", "type": "function",
+                                "function": {"name": "execute_promql", "arguments": "{}"}}],
+            })
+            messages.append({"role": "tool", "tool_call_id": f"c{i}", "content": "r" * result_size})
+        return messages
+
+    def test_small_conversation_is_returned_unchanged(self, mock_mcp_tools):
+        from chatbots import DeterministicChatBot
+
+        bot = DeterministicChatBot(LLAMA_3_2_3B, tool_executor=mock_mcp_tools)
+        messages = self._conversation(2, 100)
+
+        assert bot._fit_messages_to_budget(messages) is messages
+
+    def test_old_tool_results_are_stubbed_before_groups_are_dropped(self, mock_mcp_tools):
+        from chatbots import DeterministicChatBot
+
+        bot = DeterministicChatBot(LLAMA_3_2_3B, tool_executor=mock_mcp_tools)
+        messages = self._conversation(5, 9000)
+
+        # 10K-token window -> 8K-token budget; five ~2.25K-token results don't fit
+        with patch.object(bot, "_get_context_window_tokens", return_value=10000):
+            fitted = bot._fit_messages_to_budget(messages)
+
+        assert len(fitted) == len(messages)
+        assert fitted[3]["content"] == "[execute_promql returned 9000 chars, dropped to save context]"
+        assert fitted[-1]["content"] == "r" * 9000
+        assert messages[3]["content"] == "r" * 9000  # Input is not modified
+        assert sum(bot._count_message_tokens(m) for m in fitted) <= 8000
+
+    def test_oldest_groups_are_dropped_when_stubs_are_not_enough(self, mock_mcp_tools):
+        from chatbots import DeterministicChatBot
+
+        bot = DeterministicChatBot(LLAMA_3_2_3B, tool_executor=mock_mcp_tools)
+        history = [{"role": "user", "content": "h" * 20000}, {"role": "assistant", "content": "a" * 20000}]
+        tool_turn = self._conversation(1, 9000)
+        messages = tool_turn[:1] + history + tool_turn[1:]
+
+        # Conversation history cannot be stubbed, so the oldest entry goes
+        with patch.object(bot, "_get_context_window_tokens", return_value=10000):
+            fitted = bot._fit_messages_to_budget(messages)
+
+        assert fitted == [messages[0]] + messages[2:]
+
+    def test_token_counts_are_reused_across_iterations(self, mock_mcp_tools):
+        from chatbots import DeterministicChatBot
+
+        bot = DeterministicChatBot(LLAMA_3_2_3B, tool_executor=mock_mcp_tools)
+        messages = self._conversation(3, 100)
+
+        with patch.object(bot, "_count_message_tokens", wraps=bot._count_message_tokens) as spy:
+            bot._fit_messages_to_budget(messages)
+            messages.append({"role": "user", "content": "follow-up"})
+            bot._fit_messages_to_budget(messages)
+
+        # Only the new message is counted on the second call
+        assert spy.call_count == len(messages)
+
+
+class TestResponseCache:
+    """Test short-circuiting of repeated stand-alone questions."""
+
+    def _make_llama_bot(self, mock_mcp_tools, content):
+        from chatbots import LlamaChatBot
+
+        message = MagicMock()
+        message.content = content
+        message.tool_calls = None
+        choice = MagicMock()
+        choice.finish_reason = "stop"
+        choice.message = message
+        response = MagicMock()
+        response.choices = [choice]
+
+        bot = LlamaChatBot(LLAMA_3_1_8B, tool_executor=mock_mcp_tools)
+        bot.client = MagicMock()
+        bot.client.chat.completions.create = MagicMock(return_value=response)
+        return bot
+
+    def test_repeated_question_skips_model(self, mock_mcp_tools):
+        bot = self._make_llama_bot(mock_mcp_tools, "All pods are healthy.")
+
+        first = bot.chat("Show me running pods", namespace="demo")
+        calls = bot.client.chat.completions.create.call_count
+        second = bot.chat("  show me  RUNNING pods ", namespace="demo")
+
+        assert second == first == "All pods are healthy."
+        assert bot.client.chat.completions.create.call_count == calls
+
+        # A different namespace or a follow-up in a conversation is answered afresh
+        bot.chat("Show me running pods", namespace="other")
+        bot.chat("Show me running pods", namespace="demo",
+                 conversation_history=[{"role": "user", "content": "hi"}])
+        assert bot.client.chat.completions.create.call_count == calls * 3
+
+    def test_entries_expire_and_are_bounded(self, mock_mcp_tools):
+        from chatbots import base
+
+        bot = self._make_llama_bot(mock_mcp_tools, "unused")
+        key = bot._response_cache_key("q", None)
+        bot._cache_response(key, "answer")
+        assert bot._get_cached_response(key) == "answer"
+
+        with patch.object(base.time, "monotonic", return_value=base.time.monotonic() + base._RESPONSE_CACHE_TTL_SECONDS + 1):
+            assert bot._get_cached_response(key) is None
+
+        with patch.object(base, "_RESPONSE_CACHE_MAXSIZE", 2):
+            for question in ("a", "b", "c"):
+                bot._cache_response(bot._response_cache_key(question, None), question)
+            assert bot._get_cached_response(bot._response_cache_key("a", None)) is None
+            assert bot._get_cached_response(bot._response_cache_key("c", None)) == "c"
+
+
 class TestModelSpecificInstructions:
     """Test that each bot has model-specific instructions."""
 
@@ -663,6 +1040,35 @@ class TestBaseChatBot:
             assert "description" in tool
             assert "input_schema" in tool
 
+    def test_get_mcp_tools_lists_executor_once(self, mock_mcp_tools):
+        """Test that converted tools are cached per executor across bots."""
+        from chatbots import LlamaChatBot
+
+        with patch.object(mock_mcp_tools, "list_tools", wraps=mock_mcp_tools.list_tools) as spy:
+            first = LlamaChatBot(LLAMA_3_1_8B, tool_executor=mock_mcp_tools)._get_mcp_tools()
+            second = LlamaChatBot(LLAMA_3_1_8B, tool_executor=mock_mcp_tools)._get_mcp_tools()
+
+        assert spy.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_sdk_tool_format_is_converted_once(self, mock_mcp_tools):
+        """Test that SDK-format tools are shared across bots until the definitions change."""
+        from chatbots import OpenAIChatBot
+        import chatbots.base as base
+
+        first_bot = OpenAIChatBot(GPT_4O_MINI, api_key="test", tool_executor=mock_mcp_tools)
+        second_bot = OpenAIChatBot(GPT_4O_MINI, api_key="test", tool_executor=mock_mcp_tools)
+        first = first_bot._convert_tools_to_openai_format()
+        second = second_bot._convert_tools_to_openai_format()
+
+        assert [t["function"]["name"] for t in first] == ["execute_promql", "get_label_values"]
+        assert first[0] is second[0]
+
+        # A refreshed tool list is converted again
+        base._TOOL_DEFS_CACHE.pop(mock_mcp_tools, None)
+        assert second_bot._convert_tools_to_openai_format()[0] is not first[0]
+
     def test_create_system_prompt_includes_model_specific(self, mock_mcp_tools):
         """Test that system prompt includes model-specific instructions."""
         from chatbots import LlamaChatBot
@@ -675,6 +1081,20 @@ class TestBaseChatBot:
         assert "Tool Calling" in prompt
         assert "PromQL Patterns" in prompt
 
+    def test_system_prompt_built_once_per_namespace(self, mock_mcp_tools):
+        """Test that repeated prompts for a namespace are reused, not rebuilt."""
+        from chatbots import LlamaChatBot
+
+        bot = LlamaChatBot(LLAMA_3_1_8B, tool_executor=mock_mcp_tools)
+        with patch.object(bot, "_get_base_prompt", wraps=bot._get_base_prompt) as mock_base:
+            first = bot._create_system_prompt(namespace="demo")
+            assert bot._create_system_prompt(namespace="demo") is first
+            other = bot._create_system_prompt(namespace=None)
+
+        assert mock_base.call_count == 2
+        assert 'namespace **"demo"**' in first
+        assert "Cluster-wide analysis" in other
+
 
 class TestKorrel8rNormalization:
     """Test Korrel8r query normalization functionality in BaseChatBot."""
@@ -984,6 +1404,39 @@ class TestNamespaceInjectionPromQL:
         assert 'pod="web-1"' in result
 
 
+def test_gemini_model_reused_until_prompt_or_tools_change(mock_mcp_tools):
+    """GenerativeModel is built once per system prompt and rebuilt when tools change."""
+    from chatbots import GoogleChatBot
+
+    bot = GoogleChatBot(GEMINI_FLASH, api_key="test", tool_executor=mock_mcp_tools)
+    bot.genai = MagicMock()
+    bot.genai.GenerativeModel.side_effect = lambda **kwargs: MagicMock()
+
+    first = bot._get_generative_model("gemini-2.5-flash", "prompt for ns-a")
+    assert bot._get_generative_model("gemini-2.5-flash", "prompt for ns-a") is first
+    assert bot._get_generative_model("gemini-2.5-flash", "prompt for ns-b") is not first
+    assert bot.genai.GenerativeModel.call_count == 2
+
+    with patch.object(bot, "_get_tool_defs", return_value=()):
+        assert bot._get_generative_model("gemini-2.5-flash", "prompt for ns-a") is not first
+    assert bot.genai.GenerativeModel.call_count == 3
+
+
+def test_gemini_split_parts_separates_calls_and_text():
+    """Function calls and text are collected in one pass over the parts."""
+    from chatbots.google_bot import GoogleChatBot
+
+    call = Mock(function_call=Mock())
+    call.function_call.name = "execute_promql"
+    text_parts = [Mock(function_call=None, text="All "), Mock(function_call=None, text="good")]
+    empty = Mock(function_call=None, text="")
+
+    function_calls, text = GoogleChatBot._split_parts([text_parts[0], call, empty, text_parts[1]])
+
+    assert [fc.name for fc in function_calls] == ["execute_promql"]
+    assert text == "All good"
+
+
 class TestGeminiTextToolCallDetection:
     """Test detection of text-based tool calls in Gemini responses."""
 
@@ -1497,12 +1950,12 @@ class TestToolLoopDetection:
 
         bot = LlamaChatBot(LLAMA_3_1_8B, tool_executor=mock_mcp_tools)
 
-        # Create 6 responses that each call the same single tool
-        def make_tool_response():
+        # Create 6 responses that each call the same single tool (with new arguments)
+        def make_tool_response(i):
             tc = MagicMock()
             tc.id = "call_1"
             tc.function.name = "query_tempo_tool"
-            tc.function.arguments = json.dumps({"query": "traces"})
+            tc.function.arguments = json.dumps({"query": f"traces {i}"})
 
             message = MagicMock()
             message.content = None
@@ -1516,7 +1969,7 @@ class TestToolLoopDetection:
             response.choices = [choice]
             return response
 
-        responses = [make_tool_response() for _ in range(6)]
+        responses = [make_tool_response(i) for i in range(6)]
         bot.client = MagicMock()
         bot.client.chat.completions.create = MagicMock(side_effect=responses)
 
@@ -1526,6 +1979,46 @@ class TestToolLoopDetection:
         assert bot.client.chat.completions.create.call_count == 5
         assert "got stuck in a loop" in result
 
+    def test_identical_calls_get_reminder_then_break(self, mock_mcp_tools):
+        """Test that re-issuing identical tool calls is not re-executed and soon ends the loop."""
+        from chatbots import LlamaChatBot
+
+        bot = LlamaChatBot(LLAMA_3_1_8B, tool_executor=mock_mcp_tools)
+
+        def make_tool_response(query):
+            tc = MagicMock()
+            tc.id = "call_1"
+            tc.function.name = "execute_promql"
+            tc.function.arguments = json.dumps({"query": query})
+
+            message = MagicMock()
+            message.content = None
+            message.tool_calls = [tc]
+
+            choice = MagicMock()
+            choice.finish_reason = "tool_calls"
+            choice.message = message
+
+            response = MagicMock()
+            response.choices = [choice]
+            return response
+
+        responses = [make_tool_response(q) for q in ("up", "down", "up", "down", "up")]
+        bot.client = MagicMock()
+        bot.client.chat.completions.create = MagicMock(side_effect=responses)
+
+        with patch.object(bot, "_get_tool_result", return_value="1") as mock_result:
+            result = bot.chat("is it up?")
+
+        # Iteration 3 repeats "up" and gets a reminder; iteration 4 repeats again and breaks
+        assert bot.client.chat.completions.create.call_count == 4
+        assert mock_result.call_count == 2
+        assert "got stuck in a loop" in result
+        sent = bot.client.chat.completions.create.call_args_list[3].kwargs["messages"]
+        assert any(
+            m.get("role") == "tool" and "already called execute_promql" in m["content"] for m in sent
+        )
+
     def test_threshold_constant(self, mock_mcp_tools):
         """Test that the threshold constant is accessible and correct."""
         from chatbots import LlamaChatBot
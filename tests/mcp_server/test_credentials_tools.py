@@ -0,0 +1,394 @@
+"""
+Tests for Credentials Tools (MCP Tools)
+
+Tests cover:
+- save_api_key (server-side apply, created/updated status, concurrent saves)
+- _k8s_request token refresh on 401
+- validate_api_key (per-provider ok codes, HEAD -> GET fallback, result cache)
+- validate_api_keys (input order, per-entry errors, argument checks)
+"""
+
+import base64
+import json
+import threading
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from src.mcp_server.tools import credentials_tools
+from src.mcp_server.tools.credentials_tools import (
+    _k8s_request,
+    save_api_key,
+    validate_api_key,
+    validate_api_keys,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_credentials_state():
+    """Keep cached tokens, validation results and in-flight applies from leaking between tests"""
+    def reset():
+        credentials_tools._VALIDATION_CACHE.clear()
+        credentials_tools._INFLIGHT_APPLIES.clear()
+        credentials_tools._TOKEN_CACHE.update(value=None, ts=0.0)
+
+    reset()
+    yield
+    reset()
+
+
+def _parse_mcp_response(response):
+    """Decode the JSON payload of a single-part MCP text response"""
+    assert isinstance(response, list) and len(response) == 1
+    return json.loads(response[0]["text"])
+
+
+def _k8s_response(status, data=b"{}"):
+    return Mock(status=status, data=data)
+
+
+def _http_response(status_code):
+    return Mock(status_code=status_code)
+
+
+@patch("src.mcp_server.tools.credentials_tools.invalidate_cached_api_key")
+@patch("src.mcp_server.tools.credentials_tools._invalidate_secret_cache")
+@patch("src.mcp_server.tools.credentials_tools._sa_token", return_value="test-token")
+@patch("src.mcp_server.tools.credentials_tools._NAMESPACE", "test-namespace")
+class TestSaveApiKey:
+    """Test saving provider keys with a single server-side apply"""
+
+    @patch("src.mcp_server.tools.credentials_tools._K8S_POOL.request")
+    def test_apply_201_reports_created(self, mock_request, _mock_token, mock_invalidate, mock_invalidate_key):
+        mock_request.return_value = _k8s_response(201)
+
+        result = _parse_mcp_response(save_api_key("OpenAI", "sk-test", model_id="gpt-4o"))
+
+        assert result == {
+            "secret_name": "ai-openai-credentials",
+            "namespace": "test-namespace",
+            "status": "created",
+        }
+        mock_invalidate.assert_called_once_with("openai")
+        mock_invalidate_key.assert_called_once_with("openai")
+
+    @patch("src.mcp_server.tools.credentials_tools._K8S_POOL.request")
+    def test_apply_200_reports_updated(self, mock_request, *_mocks):
+        mock_request.return_value = _k8s_response(200)
+
+        result = _parse_mcp_response(save_api_key("google", "g-key"))
+
+        assert result["status"] == "updated"
+
+    @patch("src.mcp_server.tools.credentials_tools._K8S_POOL.request")
+    def test_sends_server_side_apply_patch(self, mock_request, *_mocks):
+        mock_request.return_value = _k8s_response(201)
+
+        save_api_key("anthropic", "sk-ant", description="team key")
+
+        method, url = mock_request.call_args.args
+        kwargs = mock_request.call_args.kwargs
+        parts = urlsplit(url)
+        assert method == "PATCH"
+        assert parts.path == "/api/v1/namespaces/test-namespace/secrets/ai-anthropic-credentials"
+        assert parse_qs(parts.query) == {"fieldManager": ["ai-obs-summarizer"], "force": ["true"]}
+        assert kwargs["headers"]["Content-Type"] == "application/apply-patch+yaml"
+        assert kwargs["headers"]["Authorization"] == "Bearer test-token"
+
+        body = json.loads(kwargs["body"])
+        assert body["kind"] == "Secret"
+        assert body["metadata"]["name"] == "ai-anthropic-credentials"
+        assert base64.b64decode(body["data"]["api-key"]).decode() == "sk-ant"
+        assert base64.b64decode(body["data"]["description"]).decode() == "team key"
+        assert "model-id" not in body["data"]
+
+    @patch("src.mcp_server.tools.credentials_tools._K8S_POOL.request")
+    def test_apply_failure_returns_error(self, mock_request, _mock_token, mock_invalidate, _mock_invalidate_key):
+        mock_request.return_value = _k8s_response(403, b"forbidden")
+
+        response = save_api_key("openai", "sk-test")
+
+        assert "Failed to save Secret ai-openai-credentials: 403 forbidden" in response[0]["text"]
+        mock_invalidate.assert_not_called()
+
+    @patch("src.mcp_server.tools.credentials_tools._K8S_POOL.request")
+    def test_concurrent_identical_saves_send_one_patch(self, mock_request, *_mocks):
+        release = threading.Event()
+        lookups = threading.Semaphore(0)
+
+        class CountingLock:
+            """Wraps the in-flight lock to signal each lookup of the in-flight table"""
+
+            def __init__(self):
+                self._lock = threading.Lock()
+
+            def __enter__(self):
+                self._lock.acquire()
+                lookups.release()
+                return self
+
+            def __exit__(self, *exc):
+                self._lock.release()
+
+        def slow_apply(*args, **kwargs):
+            assert release.wait(timeout=5)
+            return _k8s_response(201)
+
+        mock_request.side_effect = slow_apply
+        results = []
+
+        def save():
+            results.append(_parse_mcp_response(save_api_key("openai", "sk-same")))
+
+        with patch.object(credentials_tools, "_INFLIGHT_LOCK", CountingLock()):
+            leader = threading.Thread(target=save)
+            follower = threading.Thread(target=save)
+            leader.start()
+            assert lookups.acquire(timeout=5)
+            follower.start()
+            # The follower has found the leader's in-flight apply before it completes
+            assert lookups.acquire(timeout=5)
+            release.set()
+            leader.join(timeout=5)
+            follower.join(timeout=5)
+
+        assert mock_request.call_count == 1
+        assert [r["status"] for r in results] == ["created", "created"]
+        assert credentials_tools._INFLIGHT_APPLIES == {}
+
+
+class TestK8sRequestTokenRefresh:
+    """Test the single retry with a re-read token after a 401"""
+
+    @patch("src.mcp_server.tools.credentials_tools._sa_token", return_value="fresh-token")
+    @patch("src.mcp_server.tools.credentials_tools._K8S_POOL.request")
+    def test_401_retried_once_with_fresh_token(self, mock_request, mock_token):
+        responses = iter([_k8s_response(401), _k8s_response(200)])
+        auth = []
+
+        def request(method, url, headers, body):
+            # Headers are reused between attempts, so record them as sent
+            auth.append(headers["Authorization"])
+            return next(responses)
+
+        mock_request.side_effect = request
+
+        r = _k8s_request("GET", "https://k8s/secret", "stale-token")
+
+        assert r.status == 200
+        mock_token.assert_called_once_with(refresh=True)
+        assert auth == ["Bearer stale-token", "Bearer fresh-token"]
+
+    @patch("src.mcp_server.tools.credentials_tools._sa_token", return_value="stale-token")
+    @patch("src.mcp_server.tools.credentials_tools._K8S_POOL.request")
+    def test_401_not_retried_when_token_unchanged(self, mock_request, _mock_token):
+        mock_request.return_value = _k8s_response(401)
+
+        r = _k8s_request("GET", "https://k8s/secret", "stale-token")
+
+        assert r.status == 401
+        assert mock_request.call_count == 1
+
+    @patch("src.mcp_server.tools.credentials_tools._sa_token", return_value="fresh-token")
+    @patch("src.mcp_server.tools.credentials_tools._K8S_POOL.request")
+    def test_second_401_is_returned(self, mock_request, _mock_token):
+        mock_request.return_value = _k8s_response(401)
+
+        r = _k8s_request("GET", "https://k8s/secret", "stale-token")
+
+        assert r.status == 401
+        assert mock_request.call_count == 2
+
+
+class TestValidateApiKey:
+    """Test provider probes, their ok codes and the validation result cache"""
+
+    @pytest.mark.parametrize(
+        "provider,status,expected",
+        [
+            ("openai", 200, True),
+            ("openai", 403, True),
+            ("openai", 401, False),
+            ("anthropic", 200, True),
+            ("anthropic", 429, True),
+            ("anthropic", 401, False),
+            ("google", 200, True),
+            ("google", 403, False),
+            ("meta", 200, True),
+            ("meta", 401, False),
+        ],
+    )
+    @patch("src.mcp_server.tools.credentials_tools._SESSION")
+    def test_provider_ok_codes(self, mock_session, provider, status, expected):
+        mock_session.head.return_value = _http_response(status)
+        mock_session.request.return_value = _http_response(status)
+
+        result = _parse_mcp_response(validate_api_key(provider, "key"))
+
+        assert result["success"] is expected
+        assert result["details"]["status"] == status
+
+    @patch("src.mcp_server.tools.credentials_tools._SESSION")
+    def test_key_sent_in_provider_header(self, mock_session):
+        mock_session.request.return_value = _http_response(200)
+
+        validate_api_key("anthropic", "sk-ant")
+
+        method, url = mock_session.request.call_args.args
+        headers = mock_session.request.call_args.kwargs["headers"]
+        assert (method, url) == ("GET", "https://api.anthropic.com/v1/models")
+        assert headers == {"anthropic-version": "2023-06-01", "x-api-key": "sk-ant"}
+
+    @pytest.mark.parametrize(
+        "endpoint,probed",
+        [
+            ("https://gw.example.com/anthropic/v1/messages", "https://gw.example.com/anthropic/v1/models"),
+            ("https://gw.example.com/anthropic/v1/", "https://gw.example.com/anthropic/v1/models"),
+            ("https://gw.example.com/v1/models", "https://gw.example.com/v1/models"),
+        ],
+    )
+    @patch("src.mcp_server.tools.credentials_tools._SESSION")
+    def test_custom_anthropic_endpoint_probes_and_reports_models_url(self, mock_session, endpoint, probed):
+        mock_session.request.return_value = _http_response(200)
+
+        result = _parse_mcp_response(validate_api_key("anthropic", "sk-ant", endpoint=endpoint))
+
+        assert mock_session.request.call_args.args == ("GET", probed)
+        assert result["details"]["endpoint"] == probed
+
+    @patch("src.mcp_server.tools.credentials_tools._SESSION")
+    def test_head_405_falls_back_to_get(self, mock_session):
+        mock_session.head.return_value = _http_response(405)
+        mock_session.get.return_value = _http_response(200)
+
+        result = _parse_mcp_response(validate_api_key("openai", "sk-test"))
+
+        assert result["success"] is True
+        mock_session.get.assert_called_once()
+        assert mock_session.get.call_args.kwargs["headers"]["Authorization"] == "Bearer sk-test"
+
+    @patch("src.mcp_server.tools.credentials_tools._SESSION")
+    def test_definitive_result_is_cached(self, mock_session):
+        mock_session.request.return_value = _http_response(401)
+
+        first = _parse_mcp_response(validate_api_key("google", "g-key"))
+        second = _parse_mcp_response(validate_api_key("google", "g-key"))
+
+        assert first == second
+        assert mock_session.request.call_count == 1
+
+    @patch("src.mcp_server.tools.credentials_tools._SESSION")
+    def test_server_error_is_not_cached(self, mock_session):
+        mock_session.request.side_effect = [_http_response(503), _http_response(200)]
+
+        first = _parse_mcp_response(validate_api_key("google", "g-key"))
+        second = _parse_mcp_response(validate_api_key("google", "g-key"))
+
+        assert first["success"] is False
+        assert second["success"] is True
+        assert mock_session.request.call_count == 2
+
+    def test_unsupported_provider_returns_error(self):
+        response = validate_api_key("unknown", "key")
+
+        assert "Unsupported provider: unknown" in response[0]["text"]
+
+
+class TestValidateApiKeys:
+    """Test batch validation: ordering, per-entry errors and input checks"""
+
+    @staticmethod
+    def _probe_result(provider, status=200):
+        return {"success": status == 200, "details": {"provider": provider, "status": status}}
+
+    @patch("src.mcp_server.tools.credentials_tools._probe_provider")
+    def test_results_follow_input_order(self, mock_probe):
+        finished = threading.Semaphore(0)
+
+        def probe(provider, api_key, endpoint, model_id):
+            if provider == "openai":
+                # The first entry completes last
+                assert finished.acquire(timeout=5)
+                assert finished.acquire(timeout=5)
+            else:
+                finished.release()
+            return self._probe_result(provider, 200 if provider != "google" else 401)
+
+        mock_probe.side_effect = probe
+
+        result = _parse_mcp_response(validate_api_keys([
+            {"provider": "openai", "api_key": "sk-1"},
+            {"provider": "google", "api_key": "g-1"},
+            {"provider": "anthropic", "api_key": "sk-ant"},
+        ]))
+
+        assert [r["details"]["provider"] for r in result["results"]] == ["openai", "google", "anthropic"]
+        assert [r["success"] for r in result["results"]] == [True, False, True]
+
+    @patch("src.mcp_server.tools.credentials_tools._probe_provider")
+    def test_endpoint_and_model_id_passed_through(self, mock_probe):
+        mock_probe.return_value = self._probe_result("maas")
+
+        validate_api_keys([
+            {"provider": "maas", "api_key": "k", "endpoint": "https://maas/v1", "model_id": "qwen3-14b"},
+        ])
+
+        mock_probe.assert_called_once_with("maas", "k", "https://maas/v1", "qwen3-14b")
+
+    @patch("src.mcp_server.tools.credentials_tools._SESSION")
+    def test_bad_entries_get_error_objects(self, mock_session):
+        mock_session.head.return_value = _http_response(200)
+
+        result = _parse_mcp_response(validate_api_keys([
+            {"provider": "OpenAI", "api_key": "sk-1"},
+            {"provider": "unknown", "api_key": "key"},
+            {"provider": "google"},
+        ]))
+
+        ok, unsupported, missing_key = result["results"]
+        assert ok["success"] is True
+        assert unsupported == {
+            "success": False,
+            "error": "Unsupported provider: unknown",
+            "details": {"provider": "unknown"},
+        }
+        assert missing_key == {
+            "success": False,
+            "error": "provider and api_key are required",
+            "details": {"provider": "google"},
+        }
+
+    @patch("src.mcp_server.tools.credentials_tools._probe_provider")
+    def test_unexpected_probe_error_is_reported_per_entry(self, mock_probe):
+        mock_probe.side_effect = [ConnectionError("refused"), self._probe_result("google")]
+
+        result = _parse_mcp_response(validate_api_keys([
+            {"provider": "openai", "api_key": "sk-1"},
+            {"provider": "google", "api_key": "g-1"},
+        ]))
+
+        failed, ok = result["results"]
+        assert failed["success"] is False
+        assert failed["error"] == "Validation failed: refused"
+        assert ok["success"] is True
+
+    @pytest.mark.parametrize(
+        "keys",
+        [
+            {"provider": "openai", "api_key": "sk-1"},
+            "openai",
+            None,
+            [{"provider": "openai", "api_key": "sk-1"}, "google"],
+        ],
+    )
+    @patch("src.mcp_server.tools.credentials_tools._probe_provider")
+    def test_non_list_keys_rejected(self, mock_probe, keys):
+        response = validate_api_keys(keys)
+
+        assert "keys must be a list of objects" in response[0]["text"]
+        assert "INVALID_INPUT" in response[0]["text"]
+        mock_probe.assert_not_called()
+
+    def test_empty_list_returns_no_results(self):
+        assert _parse_mcp_response(validate_api_keys([])) == {"results": []}
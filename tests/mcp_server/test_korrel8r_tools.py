@@ -397,3 +397,66 @@ class TestResolvePodNames:
         result = korrel8r_tools._resolve_pod_names("ns", "my-app*")
 
         assert result == []
+
+
+class TestKorrel8rGetCorrelatedFanOut:
+    """Tests for concurrent per-goal resolution in korrel8r_get_correlated."""
+
+    @patch("src.mcp_server.tools.korrel8r_tools.fetch_goal_query_objects")
+    def test_goals_fetched_individually_and_merged(self, mock_fetch):
+        """Each goal is resolved on its own and results are merged in goal order."""
+        def fake_fetch(goals, query):
+            if goals == ["trace:span"]:
+                return {"logs": [], "traces": [{"span": "s1"}]}
+            return {"logs": [{"goal": goals[0]}], "traces": []}
+
+        mock_fetch.side_effect = fake_fetch
+
+        result = korrel8r_tools.korrel8r_get_correlated(
+            ["log:application", "trace:span", "log:infrastructure"],
+            'alert:alert:{"alertname":"TestAlert"}',
+        )
+
+        assert mock_fetch.call_count == 3
+        called_goals = sorted(call.args[0][0] for call in mock_fetch.call_args_list)
+        assert called_goals == ["log:application", "log:infrastructure", "trace:span"]
+        data = json.loads(_text(result))
+        assert data["logs"] == [{"goal": "log:application"}, {"goal": "log:infrastructure"}]
+        assert data["traces"] == [{"span": "s1"}]
+
+
+class TestKorrel8rGetCorrelatedInputValidation:
+    """Tests for rejecting malformed input before calling Korrel8r."""
+
+    @patch("src.mcp_server.tools.korrel8r_tools.fetch_goal_query_objects")
+    def test_malformed_query_rejected(self, mock_fetch):
+        result = korrel8r_tools.korrel8r_get_correlated(["log:application"], "k8s:Pod namespace=ns")
+
+        mock_fetch.assert_not_called()
+        assert "INVALID_INPUT" in _text(result)
+
+    @patch("src.mcp_server.tools.korrel8r_tools.fetch_goal_query_objects")
+    def test_missing_selector_rejected(self, mock_fetch):
+        result = korrel8r_tools.korrel8r_get_correlated(["log:application"], "k8s:Pod:")
+
+        mock_fetch.assert_not_called()
+        assert "INVALID_INPUT" in _text(result)
+
+    @patch("src.mcp_server.tools.korrel8r_tools.fetch_goal_query_objects")
+    def test_metric_promql_query_accepted(self, mock_fetch):
+        mock_fetch.return_value = {"logs": [{"msg": "m"}], "traces": []}
+
+        for query in ('metric:metric:up{job="x"}', 'metric:metric:rate(http_requests_total{job="x"}[5m])'):
+            result = korrel8r_tools.korrel8r_get_correlated(["log:application"], query)
+
+            assert "INVALID_INPUT" not in _text(result)
+            assert mock_fetch.call_args.args == (["log:application"], query)
+
+    @patch("src.mcp_server.tools.korrel8r_tools.fetch_goal_query_objects")
+    def test_unknown_goal_domain_rejected(self, mock_fetch):
+        result = korrel8r_tools.korrel8r_get_correlated(
+            ["log:application", "logs"], 'k8s:Namespace:{"name":"ns"}'
+        )
+
+        mock_fetch.assert_not_called()
+        assert "INVALID_INPUT" in _text(result)
@@ -24,3 +24,14 @@ def test_observability_mcp_server_class_exists():
     assert hasattr(ObservabilityMCPServer, '_register_mcp_tools')
 
 
+
+
+def test_observability_mcp_server_counts_registered_tools():
+    """Test that tool_count reflects the tools registered at init."""
+    import asyncio
+    from mcp_server.observability_mcp import ObservabilityMCPServer
+
+    server = ObservabilityMCPServer()
+
+    assert server.tool_count > 0
+    assert server.tool_count == len(asyncio.run(server.mcp.list_tools()))
@@ -1,5 +1,6 @@
 """Tests for MCPServerAdapter — verifies FastMCP 3.x list_tools() integration."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 from mcp_server.mcp_tools_adapter import MCPServerAdapter
@@ -85,3 +86,29 @@ class TestListTools:
         result = adapter.list_tools()
 
         assert result == []
+
+
+class TestCallTool:
+    """Verify MCPServerAdapter.call_tool() runs tools on one shared loop."""
+
+    def test_call_tool_reuses_loop_from_sync_and_async_callers(self):
+        loops = []
+
+        async def run(arguments):
+            loops.append(asyncio.get_running_loop())
+            return f"up={arguments['query']}"
+
+        tool = Mock()
+        tool.run = run
+        server = Mock()
+        server.mcp = Mock()
+        server.mcp.get_tool = AsyncMock(return_value=tool)
+        adapter = MCPServerAdapter(server)
+
+        assert adapter.call_tool("execute_promql", {"query": "1"}) == "up=1"
+
+        async def from_async_context():
+            return adapter.call_tool("execute_promql", {"query": "2"})
+
+        assert asyncio.run(from_async_context()) == "up=2"
+        assert len(loops) == 2 and loops[0] is loops[1]
@@ -12,14 +12,27 @@ import pytest
 from unittest.mock import patch, Mock, MagicMock
 import base64
 
+from src.mcp_server.tools import model_config_tools
 from src.mcp_server.tools.model_config_tools import (
     list_provider_models,
+    list_all_provider_models,
     add_model_to_config,
     update_maas_model_api_key,
     _save_maas_model_api_key,
+    _get_api_key_from_secret,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_model_config_caches():
+    """Keep cached secrets and model lists from leaking between tests"""
+    model_config_tools._SECRET_CACHE.clear()
+    model_config_tools._MODEL_LIST_CACHE.clear()
+    yield
+    model_config_tools._SECRET_CACHE.clear()
+    model_config_tools._MODEL_LIST_CACHE.clear()
+
+
 def _parse_mcp_response(response):
     """Helper to parse MCP text response format"""
     if isinstance(response, list):
@@ -60,19 +73,19 @@ class TestListProviderModels:
         assert len(data["models"]) > 0
         assert data["models"][0]["id"] == "qwen3-14b"
 
-    @patch("src.mcp_server.tools.model_config_tools.requests.get")
+    @patch("src.mcp_server.tools.model_config_tools._PROVIDER_SESSION.get")
     def test_list_openai_models_success(self, mock_get):
         """Test successful OpenAI model listing"""
         # Mock OpenAI API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "data": [
                 {"id": "gpt-4o", "created": 1234567890, "owned_by": "openai"},
                 {"id": "gpt-3.5-turbo", "created": 1234567890, "owned_by": "openai"},
                 {"id": "text-embedding-ada-002", "created": 1234567890, "owned_by": "openai"},  # Should be filtered
             ]
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         result = list_provider_models(provider="openai", api_key="test-key")
@@ -82,7 +95,7 @@ class TestListProviderModels:
         assert len(data["models"]) == 2  # Embedding model should be filtered
         assert any(m["id"] == "gpt-4o" for m in data["models"])
 
-    @patch("src.mcp_server.tools.model_config_tools.requests.get")
+    @patch("src.mcp_server.tools.model_config_tools._PROVIDER_SESSION.get")
     def test_list_openai_models_invalid_key(self, mock_get):
         """Test OpenAI with invalid API key"""
         mock_response = Mock()
@@ -103,6 +116,36 @@ class TestListProviderModels:
         assert data["error"] is True
         assert "provider is required" in data["message"]
 
+    @patch("src.mcp_server.tools.model_config_tools._PROVIDER_SESSION.get")
+    def test_list_google_models_key_in_header(self, mock_get):
+        """Test that the Google key is sent as a header, never in the URL"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "models": [
+                {"name": "models/gemini-2.0-flash", "supportedGenerationMethods": ["generateContent"]},
+                {"name": "models/text-embedding-004", "supportedGenerationMethods": ["embedContent"]},
+            ]
+        }).encode()
+        mock_get.return_value = mock_response
+
+        data = _parse_mcp_response(list_provider_models(provider="google", api_key="g-key"))
+
+        assert [m["id"] for m in data["models"]] == ["gemini-2.0-flash"]
+        url = mock_get.call_args.args[0]
+        assert "g-key" not in url
+        assert mock_get.call_args.kwargs["headers"] == {"x-goog-api-key": "g-key"}
+
+    @patch("src.mcp_server.tools.model_config_tools._PROVIDER_SESSION.get")
+    def test_list_unsupported_provider(self, mock_get):
+        """Test that unknown providers are rejected without a provider call"""
+        result = list_provider_models(provider="acme", api_key="test-key")
+        data = _parse_mcp_response(result)
+
+        assert data["error"] is True
+        assert "Unsupported provider: acme" in data["message"]
+        mock_get.assert_not_called()
+
     @patch("src.mcp_server.tools.model_config_tools._get_api_key_from_secret")
     def test_list_provider_models_no_api_key(self, mock_secret):
         """Test listing models when API key not found in secret"""
@@ -115,23 +158,135 @@ class TestListProviderModels:
         assert "API key not found" in data["message"]
 
 
+class TestListAllProviderModels:
+    """Test list_all_provider_models function"""
+
+    @patch("src.mcp_server.tools.model_config_tools._PROVIDER_SESSION.get")
+    def test_lists_each_provider_once(self, mock_get):
+        """Test that results are keyed by provider and duplicates are merged"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"data": [{"id": "gpt-4o"}]}'
+        mock_get.return_value = mock_response
+
+        result = list_all_provider_models(
+            providers=["OpenAI", "maas", "openai"],
+            api_keys={"openai": "test-key"},
+        )
+        data = _parse_mcp_response(result)
+
+        assert list(data["providers"]) == ["openai", "maas"]
+        assert data["providers"]["openai"]["models"][0]["id"] == "gpt-4o"
+        assert data["providers"]["maas"]["models"][0]["id"] == "qwen3-14b"
+        assert mock_get.call_count == 1
+
+    @patch("src.mcp_server.tools.model_config_tools._get_api_key_from_secret")
+    def test_provider_errors_reported_per_provider(self, mock_secret):
+        """Test that one provider failing does not fail the whole call"""
+        mock_secret.return_value = None
+
+        data = _parse_mcp_response(list_all_provider_models(providers=["openai", "maas"]))
+
+        assert data["providers"]["openai"]["error"] is True
+        assert data["providers"]["maas"]["count"] == 1
+
+    def test_empty_providers_rejected(self):
+        """Test that an empty provider list is an input error"""
+        result = list_all_provider_models(providers=[])
+        assert "providers must be a non-empty list" in result[0]["text"]
+
+
+class TestProviderCaches:
+    """Test caching of provider API keys and model lists"""
+
+    @patch("src.mcp_server.tools.model_config_tools._read_api_key_from_secret")
+    def test_secret_read_once_within_ttl(self, mock_read):
+        """Test that repeated lookups reuse the cached key"""
+        mock_read.return_value = "sk-cached"
+
+        assert _get_api_key_from_secret("OpenAI") == "sk-cached"
+        assert _get_api_key_from_secret("openai") == "sk-cached"
+        mock_read.assert_called_once_with("openai")
+
+    @patch("src.mcp_server.tools.model_config_tools._get_k8s_headers")
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.get")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
+    def test_secret_api_key_decoded(self, mock_get, mock_headers):
+        """Test that the api-key field is base64-decoded, and absent data tolerated"""
+        mock_headers.return_value = {"Authorization": "Bearer test-token"}
+        encoded = base64.b64encode(b"sk-secret").decode()
+        mock_get.side_effect = [
+            Mock(status_code=200, content=json.dumps({"data": {"api-key": encoded}}).encode()),
+            Mock(status_code=200, content=b'{"data": null}'),
+        ]
+
+        assert model_config_tools._read_api_key_from_secret("openai") == "sk-secret"
+        assert model_config_tools._read_api_key_from_secret("google") is None
+
+    @patch("src.mcp_server.tools.model_config_tools._read_api_key_from_secret")
+    def test_missing_secret_not_cached(self, mock_read):
+        """Test that a missing key is looked up again on the next call"""
+        mock_read.return_value = None
+
+        assert _get_api_key_from_secret("openai") is None
+        assert _get_api_key_from_secret("openai") is None
+        assert mock_read.call_count == 2
+
+    @patch("src.mcp_server.tools.model_config_tools._PROVIDER_SESSION.get")
+    @patch("src.mcp_server.tools.model_config_tools._read_api_key_from_secret")
+    def test_auth_failure_invalidates_cached_key(self, mock_read, mock_get):
+        """Test that a 401 from the provider drops the cached key"""
+        mock_read.side_effect = ["sk-old", "sk-new"]
+        mock_get.return_value = Mock(status_code=401)
+
+        data = _parse_mcp_response(list_provider_models(provider="openai"))
+        assert data["error"] is True
+        assert "openai" not in model_config_tools._SECRET_CACHE
+
+        assert _get_api_key_from_secret("openai") == "sk-new"
+
+    @patch("src.mcp_server.tools.model_config_tools._PROVIDER_SESSION.get")
+    def test_model_list_cached_per_key(self, mock_get):
+        """Test that a model list is fetched once per provider and key"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"data": [{"id": "gpt-4o"}]}'
+        mock_get.return_value = mock_response
+
+        first = list_provider_models(provider="openai", api_key="key-a")
+        second = list_provider_models(provider="openai", api_key="key-a")
+        assert first == second
+        assert mock_get.call_count == 1
+
+        list_provider_models(provider="openai", api_key="key-b")
+        assert mock_get.call_count == 2
+
+    @patch("src.mcp_server.tools.model_config_tools._PROVIDER_SESSION.get")
+    def test_model_list_errors_not_cached(self, mock_get):
+        """Test that provider errors are fetched again on the next call"""
+        mock_get.return_value = Mock(status_code=500)
+
+        list_provider_models(provider="openai", api_key="key-a")
+        list_provider_models(provider="openai", api_key="key-a")
+        assert mock_get.call_count == 2
+
+
 class TestUpdateMaasModelApiKey:
     """Test update_maas_model_api_key function"""
 
     @patch("core.model_config_manager.reload_model_config")
     @patch("src.mcp_server.tools.model_config_tools._get_k8s_headers")
     @patch("os.path.exists")
-    @patch("src.mcp_server.tools.model_config_tools.requests.patch")
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.patch")
     @patch("src.mcp_server.tools.model_config_tools._save_maas_model_api_key")
     @patch("core.model_config_manager.get_model_config")
-    @patch("os.getenv")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
     def test_update_maas_api_key_success(
-        self, mock_getenv, mock_get_config, mock_save_key, mock_patch,
+        self, mock_get_config, mock_save_key, mock_patch,
         mock_exists, mock_headers, mock_reload
     ):
         """Test successful MAAS model API key update"""
         # Setup mocks
-        mock_getenv.return_value = "test-namespace"
         mock_exists.return_value = True
         mock_headers.return_value = {"Authorization": "Bearer test-token"}
         mock_get_config.return_value = {
@@ -166,12 +321,11 @@ class TestUpdateMaasModelApiKey:
 
     @patch("src.mcp_server.tools.model_config_tools._save_maas_model_api_key")
     @patch("core.model_config_manager.get_model_config")
-    @patch("os.getenv")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
     def test_update_maas_api_key_only(
-        self, mock_getenv, mock_get_config, mock_save_key
+        self, mock_get_config, mock_save_key
     ):
         """Test updating only API key without endpoint"""
-        mock_getenv.return_value = "test-namespace"
         mock_get_config.return_value = {
             "maas/qwen3-14b": {
                 "provider": "maas",
@@ -231,12 +385,11 @@ class TestUpdateMaasModelApiKey:
 
     @patch("src.mcp_server.tools.model_config_tools._save_maas_model_api_key")
     @patch("core.model_config_manager.get_model_config")
-    @patch("os.getenv")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
     def test_update_maas_secret_save_failure(
-        self, mock_getenv, mock_get_config, mock_save_key
+        self, mock_get_config, mock_save_key
     ):
         """Test handling of Secret update failure"""
-        mock_getenv.return_value = "test-namespace"
         mock_get_config.return_value = {
             "maas/qwen3-14b": {
                 "provider": "maas",
@@ -261,16 +414,15 @@ class TestUpdateMaasModelApiKey:
     @patch("core.model_config_manager.reload_model_config")
     @patch("src.mcp_server.tools.model_config_tools._get_k8s_headers")
     @patch("os.path.exists")
-    @patch("src.mcp_server.tools.model_config_tools.requests.patch")
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.patch")
     @patch("src.mcp_server.tools.model_config_tools._save_maas_model_api_key")
     @patch("core.model_config_manager.get_model_config")
-    @patch("os.getenv")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
     def test_update_maas_configmap_update_failure(
-        self, mock_getenv, mock_get_config, mock_save_key, mock_patch,
+        self, mock_get_config, mock_save_key, mock_patch,
         mock_exists, mock_headers, mock_reload
     ):
         """Test handling of ConfigMap update failure"""
-        mock_getenv.return_value = "test-namespace"
         mock_exists.return_value = True
         mock_headers.return_value = {"Authorization": "Bearer test-token"}
         mock_get_config.return_value = {
@@ -300,15 +452,21 @@ class TestUpdateMaasModelApiKey:
         assert "warning" in data
         assert "endpoint update failed" in data["warning"]
         mock_reload.assert_not_called()  # Should not reload if ConfigMap update failed
+        # The live snapshot is not edited in place
+        assert mock_get_config.return_value["maas/qwen3-14b"] == {
+            "provider": "maas",
+            "modelName": "qwen3-14b",
+            "apiUrl": "https://old-url.com/v1",
+            "_metadata": {}
+        }
 
     @patch("src.mcp_server.tools.model_config_tools._save_maas_model_api_key")
     @patch("core.model_config_manager.get_model_config")
-    @patch("os.getenv")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
     def test_update_maas_with_maas_prefix(
-        self, mock_getenv, mock_get_config, mock_save_key
+        self, mock_get_config, mock_save_key
     ):
         """Test that maas/ prefix is handled correctly"""
-        mock_getenv.return_value = "test-namespace"
         mock_get_config.return_value = {
             "maas/qwen3-14b": {
                 "provider": "maas",
@@ -334,16 +492,15 @@ class TestUpdateMaasModelApiKey:
     @patch("core.model_config_manager.reload_model_config")
     @patch("src.mcp_server.tools.model_config_tools._get_k8s_headers")
     @patch("os.path.exists")
-    @patch("src.mcp_server.tools.model_config_tools.requests.patch")
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.patch")
     @patch("src.mcp_server.tools.model_config_tools._save_maas_model_api_key")
     @patch("core.model_config_manager.get_model_config")
-    @patch("os.getenv")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
     def test_update_maas_endpoint_normalization(
-        self, mock_getenv, mock_get_config, mock_save_key, mock_patch,
+        self, mock_get_config, mock_save_key, mock_patch,
         mock_exists, mock_headers, mock_reload
     ):
         """Test that endpoint URL is normalized correctly"""
-        mock_getenv.return_value = "test-namespace"
         mock_exists.return_value = True
         mock_headers.return_value = {"Authorization": "Bearer test-token"}
         mock_get_config.return_value = {
@@ -372,7 +529,7 @@ class TestUpdateMaasModelApiKey:
 
         # Verify the ConfigMap was updated with normalized URL
         call_args = mock_patch.call_args
-        patch_payload = call_args.kwargs["json"]
+        patch_payload = json.loads(call_args.kwargs["data"])
         config_json = patch_payload["data"]["model-config.json"]
         config = json.loads(config_json)
 
@@ -383,29 +540,18 @@ class TestUpdateMaasModelApiKey:
 class TestSaveMaasModelApiKey:
     """Test _save_maas_model_api_key helper function"""
 
-    @patch("src.mcp_server.tools.model_config_tools.requests.patch")
-    @patch("src.mcp_server.tools.model_config_tools.requests.get")
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.patch")
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.get")
     @patch("src.mcp_server.tools.model_config_tools._get_k8s_headers")
     @patch("os.path.exists")
-    @patch("os.getenv")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
     def test_save_api_key_update_existing_secret(
-        self, mock_getenv, mock_exists, mock_headers, mock_get, mock_patch
+        self, mock_exists, mock_headers, mock_get, mock_patch
     ):
         """Test updating API key in existing Secret"""
-        mock_getenv.return_value = "test-namespace"
         mock_exists.return_value = True
         mock_headers.return_value = {"Authorization": "Bearer test-token"}
 
-        # Mock GET - secret exists
-        get_response = Mock()
-        get_response.status_code = 200
-        get_response.json.return_value = {
-            "data": {
-                "other-model": base64.b64encode(b"old-key").decode()
-            }
-        }
-        mock_get.return_value = get_response
-
         # Mock PATCH - update succeeds
         patch_response = Mock()
         patch_response.status_code = 200
@@ -415,31 +561,33 @@ class TestSaveMaasModelApiKey:
 
         assert result["success"] is True
         mock_patch.assert_called_once()
+        # The field is merged in place; the Secret is never read first
+        mock_get.assert_not_called()
 
         # Verify PATCH payload
         call_args = mock_patch.call_args
-        patch_data = call_args.kwargs["json"]["data"]
-        assert "qwen3-14b" in patch_data
+        assert call_args.kwargs["headers"]["Content-Type"] == "application/strategic-merge-patch+json"
+        patch_data = json.loads(call_args.kwargs["data"])["data"]
+        assert list(patch_data) == ["qwen3-14b"]
         decoded_key = base64.b64decode(patch_data["qwen3-14b"]).decode()
         assert decoded_key == "new-api-key"
 
-    @patch("src.mcp_server.tools.model_config_tools.requests.post")
-    @patch("src.mcp_server.tools.model_config_tools.requests.get")
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.post")
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.patch")
     @patch("src.mcp_server.tools.model_config_tools._get_k8s_headers")
     @patch("os.path.exists")
-    @patch("os.getenv")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
     def test_save_api_key_create_new_secret(
-        self, mock_getenv, mock_exists, mock_headers, mock_get, mock_post
+        self, mock_exists, mock_headers, mock_patch, mock_post
     ):
         """Test creating new Secret when it doesn't exist"""
-        mock_getenv.return_value = "test-namespace"
         mock_exists.return_value = True
         mock_headers.return_value = {"Authorization": "Bearer test-token"}
 
-        # Mock GET - secret doesn't exist
-        get_response = Mock()
-        get_response.status_code = 404
-        mock_get.return_value = get_response
+        # Mock PATCH - secret doesn't exist
+        patch_response = Mock()
+        patch_response.status_code = 404
+        mock_patch.return_value = patch_response
 
         # Mock POST - create succeeds
         post_response = Mock()
@@ -453,39 +601,30 @@ class TestSaveMaasModelApiKey:
 
         # Verify POST payload
         call_args = mock_post.call_args
-        secret_payload = call_args.kwargs["json"]
+        secret_payload = json.loads(call_args.kwargs["data"])
         assert secret_payload["metadata"]["name"] == "ai-maas-credentials"
         assert "qwen3-14b" in secret_payload["data"]
 
-    @patch("os.getenv")
-    def test_save_api_key_no_namespace(self, mock_getenv):
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "")
+    def test_save_api_key_no_namespace(self):
         """Test when NAMESPACE is not set"""
-        mock_getenv.return_value = ""
 
         result = _save_maas_model_api_key("qwen3-14b", "new-api-key")
 
         assert result["success"] is False
         assert "NAMESPACE not set" in result["error"]
 
-    @patch("src.mcp_server.tools.model_config_tools.requests.patch")
-    @patch("src.mcp_server.tools.model_config_tools.requests.get")
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.patch")
     @patch("src.mcp_server.tools.model_config_tools._get_k8s_headers")
     @patch("os.path.exists")
-    @patch("os.getenv")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
     def test_save_api_key_patch_failure(
-        self, mock_getenv, mock_exists, mock_headers, mock_get, mock_patch
+        self, mock_exists, mock_headers, mock_patch
     ):
         """Test handling of Secret PATCH failure"""
-        mock_getenv.return_value = "test-namespace"
         mock_exists.return_value = True
         mock_headers.return_value = {"Authorization": "Bearer test-token"}
 
-        # Secret exists
-        get_response = Mock()
-        get_response.status_code = 200
-        get_response.json.return_value = {"data": {}}
-        mock_get.return_value = get_response
-
         # PATCH fails with 403
         patch_response = Mock()
         patch_response.status_code = 403
@@ -496,6 +635,23 @@ class TestSaveMaasModelApiKey:
         assert result["success"] is False
         assert "Failed to update secret" in result["error"]
 
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.post")
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.patch")
+    @patch("src.mcp_server.tools.model_config_tools._get_k8s_headers")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
+    def test_save_api_key_create_race_falls_back_to_patch(
+        self, mock_headers, mock_patch, mock_post
+    ):
+        """Test that a Secret created concurrently is patched instead"""
+        mock_headers.return_value = {"Authorization": "Bearer test-token"}
+        mock_patch.side_effect = [Mock(status_code=404), Mock(status_code=200)]
+        mock_post.return_value = Mock(status_code=409)
+
+        result = _save_maas_model_api_key("qwen3-14b", "new-api-key")
+
+        assert result["success"] is True
+        assert mock_patch.call_count == 2
+
 
 class TestAddModelToConfig:
     """Test add_model_to_config function"""
@@ -503,16 +659,15 @@ class TestAddModelToConfig:
     @patch("core.model_config_manager.reload_model_config")
     @patch("src.mcp_server.tools.model_config_tools._get_k8s_headers")
     @patch("os.path.exists")
-    @patch("src.mcp_server.tools.model_config_tools.requests.patch")
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.patch")
     @patch("src.mcp_server.tools.model_config_tools._save_maas_model_api_key")
     @patch("core.model_config_manager.get_model_config")
-    @patch("os.getenv")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
     def test_add_maas_model_success(
-        self, mock_getenv, mock_get_config, mock_save_key, mock_patch,
+        self, mock_get_config, mock_save_key, mock_patch,
         mock_exists, mock_headers, mock_reload
     ):
         """Test successfully adding a MAAS model"""
-        mock_getenv.return_value = "test-namespace"
         mock_exists.return_value = True
         mock_headers.return_value = {"Authorization": "Bearer test-token"}
         mock_get_config.return_value = {}
@@ -536,12 +691,11 @@ class TestAddModelToConfig:
         mock_patch.assert_called_once()
         mock_reload.assert_called_once()
 
-    @patch("os.getenv")
-    def test_add_maas_model_missing_api_key(self, mock_getenv):
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
+    def test_add_maas_model_missing_api_key(self):
         """Test adding MAAS model without API key"""
         # Need to mock NAMESPACE so we get past the namespace check
         # and reach the API key validation
-        mock_getenv.return_value = "test-namespace"
 
         result = add_model_to_config(
             provider="maas",
@@ -555,18 +709,18 @@ class TestAddModelToConfig:
     @patch("core.model_config_manager.reload_model_config")
     @patch("src.mcp_server.tools.model_config_tools._get_k8s_headers")
     @patch("os.path.exists")
-    @patch("src.mcp_server.tools.model_config_tools.requests.patch")
+    @patch("src.mcp_server.tools.model_config_tools._K8S_SESSION.patch")
     @patch("core.model_config_manager.get_model_config")
-    @patch("os.getenv")
+    @patch("src.mcp_server.tools.model_config_tools._NAMESPACE", "test-namespace")
     def test_add_openai_model_success(
-        self, mock_getenv, mock_get_config, mock_patch,
+        self, mock_get_config, mock_patch,
         mock_exists, mock_headers, mock_reload
     ):
         """Test successfully adding an OpenAI model"""
-        mock_getenv.return_value = "test-namespace"
         mock_exists.return_value = True
         mock_headers.return_value = {"Authorization": "Bearer test-token"}
-        mock_get_config.return_value = {}
+        snapshot = {"openai/gpt-4o-mini": {"provider": "openai"}}
+        mock_get_config.return_value = snapshot
 
         mock_response = Mock()
         mock_response.status_code = 200
@@ -583,3 +737,7 @@ class TestAddModelToConfig:
         assert data["model_key"] == "openai/gpt-4o"
         mock_patch.assert_called_once()
         mock_reload.assert_called_once()
+        # The new model is written to the ConfigMap, not into the live snapshot
+        patched = json.loads(json.loads(mock_patch.call_args.kwargs["data"])["data"]["model-config.json"])
+        assert set(patched) == {"openai/gpt-4o-mini", "openai/gpt-4o"}
+        assert snapshot == {"openai/gpt-4o-mini": {"provider": "openai"}}
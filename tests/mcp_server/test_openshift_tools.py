@@ -200,3 +200,55 @@ def test_list_openshift_namespaces_error(_):
     assert "❌ **Error (PROMETHEUS_ERROR)**" in text
     assert "Failed to retrieve OpenShift namespaces: boom" in text
 
+
+
+# --- Test namespace filter used by fetch_openshift_metrics_data ---
+
+def test_apply_namespace_filter_adds_matcher_to_selectors():
+    assert (
+        tools._apply_namespace_filter("sum(kube_pod_status_phase{phase='Running'})", "ns1")
+        == "sum(kube_pod_status_phase{namespace=\"ns1\",phase='Running'})"
+    )
+    assert tools._apply_namespace_filter("sum(kube_service_info)", "ns1") == 'sum(kube_service_info{namespace="ns1"})'
+
+
+# --- Test structured metric serialization in analyze_openshift ---
+
+def test_serialize_metric_rows_matches_per_row_path():
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime([1700000000, 1700000060, 1700000120], unit="s"),
+            "value": [1, 2.5, 3],
+        }
+    )
+    rows = df.to_dict(orient="records")
+
+    out = tools._serialize_metric_rows(rows)
+
+    assert [r["timestamp"] for r in out] == ["2023-11-14T22:13:20Z", "2023-11-14T22:14:20Z", "2023-11-14T22:15:20Z"]
+    assert out[:2] == [
+        {"timestamp": "2023-11-14T22:13:20Z", "value": 1.0},
+        {"timestamp": "2023-11-14T22:14:20Z", "value": 2.5},
+    ]
+    assert out == tools._serialize_metric_rows_slow(rows)
+
+
+def test_serialize_metric_rows_keeps_none_values_as_none():
+    rows = [
+        {"timestamp": pd.Timestamp("2024-01-01 00:00:00"), "value": 1.5},
+        {"timestamp": pd.Timestamp("2024-01-01 00:01:00"), "value": None},
+    ]
+
+    assert tools._serialize_metric_rows(rows) == [
+        {"timestamp": "2024-01-01T00:00:00Z", "value": 1.5},
+        {"timestamp": "2024-01-01T00:01:00Z", "value": None},
+    ]
+
+
+def test_serialize_metric_rows_irregular_rows_fall_back():
+    rows = [{"timestamp": "2024-01-01", "value": "bad"}, "junk", {"timestamp": None, "value": None}]
+
+    assert tools._serialize_metric_rows(rows) == [
+        {"timestamp": "2024-01-01", "value": None},
+        {"timestamp": "", "value": None},
+    ]
@@ -360,14 +360,14 @@ def test_get_gpu_info_success(mock_gpu_info):
         "total_gpus": 2,
         "vendors": ["NVIDIA"],
         "models": ["GPU"],
-        "temperatures": [45.0, 50.0],
+        "temperatures": {"count": 2, "min": 45.0, "avg": 47.5, "max": 50.0},
         "power_usage": []
     }
     out = tools.get_gpu_info()
     import json as _json
     data = _json.loads(_texts(out)[0])
     assert data["total_gpus"] == 2
-    assert data["temperatures"] == [45.0, 50.0]
+    assert data["temperatures"]["max"] == 50.0
     assert data["vendors"] == ["NVIDIA"]
 
 